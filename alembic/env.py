@@ -66,6 +66,13 @@ def _render_uuid(type_: Uuid, autogen_context: AutogenContext) -> str:
 # ---------------------------------------------------------------------------
 # Utility functions
 # ---------------------------------------------------------------------------
+def include_object(object_, name, type_, reflected, compare_to) -> bool:
+    """Skip database objects managed by raw SQL migrations (e.g., the SQLite FTS5 index)."""
+    if type_ == "table" and name and name.startswith("entry_fts"):
+        return False
+    return True
+
+
 def get_url() -> str:
     """Resolve the database URL Alembic should target."""
     return settings.effective_database_url
@@ -82,6 +89,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         compare_type=True,
+        include_object=include_object,
         dialect_opts={"paramstyle": "named"},
     )
 
@@ -105,6 +113,7 @@ def run_migrations_online() -> None:
             connection=connection,
             target_metadata=target_metadata,
             compare_type=True,
+            include_object=include_object,
         )
 
         with context.begin_transaction():
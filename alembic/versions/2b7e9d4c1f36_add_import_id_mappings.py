@@ -0,0 +1,31 @@
+"""add import id mappings saved with import checkpoints
+
+Revision ID: 2b7e9d4c1f36
+Revises: 8e4f1a6b3c27
+Create Date: 2026-10-17 21:14:52.730118
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '2b7e9d4c1f36'
+down_revision = '8e4f1a6b3c27'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('import_id_mappings',
+    sa.Column('import_job_id', sa.Uuid(), nullable=False),
+    sa.Column('entity_type', sa.String(length=20), nullable=False),
+    sa.Column('external_id', sa.Text(), nullable=False),
+    sa.Column('new_id', sa.Uuid(), nullable=False),
+    sa.ForeignKeyConstraint(['import_job_id'], ['import_jobs.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('import_job_id', 'entity_type', 'external_id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('import_id_mappings')
@@ -0,0 +1,65 @@
+"""add daily mood and tag rollup tables for analytics
+
+Revision ID: 47670d0eb3df
+Revises: 977f0a0382de
+Create Date: 2026-10-17 10:41:05.207734
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '47670d0eb3df'
+down_revision = '977f0a0382de'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('daily_mood_count',
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.Column('user_id', sa.Uuid(), nullable=False),
+    sa.Column('logged_date', sa.Date(), nullable=False),
+    sa.Column('category', sa.String(length=50), nullable=False),
+    sa.Column('mood_count', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'logged_date', 'category')
+    )
+    op.create_table('daily_tag_count',
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.Column('user_id', sa.Uuid(), nullable=False),
+    sa.Column('entry_date', sa.Date(), nullable=False),
+    sa.Column('tag_id', sa.Uuid(), nullable=False),
+    sa.Column('usage_count', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['tag_id'], ['tag.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'entry_date', 'tag_id')
+    )
+
+    # Backfill the rollups from existing mood logs and tag links
+    op.execute(
+        """
+        INSERT INTO daily_mood_count (created_at, updated_at, user_id, logged_date, category, mood_count)
+        SELECT CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, mood_log.user_id, mood_log.logged_date, mood.category, COUNT(*)
+        FROM mood_log
+        JOIN mood ON mood.id = mood_log.mood_id
+        GROUP BY mood_log.user_id, mood_log.logged_date, mood.category
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO daily_tag_count (created_at, updated_at, user_id, entry_date, tag_id, usage_count)
+        SELECT CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, entry.user_id, entry.entry_date, entry_tag_link.tag_id, COUNT(*)
+        FROM entry_tag_link
+        JOIN entry ON entry.id = entry_tag_link.entry_id
+        GROUP BY entry.user_id, entry.entry_date, entry_tag_link.tag_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('daily_tag_count')
+    op.drop_table('daily_mood_count')
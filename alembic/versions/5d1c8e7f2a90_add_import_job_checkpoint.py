@@ -0,0 +1,24 @@
+"""add checkpoint to import jobs for resumable imports
+
+Revision ID: 5d1c8e7f2a90
+Revises: a063414ead17
+Create Date: 2026-10-17 16:02:11.418305
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5d1c8e7f2a90'
+down_revision = 'a063414ead17'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('import_jobs', sa.Column('checkpoint', sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('import_jobs', 'checkpoint')
@@ -0,0 +1,33 @@
+"""add incremental export type and its starting point to export jobs
+
+Revision ID: 8e4f1a6b3c27
+Revises: 5d1c8e7f2a90
+Create Date: 2026-10-17 18:40:52.106214
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8e4f1a6b3c27'
+down_revision = '5d1c8e7f2a90'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    connection = op.get_bind()
+    if connection.dialect.name != "sqlite":
+        # New enum values cannot be added inside a transaction block
+        with op.get_context().autocommit_block():
+            op.execute("ALTER TYPE export_type_enum ADD VALUE IF NOT EXISTS 'incremental'")
+
+    op.add_column('export_jobs', sa.Column('since', sa.DateTime(), nullable=True))
+    op.add_column('export_jobs', sa.Column('base_export_id', sa.Uuid(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('export_jobs', 'base_export_id')
+    op.drop_column('export_jobs', 'since')
+    # PostgreSQL cannot drop a value from an enum type; 'incremental' stays
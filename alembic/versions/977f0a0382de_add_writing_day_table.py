@@ -0,0 +1,67 @@
+"""add writing_day table for incremental streaks
+
+Revision ID: 977f0a0382de
+Revises: 98a16e3b00f5
+Create Date: 2026-10-17 09:12:40.518233
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '977f0a0382de'
+down_revision = '98a16e3b00f5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('writing_day',
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.Column('user_id', sa.Uuid(), nullable=False),
+    sa.Column('entry_date', sa.Date(), nullable=False),
+    sa.Column('entry_count', sa.Integer(), nullable=False),
+    sa.Column('total_words', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'entry_date')
+    )
+
+    # Backfill one row per (user, day) from existing entries
+    op.execute(
+        """
+        INSERT INTO writing_day (created_at, updated_at, user_id, entry_date, entry_count, total_words)
+        SELECT CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, user_id, entry_date, COUNT(*), COALESCE(SUM(word_count), 0)
+        FROM entry
+        GROUP BY user_id, entry_date
+        """
+    )
+
+    # Streak totals are now maintained incrementally from here on, so start
+    # them from the backfilled counters (imports previously left them stale).
+    op.execute(
+        """
+        UPDATE writing_streak SET
+            total_entries = (
+                SELECT COALESCE(SUM(entry_count), 0) FROM writing_day
+                WHERE writing_day.user_id = writing_streak.user_id
+            ),
+            total_words = (
+                SELECT COALESCE(SUM(total_words), 0) FROM writing_day
+                WHERE writing_day.user_id = writing_streak.user_id
+            )
+        """
+    )
+    op.execute(
+        """
+        UPDATE writing_streak SET average_words_per_entry = CASE
+            WHEN total_entries > 0 THEN CAST(total_words AS FLOAT) / total_entries
+            ELSE 0.0
+        END
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('writing_day')
@@ -0,0 +1,77 @@
+"""Add full-text search index for entries
+
+Revision ID: 98a16e3b00f5
+Revises: f0cf0baa6c0d
+Create Date: 2026-10-17 09:00:00.000000
+
+SQLite: an FTS5 table (entry_fts) holds a copy of entry.title and
+entry.content with the entry's id, and is kept in sync by triggers on the
+entry table. Rows are keyed on entry.id rather than entry.rowid: entry has no
+INTEGER PRIMARY KEY, so VACUUM may renumber its rowids.
+
+PostgreSQL: a GIN expression index over a weighted tsvector (title = A,
+content = B). The expression must stay identical to
+EntryService._POSTGRES_SEARCH_DOCUMENT so the planner can use the index.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '98a16e3b00f5'
+down_revision = 'f0cf0baa6c0d'
+branch_labels = None
+depends_on = None
+
+
+POSTGRES_SEARCH_DOCUMENT = (
+    "(setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple', content), 'B'))"
+)
+
+
+def upgrade() -> None:
+    connection = op.get_bind()
+
+    if connection.dialect.name == "sqlite":
+        op.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS entry_fts USING fts5("
+            "title, content, entry_id UNINDEXED, "
+            "tokenize='unicode61 remove_diacritics 2')"
+        )
+        op.execute(
+            "CREATE TRIGGER IF NOT EXISTS entry_fts_ai AFTER INSERT ON entry BEGIN "
+            "INSERT INTO entry_fts(title, content, entry_id) "
+            "VALUES (new.title, new.content, new.id); "
+            "END"
+        )
+        op.execute(
+            "CREATE TRIGGER IF NOT EXISTS entry_fts_ad AFTER DELETE ON entry BEGIN "
+            "DELETE FROM entry_fts WHERE entry_id = old.id; "
+            "END"
+        )
+        op.execute(
+            "CREATE TRIGGER IF NOT EXISTS entry_fts_au AFTER UPDATE OF title, content ON entry BEGIN "
+            "UPDATE entry_fts SET title = new.title, content = new.content "
+            "WHERE entry_id = old.id; "
+            "END"
+        )
+        # Backfill the index from existing entries
+        op.execute("INSERT INTO entry_fts(title, content, entry_id) SELECT title, content, id FROM entry")
+    elif connection.dialect.name == "postgresql":
+        op.execute(
+            "CREATE INDEX IF NOT EXISTS idx_entry_search_document "
+            f"ON entry USING GIN ({POSTGRES_SEARCH_DOCUMENT})"
+        )
+
+
+def downgrade() -> None:
+    connection = op.get_bind()
+
+    if connection.dialect.name == "sqlite":
+        op.execute("DROP TRIGGER IF EXISTS entry_fts_au")
+        op.execute("DROP TRIGGER IF EXISTS entry_fts_ad")
+        op.execute("DROP TRIGGER IF EXISTS entry_fts_ai")
+        op.execute("DROP TABLE IF EXISTS entry_fts")
+    elif connection.dialect.name == "postgresql":
+        op.execute("DROP INDEX IF EXISTS idx_entry_search_document")
@@ -0,0 +1,59 @@
+"""add content-addressed media blob table with reference counts
+
+Revision ID: a063414ead17
+Revises: 47670d0eb3df
+Create Date: 2026-10-17 14:12:37.581204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a063414ead17'
+down_revision = '47670d0eb3df'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('media_blob',
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.Column('user_id', sa.Uuid(), nullable=False),
+    sa.Column('checksum', sa.String(length=64), nullable=False),
+    sa.Column('file_path', sa.String(length=500), nullable=False),
+    sa.Column('ref_count', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'checksum')
+    )
+
+    # Backfill one blob per user and checksum. Rows that already share a file
+    # (import deduplication) are counted; older duplicate copies stored under
+    # other paths stay untracked and are only removed when unreferenced.
+    op.execute(
+        """
+        INSERT INTO media_blob (created_at, updated_at, user_id, checksum, file_path, ref_count)
+        SELECT CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, entry.user_id, entry_media.checksum, MIN(entry_media.file_path), 0
+        FROM entry_media
+        JOIN entry ON entry.id = entry_media.entry_id
+        WHERE entry_media.checksum IS NOT NULL
+        GROUP BY entry.user_id, entry_media.checksum
+        """
+    )
+    op.execute(
+        """
+        UPDATE media_blob SET ref_count = (
+            SELECT COUNT(*)
+            FROM entry_media
+            JOIN entry ON entry.id = entry_media.entry_id
+            WHERE entry.user_id = media_blob.user_id
+              AND entry_media.checksum = media_blob.checksum
+              AND entry_media.file_path = media_blob.file_path
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('media_blob')
@@ -2,6 +2,7 @@
 Shared API dependencies.
 """
 import logging
+import time
 from typing import Annotated, Optional, Callable
 
 from fastapi import Depends, HTTPException, status, Cookie
@@ -9,8 +10,10 @@ from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, ExpiredSignatureError
 from sqlmodel import Session
 
+from app.core.concurrency import run_in_db_threadpool
 from app.core.config import JOURNIV_PLUS_DOC_URL
-from app.core.database import get_session
+from app.core.database import get_read_session_context, get_session
+from app.core.principal_cache import get_principal_cache
 from app.core.security import verify_token
 from app.middleware.request_logging import request_id_ctx
 from app.models.user import User
@@ -90,10 +93,15 @@ async def get_current_user(
         logger.error("Unexpected token validation error", extra={"error": str(e)})
         raise credentials_exception
 
-    # Get user from database
-    user = UserService(session).get_user_by_id(user_id)
+    # Get user from the principal cache, falling back to the database
+    principal_cache = get_principal_cache()
+    user = principal_cache.get(user_id)
     if user is None:
-        raise credentials_exception
+        read_started = time.monotonic()
+        user = await run_in_db_threadpool(UserService(session).get_user_by_id, user_id)
+        if user is None:
+            raise credentials_exception
+        principal_cache.set(user, read_started)
 
     # Check if user is active
     if not user.is_active:
@@ -103,9 +111,23 @@ async def get_current_user(
             detail="User account is inactive"
         )
 
+    # Writes committed through the request's session keep the user's reads
+    # off lagging replicas (see app/core/db_routing.py)
+    session.info["user_id"] = user_id
     return user
 
 
+def get_read_session(current_user: Annotated[User, Depends(get_current_user)]):
+    """
+    Dependency providing a read-only session for the current user.
+
+    Use it instead of get_session on heavy read-only routes: it reads from a
+    replica when DATABASE_REPLICA_URLS is set, unless the user wrote recently.
+    """
+    with get_read_session_context(str(current_user.id)) as session:
+        yield session
+
+
 async def get_current_admin_user(
     current_user: Annotated[User, Depends(get_current_user)]
 ) -> User:
@@ -1,7 +1,9 @@
 """
 API v1 router.
 """
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+
+from app.core.concurrency import track_route_concurrency
 from app.api.v1.endpoints import (
     auth, users, journals, entries, moods, prompts, tags,
     analytics, media, health, security, oidc, admin, version, license
@@ -10,7 +12,7 @@ from app.api.v1.endpoints import (
 from app.api.v1.endpoints.export_data import router as export_router
 from app.api.v1.endpoints.import_data import router as import_router
 
-api_router = APIRouter()
+api_router = APIRouter(dependencies=[Depends(track_route_concurrency)])
 
 # Include all endpoint routers
 api_router.include_router(auth.router)
@@ -8,6 +8,7 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlmodel import Session
 
 from app.api.dependencies import get_current_admin_user, get_session
+from app.core.concurrency import run_in_db_threadpool
 from app.core.exceptions import UserAlreadyExistsError, UserNotFoundError
 from app.core.logging_config import log_user_action, log_error
 from app.models.user import User
@@ -51,7 +52,9 @@ async def list_users(
     """
     try:
         user_service = UserService(session)
-        users = user_service.get_all_users(limit=limit, offset=offset)
+        users = await run_in_db_threadpool(user_service.get_all_users, limit=limit, offset=offset)
+        # One lookup for the whole page rather than one per user
+        timezones = await run_in_db_threadpool(user_service.get_user_timezones, [user.id for user in users])
 
         # Build response with additional metadata
         user_list = []
@@ -75,7 +78,8 @@ async def list_users(
                 last_login_at=user.last_login_at,
                 created_at=user.created_at,
                 login_type=login_type,
-                linked_providers=linked_providers if linked_providers else None
+                linked_providers=linked_providers if linked_providers else None,
+                time_zone=timezones[user.id],
             ))
 
         log_user_action(admin.email, f"listed {len(user_list)} users")
@@ -113,14 +117,14 @@ async def create_user(
         user_service = UserService(session)
 
         # Create new user with specified role
-        user = user_service.create_user_as_admin(user_data)
+        user = await run_in_db_threadpool(user_service.create_user_as_admin, user_data)
 
         log_user_action(
             admin.email,
             f"created user {user.email} with role {user.role}"
         )
 
-        user_dict = _build_user_response(user, user_service)
+        user_dict = await run_in_db_threadpool(_build_user_response, user, user_service)
         user_dict['is_oidc_user'] = False
 
         return UserResponse.model_validate(user_dict)
@@ -164,14 +168,14 @@ async def update_user(
         user_service = UserService(session)
 
         # Update user
-        user = user_service.update_user_as_admin(str(user_id), user_data)
+        user = await run_in_db_threadpool(user_service.update_user_as_admin, str(user_id), user_data)
 
         log_user_action(
             admin.email,
             f"updated user {user.email}"
         )
 
-        user_dict = _build_user_response(user, user_service)
+        user_dict = await run_in_db_threadpool(_build_user_response, user, user_service)
 
         return UserResponse.model_validate(user_dict)
     except UserNotFoundError as e:
@@ -216,14 +220,14 @@ async def delete_user(
         user_service = UserService(session)
 
         # Get user to log deletion
-        user = user_service.get_user_by_id(str(user_id))
+        user = await run_in_db_threadpool(user_service.get_user_by_id, str(user_id))
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
 
         user_email = user.email
 
         # Delete user (includes admin protection check)
-        user_service.delete_user(str(user_id), bypass_admin_check=False)
+        await run_in_db_threadpool(user_service.delete_user, str(user_id), bypass_admin_check=False)
 
         log_user_action(
             admin.email,
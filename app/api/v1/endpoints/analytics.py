@@ -7,8 +7,8 @@ from typing import Annotated, Dict, Any
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlmodel import Session
 
-from app.api.dependencies import get_current_user
-from app.core.database import get_session
+from app.api.dependencies import get_current_user, get_read_session
+from app.core.concurrency import run_in_db_threadpool
 
 logger = logging.getLogger(__name__)
 from app.models.user import User
@@ -30,7 +30,7 @@ router = APIRouter(prefix="/analytics", tags=["analytics"])
 )
 async def get_writing_streak(
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)]
+    session: Annotated[Session, Depends(get_read_session)]
 ):
     """
     Get writing streak analytics.
@@ -39,7 +39,7 @@ async def get_writing_streak(
     """
     try:
         analytics_service = AnalyticsService(session)
-        analytics = analytics_service.get_writing_analytics(current_user.id)
+        analytics = await run_in_db_threadpool(analytics_service.get_writing_analytics, current_user.id)
         return analytics
     except Exception as e:
         logger.error(
@@ -63,7 +63,7 @@ async def get_writing_streak(
 )
 async def get_writing_patterns(
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[Session, Depends(get_read_session)],
     days: int = Query(30, ge=1, le=365)
 ):
     """
@@ -73,7 +73,7 @@ async def get_writing_patterns(
     """
     try:
         analytics_service = AnalyticsService(session)
-        patterns = analytics_service.get_writing_patterns(current_user.id, days)
+        patterns = await run_in_db_threadpool(analytics_service.get_writing_patterns, current_user.id, days)
         return patterns
     except Exception as e:
         logger.error(
@@ -95,7 +95,7 @@ async def get_writing_patterns(
 )
 async def get_productivity_metrics(
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)]
+    session: Annotated[Session, Depends(get_read_session)]
 ):
     """
     Get productivity metrics.
@@ -104,7 +104,7 @@ async def get_productivity_metrics(
     """
     try:
         analytics_service = AnalyticsService(session)
-        metrics = analytics_service.get_productivity_metrics(current_user.id)
+        metrics = await run_in_db_threadpool(analytics_service.get_productivity_metrics, current_user.id)
         return metrics
     except Exception as e:
         logger.error(
@@ -126,7 +126,7 @@ async def get_productivity_metrics(
 )
 async def get_journal_analytics(
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)]
+    session: Annotated[Session, Depends(get_read_session)]
 ):
     """
     Get analytics for all journals.
@@ -135,7 +135,7 @@ async def get_journal_analytics(
     """
     try:
         analytics_service = AnalyticsService(session)
-        analytics = analytics_service.get_journal_analytics(current_user.id)
+        analytics = await run_in_db_threadpool(analytics_service.get_journal_analytics, current_user.id)
         return analytics
     except Exception as e:
         logger.error(
@@ -157,36 +157,18 @@ async def get_journal_analytics(
 )
 async def get_analytics_dashboard(
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[Session, Depends(get_read_session)],
     days: int = Query(30, ge=1, le=365)
 ):
     """
     Get comprehensive analytics dashboard.
 
     Combines all analytics data into a single response with summary statistics.
+    Results are cached per user and period until the user's next write.
     """
     try:
         analytics_service = AnalyticsService(session)
-
-        # Get all analytics data
-        writing_analytics = analytics_service.get_writing_analytics(current_user.id)
-        writing_patterns = analytics_service.get_writing_patterns(current_user.id, days)
-        productivity_metrics = analytics_service.get_productivity_metrics(current_user.id)
-        journal_analytics = analytics_service.get_journal_analytics(current_user.id)
-
-        result = {
-            "writing_streak": writing_analytics,
-            "writing_patterns": writing_patterns,
-            "productivity": productivity_metrics,
-            "journals": journal_analytics,
-            "summary": {
-                "total_journals": len(journal_analytics.get("journals", [])),
-                "total_entries": writing_analytics.get("total_entries", 0),
-                "current_streak": writing_analytics.get("current_streak", 0),
-                "longest_streak": writing_analytics.get("longest_streak", 0)
-            }
-        }
-        return result
+        return await run_in_db_threadpool(analytics_service.get_analytics_dashboard, current_user.id, days)
     except Exception as e:
         logger.error(
             "Unexpected error fetching analytics dashboard",
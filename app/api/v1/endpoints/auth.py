@@ -9,6 +9,7 @@ from jose import JWTError
 from sqlmodel import Session
 
 from app.api.dependencies import get_current_user
+from app.core.concurrency import run_in_db_threadpool
 from app.core.config import settings
 from app.core.database import get_session
 from app.core.exceptions import InvalidCredentialsError, UnauthorizedError
@@ -50,7 +51,7 @@ async def register(
         user_service = UserService(session)
 
         # Check if this is the first user (bootstrap override)
-        is_first = user_service.is_first_user()
+        is_first = await run_in_db_threadpool(user_service.is_first_user)
 
         # Block signup if disabled (unless this is the first user)
         if not is_first and user_service.is_signup_disabled():
@@ -61,16 +62,16 @@ async def register(
             raise HTTPException(status_code=403, detail="Sign up is disabled")
 
         # Check if user already exists
-        existing_user = user_service.get_user_by_email(user_data.email)
+        existing_user = await run_in_db_threadpool(user_service.get_user_by_email, user_data.email)
         if existing_user:
             raise HTTPException(status_code=400, detail="Email already registered")
 
         # Create new user (first user becomes admin automatically)
-        user = user_service.create_user(user_data)
+        user = await run_in_db_threadpool(user_service.create_user, user_data)
         log_user_action(user.email, "registered", request_id=getattr(request.state, 'request_id', None))
 
         # Get timezone from settings
-        timezone = user_service.get_user_timezone(user.id)
+        timezone = await run_in_db_threadpool(user_service.get_user_timezone, user.id)
 
         # Password-registered users are never OIDC users
         user_dict = user.model_dump(mode='json')
@@ -113,7 +114,7 @@ async def login(
 
         # Authenticate user
         try:
-            user = user_service.authenticate_user(user_data.email, user_data.password)
+            user = await run_in_db_threadpool(user_service.authenticate_user, user_data.email, user_data.password)
         except InvalidCredentialsError:
             raise HTTPException(
                 status_code=401,
@@ -143,7 +144,7 @@ async def login(
         # )
 
         # Get timezone from settings
-        timezone = user_service.get_user_timezone(user.id)
+        timezone = await run_in_db_threadpool(user_service.get_user_timezone, user.id)
 
         # Convert user to dict for response
         # Use the enum value (e.g., "user" or "admin") instead of str() which gives "UserRole.USER"
@@ -213,7 +214,7 @@ async def refresh_token(
 
         # Get user
         user_service = UserService(session)
-        user = user_service.get_user_by_id(user_id)
+        user = await run_in_db_threadpool(user_service.get_user_by_id, user_id)
         if not user:
             raise HTTPException(
                 status_code=401,
@@ -275,7 +276,7 @@ async def login_for_access_token(
 
         # Authenticate user (OAuth2 uses 'username' field for email)
         try:
-            user = user_service.authenticate_user(form_data.username, form_data.password)
+            user = await run_in_db_threadpool(user_service.authenticate_user, form_data.username, form_data.password)
         except InvalidCredentialsError:
             raise HTTPException(
                 status_code=401,
@@ -6,13 +6,15 @@ import uuid
 from datetime import date
 from typing import Annotated, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
 from sqlmodel import Session
 
-from app.api.dependencies import get_current_user
+from app.api.dependencies import get_current_user, get_read_session
+from app.core.concurrency import run_in_db_threadpool
 from app.core.database import get_session
 from app.core.exceptions import EntryNotFoundError, JournalNotFoundError, ValidationError
 from app.core.logging_config import log_user_action, log_error
+from app.core.pagination import decode_entry_cursor, set_next_cursor_header
 from app.models.user import User
 from app.schemas.entry import EntryCreate, EntryUpdate, EntryResponse, EntryMediaCreate, EntryMediaResponse
 from app.schemas.tag import TagResponse
@@ -42,7 +44,7 @@ async def create_entry(
     """Create a new journal entry."""
     entry_service = EntryService(session)
     try:
-        entry = entry_service.create_entry(current_user.id, entry_data)
+        entry = await run_in_db_threadpool(entry_service.create_entry, current_user.id, entry_data)
         log_user_action(current_user.email, f"created entry {entry.id}", request_id=None)
         return entry
     except JournalNotFoundError:
@@ -58,33 +60,43 @@ async def create_entry(
     "/",
     response_model=List[EntryResponse],
     responses={
+        400: {"description": "Invalid pagination cursor"},
         401: {"description": "Not authenticated"},
         403: {"description": "Account inactive"},
         500: {"description": "Internal server error"},
     }
 )
 async def get_user_entries(
+    response: Response,
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[Session, Depends(get_read_session)],
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the X-Next-Cursor header; overrides offset"),
 ):
     """
     Get all entries for the current user.
 
-    Supports pagination via limit and offset parameters.
+    Supports pagination via limit and offset parameters, or via cursor.
+    Full pages return an X-Next-Cursor header; pass it back as `cursor` to
+    fetch the next page at constant cost regardless of depth.
     Entries are sorted by entry_datetime_utc in descending order (newest first).
     For search functionality, use the /search endpoint.
     For date range filtering, use the /date-range endpoint.
     """
     try:
         entry_service = EntryService(session)
-        entries = entry_service.get_user_entries(
+        entries = await run_in_db_threadpool(
+            entry_service.get_user_entries,
             user_id=current_user.id,
             limit=limit,
             offset=offset,
+            cursor=decode_entry_cursor(cursor),
         )
+        set_next_cursor_header(response, entries, limit)
         return entries
+    except ValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from None
     except Exception as e:
         logger.error(
             "Unexpected error fetching entries",
@@ -97,6 +109,7 @@ async def get_user_entries(
     "/journal/{journal_id}",
     response_model=List[EntryResponse],
     responses={
+        400: {"description": "Invalid pagination cursor"},
         401: {"description": "Not authenticated"},
         403: {"description": "Account inactive"},
         404: {"description": "Journal not found"},
@@ -105,23 +118,31 @@ async def get_user_entries(
 )
 async def get_journal_entries(
     journal_id: uuid.UUID,
+    response: Response,
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[Session, Depends(get_read_session)],
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
     include_pinned: bool = Query(True),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the X-Next-Cursor header; overrides offset"),
 ):
     """
     Get entries for a specific journal.
 
     Pinned entries appear first when include_pinned=true.
+    Full pages return an X-Next-Cursor header for cursor pagination.
     """
     entry_service = EntryService(session)
     try:
-        entries = entry_service.get_journal_entries(
-            journal_id, current_user.id, limit, offset, include_pinned
+        entries = await run_in_db_threadpool(
+            entry_service.get_journal_entries,
+            journal_id, current_user.id, limit, offset, include_pinned,
+            cursor=decode_entry_cursor(cursor),
         )
+        set_next_cursor_header(response, entries, limit)
         return entries
+    except ValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from None
     except JournalNotFoundError:
         raise HTTPException(status_code=404, detail="Journal not found")
     except Exception as e:
@@ -144,7 +165,7 @@ async def get_journal_entries(
 )
 async def search_entries(
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[Session, Depends(get_read_session)],
     q: str = Query(..., min_length=1),
     journal_id: Optional[uuid.UUID] = Query(None),
     limit: int = Query(50, ge=1, le=100),
@@ -153,11 +174,14 @@ async def search_entries(
     """
     Search entries by content.
 
-    Searches title and content fields. Optionally filter by journal_id.
+    Searches title and content fields using the full-text index. Each search
+    term matches as a word prefix; results are ranked by relevance with title
+    matches first. Optionally filter by journal_id.
     """
     try:
         entry_service = EntryService(session)
-        entries = entry_service.search_entries(
+        entries = await run_in_db_threadpool(
+            entry_service.search_entries,
             current_user.id, q, journal_id, limit, offset
         )
         return entries
@@ -181,7 +205,7 @@ async def search_entries(
 )
 async def get_entries_by_date_range(
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[Session, Depends(get_read_session)],
     start_date: date = Query(...),
     end_date: date = Query(...),
     journal_id: Optional[str] = Query(None),
@@ -204,7 +228,8 @@ async def get_entries_by_date_range(
                     detail="Invalid journal_id format. Must be a valid UUID."
                 )
 
-        entries = entry_service.get_entries_by_date_range(
+        entries = await run_in_db_threadpool(
+            entry_service.get_entries_by_date_range,
             current_user.id, start_date, end_date, journal_uuid
         )
         return entries
@@ -234,7 +259,7 @@ async def get_entry(
     """Get a specific entry by ID."""
     try:
         entry_service = EntryService(session)
-        entry = entry_service.get_entry_by_id(entry_id, current_user.id)
+        entry = await run_in_db_threadpool(entry_service.get_entry_by_id, entry_id, current_user.id)
         if not entry:
             raise HTTPException(status_code=404, detail="Entry not found")
         return entry
@@ -269,7 +294,7 @@ async def update_entry(
     """Update an entry's content, title, or other properties."""
     entry_service = EntryService(session)
     try:
-        entry = entry_service.update_entry(entry_id, current_user.id, entry_data)
+        entry = await run_in_db_threadpool(entry_service.update_entry, entry_id, current_user.id, entry_data)
         log_user_action(current_user.email, "Updated entry", request_id=None)
         return entry
     except EntryNotFoundError:
@@ -338,7 +363,7 @@ async def toggle_pin(
     """Toggle pin status of an entry (on/off)."""
     entry_service = EntryService(session)
     try:
-        entry = entry_service.toggle_pin(entry_id, current_user.id)
+        entry = await run_in_db_threadpool(entry_service.toggle_pin, entry_id, current_user.id)
         log_user_action(current_user.email, f"toggled pin for entry {entry_id}", request_id=None)
         return entry
     except EntryNotFoundError:
@@ -372,7 +397,7 @@ async def add_media_to_entry(
     """Add media (image/video/audio) to an entry."""
     entry_service = EntryService(session)
     try:
-        media = entry_service.add_media_to_entry(entry_id, current_user.id, media_data)
+        media = await run_in_db_threadpool(entry_service.add_media_to_entry, entry_id, current_user.id, media_data)
         log_user_action(current_user.email, f"added media to entry {entry_id}", request_id=None)
         return media
     except EntryNotFoundError:
@@ -405,7 +430,7 @@ async def get_entry_media(
     """Get all media attached to an entry."""
     entry_service = EntryService(session)
     try:
-        media = entry_service.get_entry_media(entry_id, current_user.id)
+        media = await run_in_db_threadpool(entry_service.get_entry_media, entry_id, current_user.id)
         return [EntryMediaResponse.model_validate(media_item) for media_item in media]
     except EntryNotFoundError:
         raise HTTPException(status_code=404, detail="Entry not found")
@@ -436,7 +461,7 @@ async def get_entry_tags(
     """Get all tags associated with an entry."""
     tag_service = TagService(session)
     try:
-        tags = tag_service.get_entry_tags(entry_id, current_user.id)
+        tags = await run_in_db_threadpool(tag_service.get_entry_tags, entry_id, current_user.id)
         return tags
     except EntryNotFoundError:
         raise HTTPException(status_code=404, detail="Entry not found")
@@ -472,7 +497,7 @@ async def bulk_add_tags_to_entry(
     """
     tag_service = TagService(session)
     try:
-        tags = tag_service.bulk_add_tags_to_entry(entry_id, tag_names, current_user.id)
+        tags = await run_in_db_threadpool(tag_service.bulk_add_tags_to_entry, entry_id, tag_names, current_user.id)
         log_user_action(current_user.email, f"bulk added tags to entry {entry_id}", request_id=None)
         return tags
     except EntryNotFoundError:
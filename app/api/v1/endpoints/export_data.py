@@ -10,6 +10,7 @@ from fastapi.responses import FileResponse
 from sqlmodel import Session
 
 from app.api.dependencies import get_current_user
+from app.core.concurrency import run_in_db_threadpool
 from app.core.config import settings
 from app.core.database import get_session
 from app.core.logging_config import log_user_action, log_error
@@ -66,6 +67,8 @@ async def create_export(
     **Export Types:**
     - `full`: Export all user data (journals, entries, media, settings)
     - `journal`: Export specific journals (requires journal_ids)
+    - `incremental`: Export only what changed since `since`, or since the end of
+      `base_export_id` (default: the latest completed full or incremental export)
     """
     # Pydantic already validates export_type as ExportType enum
     export_type = export_request.export_type
@@ -82,11 +85,14 @@ async def create_export(
         export_service = ExportService(session)
 
         # Create export job
-        job = export_service.create_export(
+        job = await run_in_db_threadpool(
+            export_service.create_export,
             user_id=current_user.id,
             export_type=export_type,
             journal_ids=[uuid.UUID(jid) for jid in export_request.journal_ids] if export_request.journal_ids else None,
             include_media=export_request.include_media,
+            since=export_request.since,
+            base_export_id=uuid.UUID(export_request.base_export_id) if export_request.base_export_id else None,
         )
 
         # Queue Celery task
@@ -112,6 +118,8 @@ async def create_export(
             warnings=job.warnings,
             export_type=job.export_type.value,
             include_media=job.include_media,
+            since=job.since,
+            base_export_id=str(job.base_export_id) if job.base_export_id else None,
             file_path=None,  # Don't expose internal path
             file_size=job.file_size,
             download_url=_get_download_url(request, job.id) if job.status == JobStatus.COMPLETED else None,
@@ -151,7 +159,7 @@ async def get_export_status(
     use the download endpoint to retrieve the file.
     """
     try:
-        job = session.query(ExportJob).filter(ExportJob.id == job_id).first()
+        job = await run_in_db_threadpool(session.get, ExportJob, job_id)
 
         if not job:
             raise HTTPException(status_code=404, detail="Export job not found")
@@ -173,6 +181,8 @@ async def get_export_status(
             warnings=job.warnings,
             export_type=job.export_type.value,
             include_media=job.include_media,
+            since=job.since,
+            base_export_id=str(job.base_export_id) if job.base_export_id else None,
             file_path=None,  # Don't expose internal path
             file_size=job.file_size,
             download_url=_get_download_url(request, job.id) if job.status == JobStatus.COMPLETED else None,
@@ -208,7 +218,7 @@ async def download_export(
     The file will be named `journiv_export_{timestamp}.zip`.
     """
     try:
-        job = session.query(ExportJob).filter(ExportJob.id == job_id).first()
+        job = await run_in_db_threadpool(session.get, ExportJob, job_id)
 
         if not job:
             raise HTTPException(status_code=404, detail="Export job not found")
@@ -286,8 +296,8 @@ async def list_exports(
     """
     try:
 
-        jobs = (
-            session.query(ExportJob)
+        jobs = await run_in_db_threadpool(
+            lambda: session.query(ExportJob)
             .filter(ExportJob.user_id == current_user.id)
             .order_by(ExportJob.created_at.desc())
             .offset(offset)
@@ -309,6 +319,8 @@ async def list_exports(
                 warnings=job.warnings,
                 export_type=job.export_type.value,
                 include_media=job.include_media,
+                since=job.since,
+                base_export_id=str(job.base_export_id) if job.base_export_id else None,
                 file_path=None,
                 file_size=job.file_size,
                 download_url=_get_download_url(request, job.id) if job.status == JobStatus.COMPLETED else None,
@@ -345,7 +357,7 @@ async def delete_export_job(
     Cannot delete a job that is currently running.
     """
     try:
-        job = session.query(ExportJob).filter(ExportJob.id == job_id).first()
+        job = await run_in_db_threadpool(session.get, ExportJob, job_id)
 
         if not job:
             raise HTTPException(status_code=404, detail="Export job not found")
@@ -381,8 +393,8 @@ async def delete_export_job(
                 )
 
         # Delete job record
-        session.delete(job)
-        session.commit()
+        await run_in_db_threadpool(session.delete, job)
+        await run_in_db_threadpool(session.commit)
 
         log_user_action(
             current_user.email,
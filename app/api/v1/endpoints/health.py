@@ -14,7 +14,10 @@ try:
 except ImportError:
     PSUTIL_AVAILABLE = False
 
-from app.core.database import get_session
+from app.core.database import engine, get_session, replica_router
+from app.core.db_pool import get_pool_stats
+from app.core.concurrency import get_threadpool_stats, route_concurrency, run_in_db_threadpool
+from app.core.media_engine import get_media_engine
 from app.core.logging_config import log_error
 from app.core.config import settings
 
@@ -42,16 +45,20 @@ async def health_check(session: Annotated[Session, Depends(get_session)]):
         # Check database connection
         db_status = "connected"
         try:
-            session.exec(text("SELECT 1")).first()
+            await run_in_db_threadpool(lambda: session.exec(text("SELECT 1")).first())
         except Exception as e:
             db_status = f"disconnected: {str(e)}"
 
+        pool = get_pool_stats(engine)
         return {
             "status": "healthy" if db_status == "connected" else "degraded",
             "timestamp": _utc_now_iso(),
             "service": settings.app_name,
             "version": settings.app_version,
-            "database": db_status
+            "database": db_status,
+            "database_pool": {
+                key: pool[key] for key in ("in_use", "idle", "overflow", "waiting", "checkout_timeouts") if key in pool
+            },
         }
     except Exception as e:
         log_error(e, request_id=None)
@@ -115,3 +122,41 @@ async def memory_status():
     except Exception as e:
         log_error(e, request_id=None)
         raise HTTPException(status_code=500, detail="Failed to get memory status")
+
+
+@router.get(
+    "/concurrency",
+    response_model=Dict[str, Any],
+    responses={
+        500: {"description": "Internal server error"},
+    }
+)
+async def concurrency_status():
+    """
+    Get database threadpool, connection pool and media engine occupancy and
+    per-route concurrency.
+
+    Routes are labelled by method and path template. Waits on the database
+    threadpool indicate DB_THREADPOOL_SIZE is too small for the load; slow
+    connection checkouts the same for DB_POOL_SIZE and DB_MAX_OVERFLOW, and
+    uploads being rejected for MEDIA_ENGINE_WORKERS. Counters are those of
+    the worker process answering the request.
+    """
+    try:
+        threadpool = get_threadpool_stats()
+        pool = get_pool_stats(engine)
+        media_engine = get_media_engine()
+        saturated = threadpool["waiting"] or pool.get("waiting") or not media_engine.has_capacity()
+        return {
+            "status": "saturated" if saturated else "ok",
+            "timestamp": _utc_now_iso(),
+            "process_id": os.getpid(),
+            "db_threadpool": threadpool,
+            "db_pool": pool,
+            "db_replicas": replica_router.stats(),
+            "media_engine": media_engine.stats(),
+            "routes": route_concurrency.snapshot(),
+        }
+    except Exception as e:
+        log_error(e, request_id=None)
+        raise HTTPException(status_code=500, detail="Failed to get concurrency status")
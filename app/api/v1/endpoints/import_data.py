@@ -10,6 +10,7 @@ from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File,
 from sqlmodel import Session
 
 from app.api.dependencies import get_current_user
+from app.core.concurrency import run_in_db_threadpool
 from app.core.config import settings
 from app.core.database import get_session
 from app.core.logging_config import log_user_action, log_error
@@ -129,7 +130,8 @@ async def upload_import(
 
         # Create import job
         import_service = ImportService(session)
-        job = import_service.create_import_job(
+        job = await run_in_db_threadpool(
+            import_service.create_import_job,
             user_id=current_user.id,
             source_type=source_type_enum,
             file_path=str(upload_path),
@@ -8,6 +8,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlmodel import Session
 
 from app.api.dependencies import get_current_user
+from app.core.concurrency import run_in_db_threadpool
 from app.core.database import get_session
 from app.core.exceptions import JournalNotFoundError
 from app.core.logging_config import log_user_action, log_error
@@ -37,7 +38,7 @@ async def create_journal(
     """Create a new journal."""
     journal_service = JournalService(session)
     try:
-        journal = journal_service.create_journal(current_user.id, journal_data)
+        journal = await run_in_db_threadpool(journal_service.create_journal, current_user.id, journal_data)
         log_user_action(current_user.email, f"created journal {journal.id}", request_id=None)
         return journal
     except ValueError as e:
@@ -68,7 +69,7 @@ async def get_user_journals(
     """
     journal_service = JournalService(session)
     try:
-        journals = journal_service.get_user_journals(current_user.id, include_archived)
+        journals = await run_in_db_threadpool(journal_service.get_user_journals, current_user.id, include_archived)
         return journals
     except Exception as e:
         log_error(e, request_id=None, user_email=current_user.email)
@@ -91,7 +92,7 @@ async def get_favorite_journals(
     """Get all journals marked as favorites."""
     journal_service = JournalService(session)
     try:
-        journals = journal_service.get_favorite_journals(current_user.id)
+        journals = await run_in_db_threadpool(journal_service.get_favorite_journals, current_user.id)
         return journals
     except Exception as e:
         log_error(e, request_id=None, user_email=current_user.email)
@@ -116,7 +117,7 @@ async def get_journal(
     """Get a specific journal by ID."""
     journal_service = JournalService(session)
     try:
-        journal = journal_service.get_journal_by_id(journal_id, current_user.id)
+        journal = await run_in_db_threadpool(journal_service.get_journal_by_id, journal_id, current_user.id)
         if not journal:
             raise HTTPException(status_code=404, detail="Journal not found")
         return journal
@@ -147,7 +148,7 @@ async def update_journal(
     """Update a journal's name, description, or other properties."""
     journal_service = JournalService(session)
     try:
-        journal = journal_service.update_journal(journal_id, current_user.id, journal_data)
+        journal = await run_in_db_threadpool(journal_service.update_journal, journal_id, current_user.id, journal_data)
         log_user_action(current_user.email, f"updated journal {journal_id}", request_id=None)
         return journal
     except JournalNotFoundError:
@@ -206,7 +207,7 @@ async def toggle_favorite(
     """Toggle favorite status of a journal (on/off)."""
     journal_service = JournalService(session)
     try:
-        journal = journal_service.toggle_favorite(journal_id, current_user.id)
+        journal = await run_in_db_threadpool(journal_service.toggle_favorite, journal_id, current_user.id)
         log_user_action(current_user.email, f"toggled favorite for journal {journal_id}", request_id=None)
         return journal
     except JournalNotFoundError:
@@ -238,7 +239,7 @@ async def archive_journal(
     """
     journal_service = JournalService(session)
     try:
-        journal = journal_service.archive_journal(journal_id, current_user.id)
+        journal = await run_in_db_threadpool(journal_service.archive_journal, journal_id, current_user.id)
         log_user_action(current_user.email, f"archived journal {journal_id}", request_id=None)
         return journal
     except JournalNotFoundError:
@@ -266,7 +267,7 @@ async def unarchive_journal(
     """Unarchive a journal to restore it to active listings."""
     journal_service = JournalService(session)
     try:
-        journal = journal_service.unarchive_journal(journal_id, current_user.id)
+        journal = await run_in_db_threadpool(journal_service.unarchive_journal, journal_id, current_user.id)
         log_user_action(current_user.email, f"unarchived journal {journal_id}", request_id=None)
         return journal
     except JournalNotFoundError:
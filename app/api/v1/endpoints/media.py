@@ -1,26 +1,32 @@
 """
 Media upload and management endpoints.
 """
+import calendar
 import inspect
 import logging
 import uuid
-from pathlib import Path
 from typing import Annotated, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, BackgroundTasks, Header, Request
-from fastapi.responses import FileResponse, StreamingResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, status, UploadFile, File, Form, BackgroundTasks, Request
+from fastapi.responses import FileResponse, Response
 from sqlmodel import Session
 
 from app.api.dependencies import get_current_user
+from app.core.concurrency import run_in_db_threadpool
 from app.core import database as database_module
 from app.core.exceptions import (
     MediaNotFoundError,
     EntryNotFoundError,
     FileTooLargeError,
     InvalidFileTypeError,
-    FileValidationError
+    FileValidationError,
+    MediaEngineBusyError,
 )
+from app.core.file_response import MediaFileResponse, http_date, is_not_modified
 from app.core.logging_config import LogCategory
+from app.core.media_engine import get_media_engine
+from app.models.entry import EntryMedia
+from app.models.enums import RenditionSize, UploadStatus
 from app.models.user import User
 from app.schemas.entry import EntryMediaResponse
 from app.services import media_service as media_service_module
@@ -45,20 +51,52 @@ def _get_db_session():
         yield session_or_generator
 
 
-def _send_bytes_range_requests(file_path: Path, start: int, end: int):
-    """Generator function to send file bytes in range for streaming."""
-    with open(file_path, "rb") as f:
-        f.seek(start)
-        remaining = end - start + 1
-        while remaining:
-            chunk_size = min(8192, remaining)  # 8KB chunks
-            chunk = f.read(chunk_size)
-            if not chunk:
-                break
-            remaining -= len(chunk)
-            yield chunk
+# Originals never change once uploaded, so checksum-validated files can be
+# cached for a year without revalidation. Responses are per-user, so private.
+IMMUTABLE_MEDIA_CACHE_CONTROL = "private, max-age=31536000, immutable"
+MEDIA_CACHE_CONTROL = "private, max-age=3600"
+# Thumbnails may be regenerated by reprocessing, so they are revalidated daily.
+THUMBNAIL_CACHE_CONTROL = "private, max-age=86400"
 
 
+def _media_validator_headers(media: EntryMedia) -> dict:
+    """Cache headers for an original, derived from the stored checksum."""
+    headers = {"Last-Modified": http_date(media.created_at)}
+    if media.checksum:
+        headers["ETag"] = f'"{media.checksum}"'
+        headers["Cache-Control"] = IMMUTABLE_MEDIA_CACHE_CONTROL
+    else:
+        headers["Cache-Control"] = MEDIA_CACHE_CONTROL
+    return headers
+
+
+def _thumbnail_validator_headers(media: EntryMedia) -> dict:
+    """Cache headers for a thumbnail; reprocessing bumps updated_at and the tag."""
+    headers = {
+        "Last-Modified": http_date(media.updated_at),
+        "Cache-Control": THUMBNAIL_CACHE_CONTROL,
+    }
+    if media.checksum:
+        headers["ETag"] = f'"{media.checksum}-thumb-{calendar.timegm(media.updated_at.utctimetuple())}"'
+    return headers
+
+
+def _rendition_validator_headers(media: EntryMedia, size: RenditionSize, image_format: str) -> dict:
+    """Cache headers for a rendition; derived from the original, so as cacheable as it is."""
+    headers = _media_validator_headers(media)
+    if media.checksum:
+        headers["ETag"] = f'"{media.checksum}-{size.value}-{image_format}"'
+    # The format depends on what the client accepts
+    headers["Vary"] = "Accept"
+    return headers
+
+
+def _not_modified_response(request: Request, headers: dict, last_modified) -> Optional[Response]:
+    """Return a 304 response when the client's cached copy is still current."""
+    if is_not_modified(request.headers, headers.get("ETag"), last_modified):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return None
+
 
 @router.post(
     "/upload",
@@ -71,6 +109,7 @@ def _send_bytes_range_requests(file_path: Path, start: int, end: int):
         404: {"description": "Entry not found"},
         413: {"description": "File too large"},
         500: {"description": "Internal server error"},
+        503: {"description": "Media processing queue is full"},
     }
 )
 async def upload_media(
@@ -86,6 +125,14 @@ async def upload_media(
 
     Supports images, videos, and audio. Files are validated and processed in background.
     """
+    # Push back on upload bursts instead of queueing unbounded processing work
+    if not get_media_engine().has_capacity():
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Media processing is busy, please retry shortly",
+            headers={"Retry-After": "5"},
+        )
+
     media_service = _get_media_service()
 
     try:
@@ -100,8 +147,14 @@ async def upload_media(
         media_record = result["media_record"]
         full_file_path = result["full_file_path"]
 
-        # Queue background processing if we have a real media record
-        if media_record and hasattr(media_record, 'id') and full_file_path:
+        # Queue background processing if we have a real media record that
+        # did not reuse an already processed copy of the same file
+        if (
+            media_record
+            and hasattr(media_record, 'id')
+            and full_file_path
+            and media_record.upload_status != UploadStatus.COMPLETED
+        ):
             try:
                 processing_service = FileProcessingService(session)
                 background_tasks.add_task(
@@ -200,6 +253,7 @@ async def delete_media(
 @router.get(
     "/{media_id}",
     responses={
+        304: {"description": "Not modified"},
         401: {"description": "Not authenticated"},
         403: {"description": "Account inactive or forbidden"},
         404: {"description": "Media not found"},
@@ -208,48 +262,31 @@ async def delete_media(
 )
 async def get_media(
     media_id: uuid.UUID,
+    request: Request,
     current_user: Annotated[User, Depends(get_current_user)],
     session: Annotated[Session, Depends(_get_db_session)],
-    range_header: Optional[str] = Header(None, alias="range")
 ):
-    """Get media file by ID with proper Range request support for video streaming."""
+    """Get media file by ID with conditional request and Range, multi-range and If-Range support."""
     media_service = _get_media_service()
 
     try:
-        file_info = media_service.get_media_file_for_serving(
-            media_id, current_user.id, session, range_header
-        )
+        media = await run_in_db_threadpool(media_service.get_media_by_id, media_id, current_user.id, session)
 
-        # Handle Range request
-        if file_info["range_info"]:
-            range_info = file_info["range_info"]
-            headers = {
-                "Content-Range": f"bytes {range_info['start']}-{range_info['end']}/{file_info['file_size']}",
-                "Accept-Ranges": "bytes",
-                "Content-Length": str(range_info['length']),
-                "Cache-Control": "public, max-age=3600",
-            }
-
-            return StreamingResponse(
-                _send_bytes_range_requests(
-                    file_info["file_path"],
-                    range_info["start"],
-                    range_info["end"]
-                ),
-                status_code=status.HTTP_206_PARTIAL_CONTENT,
-                headers=headers,
-                media_type=file_info["content_type"],
-            )
+        # Answer revalidation from the stored checksum before touching the file
+        headers = _media_validator_headers(media)
+        not_modified = _not_modified_response(request, headers, media.created_at)
+        if not_modified is not None:
+            return not_modified
 
-        # Return full file
-        return FileResponse(
+        file_info = await run_in_db_threadpool(media_service.get_media_file_for_serving, media)
+
+        # The response answers Range requests itself
+        return MediaFileResponse(
             path=file_info["file_path"],
             media_type=file_info["content_type"],
             filename=file_info["filename"],
-            headers={
-                "Accept-Ranges": "bytes",
-                "Cache-Control": "public, max-age=3600",
-            },
+            stat_result=file_info["stat_result"],
+            headers=headers,
         )
 
     except MediaNotFoundError:
@@ -258,11 +295,6 @@ async def get_media(
             detail="Media not found"
         )
     except ValueError as e:
-        if "Range" in str(e):
-            raise HTTPException(
-                status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
-                detail=str(e)
-            )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
@@ -281,29 +313,71 @@ async def get_media(
 @router.get(
     "/{media_id}/thumbnail",
     responses={
+        304: {"description": "Not modified"},
         401: {"description": "Not authenticated"},
         403: {"description": "Account inactive or forbidden"},
         404: {"description": "Thumbnail not found"},
+        503: {"description": "Media processing queue is full"},
     }
 )
 async def get_media_thumbnail(
     media_id: uuid.UUID,
+    request: Request,
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(_get_db_session)]
+    session: Annotated[Session, Depends(_get_db_session)],
+    size: Optional[RenditionSize] = Query(
+        None,
+        description="Rendition size (small 150px, medium 300px, large 720px, xlarge 1440px); "
+                    "omit for the stored thumbnail",
+    ),
 ):
-    """Get media thumbnail by ID."""
+    """
+    Get media thumbnail by ID.
+
+    With `size`, returns a rendition of the image (or video frame) in AVIF or
+    WebP when the Accept header allows it, JPEG otherwise. Renditions are
+    generated on first request and cached.
+    """
     media_service = _get_media_service()
 
     try:
-        media = media_service.get_media_by_id(media_id, current_user.id, session)
-        thumbnail_path = media_service.get_media_thumbnail_path(media)
+        media = await run_in_db_threadpool(media_service.get_media_by_id, media_id, current_user.id, session)
+        if size is not None:
+            image_format = media_service.negotiate_rendition_format(request.headers.get("accept"))
+            headers = _rendition_validator_headers(media, size, image_format)
+            not_modified = _not_modified_response(request, headers, media.created_at)
+            if not_modified is not None:
+                return not_modified
+
+            rendition_path = await media_service.get_media_rendition_path(media, size, image_format)
+            return FileResponse(
+                rendition_path,
+                media_type=media_service.RENDITION_FORMATS[image_format]["mime_type"],
+                headers=headers,
+            )
+
+        if not media.thumbnail_path:
+            raise MediaNotFoundError("Thumbnail not found")
+
+        headers = _thumbnail_validator_headers(media)
+        not_modified = _not_modified_response(request, headers, media.updated_at)
+        if not_modified is not None:
+            return not_modified
 
-        return FileResponse(thumbnail_path)
+        thumbnail_path = await run_in_db_threadpool(media_service.get_media_thumbnail_path, media)
+
+        return FileResponse(thumbnail_path, headers=headers)
     except MediaNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Thumbnail not found"
         )
+    except MediaEngineBusyError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Media processing is busy, please retry shortly",
+            headers={"Retry-After": "5"},
+        )
     except HTTPException:
         raise
     except Exception as e:
@@ -334,8 +408,8 @@ async def get_media_info(
     media_service = _get_media_service()
 
     try:
-        media = media_service.get_media_by_id(media_id, current_user.id, session)
-        full_path = media_service.get_media_file_path(media)
+        media = await run_in_db_threadpool(media_service.get_media_by_id, media_id, current_user.id, session)
+        full_path = await run_in_db_threadpool(media_service.get_media_file_path, media)
 
         info = await media_service.get_media_info(str(full_path))
         return info
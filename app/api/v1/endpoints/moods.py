@@ -9,6 +9,7 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlmodel import Session
 
 from app.api.dependencies import get_current_user
+from app.core.concurrency import run_in_db_threadpool
 from app.core.database import get_session
 from app.core.exceptions import MoodNotFoundError, EntryNotFoundError
 from app.core.logging_config import log_error
@@ -45,9 +46,9 @@ async def get_all_moods(
     mood_service = MoodService(session)
     try:
         if category:
-            moods = mood_service.get_moods_by_category(category)
+            moods = await run_in_db_threadpool(mood_service.get_moods_by_category, category)
         else:
-            moods = mood_service.get_all_moods()
+            moods = await run_in_db_threadpool(mood_service.get_all_moods)
         return moods
     except Exception as e:
         log_error(e, request_id="", user_email=current_user.email)
@@ -82,7 +83,8 @@ async def get_user_mood_logs(
     """
     mood_service = MoodService(session)
     try:
-        mood_logs = mood_service.get_user_mood_logs(
+        mood_logs = await run_in_db_threadpool(
+            mood_service.get_user_mood_logs,
             current_user.id, limit, offset, mood_id, entry_id, start_date, end_date
         )
         return mood_logs
@@ -115,7 +117,7 @@ async def get_recent_moods(
     """
     mood_service = MoodService(session)
     try:
-        mood_logs = mood_service.get_recent_moods(current_user.id, limit)
+        mood_logs = await run_in_db_threadpool(mood_service.get_recent_moods, current_user.id, limit)
         return mood_logs
     except Exception as e:
         log_error(e, request_id="", user_email=current_user.email)
@@ -144,7 +146,7 @@ async def log_mood(
     """Log a mood for the current user."""
     mood_service = MoodService(session)
     try:
-        mood_log = mood_service.log_mood(current_user.id, mood_log_data)
+        mood_log = await run_in_db_threadpool(mood_service.log_mood, current_user.id, mood_log_data)
         return mood_log
     except MoodNotFoundError:
         raise HTTPException(
@@ -186,7 +188,7 @@ async def get_mood_log(
     """Get a specific mood log by ID."""
     mood_service = MoodService(session)
     try:
-        mood_log = mood_service.get_mood_log_by_id(mood_log_id, current_user.id)
+        mood_log = await run_in_db_threadpool(mood_service.get_mood_log_by_id, mood_log_id, current_user.id)
         if not mood_log:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -222,7 +224,7 @@ async def update_mood_log(
     """Update a mood log."""
     mood_service = MoodService(session)
     try:
-        mood_log = mood_service.update_mood_log(mood_log_id, current_user.id, mood_log_data)
+        mood_log = await run_in_db_threadpool(mood_service.update_mood_log, mood_log_id, current_user.id, mood_log_data)
         return mood_log
     except MoodNotFoundError:
         raise HTTPException(
@@ -259,7 +261,7 @@ async def delete_mood_log(
     """Delete a mood log."""
     mood_service = MoodService(session)
     try:
-        mood_service.delete_mood_log(mood_log_id, current_user.id)
+        await run_in_db_threadpool(mood_service.delete_mood_log, mood_log_id, current_user.id)
     except MoodNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -295,7 +297,7 @@ async def get_mood_statistics(
     """
     mood_service = MoodService(session)
     try:
-        statistics = mood_service.get_mood_statistics(current_user.id, start_date, end_date)
+        statistics = await run_in_db_threadpool(mood_service.get_mood_statistics, current_user.id, start_date, end_date)
         return statistics
     except Exception as e:
         log_error(e, request_id="", user_email=current_user.email)
@@ -324,7 +326,7 @@ async def get_mood_streak(
     """
     mood_service = MoodService(session)
     try:
-        streak = mood_service.get_mood_streak(current_user.id)
+        streak = await run_in_db_threadpool(mood_service.get_mood_streak, current_user.id)
         return streak
     except Exception as e:
         log_error(e, request_id="", user_email=current_user.email)
@@ -351,7 +353,7 @@ async def get_mood(
     """Get a specific mood by ID."""
     mood_service = MoodService(session)
     try:
-        mood = mood_service.get_mood_by_id(mood_id)
+        mood = await run_in_db_threadpool(mood_service.get_mood_by_id, mood_id)
         if not mood:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -10,6 +10,7 @@ from fastapi.responses import RedirectResponse
 from authlib.integrations.starlette_client import OAuthError
 from sqlmodel import Session, select
 
+from app.core.concurrency import run_in_db_threadpool
 from app.core.config import settings
 from app.core.database import get_session
 from app.core.oidc import oauth, build_pkce
@@ -192,7 +193,7 @@ async def oidc_callback(
     user_service = UserService(session)
 
     # Check if this is the first user (bootstrap override)
-    is_first = user_service.is_first_user()
+    is_first = await run_in_db_threadpool(user_service.is_first_user)
 
     # If not first user, check signup/auto-provision settings
     if not is_first and settings.disable_signup:
@@ -201,14 +202,14 @@ async def oidc_callback(
             ExternalIdentity.issuer == issuer,
             ExternalIdentity.subject == subject
         )
-        external_identity = session.exec(statement).first()
+        external_identity = await run_in_db_threadpool(lambda: session.exec(statement).first())
 
         # Check if a local user (admin-created) exists with the same email.
         # This allows existing users to log in/link SSO even if signup is disabled,
         # ensuring the admin's user management action is respected.
         local_user_by_email = None
         if email:
-            local_user_by_email = user_service.get_user_by_email(email)
+            local_user_by_email = await run_in_db_threadpool(user_service.get_user_by_email, email)
 
         # Block login ONLY if neither an external identity nor a local user exists.
         if not external_identity and not local_user_by_email:
@@ -224,7 +225,8 @@ async def oidc_callback(
         # First user always gets provisioned as admin (bootstrap override)
         # Otherwise, respect oidc_auto_provision setting
         # This function handles linking the ExternalIdentity to an existing local user if found.
-        user = user_service.get_or_create_user_from_oidc(
+        user = await run_in_db_threadpool(
+            user_service.get_or_create_user_from_oidc,
             issuer=issuer,
             subject=subject,
             email=email,
@@ -241,7 +243,7 @@ async def oidc_callback(
     refresh_token = create_refresh_token(data={"sub": str(user.id)})
 
     # Get user timezone
-    timezone = user_service.get_user_timezone(user.id)
+    timezone = await run_in_db_threadpool(user_service.get_user_timezone, user.id)
 
     # Build user payload with OIDC flag
     user_payload = {
@@ -8,6 +8,7 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlmodel import Session
 
 from app.api.dependencies import get_current_user
+from app.core.concurrency import run_in_db_threadpool
 from app.core.database import get_session
 from app.core.exceptions import PromptNotFoundError
 from app.core.logging_config import log_error
@@ -41,7 +42,7 @@ async def get_system_prompts(
     """
     prompt_service = PromptService(session)
     try:
-        prompts = prompt_service.get_system_prompts(category, difficulty_level, limit)
+        prompts = await run_in_db_threadpool(prompt_service.get_system_prompts, category, difficulty_level, limit)
         return prompts
     except Exception as e:
         log_error(e, request_id="", user_email=current_user.email)
@@ -73,7 +74,8 @@ async def get_random_prompt(
     """
     prompt_service = PromptService(session)
     try:
-        prompt = prompt_service.get_random_prompt(
+        prompt = await run_in_db_threadpool(
+            prompt_service.get_random_prompt,
             user_id=None, category=category, difficulty_level=difficulty_level
         )
         if not prompt:
@@ -112,7 +114,7 @@ async def get_daily_prompt(
     """
     prompt_service = PromptService(session)
     try:
-        prompt = prompt_service.get_daily_prompt(current_user.id)
+        prompt = await run_in_db_threadpool(prompt_service.get_daily_prompt, current_user.id)
         if not prompt:
             return Response(status_code=status.HTTP_204_NO_CONTENT)
         return prompt
@@ -145,7 +147,7 @@ async def search_prompts(
     """
     prompt_service = PromptService(session)
     try:
-        prompts = prompt_service.search_prompts(q, user_id=None)
+        prompts = await run_in_db_threadpool(prompt_service.search_prompts, q, user_id=None)
         return prompts
     except Exception as e:
         log_error(e, request_id="", user_email=current_user.email)
@@ -175,7 +177,7 @@ async def get_prompt_statistics(
     """
     prompt_service = PromptService(session)
     try:
-        statistics = prompt_service.get_prompt_statistics(current_user.id)
+        statistics = await run_in_db_threadpool(prompt_service.get_prompt_statistics, current_user.id)
         return statistics
     except Exception as e:
         log_error(e, request_id="", user_email=current_user.email)
@@ -202,7 +204,7 @@ async def get_prompt(
     """Get a specific prompt by ID."""
     prompt_service = PromptService(session)
     try:
-        prompt = prompt_service.get_prompt_by_id(prompt_id)
+        prompt = await run_in_db_threadpool(prompt_service.get_prompt_by_id, prompt_id)
         if not prompt:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
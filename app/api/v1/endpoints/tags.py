@@ -4,13 +4,15 @@ Tag endpoints.
 import uuid
 from typing import Annotated, List, Optional, Dict, Any
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
 from sqlmodel import Session
 
-from app.api.dependencies import get_current_user, get_plus_factory
+from app.api.dependencies import get_current_user, get_plus_factory, get_read_session
+from app.core.concurrency import run_in_db_threadpool
 from app.core.database import get_session
-from app.core.exceptions import TagNotFoundError
+from app.core.exceptions import TagNotFoundError, ValidationError
 from app.core.logging_config import log_error
+from app.core.pagination import decode_entry_cursor, set_next_cursor_header
 from app.models.user import User
 from app.schemas.entry import EntryPreviewResponse
 from app.schemas.tag import TagCreate, TagUpdate, TagResponse, EntryTagLinkResponse, TagAnalyticsResponse, TagDetailAnalyticsResponse
@@ -38,7 +40,7 @@ async def create_tag(
     """Create a new tag."""
     tag_service = TagService(session)
     try:
-        tag = tag_service.create_tag(current_user.id, tag_data)
+        tag = await run_in_db_threadpool(tag_service.create_tag, current_user.id, tag_data)
         return tag
     except ValueError as e:
         raise HTTPException(
@@ -74,7 +76,7 @@ async def get_user_tags(
     Supports pagination and optional search filtering.
     """
     tag_service = TagService(session)
-    tags = tag_service.get_user_tags(current_user.id, limit, offset, search)
+    tags = await run_in_db_threadpool(tag_service.get_user_tags, current_user.id, limit, offset, search)
     return tags
 
 
@@ -88,7 +90,7 @@ async def get_user_tags(
 )
 async def get_popular_tags(
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[Session, Depends(get_read_session)],
     limit: int = Query(20, ge=1, le=50)
 ):
     """
@@ -97,7 +99,7 @@ async def get_popular_tags(
     Returns tags ordered by usage count (descending).
     """
     tag_service = TagService(session)
-    tags = tag_service.get_popular_tags(current_user.id, limit)
+    tags = await run_in_db_threadpool(tag_service.get_popular_tags, current_user.id, limit)
     return tags
 
 
@@ -117,7 +119,7 @@ async def search_tags(
 ):
     """Search tags by name."""
     tag_service = TagService(session)
-    tags = tag_service.search_tags(current_user.id, q, limit)
+    tags = await run_in_db_threadpool(tag_service.search_tags, current_user.id, q, limit)
     return tags
 
 
@@ -135,7 +137,7 @@ async def search_tags(
 )
 async def get_tag_analytics(
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[Session, Depends(get_read_session)],
     plus_factory=Depends(get_plus_factory)
 ):
     """
@@ -148,7 +150,7 @@ async def get_tag_analytics(
     """
     try:
         tag_service = TagService(session)
-        analytics = tag_service.get_tag_analytics(current_user.id, plus_factory)
+        analytics = await run_in_db_threadpool(tag_service.get_tag_analytics, current_user.id, plus_factory)
         return analytics
 
     except PermissionError as e:
@@ -196,7 +198,7 @@ async def get_tag_analytics(
 async def get_tag_detail_analytics(
     tag_id: uuid.UUID,
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[Session, Depends(get_read_session)],
     plus_factory=Depends(get_plus_factory),
     days: int = Query(365, ge=1, le=3650, description="Number of days to analyze")
 ):
@@ -210,7 +212,8 @@ async def get_tag_detail_analytics(
     """
     try:
         tag_service = TagService(session)
-        analytics = tag_service.get_tag_detail_analytics(
+        analytics = await run_in_db_threadpool(
+            tag_service.get_tag_detail_analytics,
             tag_id=tag_id,
             user_id=current_user.id,
             plus_factory=plus_factory,
@@ -270,7 +273,7 @@ async def get_tag(
     """Get a specific tag by ID."""
     tag_service = TagService(session)
     try:
-        tag = tag_service.get_tag_by_id(tag_id, current_user.id)
+        tag = await run_in_db_threadpool(tag_service.get_tag_by_id, tag_id, current_user.id)
         if not tag:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -312,7 +315,7 @@ async def update_tag(
     """Update a tag."""
     tag_service = TagService(session)
     try:
-        tag = tag_service.update_tag(tag_id, current_user.id, tag_data)
+        tag = await run_in_db_threadpool(tag_service.update_tag, tag_id, current_user.id, tag_data)
         return tag
     except TagNotFoundError:
         raise HTTPException(
@@ -350,7 +353,7 @@ async def delete_tag(
     """Delete a tag."""
     tag_service = TagService(session)
     try:
-        tag_service.delete_tag(tag_id, current_user.id)
+        await run_in_db_threadpool(tag_service.delete_tag, tag_id, current_user.id)
     except TagNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -397,7 +400,7 @@ async def merge_tags(
                 detail="Cannot merge tag into itself"
             )
 
-        merged_tag = tag_service.merge_tags(source_id, target_id, current_user.id)
+        merged_tag = await run_in_db_threadpool(tag_service.merge_tags, source_id, target_id, current_user.id)
         return merged_tag
     except TagNotFoundError as e:
         raise HTTPException(
@@ -442,7 +445,7 @@ async def add_tag_to_entry(
     """Add a tag to an entry."""
     tag_service = TagService(session)
     try:
-        link = tag_service.add_tag_to_entry(entry_id, tag_id, current_user.id)
+        link = await run_in_db_threadpool(tag_service.add_tag_to_entry, entry_id, tag_id, current_user.id)
         return link
     except TagNotFoundError:
         raise HTTPException(
@@ -481,7 +484,7 @@ async def remove_tag_from_entry(
     """Remove a tag from an entry."""
     tag_service = TagService(session)
     try:
-        tag_service.remove_tag_from_entry(entry_id, tag_id, current_user.id)
+        await run_in_db_threadpool(tag_service.remove_tag_from_entry, entry_id, tag_id, current_user.id)
     except TagNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -517,7 +520,7 @@ async def get_entry_tags(
     """Get all tags for an entry."""
     tag_service = TagService(session)
     try:
-        tags = tag_service.get_entry_tags(entry_id, current_user.id)
+        tags = await run_in_db_threadpool(tag_service.get_entry_tags, entry_id, current_user.id)
         return tags
     except ValueError as e:
         raise HTTPException(
@@ -562,7 +565,7 @@ async def bulk_add_tags_to_entry(
 
     tag_service = TagService(session)
     try:
-        tags = tag_service.bulk_add_tags_to_entry(entry_id, tag_names, current_user.id)
+        tags = await run_in_db_threadpool(tag_service.bulk_add_tags_to_entry, entry_id, tag_names, current_user.id)
         return tags
     except ValueError as e:
         raise HTTPException(
@@ -581,6 +584,7 @@ async def bulk_add_tags_to_entry(
     "/{tag_id}/entries",
     response_model=List[EntryPreviewResponse],
     responses={
+        400: {"description": "Invalid pagination cursor"},
         401: {"description": "Not authenticated"},
         403: {"description": "Account inactive"},
         404: {"description": "Tag not found"},
@@ -588,19 +592,26 @@ async def bulk_add_tags_to_entry(
 )
 async def get_entries_by_tag(
     tag_id: uuid.UUID,
+    response: Response,
     current_user: Annotated[User, Depends(get_current_user)],
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[Session, Depends(get_read_session)],
     limit: int = Query(50, ge=1, le=100),
-    offset: int = Query(0, ge=0)
+    offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the X-Next-Cursor header; overrides offset")
 ):
     """
     Get entries that have a specific tag.
 
     Returns entry previews with truncated content.
+    Full pages return an X-Next-Cursor header for cursor pagination.
     """
     tag_service = TagService(session)
     try:
-        entries = tag_service.get_entries_by_tag(tag_id, current_user.id, limit, offset)
+        entries = await run_in_db_threadpool(
+            tag_service.get_entries_by_tag,
+            tag_id, current_user.id, limit, offset, cursor=decode_entry_cursor(cursor)
+        )
+        set_next_cursor_header(response, entries, limit)
         # Truncate content for preview
         return [
             EntryPreviewResponse(
@@ -620,3 +631,8 @@ async def get_entries_by_tag(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Tag not found"
         )
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
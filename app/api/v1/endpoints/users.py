@@ -8,6 +8,7 @@ from pydantic import BaseModel
 from sqlmodel import Session
 
 from app.api.dependencies import get_current_user
+from app.core.concurrency import run_in_db_threadpool
 from app.core.database import get_session
 from app.core.logging_config import log_user_action, log_error
 from app.models.user import User
@@ -40,10 +41,10 @@ async def get_current_user_info(
     Returns complete user information including account status and timestamps.
     """
     user_service = UserService(session)
-    timezone = user_service.get_user_timezone(current_user.id)
+    timezone = await run_in_db_threadpool(user_service.get_user_timezone, current_user.id)
 
     # Check if user is OIDC user using service method
-    is_oidc_user = user_service.is_oidc_user(str(current_user.id))
+    is_oidc_user = await run_in_db_threadpool(user_service.is_oidc_user, str(current_user.id))
 
     # Create response with timezone from settings
     user_dict = current_user.model_dump(mode='json')
@@ -89,7 +90,7 @@ async def update_current_user(
     user_service = UserService(session)
 
     try:
-        updated_user = user_service.update_user(str(current_user.id), user_update)
+        updated_user = await run_in_db_threadpool(user_service.update_user, str(current_user.id), user_update)
     except ValueError as e:
         # Handle password verification errors
         log_user_action(current_user.email, f"User update failed: {str(e)}", request_id="")
@@ -108,10 +109,10 @@ async def update_current_user(
     log_user_action(current_user.email, "Updated user", request_id="")
 
     # Get timezone from settings
-    timezone = user_service.get_user_timezone(updated_user.id)
+    timezone = await run_in_db_threadpool(user_service.get_user_timezone, updated_user.id)
 
     # Check if user is OIDC user using service method
-    is_oidc_user = user_service.is_oidc_user(str(updated_user.id))
+    is_oidc_user = await run_in_db_threadpool(user_service.is_oidc_user, str(updated_user.id))
 
     user_dict = updated_user.model_dump(mode='json')
     user_dict['time_zone'] = timezone
@@ -144,7 +145,7 @@ async def delete_current_user(
 
     try:
         # Bypass admin check for self-deletion
-        success = user_service.delete_user(str(current_user.id), bypass_admin_check=True)
+        success = await run_in_db_threadpool(user_service.delete_user, str(current_user.id), bypass_admin_check=True)
 
         if not success:
             raise HTTPException(
@@ -184,7 +185,7 @@ async def get_current_user_settings(
     user_service = UserService(session)
 
     try:
-        settings = user_service.get_user_settings(str(current_user.id))
+        settings = await run_in_db_threadpool(user_service.get_user_settings, str(current_user.id))
         return UserSettingsResponse.model_validate(settings)
     except Exception as e:
         log_error(e, request_id="", user_email=current_user.email)
@@ -218,7 +219,7 @@ async def update_current_user_settings(
     user_service = UserService(session)
 
     try:
-        updated_settings = user_service.update_user_settings(str(current_user.id), settings_update)
+        updated_settings = await run_in_db_threadpool(user_service.update_user_settings, str(current_user.id), settings_update)
         log_user_action(current_user.email, "Updated settings", request_id="")
         return UserSettingsResponse.model_validate(updated_settings)
     except ValueError as e:
@@ -0,0 +1,131 @@
+"""
+Analytics dashboard cache.
+
+Caches the computed dashboard per user and period. Every key embeds a per-user
+version stamp, so writes that affect analytics only need to replace the stamp
+to make all of the user's cached dashboards unreachable at once.
+
+Uses Redis when available (production), falls back to in-memory cache (dev).
+"""
+import logging
+import threading
+import uuid
+from datetime import date
+from typing import Any, Dict, Optional
+
+from app.core.scoped_cache import ScopedCache
+from app.core.config import ANALYTICS_CACHE_TTL
+from app.core.logging_config import LogCategory
+
+logger = logging.getLogger(LogCategory.APP)
+
+
+class AnalyticsCache(ScopedCache):
+    """
+    Cache wrapper for analytics dashboards.
+
+    Keys are scoped by user id; the cache type carries the requested period,
+    the UTC day the dashboard was computed for and the user's version stamp.
+    """
+
+    def __init__(self, cache_backend=None):
+        """
+        Initialize analytics cache.
+
+        Args:
+            cache_backend: Optional cache backend (for testing).
+                          If None, creates cache from settings.
+        """
+        super().__init__("analytics", cache_backend=cache_backend, log=logger)
+        logger.debug("AnalyticsCache initialized")
+
+    def get_version(self, user_id: str) -> str:
+        """
+        Get the user's current version stamp, creating one if missing.
+
+        A missing stamp is replaced with a fresh one rather than a fixed
+        default, so an evicted stamp can never resurrect stale entries.
+        """
+        cached = self.get(user_id, "version")
+        if cached and cached.get("stamp"):
+            return cached["stamp"]
+        return self._new_version(user_id)
+
+    def _new_version(self, user_id: str) -> str:
+        stamp = uuid.uuid4().hex
+        self.set(user_id, "version", {"stamp": stamp}, None)
+        return stamp
+
+    @staticmethod
+    def _dashboard_type(days: int, today: date, version: str) -> str:
+        return f"dashboard-{days}-{today.isoformat()}-{version}"
+
+    def get_dashboard(self, user_id: str, days: int, today: date, version: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached dashboard.
+
+        Args:
+            user_id: User UUID
+            days: Writing pattern period in days
+            today: UTC day the dashboard is computed for
+            version: User's current version stamp
+
+        Returns:
+            Dashboard dict or None if not cached
+        """
+        cached = self.get(user_id, self._dashboard_type(days, today, version))
+
+        if cached is not None:
+            logger.debug(f"Analytics dashboard cache HIT for user={user_id} days={days}")
+            return cached
+
+        logger.debug(f"Analytics dashboard cache MISS for user={user_id} days={days}")
+        return None
+
+    def set_dashboard(self, user_id: str, days: int, today: date, version: str, dashboard: Dict[str, Any]) -> None:
+        """
+        Cache a computed dashboard under the version stamp it was read with.
+
+        Args:
+            user_id: User UUID
+            days: Writing pattern period in days
+            today: UTC day the dashboard was computed for
+            version: Version stamp read before computing the dashboard
+            dashboard: JSON-serializable dashboard dict
+        """
+        self.set(user_id, self._dashboard_type(days, today, version), dashboard, ANALYTICS_CACHE_TTL)
+
+    def invalidate(self, user_id: str) -> None:
+        """
+        Invalidate all cached dashboards for a user.
+
+        Call after committing any write that changes entries, moods, tags or
+        journals; dashboards cached under the previous stamp expire on their own.
+
+        Args:
+            user_id: User UUID
+        """
+        self._new_version(user_id)
+        logger.debug(f"Invalidated analytics cache for user={user_id}")
+
+
+# Global analytics cache instance
+_analytics_cache: Optional[AnalyticsCache] = None
+_analytics_cache_lock = threading.Lock()
+
+
+def get_analytics_cache() -> AnalyticsCache:
+    """
+    Get or create the global analytics cache instance.
+
+    Returns:
+        AnalyticsCache singleton instance
+    """
+    global _analytics_cache
+
+    if _analytics_cache is None:
+        with _analytics_cache_lock:
+            if _analytics_cache is None:
+                _analytics_cache = AnalyticsCache()
+
+    return _analytics_cache
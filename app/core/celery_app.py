@@ -12,8 +12,10 @@ celery_app = Celery(
     include=[
         "app.tasks.import_tasks",
         "app.tasks.export_tasks",
+        "app.tasks.media_tasks",
         "app.tasks.version_check",
         "app.tasks.license_refresh",
+        "app.tasks.analytics_tasks",
     ],
 )
 
@@ -0,0 +1,172 @@
+"""
+Bounded threadpool dispatch for blocking database work.
+
+Route handlers are async, but SQLModel sessions and the service layer are
+synchronous. Blocking service calls are dispatched through
+run_in_db_threadpool() so a slow query occupies one worker thread instead of
+stalling every request on the event loop. The pool is bounded by
+DB_THREADPOOL_SIZE and every dispatch is attributed to the current route so
+per-route concurrency can be inspected via the /concurrency health endpoint.
+"""
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+import anyio
+import anyio.to_thread
+from fastapi import Request
+
+from app.core.config import settings
+
+T = TypeVar("T")
+
+UNROUTED_LABEL = "unrouted"
+
+# Route label of the request being handled (set by track_route_concurrency)
+_current_route: ContextVar[str] = ContextVar("db_dispatch_route", default=UNROUTED_LABEL)
+
+_limiter: Optional[anyio.CapacityLimiter] = None
+_limiter_lock = threading.Lock()
+
+
+@dataclass
+class RouteConcurrencyStats:
+    """Counters for a single route."""
+
+    requests: int = 0
+    in_flight: int = 0
+    peak_in_flight: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    db_calls: int = 0
+    db_wait_seconds: float = 0.0
+    db_max_wait_seconds: float = 0.0
+    db_run_seconds: float = 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return a JSON-serializable view of the counters."""
+        return {
+            "requests": self.requests,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "avg_ms": round(self.total_seconds / self.requests * 1000, 2) if self.requests else 0.0,
+            "max_ms": round(self.max_seconds * 1000, 2),
+            "db_calls": self.db_calls,
+            "db_avg_wait_ms": round(self.db_wait_seconds / self.db_calls * 1000, 2) if self.db_calls else 0.0,
+            "db_max_wait_ms": round(self.db_max_wait_seconds * 1000, 2),
+            "db_avg_run_ms": round(self.db_run_seconds / self.db_calls * 1000, 2) if self.db_calls else 0.0,
+        }
+
+
+class RouteConcurrencyRegistry:
+    """Thread-safe registry of per-route concurrency counters."""
+
+    def __init__(self):
+        self._stats: Dict[str, RouteConcurrencyStats] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, route: str) -> RouteConcurrencyStats:
+        stats = self._stats.get(route)
+        if stats is None:
+            stats = self._stats[route] = RouteConcurrencyStats()
+        return stats
+
+    def request_started(self, route: str) -> None:
+        with self._lock:
+            stats = self._get(route)
+            stats.in_flight += 1
+            stats.peak_in_flight = max(stats.peak_in_flight, stats.in_flight)
+
+    def request_finished(self, route: str, elapsed: float) -> None:
+        with self._lock:
+            stats = self._get(route)
+            stats.in_flight = max(0, stats.in_flight - 1)
+            stats.requests += 1
+            stats.total_seconds += elapsed
+            stats.max_seconds = max(stats.max_seconds, elapsed)
+
+    def db_call_finished(self, route: str, wait: float, run: float) -> None:
+        with self._lock:
+            stats = self._get(route)
+            stats.db_calls += 1
+            stats.db_wait_seconds += wait
+            stats.db_max_wait_seconds = max(stats.db_max_wait_seconds, wait)
+            stats.db_run_seconds += run
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {route: stats.snapshot() for route, stats in sorted(self._stats.items())}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+route_concurrency = RouteConcurrencyRegistry()
+
+
+def get_db_limiter() -> anyio.CapacityLimiter:
+    """Get or create the capacity limiter bounding the database threadpool."""
+    global _limiter
+
+    if _limiter is None:
+        with _limiter_lock:
+            if _limiter is None:
+                _limiter = anyio.CapacityLimiter(settings.db_threadpool_size)
+    return _limiter
+
+
+async def run_in_db_threadpool(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run a blocking (database-bound) callable in the dedicated threadpool.
+
+    Context variables (request id, current route) propagate into the worker
+    thread. Time spent waiting for a free thread and time spent running are
+    recorded against the current route.
+    """
+    route = _current_route.get()
+    queued_at = time.perf_counter()
+    started_at: Optional[float] = None
+
+    def _call() -> T:
+        nonlocal started_at
+        started_at = time.perf_counter()
+        return func(*args, **kwargs)
+
+    try:
+        return await anyio.to_thread.run_sync(_call, limiter=get_db_limiter())
+    finally:
+        finished_at = time.perf_counter()
+        began = started_at if started_at is not None else finished_at
+        route_concurrency.db_call_finished(route, began - queued_at, finished_at - began)
+
+
+async def track_route_concurrency(request: Request):
+    """
+    Router dependency recording in-flight requests and latency per route.
+
+    Labels use the route template (e.g. "GET /entries/{entry_id}") so path
+    parameters do not fan out into separate series.
+    """
+    route = request.scope.get("route")
+    label = f"{request.method} {getattr(route, 'path', request.url.path)}"
+    _current_route.set(label)
+    route_concurrency.request_started(label)
+    started_at = time.perf_counter()
+    try:
+        yield
+    finally:
+        route_concurrency.request_finished(label, time.perf_counter() - started_at)
+
+
+def get_threadpool_stats() -> Dict[str, Any]:
+    """Return occupancy of the database threadpool."""
+    limiter = get_db_limiter()
+    statistics = limiter.statistics()
+    return {
+        "size": int(limiter.total_tokens),
+        "in_use": statistics.borrowed_tokens,
+        "waiting": statistics.tasks_waiting,
+    }
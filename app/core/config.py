@@ -63,6 +63,25 @@ class Settings(BaseSettings):
     postgres_host: Optional[str] = None
     postgres_port: Optional[int] = None
 
+    # Maximum worker threads running blocking database work for async routes
+    db_threadpool_size: int = 40
+
+    # PostgreSQL connection pool, per worker process: up to DB_POOL_SIZE +
+    # DB_MAX_OVERFLOW connections, so workers x that must stay below the
+    # server's max_connections. Checkouts wait at most DB_POOL_TIMEOUT seconds
+    # and those slower than DB_POOL_SLOW_CHECKOUT_MS are logged.
+    db_pool_size: int = 5
+    db_max_overflow: int = 3
+    db_pool_timeout: float = 30.0
+    db_pool_recycle: int = 3600
+    db_pool_slow_checkout_ms: float = 500.0
+
+    # Read replicas of the PostgreSQL primary (comma-separated URLs). Heavy
+    # read-only routes are spread over them; a user's reads stay on the primary
+    # for DB_REPLICA_STICKY_SECONDS after their own writes, which must exceed
+    # the usual replication lag.
+    database_replica_urls: Optional[List[str]] = None
+    db_replica_sticky_seconds: int = 10
 
     # Security
     secret_key: str = ""  # Must be set via environment variable
@@ -116,6 +135,11 @@ class Settings(BaseSettings):
     ffprobe_timeout: int = 300  # 5 minutes for video metadata extraction
     ffmpeg_timeout: int = 300   # 5 minutes for video thumbnail generation
 
+    # Media processing engine (thumbnails, metadata) - worker processes, 0 runs inline
+    media_engine_workers: int = 2
+    # Jobs waiting for a worker before uploads are turned away with 503
+    media_engine_queue_size: int = 64
+
 
     # Application configuration
     app_port: int = 8000
@@ -582,6 +606,73 @@ class Settings(BaseSettings):
             raise ValueError("Timeout cannot exceed 3600 seconds (1 hour)")
         return v
 
+    @field_validator('db_threadpool_size')
+    @classmethod
+    def validate_db_threadpool_size(cls, v: int) -> int:
+        """Validate the database threadpool size is positive."""
+        if v <= 0:
+            raise ValueError("DB_THREADPOOL_SIZE must be positive")
+        return v
+
+    @field_validator('db_pool_size', 'db_pool_timeout', 'db_pool_recycle', 'db_pool_slow_checkout_ms')
+    @classmethod
+    def validate_db_pool_positive(cls, v: float, info: ValidationInfo) -> float:
+        """Validate the database pool size and timings are positive."""
+        if v <= 0:
+            raise ValueError(f"{info.field_name.upper()} must be positive")
+        return v
+
+    @field_validator('database_replica_urls', mode='before')
+    @classmethod
+    def parse_database_replica_urls(cls, v):
+        """Parse read replica URLs from a comma-separated string or list."""
+        if v is None:
+            return []
+        if isinstance(v, str):
+            return [url.strip() for url in v.split(',') if url.strip()]
+        return v
+
+    @field_validator('database_replica_urls')
+    @classmethod
+    def validate_database_replica_urls(cls, v: Optional[List[str]]) -> List[str]:
+        """Validate read replica URLs are PostgreSQL URLs."""
+        v = v or []
+        if any(not cls._is_postgres_url(url) for url in v):
+            raise ValueError("DATABASE_REPLICA_URLS must only contain PostgreSQL URLs")
+        return v
+
+    @field_validator('db_replica_sticky_seconds')
+    @classmethod
+    def validate_db_replica_sticky_seconds(cls, v: int) -> int:
+        """Validate the read-your-writes window is positive."""
+        if v <= 0:
+            raise ValueError("DB_REPLICA_STICKY_SECONDS must be positive")
+        return v
+
+    @field_validator('db_max_overflow')
+    @classmethod
+    def validate_db_max_overflow(cls, v: int) -> int:
+        """Validate the database pool overflow is not negative."""
+        if v < 0:
+            raise ValueError("DB_MAX_OVERFLOW cannot be negative")
+        return v
+
+    @field_validator('media_engine_workers')
+    @classmethod
+    def validate_media_engine_workers(cls, v: int) -> int:
+        """Validate the media engine worker count is not negative."""
+        if v < 0:
+            raise ValueError("MEDIA_ENGINE_WORKERS cannot be negative")
+        return v
+
+    @field_validator('media_engine_queue_size')
+    @classmethod
+    def validate_media_engine_queue_size(cls, v: int) -> int:
+        """Validate the media engine queue size is positive."""
+        if v <= 0:
+            raise ValueError("MEDIA_ENGINE_QUEUE_SIZE must be positive")
+        return v
+
     @field_validator('celery_broker_url', 'celery_result_backend')
     @classmethod
     def validate_celery_urls(cls, v: Optional[str], info: ValidationInfo) -> Optional[str]:
@@ -624,6 +715,9 @@ class Settings(BaseSettings):
 
         Runs before validate_production_settings to ensure DB_DRIVER is properly configured.
         """
+        if self.database_replica_urls and self.db_driver != "postgres":
+            raise ValueError("DATABASE_REPLICA_URLS requires DB_DRIVER=postgres")
+
         if self.db_driver != "postgres":
             return self
 
@@ -799,6 +893,29 @@ LICENSE_REFRESH_INTERVAL_HOURS = 1
 # Cache TTL: 8 hours (28800 seconds)
 LICENSE_CACHE_TTL = 28800
 
+# Analytics dashboard cache constants
+# Entries are invalidated on write through a per-user version stamp; the TTL
+# only bounds how long unreachable (superseded) entries linger.
+ANALYTICS_CACHE_TTL = 3600
+
+# Authenticated principal cache constants
+# Users are invalidated on update and delete; the TTLs bound how long another
+# worker process can keep serving a stale copy. The in-process tier holds at
+# most PRINCIPAL_CACHE_SIZE users and expires sooner than the shared (Redis) tier.
+PRINCIPAL_CACHE_TTL = 60
+PRINCIPAL_LOCAL_CACHE_TTL = 15
+PRINCIPAL_CACHE_SIZE = 1024
+
+# User settings cache constants
+# Entries are invalidated when settings change; the TTL bounds how long another
+# worker without a shared (Redis) cache can keep reading the previous settings.
+USER_SETTINGS_CACHE_TTL = 300
+
+# Reference data cache constants
+# System moods and prompts are invalidated by version stamp on every write;
+# the TTL only bounds how long superseded listings and prompt usage counts live.
+REFERENCE_CACHE_TTL = 3600
+
 
 def get_settings() -> Settings:
     """Get settings instance."""
@@ -5,14 +5,17 @@ Supports SQLite (default) and PostgreSQL (optional override).
 import json
 import logging
 from pathlib import Path
+from typing import Optional
 
 from sqlalchemy import event
 from sqlalchemy.engine import make_url
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy.exc import IntegrityError, OperationalError
 from sqlalchemy.pool import StaticPool
 from sqlmodel import SQLModel, create_engine, Session, select
 
 from app.core.config import settings, PROJECT_ROOT
+from app.core.db_pool import InstrumentedQueuePool, instrument_engine
+from app.core.db_routing import ReplicaRouter
 
 logger = logging.getLogger(__name__)
 
@@ -35,7 +38,8 @@ if database_type == "sqlite":
     engine_kwargs = {
         "echo": False,
         "connect_args": {"check_same_thread": False},
-        "poolclass": StaticPool if is_sqlite_memory else None,
+        # File databases keep SQLAlchemy's default pool sizing, instrumented
+        "poolclass": StaticPool if is_sqlite_memory else InstrumentedQueuePool,
     }
 
     engine = create_engine(database_url, **engine_kwargs)
@@ -57,14 +61,19 @@ elif database_type in {"postgres", "postgresql"}:
     # PostgreSQL-specific optimizations
     engine_kwargs = {
         "echo": False,
+        "poolclass": InstrumentedQueuePool,
         "pool_pre_ping": True,
-        "pool_size": 5,
-        "max_overflow": 3,
-        "pool_recycle": 3600,  # Recycle connections every hour
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
     }
 
     engine = create_engine(database_url, **engine_kwargs)
-    logger.info("Configured PostgreSQL engine with connection pooling")
+    logger.info(
+        f"Configured PostgreSQL engine with connection pooling "
+        f"(size={settings.db_pool_size}, max_overflow={settings.db_max_overflow})"
+    )
 
 else:
     # Fallback for other database types
@@ -78,6 +87,36 @@ else:
         "Install the appropriate DB driver for production use."
     )
 
+instrument_engine(engine)
+
+# Read replicas share the primary's pool settings (validated as PostgreSQL)
+replica_engines = [create_engine(url, **engine_kwargs) for url in settings.database_replica_urls or []]
+for replica_engine in replica_engines:
+    instrument_engine(replica_engine)
+replica_router = ReplicaRouter(replica_engines)
+
+if replica_router.enabled:
+    logger.info(f"Routing read-only queries over {len(replica_engines)} read replica(s)")
+
+    @event.listens_for(Session, "after_flush")
+    def _note_flushed_writes(session, flush_context):
+        session.info["has_writes"] = True
+
+    @event.listens_for(Session, "do_orm_execute")
+    def _note_bulk_writes(orm_execute_state):
+        if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+            orm_execute_state.session.info["has_writes"] = True
+
+    @event.listens_for(Session, "after_commit")
+    def _record_user_write(session):
+        # user_id is set on request sessions by get_current_user
+        if session.info.pop("has_writes", False) and session.info.get("user_id"):
+            replica_router.record_write(session.info["user_id"])
+
+    @event.listens_for(Session, "after_rollback")
+    def _forget_rolled_back_writes(session):
+        session.info.pop("has_writes", None)
+
 
 def create_db_and_tables():
     """Create database tables using Alembic migrations."""
@@ -137,6 +176,36 @@ def get_session_context():
     return Session(engine)
 
 
+def get_read_session_context(user_id: Optional[str] = None) -> Session:
+    """
+    Get a session for read-only work, on a read replica when configured.
+
+    The session is on the primary when there are no replicas, when the user
+    wrote within DB_REPLICA_STICKY_SECONDS, or when the chosen replica cannot
+    be reached. Nothing may be written through it.
+
+    Args:
+        user_id: User the reads are for, so their own writes are visible
+
+    Example:
+        with get_read_session_context(str(user_id)) as session:
+            # read-only queries
+            pass
+    """
+    replica = replica_router.choose(user_id)
+    if replica is None:
+        return Session(engine)
+
+    session = Session(replica)
+    try:
+        session.connection()
+    except OperationalError:
+        session.close()
+        replica_router.mark_down(replica)
+        return Session(engine)
+    return session
+
+
 def seed_initial_data():
     """Seed initial data if database is empty."""
     import os
@@ -179,12 +248,12 @@ def seed_initial_data():
             logger.error(e)
             # Don't raise the exception - seeding is not critical for app startup
 
-def _seed_data_from_json(session: Session, model: type[SQLModel], file_path: Path, unique_field: str):
-    """Generic function to seed data from a JSON file."""
+def _seed_data_from_json(session: Session, model: type[SQLModel], file_path: Path, unique_field: str) -> bool:
+    """Generic function to seed data from a JSON file. Returns whether new rows were committed."""
     try:
         if not file_path.exists():
             logger.warning(f"Seed file not found: {file_path}")
-            return
+            return False
 
         with open(file_path, 'r', encoding='utf-8') as f:
             data_to_seed = json.load(f)
@@ -202,24 +271,30 @@ def _seed_data_from_json(session: Session, model: type[SQLModel], file_path: Pat
         if new_items_count > 0:
             session.commit()
             logger.info(f"Seeded {new_items_count} new {model.__tablename__} successfully.")
-        else:
-            logger.info(f"All {model.__tablename__} already exist, no new items seeded.")
+            return True
+        logger.info(f"All {model.__tablename__} already exist, no new items seeded.")
+        return False
 
     except Exception as e:
         logger.error(e)
         session.rollback()
+        return False
 
 
 def seed_moods(session: Session):
     """Seed moods from JSON file."""
+    from app.core.reference_cache import REFERENCE_MOODS, get_reference_cache
     from app.models.mood import Mood
-    _seed_data_from_json(session, Mood, PROJECT_ROOT / "scripts/moods.json", "name")
+    if _seed_data_from_json(session, Mood, PROJECT_ROOT / "scripts/moods.json", "name"):
+        get_reference_cache().invalidate(REFERENCE_MOODS)
 
 
 def seed_prompts(session: Session):
     """Seed prompts from JSON file."""
+    from app.core.reference_cache import REFERENCE_PROMPTS, get_reference_cache
     from app.models.prompt import Prompt
-    _seed_data_from_json(session, Prompt, PROJECT_ROOT / "scripts/prompts.json", "text")
+    if _seed_data_from_json(session, Prompt, PROJECT_ROOT / "scripts/prompts.json", "text"):
+        get_reference_cache().invalidate(REFERENCE_PROMPTS)
 
 
 def seed_instance_details(session: Session):
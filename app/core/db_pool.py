@@ -0,0 +1,181 @@
+"""
+Instrumented connection pool for the database engine.
+
+Requests that find every pooled connection in use wait on checkout (for at
+most DB_POOL_TIMEOUT seconds) before running a single query. To size
+DB_POOL_SIZE and DB_MAX_OVERFLOW against the number of API workers, the
+engine's pool records:
+
+- a histogram of checkout waits, and the checkouts timing out;
+- in-use, overflow and waiting gauges, with the peak in use;
+- the age of open connections (recycled after DB_POOL_RECYCLE seconds).
+
+Checkouts slower than DB_POOL_SLOW_CHECKOUT_MS are logged with the pool
+status. The counters are per process: each API worker reports its own pool
+via the health endpoints.
+"""
+import threading
+import time
+from typing import Any, Dict
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import Pool, PoolProxiedConnection, QueuePool
+
+from app.core.config import settings
+from app.core.logging_config import log_warning
+
+# Upper bounds (ms) of the checkout wait histogram buckets
+CHECKOUT_WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class PoolMetrics:
+    """Thread-safe checkout and connection counters of a pool."""
+
+    def __init__(self, slow_checkout_ms: float):
+        self.slow_checkout_ms = slow_checkout_ms
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._buckets = [0] * (len(CHECKOUT_WAIT_BUCKETS_MS) + 1)
+            self._checkouts = 0
+            self._wait_seconds = 0.0
+            self._max_wait_seconds = 0.0
+            self._timeouts = 0
+            self._slow_checkouts = 0
+            self._waiting = 0
+            self._peak_in_use = 0
+            # id(dbapi connection) -> time.monotonic() it was opened
+            self._opened_at: Dict[int, float] = {}
+
+    def checkout_started(self) -> None:
+        with self._lock:
+            self._waiting += 1
+
+    def checkout_finished(self, wait: float, pool: Pool, timed_out: bool = False) -> None:
+        """Record one checkout that waited ``wait`` seconds."""
+        wait_ms = wait * 1000
+        bucket = next(
+            (index for index, bound in enumerate(CHECKOUT_WAIT_BUCKETS_MS) if wait_ms <= bound),
+            len(CHECKOUT_WAIT_BUCKETS_MS),
+        )
+        in_use = pool.checkedout() if isinstance(pool, QueuePool) else 0
+        slow = wait_ms >= self.slow_checkout_ms
+        with self._lock:
+            self._waiting -= 1
+            self._buckets[bucket] += 1
+            self._checkouts += 1
+            self._wait_seconds += wait
+            self._max_wait_seconds = max(self._max_wait_seconds, wait)
+            self._peak_in_use = max(self._peak_in_use, in_use)
+            if timed_out:
+                self._timeouts += 1
+            if slow:
+                self._slow_checkouts += 1
+
+        if slow:
+            log_warning(
+                f"Slow database connection checkout: waited {wait_ms:.0f}ms"
+                f"{' and timed out' if timed_out else ''} ({pool.status()})"
+            )
+
+    def connection_opened(self, dbapi_connection: Any) -> None:
+        with self._lock:
+            self._opened_at[id(dbapi_connection)] = time.monotonic()
+
+    def connection_closed(self, dbapi_connection: Any) -> None:
+        with self._lock:
+            self._opened_at.pop(id(dbapi_connection), None)
+
+    def snapshot(self, pool: Pool) -> Dict[str, Any]:
+        """Return a JSON-serializable view of the counters and the pool's gauges."""
+        now = time.monotonic()
+        with self._lock:
+            ages = [now - opened_at for opened_at in self._opened_at.values()]
+            histogram = {
+                f"le_{bound}ms": count
+                for bound, count in zip(CHECKOUT_WAIT_BUCKETS_MS, self._buckets)
+            }
+            histogram["gt_{}ms".format(CHECKOUT_WAIT_BUCKETS_MS[-1])] = self._buckets[-1]
+            stats: Dict[str, Any] = {
+                "pool": type(pool).__name__,
+                "waiting": self._waiting,
+                "peak_in_use": self._peak_in_use,
+                "checkouts": self._checkouts,
+                "checkout_timeouts": self._timeouts,
+                "slow_checkouts": self._slow_checkouts,
+                "checkout_avg_wait_ms": round(self._wait_seconds / self._checkouts * 1000, 2) if self._checkouts else 0.0,
+                "checkout_max_wait_ms": round(self._max_wait_seconds * 1000, 2),
+                "checkout_wait_histogram": histogram,
+                "connections": {
+                    "open": len(ages),
+                    "avg_age_seconds": round(sum(ages) / len(ages), 1) if ages else 0.0,
+                    "max_age_seconds": round(max(ages), 1) if ages else 0.0,
+                },
+            }
+        if isinstance(pool, QueuePool):
+            stats.update({
+                "size": pool.size(),
+                "max_overflow": pool._max_overflow,
+                "timeout_seconds": pool.timeout(),
+                "in_use": pool.checkedout(),
+                "idle": pool.checkedin(),
+                "overflow": max(0, pool.overflow()),
+            })
+        return stats
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool recording how long each checkout waits in its metrics."""
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics(slow_checkout_ms=settings.db_pool_slow_checkout_ms)
+
+    def recreate(self) -> "InstrumentedQueuePool":
+        # Engine.dispose() replaces the pool; the counters carry over
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+    def connect(self) -> PoolProxiedConnection:
+        pool_metrics = self.metrics
+        pool_metrics.checkout_started()
+        started = time.perf_counter()
+        timed_out = False
+        try:
+            return super().connect()
+        except PoolTimeoutError:
+            timed_out = True
+            raise
+        finally:
+            pool_metrics.checkout_finished(time.perf_counter() - started, self, timed_out=timed_out)
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Track the age of the connections of an engine using InstrumentedQueuePool."""
+    if not isinstance(engine.pool, InstrumentedQueuePool):
+        return
+
+    @event.listens_for(engine, "connect")
+    def _connection_opened(dbapi_connection, connection_record):
+        engine.pool.metrics.connection_opened(dbapi_connection)
+
+    @event.listens_for(engine.pool, "close")
+    def _connection_closed(dbapi_connection, connection_record):
+        engine.pool.metrics.connection_closed(dbapi_connection)
+
+    @event.listens_for(engine.pool, "close_detached")
+    def _detached_connection_closed(dbapi_connection):
+        engine.pool.metrics.connection_closed(dbapi_connection)
+
+
+def get_pool_stats(engine: Engine) -> Dict[str, Any]:
+    """Return the checkout telemetry and gauges of an engine's pool."""
+    pool = engine.pool
+    if isinstance(pool, InstrumentedQueuePool):
+        return pool.metrics.snapshot(pool)
+    return {"pool": type(pool).__name__, "status": pool.status()}
@@ -0,0 +1,139 @@
+"""
+Read replica routing.
+
+When DATABASE_REPLICA_URLS is set, heavy read-only paths (analytics, tag
+statistics, entry listings) open their sessions on a replica chosen
+round-robin, so read throughput grows with the number of replicas instead of
+competing with writes on the primary. Exports stay on the primary: each one
+marks the point the next incremental export continues from, which a lagging
+replica would place past writes it has not received yet.
+
+Replicas lag behind the primary, so a user who just wrote would not see the
+write on a replica. Committing a write of a request's user records it in the
+shared cache; that user's reads then stay on the primary for
+DB_REPLICA_STICKY_SECONDS. Without Redis the record is per worker process.
+
+A replica that fails to connect is skipped for REPLICA_RETRY_SECONDS and the
+read falls back to the primary.
+"""
+import itertools
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+from app.core.db_pool import get_pool_stats
+from app.core.logging_config import LogCategory, log_warning
+from app.core.scoped_cache import ScopedCache
+
+logger = logging.getLogger(LogCategory.APP)
+
+# How long a replica that failed to connect is left out of rotation
+REPLICA_RETRY_SECONDS = 30
+
+
+class ReplicaRouter:
+    """Round-robin choice of read replicas with read-your-writes stickiness."""
+
+    def __init__(
+        self,
+        replicas: List[Engine],
+        cache_backend=None,
+        sticky_seconds: int = settings.db_replica_sticky_seconds,
+    ):
+        """
+        Initialize replica router.
+
+        Args:
+            replicas: Engines of the read replicas (may be empty)
+            cache_backend: Optional cache backend for recent writes (for testing).
+                          If None and there are replicas, creates cache from settings.
+            sticky_seconds: How long a user's reads stay on the primary after a write
+        """
+        self.replicas = replicas
+        self.sticky_seconds = sticky_seconds
+        self._writes = (
+            ScopedCache("replica", cache_backend=cache_backend, log=logger) if replicas else None
+        )
+        self._rotation = itertools.cycle(range(len(replicas)))
+        self._down_until: Dict[int, float] = {}
+        self._lock = threading.Lock()
+        self._reads = [0] * len(replicas)
+        self._primary_reads = 0
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.replicas)
+
+    def record_write(self, user_id: str) -> None:
+        """
+        Keep a user's reads on the primary until replicas have their write.
+
+        Args:
+            user_id: User UUID
+        """
+        if self._writes is not None:
+            self._writes.set(str(user_id), "last_write", {"at": time.time()}, self.sticky_seconds)
+
+    def is_sticky(self, user_id: Optional[str]) -> bool:
+        """Whether a user wrote within the last sticky_seconds."""
+        if self._writes is None or user_id is None:
+            return False
+        return self._writes.get(str(user_id), "last_write") is not None
+
+    def choose(self, user_id: Optional[str] = None) -> Optional[Engine]:
+        """
+        Choose the replica to read from.
+
+        Args:
+            user_id: User the read is for, if any
+
+        Returns:
+            A replica engine, or None to read from the primary
+        """
+        if not self.replicas or self.is_sticky(user_id):
+            return self._read_from_primary()
+
+        now = time.monotonic()
+        with self._lock:
+            for _ in range(len(self.replicas)):
+                index = next(self._rotation)
+                if self._down_until.get(index, 0.0) <= now:
+                    self._reads[index] += 1
+                    return self.replicas[index]
+        return self._read_from_primary()
+
+    def mark_down(self, replica: Engine) -> None:
+        """Leave a replica that failed to connect out of rotation for a while."""
+        index = self.replicas.index(replica)
+        with self._lock:
+            self._down_until[index] = time.monotonic() + REPLICA_RETRY_SECONDS
+        log_warning(
+            f"Read replica {replica.url.render_as_string(hide_password=True)} is unavailable; "
+            f"reading from the primary for {REPLICA_RETRY_SECONDS}s"
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """Return per-replica read counters, availability and pool telemetry."""
+        now = time.monotonic()
+        with self._lock:
+            return {
+                "primary_reads": self._primary_reads,
+                "replicas": [
+                    {
+                        "url": replica.url.render_as_string(hide_password=True),
+                        "reads": self._reads[index],
+                        "available": self._down_until.get(index, 0.0) <= now,
+                        "db_pool": get_pool_stats(replica),
+                    }
+                    for index, replica in enumerate(self.replicas)
+                ],
+            }
+
+    def _read_from_primary(self) -> None:
+        with self._lock:
+            self._primary_reads += 1
+        return None
@@ -82,6 +82,11 @@ class FileProcessingError(JournivAppException):
     pass
 
 
+class MediaEngineBusyError(JournivAppException):
+    """Raised when the media processing queue is full."""
+    pass
+
+
 class TokenNotFoundError(JournivAppException):
     """Raised when a token is not found."""
     pass
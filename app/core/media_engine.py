@@ -0,0 +1,245 @@
+"""
+Process pool for CPU-bound media work (thumbnails, metadata extraction).
+
+Pillow resizing holds the GIL, so running it on threads of the API process
+slows down request handling. Media jobs are instead queued on a bounded
+priority queue and run in a pool of MEDIA_ENGINE_WORKERS processes.
+
+- User-visible work (MediaPriority.UPLOAD) is dispatched before batch
+  reprocessing (MediaPriority.BATCH), in submission order within a priority.
+- At most MEDIA_ENGINE_QUEUE_SIZE jobs wait for a worker. Submitting to a
+  full queue blocks the caller, or raises MediaEngineBusyError when the
+  caller cannot wait (e.g. the event loop), so bursts push back on clients
+  instead of piling up in memory.
+
+Jobs must be picklable: module-level functions or class/static methods.
+With MEDIA_ENGINE_WORKERS=0, or inside a daemonic process such as a Celery
+prefork worker (which cannot start child processes), jobs run inline in the
+calling thread.
+"""
+import atexit
+import heapq
+import itertools
+import multiprocessing
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from enum import IntEnum
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.exceptions import MediaEngineBusyError
+from app.core.logging_config import log_info, log_warning
+
+
+class MediaPriority(IntEnum):
+    """Dispatch priority of a media job; lower values run first."""
+
+    UPLOAD = 0
+    BATCH = 10
+
+
+_Job = Tuple[int, int, Future, Callable[..., Any], Tuple[Any, ...]]
+
+
+class MediaEngine:
+    """Bounded priority queue feeding a process pool."""
+
+    def __init__(self, workers: int, queue_size: int):
+        self.queue_size = queue_size
+        self.inline = workers <= 0 or bool(multiprocessing.current_process().daemon)
+        self.workers = 0 if self.inline else workers
+        self._queue: List[_Job] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._dispatchers: List[threading.Thread] = []
+        self._shutdown = False
+        self._active = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+
+    def submit(
+        self,
+        func: Callable[..., Any],
+        *args: Any,
+        priority: MediaPriority = MediaPriority.BATCH,
+        block: bool = True,
+        timeout: Optional[float] = None,
+    ) -> Future:
+        """
+        Queue a job and return a Future for its result.
+
+        Args:
+            func: Picklable callable to run in a worker process
+            priority: Dispatch priority
+            block: Wait for room when the queue is full instead of raising
+            timeout: Longest wait for room, in seconds (None waits forever)
+
+        Raises:
+            MediaEngineBusyError: If the queue is full and the job cannot wait
+            RuntimeError: If the engine is shut down
+        """
+        if self.inline:
+            return self._run_inline(func, args)
+
+        future: Future = Future()
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError("Media engine is not available (shutting down)")
+            if len(self._queue) >= self.queue_size:
+                if not block or not self._condition.wait_for(
+                    lambda: len(self._queue) < self.queue_size or self._shutdown, timeout
+                ):
+                    self._rejected += 1
+                    raise MediaEngineBusyError("Media processing queue is full")
+                if self._shutdown:
+                    raise RuntimeError("Media engine is not available (shutting down)")
+            self._start()
+            heapq.heappush(self._queue, (int(priority), next(self._sequence), future, func, args))
+            self._condition.notify_all()
+        return future
+
+    def run(self, func: Callable[..., Any], *args: Any, priority: MediaPriority = MediaPriority.BATCH) -> Any:
+        """Run a job and wait for its result."""
+        return self.submit(func, *args, priority=priority).result()
+
+    def has_capacity(self) -> bool:
+        """Whether a job submitted now would be queued without waiting."""
+        with self._condition:
+            return self.inline or len(self._queue) < self.queue_size
+
+    def stats(self) -> Dict[str, Any]:
+        """Return occupancy and throughput counters."""
+        with self._condition:
+            queued = {priority.name.lower(): 0 for priority in MediaPriority}
+            for job in self._queue:
+                queued[MediaPriority(job[0]).name.lower()] += 1
+            return {
+                "workers": self.workers,
+                "inline": self.inline,
+                "queue_size": self.queue_size,
+                "queued": queued,
+                "active": self._active,
+                "completed": self._completed,
+                "failed": self._failed,
+                "rejected": self._rejected,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop dispatching; queued jobs that have not started are cancelled."""
+        with self._condition:
+            if self._shutdown:
+                return
+            self._shutdown = True
+            pending, self._queue = self._queue, []
+            self._condition.notify_all()
+        for job in pending:
+            job[2].cancel()
+        if wait:
+            for dispatcher in self._dispatchers:
+                dispatcher.join()
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _run_inline(self, func: Callable[..., Any], args: Tuple[Any, ...]) -> Future:
+        future: Future = Future()
+        try:
+            future.set_result(func(*args))
+        except BaseException as exc:
+            future.set_exception(exc)
+        return future
+
+    def _start(self) -> None:
+        """Start the pool and its dispatchers on first use (holding the lock)."""
+        if self._dispatchers:
+            return
+        self._executor = self._create_executor()
+        for index in range(self.workers):
+            dispatcher = threading.Thread(
+                target=self._dispatch, name=f"media-engine-{index}", daemon=True
+            )
+            dispatcher.start()
+            self._dispatchers.append(dispatcher)
+        log_info(f"Media engine started with {self.workers} worker processes")
+
+    def _create_executor(self) -> ProcessPoolExecutor:
+        # Forking would copy the parent's open database connections and threads
+        return ProcessPoolExecutor(
+            max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+        )
+
+    def _dispatch(self) -> None:
+        """
+        Hand jobs to the pool one at a time per dispatcher.
+
+        Each dispatcher keeps at most one job in the pool, so waiting jobs
+        stay on the priority queue where uploads can overtake them.
+        """
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._queue or self._shutdown)
+                if self._shutdown:
+                    return
+                _, _, future, func, args = heapq.heappop(self._queue)
+                self._active += 1
+                # A slot freed up for a blocked submitter
+                self._condition.notify_all()
+
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(self._execute(func, args))
+                except BaseException as exc:
+                    future.set_exception(exc)
+
+            with self._condition:
+                self._active -= 1
+                if future.cancelled() or future.exception() is not None:
+                    self._failed += 1
+                else:
+                    self._completed += 1
+
+    def _execute(self, func: Callable[..., Any], args: Tuple[Any, ...]) -> Any:
+        executor = self._executor
+        try:
+            return executor.submit(func, *args).result()
+        except BrokenProcessPool:
+            # A worker died (e.g. killed for memory); replace the pool once
+            with self._condition:
+                if self._shutdown:
+                    raise
+                if self._executor is executor:
+                    log_warning("Media engine worker pool broke; restarting it")
+                    self._executor = self._create_executor()
+                executor = self._executor
+            return executor.submit(func, *args).result()
+
+
+_engine: Optional[MediaEngine] = None
+_engine_lock = threading.Lock()
+
+
+def get_media_engine() -> MediaEngine:
+    """Get or create the media engine configured from settings."""
+    global _engine
+
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = MediaEngine(settings.media_engine_workers, settings.media_engine_queue_size)
+    return _engine
+
+
+def shutdown_media_engine(wait: bool = True) -> None:
+    """Shut down the media engine if it was started."""
+    global _engine
+
+    with _engine_lock:
+        engine, _engine = _engine, None
+    if engine is not None:
+        log_info("Shutting down media engine")
+        engine.shutdown(wait=wait)
+
+
+atexit.register(shutdown_media_engine)
@@ -0,0 +1,114 @@
+"""
+Keyset (cursor) pagination helpers.
+
+Cursors are opaque, URL-safe tokens that encode the sort key of the last row
+on a page. The next page is fetched with an indexed range condition on that
+key instead of OFFSET, so deep pages cost the same as the first one.
+"""
+import base64
+import json
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Optional, Sequence
+
+from fastapi import Response
+from sqlalchemy import tuple_
+
+from app.core.exceptions import ValidationError
+from app.core.time_utils import ensure_utc
+from app.models.entry import Entry
+
+# Response header carrying the cursor for the following page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+@dataclass(frozen=True)
+class EntryCursor:
+    """
+    Position in an entry timeline ordered by (is_pinned, entry_datetime_utc, id) descending.
+
+    Timelines that do not float pinned entries to the top ignore is_pinned.
+    """
+
+    entry_datetime_utc: datetime
+    id: uuid.UUID
+    is_pinned: bool = False
+
+    @classmethod
+    def from_entry(cls, entry: Any) -> "EntryCursor":
+        """Build the cursor pointing just after the given entry."""
+        return cls(
+            entry_datetime_utc=ensure_utc(entry.entry_datetime_utc),
+            id=entry.id,
+            is_pinned=bool(entry.is_pinned),
+        )
+
+    def encode(self) -> str:
+        """Serialize the cursor into an opaque URL-safe token."""
+        payload = json.dumps(
+            {
+                "p": self.is_pinned,
+                "t": self.entry_datetime_utc.isoformat(),
+                "i": str(self.id),
+            },
+            separators=(",", ":"),
+        )
+        return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "EntryCursor":
+        """
+        Parse a token produced by encode().
+
+        Raises:
+            ValidationError: If the token is malformed
+        """
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+            return cls(
+                entry_datetime_utc=ensure_utc(datetime.fromisoformat(payload["t"])),
+                id=uuid.UUID(payload["i"]),
+                is_pinned=bool(payload.get("p", False)),
+            )
+        except (ValueError, TypeError, KeyError, AttributeError) as exc:
+            raise ValidationError("Invalid pagination cursor") from exc
+
+
+def decode_entry_cursor(token: Optional[str]) -> Optional[EntryCursor]:
+    """Decode an optional cursor query parameter."""
+    if not token:
+        return None
+    return EntryCursor.decode(token)
+
+
+def apply_entry_cursor(statement, cursor: Optional[EntryCursor], *, pinned_first: bool = False):
+    """
+    Restrict a descending entry timeline to rows after the cursor.
+
+    The row-value comparison matches the ORDER BY key so the database can
+    seek directly through idx_entry_user_datetime / idx_entries_journal_date
+    instead of scanning and discarding OFFSET rows.
+    """
+    if cursor is None:
+        return statement
+    if pinned_first:
+        return statement.where(
+            tuple_(Entry.is_pinned, Entry.entry_datetime_utc, Entry.id)
+            < tuple_(cursor.is_pinned, cursor.entry_datetime_utc, cursor.id)
+        )
+    return statement.where(
+        tuple_(Entry.entry_datetime_utc, Entry.id)
+        < tuple_(cursor.entry_datetime_utc, cursor.id)
+    )
+
+
+def set_next_cursor_header(response: Response, entries: Sequence[Any], limit: int) -> None:
+    """
+    Expose the cursor for the next page when the current page is full.
+
+    A short page means the timeline is exhausted, so no header is emitted.
+    """
+    if entries and len(entries) >= limit:
+        response.headers[NEXT_CURSOR_HEADER] = EntryCursor.from_entry(entries[-1]).encode()
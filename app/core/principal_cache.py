@@ -0,0 +1,176 @@
+"""
+Authenticated principal cache.
+
+get_current_user runs on every authenticated request, so the user it loads
+is cached by id: first in a small in-process LRU, then in Redis when one is
+configured (shared between workers). UserService invalidates a user whenever
+it updates or deletes one; the short TTLs bound how long another worker can
+keep a stale copy.
+
+Cached users carry every column except the password hash and are rebuilt as
+new, session-less User objects on each hit, so they must not be added to a
+session or used to reach relationships.
+"""
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from app.core.cache import create_cache
+from app.core.config import (
+    PRINCIPAL_CACHE_SIZE,
+    PRINCIPAL_CACHE_TTL,
+    PRINCIPAL_LOCAL_CACHE_TTL,
+    settings,
+)
+from app.core.logging_config import LogCategory
+from app.core.scoped_cache import ScopedCache
+from app.models.enums import UserRole
+from app.models.user import User
+
+logger = logging.getLogger(LogCategory.APP)
+
+_DATETIME_FIELDS = ("created_at", "updated_at", "last_login_at")
+
+
+class PrincipalCache:
+    """
+    Two-tier cache of authenticated users keyed by user id.
+
+    An invalidation leaves a marker in the local tier, so a lookup that read
+    the database before the invalidation cannot cache what it read.
+    """
+
+    def __init__(self, cache_backend=None, max_entries: int = PRINCIPAL_CACHE_SIZE):
+        """
+        Initialize principal cache.
+
+        Args:
+            cache_backend: Optional shared cache backend (for testing).
+                          If None, Redis is used when REDIS_URL is set.
+            max_entries: Capacity of the in-process tier
+        """
+        if cache_backend is None and settings.redis_url:
+            cache_backend = create_cache(settings.redis_url)
+        self._shared = ScopedCache("principal", cache_backend=cache_backend, log=logger) if cache_backend else None
+        self._max_entries = max_entries
+        # user_id -> (expires_at, snapshot or None, invalidated_at)
+        self._local: "OrderedDict[str, Tuple[float, Optional[Dict[str, Any]], float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id: str) -> Optional[User]:
+        """
+        Get a cached user.
+
+        Args:
+            user_id: User UUID
+
+        Returns:
+            A fresh User object or None if not cached
+        """
+        now = time.monotonic()
+        with self._lock:
+            cached = self._local.get(user_id)
+            if cached is not None and cached[1] is not None and cached[0] > now:
+                self._local.move_to_end(user_id)
+                return self._load(cached[1])
+
+        if self._shared is None:
+            return None
+        snapshot = self._shared.get(user_id, "user")
+        if snapshot is None:
+            return None
+        self._store_local(user_id, snapshot, now)
+        return self._load(snapshot)
+
+    def set(self, user: User, read_started: float) -> None:
+        """
+        Cache a user loaded from the database.
+
+        Args:
+            user: User as loaded from the database
+            read_started: time.monotonic() taken before the user was read;
+                          the user is not cached if invalidated since
+        """
+        user_id = str(user.id)
+        snapshot = user.model_dump(mode="json", exclude={"password"})
+        if not self._store_local(user_id, snapshot, read_started):
+            return
+        if self._shared is not None:
+            self._shared.set(user_id, "user", snapshot, PRINCIPAL_CACHE_TTL)
+
+    def invalidate(self, user_id: str) -> None:
+        """
+        Drop a user from both tiers.
+
+        Call after committing any change to the user (profile, role, active
+        status) or deleting it.
+
+        Args:
+            user_id: User UUID
+        """
+        user_id = str(user_id)
+        now = time.monotonic()
+        with self._lock:
+            self._local[user_id] = (0.0, None, now)
+            self._local.move_to_end(user_id)
+            self._evict()
+        if self._shared is not None:
+            self._shared.delete(user_id, "user")
+        logger.debug(f"Invalidated principal cache for user={user_id}")
+
+    def clear(self) -> None:
+        """Clear the in-process tier."""
+        with self._lock:
+            self._local.clear()
+
+    def _store_local(self, user_id: str, snapshot: Dict[str, Any], read_started: float) -> bool:
+        with self._lock:
+            cached = self._local.get(user_id)
+            if cached is not None and cached[2] >= read_started:
+                return False
+            invalidated_at = cached[2] if cached is not None else 0.0
+            self._local[user_id] = (time.monotonic() + PRINCIPAL_LOCAL_CACHE_TTL, snapshot, invalidated_at)
+            self._local.move_to_end(user_id)
+            self._evict()
+        return True
+
+    def _evict(self) -> None:
+        while len(self._local) > self._max_entries:
+            self._local.popitem(last=False)
+
+    @staticmethod
+    def _load(snapshot: Dict[str, Any]) -> User:
+        """Rebuild a User from its JSON snapshot with typed ids, role and timestamps."""
+        values = dict(snapshot)
+        values["id"] = uuid.UUID(values["id"])
+        values["role"] = UserRole(values["role"])
+        for field in _DATETIME_FIELDS:
+            if values.get(field):
+                values[field] = datetime.fromisoformat(values[field])
+        return User(**values)
+
+
+# Global principal cache instance
+_principal_cache: Optional[PrincipalCache] = None
+_principal_cache_lock = threading.Lock()
+
+
+def get_principal_cache() -> PrincipalCache:
+    """
+    Get or create the global principal cache instance.
+
+    Returns:
+        PrincipalCache singleton instance
+    """
+    global _principal_cache
+
+    if _principal_cache is None:
+        with _principal_cache_lock:
+            if _principal_cache is None:
+                _principal_cache = PrincipalCache()
+
+    return _principal_cache
@@ -0,0 +1,223 @@
+"""
+Reference data cache for system moods and system prompts.
+
+Reference data is read on most requests and changes rarely, so listings are
+cached as immutable records rather than ORM objects. Every key embeds a
+version stamp per kind of data ("moods", "prompts"); a write only replaces
+the stamp. With Redis the stamp is shared, so every worker sees the change
+on its next read. Decoded listings are also memoized in-process per stamp,
+so a hit costs one stamp lookup.
+
+Uses Redis when available (production), falls back to in-memory cache (dev).
+"""
+import logging
+import threading
+import uuid
+from dataclasses import asdict, dataclass, fields
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar
+
+from app.core.config import REFERENCE_CACHE_TTL
+from app.core.logging_config import LogCategory
+from app.core.scoped_cache import ScopedCache
+
+logger = logging.getLogger(LogCategory.APP)
+
+R = TypeVar("R", bound="ReferenceRecord")
+
+# Kinds of reference data, each with its own version stamp
+REFERENCE_MOODS = "moods"
+REFERENCE_PROMPTS = "prompts"
+
+
+class ReferenceRecord:
+    """Base for immutable, session-less copies of reference rows."""
+
+    _UUID_FIELDS: Tuple[str, ...] = ("id",)
+    _DATETIME_FIELDS: Tuple[str, ...] = ("created_at", "updated_at")
+
+    @classmethod
+    def from_model(cls: Type[R], model: Any) -> R:
+        """Copy the record's fields from an ORM object."""
+        return cls(**{field.name: getattr(model, field.name) for field in fields(cls)})
+
+    def to_json(self) -> Dict[str, Any]:
+        values = asdict(self)
+        for name in self._UUID_FIELDS:
+            if values[name] is not None:
+                values[name] = str(values[name])
+        for name in self._DATETIME_FIELDS:
+            if values[name] is not None:
+                values[name] = values[name].isoformat()
+        return values
+
+    @classmethod
+    def from_json(cls: Type[R], values: Dict[str, Any]) -> R:
+        values = dict(values)
+        for name in cls._UUID_FIELDS:
+            if values[name] is not None:
+                values[name] = uuid.UUID(values[name])
+        for name in cls._DATETIME_FIELDS:
+            if values[name] is not None:
+                values[name] = datetime.fromisoformat(values[name])
+        return cls(**values)
+
+
+@dataclass(frozen=True)
+class MoodRecord(ReferenceRecord):
+    """A system mood."""
+
+    id: uuid.UUID
+    name: str
+    icon: Optional[str]
+    category: str
+    created_at: datetime
+    updated_at: datetime
+
+
+@dataclass(frozen=True)
+class PromptRecord(ReferenceRecord):
+    """
+    A system prompt.
+
+    usage_count is a snapshot: counting a use does not invalidate the cache,
+    so it can lag by up to REFERENCE_CACHE_TTL.
+    """
+
+    _UUID_FIELDS = ("id", "user_id")
+
+    id: uuid.UUID
+    text: str
+    category: Optional[str]
+    difficulty_level: int
+    estimated_time_minutes: Optional[int]
+    is_active: bool
+    usage_count: int
+    user_id: Optional[uuid.UUID]
+    created_at: datetime
+    updated_at: datetime
+
+
+class ReferenceCache(ScopedCache):
+    """
+    Cache wrapper for reference data listings.
+
+    Keys are scoped by kind of data; the cache type carries the listing
+    variant (e.g. a category filter) and the kind's version stamp.
+    """
+
+    def __init__(self, cache_backend=None):
+        """
+        Initialize reference cache.
+
+        Args:
+            cache_backend: Optional cache backend (for testing).
+                          If None, creates cache from settings.
+        """
+        super().__init__("reference", cache_backend=cache_backend, log=logger)
+        self._decoded: Dict[Tuple[str, str], Tuple[str, tuple]] = {}
+        self._lock = threading.Lock()
+        logger.debug("ReferenceCache initialized")
+
+    def get_version(self, kind: str) -> str:
+        """
+        Get the current version stamp of a kind of data, creating one if missing.
+
+        A missing stamp is replaced with a fresh one rather than a fixed
+        default, so an evicted stamp can never resurrect stale listings.
+        """
+        cached = self.get(kind, "version")
+        if cached and cached.get("stamp"):
+            return cached["stamp"]
+        return self._new_version(kind)
+
+    def _new_version(self, kind: str) -> str:
+        stamp = uuid.uuid4().hex
+        self.set(kind, "version", {"stamp": stamp}, None)
+        return stamp
+
+    def get_records(self, kind: str, variant: str, record_type: Type[R]) -> Tuple[str, Optional[Tuple[R, ...]]]:
+        """
+        Get a cached listing.
+
+        Args:
+            kind: Kind of data, e.g. "moods"
+            variant: Listing variant (must not contain ':')
+            record_type: Record class the listing holds
+
+        Returns:
+            The current version stamp, and the records or None if not cached.
+            Pass the stamp to set_records when caching a fresh listing.
+        """
+        version = self.get_version(kind)
+        with self._lock:
+            decoded = self._decoded.get((kind, variant))
+        if decoded is not None and decoded[0] == version:
+            return version, decoded[1]
+
+        cached = self.get(kind, f"{variant}-{version}")
+        if cached is None:
+            logger.debug(f"Reference cache MISS for {kind} {variant}")
+            return version, None
+
+        records = tuple(record_type.from_json(values) for values in cached["records"])
+        with self._lock:
+            self._decoded[(kind, variant)] = (version, records)
+        return version, records
+
+    def set_records(self, kind: str, variant: str, version: str, records: List[ReferenceRecord]) -> None:
+        """
+        Cache a listing under the version stamp it was read with.
+
+        Args:
+            kind: Kind of data, e.g. "moods"
+            variant: Listing variant (must not contain ':')
+            version: Version stamp returned by get_records before reading
+            records: Records read from the database
+        """
+        self.set(
+            kind,
+            f"{variant}-{version}",
+            {"records": [record.to_json() for record in records]},
+            REFERENCE_CACHE_TTL,
+        )
+        with self._lock:
+            self._decoded[(kind, variant)] = (version, tuple(records))
+
+    def invalidate(self, kind: str) -> None:
+        """
+        Invalidate all cached listings of a kind of data, in every worker.
+
+        Call after committing a write to the data; listings cached under the
+        previous stamp expire on their own.
+
+        Args:
+            kind: Kind of data, e.g. "moods"
+        """
+        self._new_version(kind)
+        with self._lock:
+            for key in [key for key in self._decoded if key[0] == kind]:
+                del self._decoded[key]
+        logger.debug(f"Invalidated reference cache for {kind}")
+
+
+# Global reference cache instance
+_reference_cache: Optional[ReferenceCache] = None
+_reference_cache_lock = threading.Lock()
+
+
+def get_reference_cache() -> ReferenceCache:
+    """
+    Get or create the global reference cache instance.
+
+    Returns:
+        ReferenceCache singleton instance
+    """
+    global _reference_cache
+
+    if _reference_cache is None:
+        with _reference_cache_lock:
+            if _reference_cache is None:
+                _reference_cache = ReferenceCache()
+
+    return _reference_cache
@@ -0,0 +1,94 @@
+"""
+User settings cache.
+
+Caches each user's settings (time zone, theme, writing goal, ...) so the
+services that only need to read them, chiefly for the time zone, skip the
+query. UserService invalidates a user's entry when their settings change.
+
+Uses Redis when available (production), falls back to in-memory cache (dev).
+"""
+import logging
+import threading
+from typing import Any, Dict, Optional
+
+from app.core.config import USER_SETTINGS_CACHE_TTL
+from app.core.logging_config import LogCategory
+from app.core.scoped_cache import ScopedCache
+
+logger = logging.getLogger(LogCategory.APP)
+
+
+class UserSettingsCache(ScopedCache):
+    """
+    Cache wrapper for user settings.
+
+    Keys are scoped by user id. A user without a settings row is cached as
+    an empty dict, so the miss is not queried again either.
+    """
+
+    def __init__(self, cache_backend=None):
+        """
+        Initialize user settings cache.
+
+        Args:
+            cache_backend: Optional cache backend (for testing).
+                          If None, creates cache from settings.
+        """
+        super().__init__("user_settings", cache_backend=cache_backend, log=logger)
+        logger.debug("UserSettingsCache initialized")
+
+    def get_settings(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a user's cached settings.
+
+        Args:
+            user_id: User UUID
+
+        Returns:
+            Settings dict (empty if the user has none) or None if not cached
+        """
+        return self.get(user_id, "settings")
+
+    def set_settings(self, user_id: str, user_settings: Dict[str, Any]) -> None:
+        """
+        Cache a user's settings.
+
+        Args:
+            user_id: User UUID
+            user_settings: JSON-serializable settings dict
+        """
+        self.set(user_id, "settings", user_settings, USER_SETTINGS_CACHE_TTL)
+
+    def invalidate(self, user_id: str) -> None:
+        """
+        Invalidate a user's cached settings.
+
+        Call after committing a change to the user's settings.
+
+        Args:
+            user_id: User UUID
+        """
+        self.delete(user_id, "settings")
+        logger.debug(f"Invalidated settings cache for user={user_id}")
+
+
+# Global user settings cache instance
+_user_settings_cache: Optional[UserSettingsCache] = None
+_user_settings_cache_lock = threading.Lock()
+
+
+def get_user_settings_cache() -> UserSettingsCache:
+    """
+    Get or create the global user settings cache instance.
+
+    Returns:
+        UserSettingsCache singleton instance
+    """
+    global _user_settings_cache
+
+    if _user_settings_cache is None:
+        with _user_settings_cache_lock:
+            if _user_settings_cache is None:
+                _user_settings_cache = UserSettingsCache()
+
+    return _user_settings_cache
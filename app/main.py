@@ -17,7 +17,6 @@ from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.responses import JSONResponse, FileResponse, Response
 from starlette.staticfiles import StaticFiles
 from starlette.middleware.sessions import SessionMiddleware
-from fastapi.middleware.gzip import GZipMiddleware
 
 from app.api.v1.api import api_router
 from app.core.config import settings
@@ -32,9 +31,12 @@ from app.core.exceptions import (
 )
 from app.core.logging_config import setup_logging, log_info, log_warning, log_error
 from app.core.http_client import close_http_client
+from app.core.media_engine import shutdown_media_engine
+from app.core.pagination import NEXT_CURSOR_HEADER
 from app.core.rate_limiting import limiter, rate_limit_exceeded_handler
 from app.middleware.request_logging import request_id_ctx, RequestLoggingMiddleware
 from app.middleware.csp_middleware import create_csp_middleware
+from app.middleware.gzip_middleware import MediaAwareGZipMiddleware
 
 # -----------------------------------------------------------------------------
 # Startup / Shutdown
@@ -74,6 +76,11 @@ async def lifespan(app: FastAPI):
         log_info("HTTP client closed")
     except Exception as exc:
         log_warning(f"Failed to close HTTP client: {exc}")
+    try:
+        shutdown_media_engine()
+        log_info("Media engine shut down")
+    except Exception as exc:
+        log_warning(f"Failed to shut down media engine: {exc}")
 
 
 # -----------------------------------------------------------------------------
@@ -115,6 +122,7 @@ if cors_enabled:
         allow_credentials=True,
         allow_methods=["GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS"],
         allow_headers=["Authorization", "Content-Type", "Accept", "Origin", "X-Requested-With"],
+        expose_headers=[NEXT_CURSOR_HEADER],
         max_age=3600,
     )
     log_info(f"CORS enabled for origins: {cors_origins}")
@@ -181,7 +189,8 @@ else:
 
 # GZip Middleware.
 # This compresses responses (HTML, JSON, JS, CSS, etc.) larger than 1KB.
-app.add_middleware(GZipMiddleware, minimum_size=1024)
+# Media and byte-range responses are sent uncompressed.
+app.add_middleware(MediaAwareGZipMiddleware, minimum_size=1024)
 
 app.add_middleware(TrustedHostMiddleware, allowed_hosts=trusted_hosts)
 
@@ -0,0 +1,60 @@
+"""
+GZip middleware that leaves media and partial responses untouched.
+
+Starlette's GZipMiddleware compresses every response above the size threshold,
+including images, videos and byte-range responses. Those are already
+compressed (so gzip only burns CPU) and a 206 body must stay byte-for-byte what
+its Content-Range describes, so they are passed through as-is.
+"""
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipMiddleware, GZipResponder, IdentityResponder
+from starlette.types import Message, Receive, Scope, Send
+
+UNCOMPRESSED_CONTENT_TYPES = (
+    "text/event-stream",
+    "image/",
+    "video/",
+    "audio/",
+    "multipart/byteranges",
+    "application/zip",
+    "application/gzip",
+    "application/octet-stream",
+)
+
+
+class _PassThroughMixin:
+    """Mark media and partial responses as excluded from compression."""
+
+    async def send_with_compression(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            await super().send_with_compression(message)
+            headers = Headers(raw=message["headers"])
+            if message["status"] == 206 or headers.get("content-type", "").startswith(UNCOMPRESSED_CONTENT_TYPES):
+                self.content_type_is_excluded = True
+            return
+        await super().send_with_compression(message)
+
+
+class _MediaAwareGZipResponder(_PassThroughMixin, GZipResponder):
+    pass
+
+
+class _MediaAwareIdentityResponder(_PassThroughMixin, IdentityResponder):
+    pass
+
+
+class MediaAwareGZipMiddleware(GZipMiddleware):
+    """GZipMiddleware that skips already-compressed and partial responses."""
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        if "gzip" in headers.get("Accept-Encoding", ""):
+            responder = _MediaAwareGZipResponder(self.app, self.minimum_size, compresslevel=self.compresslevel)
+        else:
+            responder = _MediaAwareIdentityResponder(self.app, self.minimum_size)
+
+        await responder(scope, receive, send)
@@ -1,12 +1,12 @@
 # Import all models for easy access
-from .analytics import WritingStreak
+from .analytics import DailyMoodCount, DailyTagCount, WritingDay, WritingStreak
 from .base import BaseModel
 from .instance_detail import InstanceDetail
-from .entry import Entry, EntryMedia
+from .entry import Entry, EntryMedia, MediaBlob
 from .entry_tag_link import EntryTagLink
 from .export_job import ExportJob
 from .external_identity import ExternalIdentity
-from .import_job import ImportJob
+from .import_job import ImportIdMapping, ImportJob
 from .journal import Journal
 from .mood import Mood, MoodLog
 from .prompt import Prompt
@@ -20,14 +20,19 @@ __all__ = [
     "Journal",
     "Entry",
     "EntryMedia",
+    "MediaBlob",
     "Mood",
     "MoodLog",
     "Prompt",
     "Tag",
     "EntryTagLink",
     "WritingStreak",
+    "WritingDay",
+    "DailyMoodCount",
+    "DailyTagCount",
     "ExternalIdentity",
     "ImportJob",
+    "ImportIdMapping",
     "ExportJob",
     "InstanceDetail",
 ]
@@ -9,10 +9,10 @@ from datetime import date
 from typing import Optional, TYPE_CHECKING
 
 from pydantic import field_validator
-from sqlalchemy import Column, ForeignKey
-from sqlmodel import Field, Relationship, Index, CheckConstraint
+from sqlalchemy import Column, ForeignKey, String
+from sqlmodel import Field, Relationship, Index, CheckConstraint, SQLModel
 
-from .base import BaseModel
+from .base import BaseModel, TimestampMixin
 
 if TYPE_CHECKING:
     from .user import User
@@ -115,3 +115,101 @@ class WritingStreak(BaseModel, table=True):
         if v < current_streak:
             raise ValueError('longest_streak must be >= current_streak')
         return v
+
+
+class WritingDay(TimestampMixin, SQLModel, table=True):
+    """
+    Per-user, per-day entry and word counts.
+
+    Maintained in the same transaction as entry writes so streaks and totals
+    can be derived from one compact row per writing day instead of scanning
+    every entry. A row exists only while its day has at least one entry.
+    """
+    __tablename__ = "writing_day"
+
+    user_id: uuid.UUID = Field(
+        sa_column=Column(
+            ForeignKey("user.id", ondelete="CASCADE"),
+            primary_key=True,
+            nullable=False
+        ),
+        description="User this day belongs to"
+    )
+    entry_date: date = Field(
+        primary_key=True,
+        description="Local calendar date of the entries"
+    )
+    entry_count: int = Field(
+        default=0,
+        description="Number of entries written on this date"
+    )
+    total_words: int = Field(
+        default=0,
+        description="Total word count of entries written on this date"
+    )
+
+
+class DailyMoodCount(TimestampMixin, SQLModel, table=True):
+    """
+    Per-user, per-day mood log counts by mood category.
+
+    Part of the daily analytics rollup alongside WritingDay; the rows for a
+    day are refreshed whenever a mood log on that day is written.
+    """
+    __tablename__ = "daily_mood_count"
+
+    user_id: uuid.UUID = Field(
+        sa_column=Column(
+            ForeignKey("user.id", ondelete="CASCADE"),
+            primary_key=True,
+            nullable=False
+        ),
+        description="User these mood logs belong to"
+    )
+    logged_date: date = Field(
+        primary_key=True,
+        description="Local date the moods were logged for"
+    )
+    category: str = Field(
+        sa_column=Column(String(50), primary_key=True, nullable=False),
+        description="Mood category (positive, negative, neutral)"
+    )
+    mood_count: int = Field(
+        default=0,
+        description="Number of mood logs in this category on this date"
+    )
+
+
+class DailyTagCount(TimestampMixin, SQLModel, table=True):
+    """
+    Per-user, per-day tag usage across entries.
+
+    Part of the daily analytics rollup alongside WritingDay; the rows for a
+    day are refreshed whenever tags on that day's entries change.
+    """
+    __tablename__ = "daily_tag_count"
+
+    user_id: uuid.UUID = Field(
+        sa_column=Column(
+            ForeignKey("user.id", ondelete="CASCADE"),
+            primary_key=True,
+            nullable=False
+        ),
+        description="User the tagged entries belong to"
+    )
+    entry_date: date = Field(
+        primary_key=True,
+        description="Local date of the tagged entries"
+    )
+    tag_id: uuid.UUID = Field(
+        sa_column=Column(
+            ForeignKey("tag.id", ondelete="CASCADE"),
+            primary_key=True,
+            nullable=False
+        ),
+        description="Tag applied to the entries"
+    )
+    usage_count: int = Field(
+        default=0,
+        description="Number of entries on this date carrying the tag"
+    )
@@ -7,10 +7,10 @@ from typing import List, Optional, TYPE_CHECKING
 
 from pydantic import field_validator
 from sqlalchemy import Column, ForeignKey, Enum as SAEnum, UniqueConstraint, String, DateTime
-from sqlmodel import Field, Relationship, Index, CheckConstraint
+from sqlmodel import Field, Relationship, Index, CheckConstraint, SQLModel
 
 from app.core.time_utils import utc_now
-from .base import BaseModel
+from .base import BaseModel, TimestampMixin
 from .enums import MediaType, UploadStatus
 
 if TYPE_CHECKING:
@@ -198,3 +198,36 @@ class EntryMedia(BaseModel, table=True):
         except ValueError as exc:
             allowed_statuses = sorted(status.value for status in UploadStatus)
             raise ValueError(f'Invalid upload_status: {v}. Must be one of {allowed_statuses}') from exc
+
+
+class MediaBlob(TimestampMixin, SQLModel, table=True):
+    """
+    Content-addressed media file shared by a user's EntryMedia rows.
+
+    Identical bytes are stored once per user; ref_count tracks how many
+    EntryMedia rows point at file_path so the file is only removed from
+    disk when the last of them is deleted.
+    """
+    __tablename__ = "media_blob"
+
+    user_id: uuid.UUID = Field(
+        sa_column=Column(
+            ForeignKey("user.id", ondelete="CASCADE"),
+            primary_key=True,
+            nullable=False
+        ),
+        description="User owning the stored file"
+    )
+    checksum: str = Field(
+        sa_column=Column(String(64), primary_key=True, nullable=False),
+        description="SHA-256 of the file contents"
+    )
+    file_path: str = Field(
+        ...,
+        max_length=500,
+        description="Stored file path relative to the media root"
+    )
+    ref_count: int = Field(
+        default=0,
+        description="Number of EntryMedia rows referencing file_path"
+    )
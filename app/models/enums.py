@@ -12,6 +12,14 @@ class MediaType(str, Enum):
     UNKNOWN = "unknown"
 
 
+class RenditionSize(str, Enum):
+    """Named sizes of media renditions served by the thumbnail endpoint."""
+    SMALL = "small"
+    MEDIUM = "medium"
+    LARGE = "large"
+    XLARGE = "xlarge"
+
+
 class UploadStatus(str, Enum):
     """Upload status for media files."""
     PENDING = "pending"
@@ -126,4 +134,5 @@ class ExportType(str, Enum):
     """Types of exports."""
     FULL = "full"  # Full user export
     JOURNAL = "journal"  # Single journal export
+    INCREMENTAL = "incremental"  # Changes since an earlier export
 
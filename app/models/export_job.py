@@ -55,6 +55,14 @@ class ExportJob(BaseModel, table=True):
         description="Specific journal IDs to export (for selective export)"
     )
     include_media: bool = Field(default=True, description="Whether to include media files")
+    since: Optional[datetime] = Field(
+        default=None,
+        description="Only export data changed after this time (for incremental export)"
+    )
+    base_export_id: Optional[uuid.UUID] = Field(
+        default=None,
+        description="Export this incremental export continues from"
+    )
 
     # Progress tracking
     total_items: int = Field(default=0, description="Total number of items to export")
@@ -5,8 +5,8 @@ from datetime import datetime
 from typing import Optional, Dict, Any, List
 import uuid
 
-from sqlalchemy import Column, ForeignKey, Enum as SAEnum
-from sqlmodel import Field, Column as SQLModelColumn, JSON
+from sqlalchemy import Column, ForeignKey, String, Text, Enum as SAEnum
+from sqlmodel import Field, Column as SQLModelColumn, JSON, SQLModel
 
 from app.models.base import BaseModel
 from app.models.enums import JobStatus, ImportSourceType
@@ -72,6 +72,13 @@ class ImportJob(BaseModel, table=True):
         description="List of warning messages"
     )
 
+    # Resume state of a running import, saved with every import commit
+    checkpoint: Optional[Dict[str, Any]] = Field(
+        default=None,
+        sa_column=SQLModelColumn(JSON),
+        description="State to resume an interrupted import from"
+    )
+
     # Completion timestamp
     completed_at: Optional[datetime] = Field(default=None, description="When the job completed or failed")
 
@@ -99,8 +106,13 @@ class ImportJob(BaseModel, table=True):
         self.status = JobStatus.COMPLETED
         self.progress = 100
         self.result_data = result_data
+        self.checkpoint = None
         self.completed_at = utc_now()
 
+    def save_checkpoint(self, checkpoint: Dict[str, Any]):
+        """Record the state an interrupted import resumes from."""
+        self.checkpoint = checkpoint
+
     def mark_failed(self, error_message: str):
         """Mark job as failed with error."""
         self.status = JobStatus.FAILED
@@ -119,3 +131,32 @@ class ImportJob(BaseModel, table=True):
         if self.warnings is None:
             self.warnings = []
         self.warnings.append(warning)
+
+
+class ImportIdMapping(SQLModel, table=True):
+    """
+    ID mapping recorded by a running import, saved with its checkpoints.
+
+    Each checkpoint appends the mappings added since the previous one rather
+    than rewriting the whole map with the job's checkpoint, so a resumed
+    import can still report every mapping in its result.
+    """
+    __tablename__ = "import_id_mappings"
+
+    import_job_id: uuid.UUID = Field(
+        sa_column=Column(
+            ForeignKey("import_jobs.id", ondelete="CASCADE"),
+            primary_key=True,
+            nullable=False
+        ),
+        description="Import job that recorded the mapping"
+    )
+    entity_type: str = Field(
+        sa_column=Column(String(20), primary_key=True, nullable=False),
+        description="Type of the mapped record (journals, entries, media)"
+    )
+    external_id: str = Field(
+        sa_column=Column(Text, primary_key=True, nullable=False),
+        description="ID of the record in the imported export"
+    )
+    new_id: uuid.UUID = Field(..., description="ID of the record created by the import")
@@ -55,7 +55,7 @@ class MediaDTO(BaseModel):
     # PLACEHOLDER: For import compatibility, not in database yet
     caption: Optional[str] = Field(None, description="PLACEHOLDER: Media caption (not stored in DB, use alt_text)")
 
-    # Import tracking (not exported for regular users)
+    # Import tracking (Journiv exports carry the record's own ID, to chain incremental exports)
     external_id: Optional[str] = Field(None, description="Original ID from source system")
 
 
@@ -117,7 +117,7 @@ class EntryDTO(BaseModel):
     created_at: datetime = Field(..., description="Entry creation time in UTC")
     updated_at: datetime = Field(..., description="Entry last update time in UTC")
 
-    # Import tracking (not exported for regular users)
+    # Import tracking (Journiv exports carry the record's own ID, to chain incremental exports)
     external_id: Optional[str] = Field(None, description="Original ID from source system")
 
     @field_validator('entry_timezone', mode='before')
@@ -172,7 +172,7 @@ class JournalDTO(BaseModel):
     created_at: datetime = Field(..., description="Journal creation time in UTC")
     updated_at: datetime = Field(..., description="Journal last update time in UTC")
 
-    # Import tracking (not exported for regular users)
+    # Import tracking (Journiv exports carry the record's own ID, to chain incremental exports)
     external_id: Optional[str] = Field(None, description="Original ID from source system")
 
 
@@ -219,11 +219,34 @@ class UserSettingsDTO(BaseModel):
 # Top-Level Export DTO
 # ============================================================================
 
+class ExportManifestDTO(BaseModel):
+    """
+    Identifies an export and what it covers, so incremental exports can be chained.
+
+    Maps to: ExportJob model (app/models/export_job.py)
+    """
+    export_id: str = Field(..., description="ID of the export job that wrote this export")
+    export_type: ExportType = Field(..., description="Export type: full, journal, incremental")
+    base_export_id: Optional[str] = Field(None, description="Export an incremental export continues from")
+    since: Optional[datetime] = Field(None, description="Only changes after this time are included (UTC)")
+    until: datetime = Field(..., description="Changes up to this time are included (UTC)")
+    journal_ids: Optional[List[str]] = Field(
+        None,
+        description="IDs of all the user's journals, for incremental exports; imports delete earlier imports of the others"
+    )
+    entry_ids: Optional[List[str]] = Field(
+        None,
+        description="IDs of all the user's entries, for incremental exports; imports delete earlier imports of the others"
+    )
+
+
 class JournivExportDTO(BaseModel):
     """
     Complete Journiv data export.
 
-    This is the top-level structure for full exports.
+    This is the top-level structure for full exports. Incremental exports
+    share it, holding only the journals and entries changed since their base
+    export (see manifest).
     """
     # Metadata
     export_version: str = Field("1.0", description="Export format version")
@@ -234,6 +257,7 @@ class JournivExportDTO(BaseModel):
     user_email: str = Field(..., description="User's email")
     user_name: Optional[str] = Field(None, description="User's display name")
     user_settings: Optional[UserSettingsDTO] = Field(None, description="User preferences")
+    manifest: Optional[ExportManifestDTO] = Field(None, description="Export identity, for chaining incremental exports")
 
     # Data
     journals: List[JournalDTO] = Field(..., description="All journals with their entries")
@@ -266,9 +290,14 @@ class ExportJobCreateRequest(BaseModel):
 
     Maps to: ExportJob model (app/models/export_job.py)
     """
-    export_type: ExportType = Field(..., description="Export type: full, journal")
+    export_type: ExportType = Field(..., description="Export type: full, journal, incremental")
     journal_ids: Optional[List[str]] = Field(None, description="Specific journal IDs for selective export")
     include_media: bool = Field(True, description="Whether to include media files")
+    since: Optional[datetime] = Field(None, description="Export changes after this time (for incremental export)")
+    base_export_id: Optional[str] = Field(
+        None,
+        description="Export changes since this earlier export (for incremental export; defaults to the latest)"
+    )
 
 
 class JobStatusResponse(BaseModel):
@@ -295,8 +324,10 @@ class ExportJobStatusResponse(JobStatusResponse):
 
     Maps to: ExportJob model (app/models/export_job.py)
     """
-    export_type: ExportType = Field(..., description="Export type: full, journal")
+    export_type: ExportType = Field(..., description="Export type: full, journal, incremental")
     include_media: bool = Field(..., description="Whether media is included")
+    since: Optional[datetime] = Field(None, description="Changes after this time are exported (incremental export)")
+    base_export_id: Optional[str] = Field(None, description="Export an incremental export continues from")
     file_path: Optional[str] = Field(None, description="Path to export file (internal use)")
     file_size: Optional[int] = Field(None, description="Export file size in bytes")
     download_url: Optional[str] = Field(None, description="URL to download export file")
@@ -322,7 +353,11 @@ class ImportResultSummary(BaseModel):
     Used in ImportJob.result_data (JSON field)
     """
     journals_created: int = Field(0, description="Number of journals created")
+    journals_updated: int = Field(0, description="Journals from earlier imports updated by an incremental import")
     entries_created: int = Field(0, description="Number of entries created")
+    entries_updated: int = Field(0, description="Created entries that replaced an earlier import of the same entry")
+    journals_deleted: int = Field(0, description="Journals from earlier imports deleted by an incremental import")
+    entries_deleted: int = Field(0, description="Entries from earlier imports deleted by an incremental import")
     media_files_imported: int = Field(0, description="Number of media files imported")
     tags_created: int = Field(0, description="Number of new tags created")
     moods_created: int = Field(0, description="Number of new mood definitions created")
@@ -346,6 +381,10 @@ class ImportResultSummary(BaseModel):
         default_factory=dict,
         description="Mapping of external IDs to newly created IDs grouped by entity type"
     )
+    manifest: Optional[ExportManifestDTO] = Field(
+        None,
+        description="Manifest of the imported export, to resolve incremental exports based on it"
+    )
 
 
 # ============================================================================
@@ -395,7 +434,7 @@ DATABASE SCHEMA MAPPING NOTES:
    - JournalColor: 20+ predefined hex colors
    - JobStatus: pending, running, completed, failed, cancelled
    - ImportSourceType: journiv, markdown, dayone
-   - ExportType: full, journal
+   - ExportType: full, journal, incremental
 
 PLACEHOLDER FIELDS (for future implementation):
 - MediaDTO: caption (use alt_text instead)
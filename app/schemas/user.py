@@ -175,3 +175,4 @@ class AdminUserListResponse(BaseModel):
     created_at: datetime
     login_type: str  # "local" or "oidc"
     linked_providers: Optional[list[str]] = None  # List of OIDC provider names
+    time_zone: str = "UTC"
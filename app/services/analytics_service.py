@@ -3,19 +3,37 @@ Analytics service for managing analytics data.
 """
 import uuid
 from datetime import datetime, date, timedelta, timezone
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, List, Tuple
 
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import delete, insert
+from sqlalchemy.dialects.postgresql import insert as postgres_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import SQLAlchemyError
 from sqlmodel import Session, select, func
 
+from app.core.analytics_cache import get_analytics_cache
+from app.core.config import settings
 from app.core.logging_config import log_info, log_error
-from app.models.analytics import WritingStreak
+from app.models.analytics import DailyMoodCount, DailyTagCount, WritingDay, WritingStreak
 from app.core.time_utils import utc_now
 from app.models.entry import Entry
 from app.models.journal import Journal
-from app.models.mood import MoodLog
+from app.models.mood import Mood, MoodLog
 from app.models.tag import Tag, EntryTagLink
 
+# Per-day deltas keyed by local entry date: (entry count delta, word count delta)
+DayChanges = Dict[date, Tuple[int, int]]
+
+# Dates per IN (...) clause when refreshing rollups, below SQLite's bind limit
+ROLLUP_DATE_BATCH_SIZE = 500
+
+
+def add_day_change(changes: DayChanges, entry_date: date, entry_delta: int, word_delta: int) -> None:
+    """Accumulate an entry/word delta for one day."""
+    entries, words = changes.get(entry_date, (0, 0))
+    changes[entry_date] = (entries + entry_delta, words + word_delta)
+
 
 class AnalyticsService:
     """Service class for analytics operations."""
@@ -45,72 +63,164 @@ class AnalyticsService:
             log_info(f"Writing streak created for user {user_id}")
         return streak
 
-    def update_writing_streak(self, user_id: uuid.UUID, entry_date: date) -> WritingStreak:
-        """Update writing streak when a new entry is created.
+    def record_entry_changes(self, user_id: uuid.UUID, changes: DayChanges) -> WritingStreak:
+        """
+        Fold per-day entry/word deltas into the day-count table and streak record.
 
-        Note: If the entry is backdated (earlier than last_entry_date),
-        we recalculate the entire streak to ensure accuracy.
+        Runs inside the caller's transaction and does not commit, so the counters
+        move atomically with the entry writes that caused them. Same-day and
+        forward-dated changes update the streak in O(1); only a writing day
+        appearing before the latest one or a day disappearing re-derives the
+        streak, and then from the compact writing_day rows.
         """
         streak = self.get_writing_streak(user_id)
+
+        changes = {
+            entry_date: deltas for entry_date, deltas in changes.items() if any(deltas)
+        }
+        remaining_by_day = self._adjust_writing_days(user_id, changes)
+
+        appeared_days = []
+        vanished_days = []
+        entry_delta_total = 0
+        word_delta_total = 0
+        for entry_date, (entry_delta, word_delta) in sorted(changes.items()):
+            remaining = remaining_by_day[entry_date]
+            previous = remaining - entry_delta
+            if previous <= 0 < remaining:
+                appeared_days.append(entry_date)
+            elif remaining <= 0 < previous:
+                vanished_days.append(entry_date)
+            entry_delta_total += entry_delta
+            word_delta_total += word_delta
+
         if not streak:
-            streak = self.create_writing_streak(user_id)
+            # First streak record for this user: derive everything from the day rows
+            streak = WritingStreak(user_id=user_id)
+            self._update_entry_stats(user_id, streak)
+            self._apply_streak_metadata(streak, self._recalculate_streak_metadata(user_id))
+            self.session.add(streak)
+            return streak
+
+        streak.total_entries = max(0, streak.total_entries + entry_delta_total)
+        streak.total_words = max(0, streak.total_words + word_delta_total)
+        streak.average_words_per_entry = (
+            streak.total_words / streak.total_entries if streak.total_entries > 0 else 0.0
+        )
+
+        backdated = bool(
+            appeared_days and streak.last_entry_date and appeared_days[0] < streak.last_entry_date
+        )
+        if vanished_days or backdated:
+            self._apply_streak_metadata(streak, self._recalculate_streak_metadata(user_id))
+        else:
+            for entry_date in appeared_days:
+                self._extend_streak(streak, entry_date)
+
+        streak.updated_at = utc_now()
+        self.session.add(streak)
+        return streak
 
-        # If backdated entry, recalculate everything from scratch
-        if streak.last_entry_date and entry_date < streak.last_entry_date:
-            log_info(f"Backdated entry detected for user {user_id}: {entry_date} < {streak.last_entry_date}. Recalculating streak.")
-            # Flush the session to ensure the entry is visible in queries
-            self.session.flush()
-            result = self.recalculate_writing_streak_stats(user_id)
-            return result if result is not None else streak
+    def _adjust_writing_days(
+        self,
+        user_id: uuid.UUID,
+        changes: DayChanges,
+    ) -> Dict[date, int]:
+        """
+        Atomically apply per-day deltas and return each day's remaining entry count.
+
+        All days are upserted with a single executemany statement; the counts
+        are then read back in date batches. The upsert keeps the rows locked
+        for the rest of the transaction, so the values read are exactly the
+        ones this change produced. Days left without entries are deleted.
+        """
+        if not changes:
+            return {}
+
+        now = utc_now()
+        dialect_insert = postgres_insert if settings.database_type == 'postgres' else sqlite_insert
+        statement = dialect_insert(WritingDay)
+        statement = statement.on_conflict_do_update(
+            index_elements=[WritingDay.user_id, WritingDay.entry_date],
+            set_={
+                'entry_count': WritingDay.entry_count + statement.excluded.entry_count,
+                'total_words': WritingDay.total_words + statement.excluded.total_words,
+                'updated_at': statement.excluded.updated_at,
+            },
+        )
+        self.session.exec(
+            statement,
+            params=[
+                {
+                    'user_id': user_id,
+                    'entry_date': entry_date,
+                    'entry_count': entry_delta,
+                    'total_words': word_delta,
+                    'created_at': now,
+                    'updated_at': now,
+                }
+                for entry_date, (entry_delta, word_delta) in changes.items()
+            ],
+        )
 
-        # Calculate if this is a consecutive day (only for forward-dated or same-day entries)
+        remaining_by_day: Dict[date, int] = {}
+        days = sorted(changes)
+        for start in range(0, len(days), ROLLUP_DATE_BATCH_SIZE):
+            batch = days[start:start + ROLLUP_DATE_BATCH_SIZE]
+            rows = self.session.exec(
+                select(WritingDay.entry_date, WritingDay.entry_count).where(
+                    WritingDay.user_id == user_id,
+                    WritingDay.entry_date.in_(batch),
+                )
+            ).all()
+            remaining_by_day.update({entry_date: int(count) for entry_date, count in rows})
+
+            if any(remaining_by_day[entry_date] <= 0 for entry_date in batch):
+                self.session.exec(
+                    delete(WritingDay).where(
+                        WritingDay.user_id == user_id,
+                        WritingDay.entry_date.in_(batch),
+                        WritingDay.entry_count <= 0,
+                    )
+                )
+        return remaining_by_day
+
+    def _extend_streak(self, streak: WritingStreak, entry_date: date) -> None:
+        """Advance streak metadata for a new writing day on or after the latest one."""
         if streak.last_entry_date:
             days_diff = (entry_date - streak.last_entry_date).days
             if days_diff == 1:
                 # Consecutive day - increment streak
                 streak.current_streak += 1
-                if streak.current_streak > streak.longest_streak:
-                    streak.longest_streak = streak.current_streak
             elif days_diff > 1:
                 # Gap in entries - reset streak
                 streak.current_streak = 1
                 streak.streak_start_date = entry_date
-                # Update longest streak if needed
-                if streak.current_streak > streak.longest_streak:
-                    streak.longest_streak = streak.current_streak
             # If days_diff == 0, it's the same day, don't change streak
         else:
             # First entry
             streak.current_streak = 1
             streak.streak_start_date = entry_date
-            # Update longest streak if needed
-            if streak.current_streak > streak.longest_streak:
-                streak.longest_streak = streak.current_streak
 
-        # Update last entry date (only if current or future date)
+        if streak.current_streak > streak.longest_streak:
+            streak.longest_streak = streak.current_streak
         streak.last_entry_date = entry_date
 
-        # Update total entries and words
-        self._update_entry_stats(user_id, streak)
-
-        try:
-            self.session.add(streak)
-            self.session.commit()
-            self.session.refresh(streak)
-        except SQLAlchemyError as exc:
-            self.session.rollback()
-            log_error(exc)
-            raise
-        else:
-            log_info(f"Writing streak updated for user {user_id}")
-        return streak
+    def _apply_streak_metadata(self, streak: WritingStreak, streaks: Dict[str, Any]) -> None:
+        """Copy recalculated streak metadata onto the streak record."""
+        streak.current_streak = streaks['current_streak']
+        streak.longest_streak = streaks['longest_streak']
+        streak.last_entry_date = streaks['last_entry_date']
+        streak.streak_start_date = streaks['streak_start_date']
 
     def recalculate_writing_streak_stats(self, user_id: uuid.UUID) -> Optional[WritingStreak]:
         """
-        Recalculate writing streak statistics for a user.
+        Rebuild writing streak statistics for a user from their entries.
 
-        This should be called when entries are deleted to ensure the cached
-        total_entries, total_words, and streak metadata values are accurate.
+        Regenerates the user's writing_day rows from an aggregate over entries,
+        then derives totals and streak metadata from them. Day-to-day changes
+        go through record_entry_changes(); this is for bulk writes (imports)
+        and repairs.
 
         Returns:
             WritingStreak object if it exists, None otherwise
@@ -119,13 +229,9 @@ class AnalyticsService:
         if not streak:
             return None
 
+        self._rebuild_writing_days(user_id)
         self._update_entry_stats(user_id, streak)
-
-        streaks = self._recalculate_streak_metadata(user_id)
-        streak.current_streak = streaks['current_streak']
-        streak.longest_streak = streaks['longest_streak']
-        streak.last_entry_date = streaks['last_entry_date']
-        streak.streak_start_date = streaks['streak_start_date']
+        self._apply_streak_metadata(streak, self._recalculate_streak_metadata(user_id))
 
         try:
             self.session.add(streak)
@@ -139,34 +245,49 @@ class AnalyticsService:
         log_info(f"Writing streak stats recalculated for user {user_id}")
         return streak
 
+    def _rebuild_writing_days(self, user_id: uuid.UUID) -> None:
+        """Replace a user's writing_day rows with fresh per-day aggregates."""
+        self.session.exec(delete(WritingDay).where(WritingDay.user_id == user_id))
+        days = self.session.exec(
+            select(
+                Entry.entry_date,
+                func.count(Entry.id),
+                func.coalesce(func.sum(Entry.word_count), 0),
+            )
+            .where(Entry.user_id == user_id)
+            .group_by(Entry.entry_date)
+        ).all()
+        self.session.add_all(
+            WritingDay(
+                user_id=user_id,
+                entry_date=entry_date,
+                entry_count=int(entry_count),
+                total_words=int(total_words or 0),
+            )
+            for entry_date, entry_count, total_words in days
+        )
+        self.session.flush()
+
     def _update_entry_stats(self, user_id: uuid.UUID, streak: WritingStreak):
-        """Update total entries and words statistics."""
-        result = self.session.exec(
+        """Update total entries and words statistics from the day-count table."""
+        total_entries, total_words = self.session.exec(
             select(
-                func.count(Entry.id).label("entry_count"),
-                func.coalesce(func.sum(Entry.word_count), 0).label("total_words"),
+                func.coalesce(func.sum(WritingDay.entry_count), 0),
+                func.coalesce(func.sum(WritingDay.total_words), 0),
             ).where(
-                Entry.user_id == user_id,
+                WritingDay.user_id == user_id,
             )
-        ).first()
-
-        if result is None:
-            total_entries = 0
-            total_words = 0
-        elif isinstance(result, tuple):
-            total_entries = int(result[0] or 0)
-            total_words = int(result[1] or 0)
-        else:
-            total_entries = int(getattr(result, "entry_count", 0) or 0)
-            total_words = int(getattr(result, "total_words", 0) or 0)
+        ).one()
 
-        streak.total_entries = total_entries
-        streak.total_words = total_words
-        streak.average_words_per_entry = total_words / total_entries if total_entries > 0 else 0.0
+        streak.total_entries = int(total_entries or 0)
+        streak.total_words = int(total_words or 0)
+        streak.average_words_per_entry = (
+            streak.total_words / streak.total_entries if streak.total_entries > 0 else 0.0
+        )
 
     def _recalculate_streak_metadata(self, user_id: uuid.UUID) -> Dict[str, Any]:
         """
-        Recalculate streak metadata from all user entries.
+        Recalculate streak metadata from the user's writing days.
 
         Streaks are based on UNIQUE days that have at least one entry.
         Multiple entries on the same day count as one day for streak purposes.
@@ -174,17 +295,12 @@ class AnalyticsService:
         Returns:
             Dict with current_streak, longest_streak, last_entry_date, streak_start_date
         """
-        # Expire all to ensure we get fresh data from the database
-        self.session.expire_all()
-        entries = self.session.exec(
-            select(Entry).where(Entry.user_id == user_id).order_by(Entry.entry_date.desc())
+        unique_dates = self.session.exec(
+            select(WritingDay.entry_date)
+            .where(WritingDay.user_id == user_id, WritingDay.entry_count > 0)
+            .order_by(WritingDay.entry_date.desc())
         ).all()
 
-        unique_dates = sorted(
-            {e.entry_date for e in entries if e.entry_date is not None},
-            reverse=True
-        )
-
         if not unique_dates:
             return {
                 'current_streak': 0,
@@ -223,6 +339,107 @@ class AnalyticsService:
             'streak_start_date': streak_start_date
         }
 
+    def refresh_daily_rollups(self, user_id: uuid.UUID, dates: Iterable[Optional[date]]) -> None:
+        """
+        Recompute the mood and tag rollup rows for the given days.
+
+        Runs inside the caller's transaction (pending writes are flushed by the
+        aggregate queries) and does not commit. Cost is proportional to the
+        rows on the affected days, not to the user's history.
+        """
+        days = sorted({day for day in dates if day is not None})
+        for start in range(0, len(days), ROLLUP_DATE_BATCH_SIZE):
+            batch = days[start:start + ROLLUP_DATE_BATCH_SIZE]
+            self.session.exec(
+                delete(DailyMoodCount).where(
+                    DailyMoodCount.user_id == user_id,
+                    DailyMoodCount.logged_date.in_(batch),
+                )
+            )
+            self.session.exec(
+                delete(DailyTagCount).where(
+                    DailyTagCount.user_id == user_id,
+                    DailyTagCount.entry_date.in_(batch),
+                )
+            )
+            self._insert_daily_rollups(user_id, batch)
+
+    def rebuild_daily_rollups(self, user_id: uuid.UUID) -> None:
+        """
+        Regenerate every daily rollup row and the streak record for a user.
+
+        Used by the rebuild Celery task to repair drift; regular writes keep
+        the rollups current through record_entry_changes() and
+        refresh_daily_rollups().
+        """
+        try:
+            self._rebuild_writing_days(user_id)
+            self.session.exec(delete(DailyMoodCount).where(DailyMoodCount.user_id == user_id))
+            self.session.exec(delete(DailyTagCount).where(DailyTagCount.user_id == user_id))
+            self._insert_daily_rollups(user_id)
+
+            streak = self.get_writing_streak(user_id)
+            if streak:
+                self._update_entry_stats(user_id, streak)
+                self._apply_streak_metadata(streak, self._recalculate_streak_metadata(user_id))
+                self.session.add(streak)
+            self.session.commit()
+        except SQLAlchemyError as exc:
+            self.session.rollback()
+            log_error(exc)
+            raise
+
+        log_info(f"Daily analytics rollups rebuilt for user {user_id}")
+
+    def _insert_daily_rollups(self, user_id: uuid.UUID, days: Optional[List[date]] = None) -> None:
+        """Aggregate mood logs and tag links into rollup rows (all days when days is None)."""
+        mood_statement = (
+            select(MoodLog.logged_date, Mood.category, func.count(MoodLog.id))
+            .join(Mood, Mood.id == MoodLog.mood_id)
+            .where(MoodLog.user_id == user_id)
+            .group_by(MoodLog.logged_date, Mood.category)
+        )
+        tag_statement = (
+            select(Entry.entry_date, EntryTagLink.tag_id, func.count(EntryTagLink.entry_id))
+            .join(Entry, Entry.id == EntryTagLink.entry_id)
+            .where(Entry.user_id == user_id)
+            .group_by(Entry.entry_date, EntryTagLink.tag_id)
+        )
+        if days is not None:
+            mood_statement = mood_statement.where(MoodLog.logged_date.in_(days))
+            tag_statement = tag_statement.where(Entry.entry_date.in_(days))
+
+        mood_rows = self.session.exec(mood_statement).all()
+        tag_rows = self.session.exec(tag_statement).all()
+        # Plain executemany inserts: a bulk import can touch tens of thousands
+        # of rollup rows, and nothing reads these back as ORM instances
+        if mood_rows:
+            self.session.exec(
+                insert(DailyMoodCount),
+                params=[
+                    {
+                        'user_id': user_id,
+                        'logged_date': logged_date,
+                        'category': str(getattr(category, "value", category)),
+                        'mood_count': int(mood_count),
+                    }
+                    for logged_date, category, mood_count in mood_rows
+                ],
+            )
+        if tag_rows:
+            self.session.exec(
+                insert(DailyTagCount),
+                params=[
+                    {
+                        'user_id': user_id,
+                        'entry_date': entry_date,
+                        'tag_id': tag_id,
+                        'usage_count': int(usage_count),
+                    }
+                    for entry_date, tag_id, usage_count in tag_rows
+                ],
+            )
+
     def get_writing_analytics(self, user_id: uuid.UUID) -> Dict[str, Any]:
         """Get comprehensive writing analytics for a user."""
         streak = self.get_writing_streak(user_id)
@@ -252,56 +469,161 @@ class AnalyticsService:
         end_date = utc_now().date()
         start_date = end_date - timedelta(days=days)
 
-        # Get entries by day
-        entries_by_day = self.session.exec(
+        # Per-day counters come from the daily rollup tables
+        return self._format_writing_patterns(
+            days,
+            start_date,
+            self._get_writing_days(user_id, start_date, end_date),
+            self._get_mood_days(user_id, start_date, end_date),
+            self._get_top_tags(user_id, start_date, end_date),
+        )
+
+    def get_productivity_metrics(self, user_id: uuid.UUID) -> Dict[str, Any]:
+        """Get productivity metrics for a user.
+
+        Months are bucketed by the entries' local dates via the writing_day
+        rollup.
+        """
+        today = utc_now().date()
+        last_month_start = (today.replace(day=1) - timedelta(days=1)).replace(day=1)
+        return self._summarize_productivity(
+            today, self._get_writing_days(user_id, last_month_start, today)
+        )
+
+    def get_journal_analytics(self, user_id: uuid.UUID) -> Dict[str, Any]:
+        """Get analytics for all journals of a user.
+
+        Reads the journal's denormalized counters, which the entry service
+        keeps current on every entry write.
+        """
+        return self._format_journal_analytics(self._get_journals(user_id))
+
+    def get_analytics_dashboard(self, user_id: uuid.UUID, days: int = 30) -> Dict[str, Any]:
+        """Get the combined analytics dashboard, served from cache when current.
+
+        The cache key carries the user's version stamp, which entry, mood, tag
+        and journal writes replace after committing.
+        """
+        cache = get_analytics_cache()
+        scope_id = str(user_id)
+        today = utc_now().date()
+
+        # Read the stamp before the data so a write racing with this build
+        # leaves the result under a stamp that is already superseded.
+        version = cache.get_version(scope_id)
+        dashboard = cache.get_dashboard(scope_id, days, today, version)
+        if dashboard is not None:
+            return dashboard
+
+        dashboard = jsonable_encoder(self._build_analytics_dashboard(user_id, days, today))
+        cache.set_dashboard(scope_id, days, today, version, dashboard)
+        return dashboard
+
+    def _build_analytics_dashboard(self, user_id: uuid.UUID, days: int, today: date) -> Dict[str, Any]:
+        """Compute the dashboard with one query per source table.
+
+        A single writing_day range read covers both the pattern window and the
+        two months the productivity metrics compare.
+        """
+        start_date = today - timedelta(days=days)
+        last_month_start = (today.replace(day=1) - timedelta(days=1)).replace(day=1)
+
+        writing_analytics = self.get_writing_analytics(user_id)
+        writing_days = self._get_writing_days(user_id, min(start_date, last_month_start), today)
+        writing_patterns = self._format_writing_patterns(
+            days,
+            start_date,
+            writing_days,
+            self._get_mood_days(user_id, start_date, today),
+            self._get_top_tags(user_id, start_date, today),
+        )
+        productivity_metrics = self._summarize_productivity(today, writing_days)
+        journal_analytics = self._format_journal_analytics(self._get_journals(user_id))
+
+        return {
+            "writing_streak": writing_analytics,
+            "writing_patterns": writing_patterns,
+            "productivity": productivity_metrics,
+            "journals": journal_analytics,
+            "summary": {
+                "total_journals": len(journal_analytics.get("journals", [])),
+                "total_entries": writing_analytics.get("total_entries", 0),
+                "current_streak": writing_analytics.get("current_streak", 0),
+                "longest_streak": writing_analytics.get("longest_streak", 0)
+            }
+        }
+
+    def _get_writing_days(self, user_id: uuid.UUID, start_date: date, end_date: date) -> List[Any]:
+        """Return (entry_date, entry_count, total_words) rollup rows in a date range."""
+        return self.session.exec(
             select(
-                Entry.entry_date.label('entry_date'),
-                func.count(Entry.id).label('entry_count'),
-                func.sum(Entry.word_count).label('total_words')
+                WritingDay.entry_date,
+                WritingDay.entry_count,
+                WritingDay.total_words,
             )
             .where(
-                Entry.user_id == user_id,
-                Entry.entry_date >= start_date,
-                Entry.entry_date <= end_date
+                WritingDay.user_id == user_id,
+                WritingDay.entry_date >= start_date,
+                WritingDay.entry_date <= end_date
             )
-            .group_by(Entry.entry_date)
-            .order_by(Entry.entry_date)
+            .order_by(WritingDay.entry_date)
         ).all()
 
-        # Get mood patterns
-        mood_patterns = self.session.exec(
+    def _get_mood_days(self, user_id: uuid.UUID, start_date: date, end_date: date) -> List[Any]:
+        """Return (logged_date, category, mood_count) rollup rows in a date range."""
+        return self.session.exec(
             select(
-                MoodLog.logged_date.label('mood_date'),
-                func.count(MoodLog.id).label('mood_count')
+                DailyMoodCount.logged_date,
+                DailyMoodCount.category,
+                DailyMoodCount.mood_count,
             )
             .where(
-                MoodLog.user_id == user_id,
-                MoodLog.logged_date >= start_date,
-                MoodLog.logged_date <= end_date
+                DailyMoodCount.user_id == user_id,
+                DailyMoodCount.logged_date >= start_date,
+                DailyMoodCount.logged_date <= end_date
             )
-            .group_by(MoodLog.logged_date)
-            .order_by(MoodLog.logged_date)
+            .order_by(DailyMoodCount.logged_date)
         ).all()
 
-        # Get tag usage
-        tag_usage = self.session.exec(
+    def _get_top_tags(self, user_id: uuid.UUID, start_date: date, end_date: date) -> List[Any]:
+        """Return the ten most used (name, usage_count) tags in a date range."""
+        return self.session.exec(
             select(
                 Tag.name,
-                func.count(EntryTagLink.entry_id).label('usage_count')
+                func.sum(DailyTagCount.usage_count).label('usage_count')
             )
-            .join(EntryTagLink, Tag.id == EntryTagLink.tag_id)
-            .join(Entry, EntryTagLink.entry_id == Entry.id)
+            .join(Tag, Tag.id == DailyTagCount.tag_id)
             .where(
-                Tag.user_id == user_id,
-                Entry.user_id == user_id,
-                Entry.entry_date >= start_date,
-                Entry.entry_date <= end_date
+                DailyTagCount.user_id == user_id,
+                DailyTagCount.entry_date >= start_date,
+                DailyTagCount.entry_date <= end_date
             )
-            .group_by(Tag.name)
-            .order_by(func.count(EntryTagLink.entry_id).desc())
+            .group_by(Tag.id, Tag.name)
+            .order_by(func.sum(DailyTagCount.usage_count).desc())
             .limit(10)
         ).all()
 
+    def _get_journals(self, user_id: uuid.UUID) -> List[Journal]:
+        return self.session.exec(
+            select(Journal)
+            .where(
+                Journal.user_id == user_id,
+            )
+            .order_by(Journal.entry_count.desc())
+        ).all()
+
+    @staticmethod
+    def _format_writing_patterns(
+        days: int,
+        start_date: date,
+        writing_days: List[Any],
+        mood_rows: List[Any],
+        tag_usage: List[Any],
+    ) -> Dict[str, Any]:
+        mood_patterns: Dict[date, Dict[str, int]] = {}
+        for logged_date, category, mood_count in mood_rows:
+            mood_patterns.setdefault(logged_date, {})[category] = mood_count
+
         return {
             'period_days': days,
             'entries_by_day': [
@@ -310,14 +632,16 @@ class AnalyticsService:
                     'entry_count': day.entry_count,
                     'total_words': day.total_words or 0
                 }
-                for day in entries_by_day
+                for day in writing_days
+                if day.entry_date >= start_date
             ],
             'mood_patterns': [
                 {
-                    'date': str(day.mood_date),
-                    'mood_count': day.mood_count
+                    'date': str(mood_date),
+                    'mood_count': sum(categories.values()),
+                    'categories': categories
                 }
-                for day in mood_patterns
+                for mood_date, categories in mood_patterns.items()
             ],
             'top_tags': [
                 {
@@ -328,46 +652,28 @@ class AnalyticsService:
             ]
         }
 
-    def get_productivity_metrics(self, user_id: uuid.UUID) -> Dict[str, Any]:
-        """Get productivity metrics for a user."""
-        now = utc_now()
-        month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-
-        current_month_entries = self.session.exec(
-            select(func.count(Entry.id))
-            .where(
-                Entry.user_id == user_id,
-                Entry.entry_datetime_utc >= month_start
-            )
-        ).one() or 0
-
-        current_month_words = self.session.exec(
-            select(func.coalesce(func.sum(Entry.word_count), 0))
-            .where(
-                Entry.user_id == user_id,
-                Entry.entry_datetime_utc >= month_start
-            )
-        ).one() or 0
-
-        # Get last month stats for comparison
-        last_month_end = month_start - timedelta(seconds=1)
-        last_month_start = last_month_end.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-
-        last_month_entries = self.session.exec(
-            select(func.count(Entry.id))
-            .where(
-                Entry.user_id == user_id,
-                Entry.entry_datetime_utc >= last_month_start,
-                Entry.entry_datetime_utc < month_start
-            )
-        ).one() or 0
+    @staticmethod
+    def _summarize_productivity(today: date, writing_days: List[Any]) -> Dict[str, Any]:
+        """Compare this month with last month from rollup rows covering both."""
+        month_start = today.replace(day=1)
+        last_month_start = (month_start - timedelta(days=1)).replace(day=1)
+
+        current_month_entries = 0
+        current_month_words = 0
+        last_month_entries = 0
+        for day in writing_days:
+            if month_start <= day.entry_date <= today:
+                current_month_entries += day.entry_count
+                current_month_words += day.total_words or 0
+            elif last_month_start <= day.entry_date < month_start:
+                last_month_entries += day.entry_count
 
         # Calculate growth
         entry_growth = 0
-        if last_month_entries and last_month_entries > 0:
+        if last_month_entries > 0:
             entry_growth = ((current_month_entries - last_month_entries) / last_month_entries) * 100
 
-        today_day = now.date().day
+        today_day = today.day
         return {
             'current_month_entries': current_month_entries,
             'current_month_words': current_month_words,
@@ -376,25 +682,8 @@ class AnalyticsService:
             'average_words_per_day': round(current_month_words / today_day, 2)
         }
 
-    def get_journal_analytics(self, user_id: uuid.UUID) -> Dict[str, Any]:
-        """Get analytics for all journals of a user."""
-        # Get journal stats
-        journal_stats = self.session.exec(
-            select(
-                Journal.id,
-                Journal.title,
-                func.count(Entry.id).label('entry_count'),
-                func.sum(Entry.word_count).label('total_words'),
-                func.max(Entry.entry_datetime_utc).label('last_entry')
-            )
-            .outerjoin(Entry, Journal.id == Entry.journal_id)
-            .where(
-                Journal.user_id == user_id,
-            )
-            .group_by(Journal.id, Journal.title)
-            .order_by(func.count(Entry.id).desc())
-        ).all()
-
+    @staticmethod
+    def _format_journal_analytics(journals: List[Journal]) -> Dict[str, Any]:
         return {
             'journals': [
                 {
@@ -402,8 +691,8 @@ class AnalyticsService:
                     'title': journal.title,
                     'entry_count': journal.entry_count,
                     'total_words': journal.total_words or 0,
-                    'last_entry': journal.last_entry
+                    'last_entry': journal.last_entry_at
                 }
-                for journal in journal_stats
+                for journal in journals
             ]
         }
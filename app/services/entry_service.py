@@ -1,25 +1,47 @@
 """
 Entry service for managing journal entries.
 """
+import re
 import uuid
 from datetime import date, datetime
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import column, func, literal_column, or_, text, update
+from sqlalchemy.exc import OperationalError, SQLAlchemyError
 from sqlmodel import Session, select
 from zoneinfo import ZoneInfo
 
+from app.core.analytics_cache import get_analytics_cache
+from app.core.concurrency import run_in_db_threadpool
+from app.core.config import settings
 from app.core.exceptions import EntryNotFoundError, JournalNotFoundError, ValidationError
 from app.core.logging_config import log_info, log_warning, log_error
+from app.core.pagination import EntryCursor, apply_entry_cursor
 from app.core.time_utils import utc_now, local_date_for_user, ensure_utc, to_utc
 from app.models.entry import Entry, EntryMedia
 from app.models.entry_tag_link import EntryTagLink
 from app.models.journal import Journal
+from app.models.mood import MoodLog
 from app.schemas.entry import EntryCreate, EntryUpdate, EntryMediaCreate
 
 DEFAULT_ENTRY_PAGE_LIMIT = 50
 MAX_ENTRY_PAGE_LIMIT = 100
 
+# Word tokens extracted from free-form search input before building FTS queries
+_SEARCH_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def touch_entries(session: Session, entry_ids: Iterable[Optional[uuid.UUID]]) -> None:
+    """Bump updated_at of entries whose tags, media or mood logs were removed or relinked.
+
+    Removing a row leaves nothing newer behind, so without this an incremental
+    export would not see the entry as changed. Runs inside the caller's
+    transaction and does not commit.
+    """
+    entry_ids = {entry_id for entry_id in entry_ids if entry_id is not None}
+    if entry_ids:
+        session.execute(update(Entry).where(Entry.id.in_(entry_ids)).values(updated_at=utc_now()))
+
 
 class EntryService:
     """Service class for entry operations."""
@@ -134,8 +156,14 @@ class EntryService:
             user_id=user_id
         )
 
+        from app.services.analytics_service import AnalyticsService
+
         try:
             self.session.add(entry)
+            # Keep the day-count table and writing streak in the same transaction
+            AnalyticsService(self.session).record_entry_changes(
+                user_id, {entry_date: (1, word_count)}
+            )
             self._commit()
             self.session.refresh(entry)
         except SQLAlchemyError as exc:
@@ -155,14 +183,7 @@ class EntryService:
         except Exception as exc:
             log_error(exc)
 
-        # Update writing streak analytics
-        try:
-            from app.services.analytics_service import AnalyticsService
-            analytics_service = AnalyticsService(self.session)
-            analytics_service.update_writing_streak(user_id, entry.entry_date)
-        except Exception as exc:
-            log_error(exc)
-
+        get_analytics_cache().invalidate(str(user_id))
         return entry
 
     def get_entry_by_id(self, entry_id: uuid.UUID, user_id: uuid.UUID) -> Optional[Entry]:
@@ -179,9 +200,14 @@ class EntryService:
         user_id: uuid.UUID,
         limit: int = DEFAULT_ENTRY_PAGE_LIMIT,
         offset: int = 0,
-        include_pinned: bool = True
+        include_pinned: bool = True,
+        cursor: Optional[EntryCursor] = None
     ) -> List[Entry]:
-        """Get entries for a specific journal."""
+        """Get entries for a specific journal.
+
+        When a cursor is given, offset is ignored and the page starts right
+        after the cursor position.
+        """
         from app.services.journal_service import JournalService
         JournalService(self.session)._get_owned_journal(journal_id, user_id)
 
@@ -192,31 +218,45 @@ class EntryService:
         if not include_pinned:
             statement = statement.where(Entry.is_pinned.is_(False))
 
+        statement = apply_entry_cursor(statement, cursor, pinned_first=True)
         statement = statement.order_by(
             Entry.is_pinned.desc(),
-            Entry.entry_datetime_utc.desc()
-        ).offset(offset).limit(limit)
+            Entry.entry_datetime_utc.desc(),
+            Entry.id.desc()
+        )
+        if cursor is None:
+            statement = statement.offset(offset)
 
-        return list(self.session.exec(statement))
+        return list(self.session.exec(statement.limit(limit)))
 
     def get_user_entries(
         self,
         user_id: uuid.UUID,
         limit: int = DEFAULT_ENTRY_PAGE_LIMIT,
         offset: int = 0,
+        cursor: Optional[EntryCursor] = None,
     ) -> List[Entry]:
-        """Get all entries for a user across all journals, sorted by entry_datetime_utc descending."""
+        """Get all entries for a user across all journals, sorted by entry_datetime_utc descending.
+
+        When a cursor is given, offset is ignored and the page starts right
+        after the cursor position.
+        """
         statement = select(Entry).where(
             Entry.user_id == user_id,
-        ).order_by(Entry.entry_datetime_utc.desc())
+        )
 
-        statement = statement.offset(offset).limit(limit)
+        statement = apply_entry_cursor(statement, cursor)
+        statement = statement.order_by(Entry.entry_datetime_utc.desc(), Entry.id.desc())
+        if cursor is None:
+            statement = statement.offset(offset)
 
-        return list(self.session.exec(statement))
+        return list(self.session.exec(statement.limit(limit)))
 
     def update_entry(self, entry_id: uuid.UUID, user_id: uuid.UUID, entry_data: EntryUpdate) -> Entry:
         """Update an entry."""
         entry = self._get_owned_entry(entry_id, user_id)
+        old_entry_date = entry.entry_date
+        old_word_count = entry.word_count
 
         # Handle journal change if requested
         old_journal_id = None
@@ -277,8 +317,19 @@ class EntryService:
             entry.is_pinned = entry_data.is_pinned
 
         entry.updated_at = utc_now()
+
+        from app.services.analytics_service import AnalyticsService, add_day_change
+
+        day_changes = {}
+        add_day_change(day_changes, old_entry_date, -1, -old_word_count)
+        add_day_change(day_changes, entry.entry_date, 1, entry.word_count)
         try:
             self.session.add(entry)
+            analytics_service = AnalyticsService(self.session)
+            analytics_service.record_entry_changes(user_id, day_changes)
+            if entry.entry_date != old_entry_date:
+                # Tag usage follows the entry to its new day
+                analytics_service.refresh_daily_rollups(user_id, [old_entry_date, entry.entry_date])
             self._commit()
             self.session.refresh(entry)
         except SQLAlchemyError as exc:
@@ -286,15 +337,19 @@ class EntryService:
             log_error(exc)
             raise
 
-        # Recalculate stats for both journals if journal was changed
+        # Recalculate stats for both journals if journal was changed, or for the
+        # current journal when its word total or latest entry time may have moved
+        journals_to_recount = []
         if old_journal_id is not None and new_journal_id is not None:
+            journals_to_recount = [old_journal_id, new_journal_id]
+        elif entry.word_count != old_word_count or timestamp_changed:
+            journals_to_recount = [entry.journal_id]
+        if journals_to_recount:
             try:
                 from app.services.journal_service import JournalService
                 journal_service = JournalService(self.session)
-                # Recalculate old journal stats
-                journal_service.recalculate_journal_entry_count(old_journal_id, user_id)
-                # Recalculate new journal stats
-                journal_service.recalculate_journal_entry_count(new_journal_id, user_id)
+                for journal_id in journals_to_recount:
+                    journal_service.recalculate_journal_entry_count(journal_id, user_id)
             except JournalNotFoundError:
                 log_warning(f"Journal missing during entry update recount for user {user_id}")
             except SQLAlchemyError as exc:
@@ -302,11 +357,31 @@ class EntryService:
             except Exception as exc:
                 log_error(exc)
 
+        get_analytics_cache().invalidate(str(user_id))
         log_info(f"Entry updated for user {user_id}: {entry.id}")
         return entry
 
     async def delete_entry(self, entry_id: uuid.UUID, user_id: uuid.UUID) -> bool:
         """Hard delete an entry and its related records."""
+        from app.services.media_service import MediaService
+
+        media_files_to_delete = await run_in_db_threadpool(
+            self._delete_entry_records, entry_id, user_id
+        )
+
+        # Delete physical media files from disk
+        media_service = MediaService()
+        for file_path in media_files_to_delete:
+            try:
+                await media_service.delete_media_file(file_path)
+            except Exception as exc:
+                log_warning(f"Failed to delete media file {file_path} after entry deletion: {exc}")
+
+        log_info(f"Entry hard-deleted for user {user_id}: {entry_id}")
+        return True
+
+    def _delete_entry_records(self, entry_id: uuid.UUID, user_id: uuid.UUID) -> List[str]:
+        """Delete the entry rows and refresh derived stats; return media files to remove."""
         entry = self._get_owned_entry(entry_id, user_id)
 
         # Hard delete related EntryMedia records
@@ -315,16 +390,7 @@ class EntryService:
         media_statement = select(EntryMedia).where(EntryMedia.entry_id == entry_id)
         media_records = self.session.exec(media_statement).all()
 
-        media_service = MediaService()
-        media_files_to_delete = []
-
         for media in media_records:
-            # Collect file paths for deletion (file_path is relative to media_root)
-            if media.file_path:
-                full_path = (media_service.media_root / media.file_path).resolve()
-                if full_path.exists() and str(full_path).startswith(str(media_service.media_root.resolve())):
-                    media_files_to_delete.append(str(full_path))
-
             self.session.delete(media)
 
         # Hard delete related EntryTagLink records
@@ -336,10 +402,26 @@ class EntryService:
         # Store journal_id for recount before deleting entry
         journal_id = entry.journal_id
 
+        # The entry's mood log goes with it; remember its day for the rollup
+        mood_log_dates = self.session.exec(
+            select(MoodLog.logged_date).where(MoodLog.entry_id == entry_id)
+        ).all()
+
         # Hard delete the entry
         self.session.delete(entry)
 
+        from app.services.analytics_service import AnalyticsService
+
         try:
+            # Files shared with other media stay on disk
+            media_files_to_delete = MediaService().release_media_files(
+                self.session, user_id, media_records
+            )
+            analytics_service = AnalyticsService(self.session)
+            analytics_service.record_entry_changes(
+                user_id, {entry.entry_date: (-1, -entry.word_count)}
+            )
+            analytics_service.refresh_daily_rollups(user_id, [entry.entry_date, *mood_log_dates])
             self._commit()
         except SQLAlchemyError as exc:
             self.session.rollback()
@@ -356,25 +438,8 @@ class EntryService:
         except Exception as exc:
             log_error(exc)
 
-        # Recalculate writing streak statistics after entry is deleted
-        # This ensures analytics reflect the correct entry counts
-        try:
-            from app.services.analytics_service import AnalyticsService
-            analytics_service = AnalyticsService(self.session)
-            analytics_service.recalculate_writing_streak_stats(user_id)
-        except Exception as exc:
-            # Log error but don't fail the deletion
-            log_warning(f"Failed to update writing streak stats after entry deletion: {exc}")
-
-        # Delete physical media files from disk
-        for file_path in media_files_to_delete:
-            try:
-                await media_service.delete_media_file(file_path)
-            except Exception as exc:
-                log_warning(f"Failed to delete media file {file_path} after entry deletion: {exc}")
-
-        log_info(f"Entry hard-deleted for user {user_id}: {entry_id}")
-        return True
+        get_analytics_cache().invalidate(str(user_id))
+        return media_files_to_delete
 
     def toggle_pin(self, entry_id: uuid.UUID, user_id: uuid.UUID) -> Entry:
         """Toggle pin status of an entry."""
@@ -394,6 +459,21 @@ class EntryService:
         log_info(f"Entry pin toggled for user {user_id}: {entry.id} -> {entry.is_pinned}")
         return entry
 
+    # Weighted search document (title = A, content = B). Must match the GIN index
+    # expression created by migration 98a16e3b00f5 so PostgreSQL can use it.
+    _POSTGRES_SEARCH_DOCUMENT = (
+        "(setweight(to_tsvector('simple', coalesce(entry.title, '')), 'A') || "
+        "setweight(to_tsvector('simple', entry.content), 'B'))"
+    )
+    # bm25 column weights for the SQLite FTS5 table (title, content)
+    _SQLITE_TITLE_WEIGHT = 10.0
+    _SQLITE_CONTENT_WEIGHT = 1.0
+
+    @staticmethod
+    def _tokenize_search_query(query: str) -> List[str]:
+        """Split a search query into word tokens safe to embed in FTS syntax."""
+        return _SEARCH_TOKEN_PATTERN.findall(query or "")
+
     def search_entries(
         self,
         user_id: uuid.UUID,
@@ -402,10 +482,102 @@ class EntryService:
         limit: int = DEFAULT_ENTRY_PAGE_LIMIT,
         offset: int = 0
     ) -> List[Entry]:
-        """Search entries by content."""
+        """Search entries by title and content.
+
+        Uses the full-text index (FTS5 on SQLite, tsvector/GIN on PostgreSQL) with
+        prefix matching on every term. Results are ranked by relevance, with title
+        matches weighted above content matches, then by entry_datetime_utc descending.
+        Falls back to a substring scan when the query has no word tokens or the
+        index is unavailable.
+        """
+        tokens = self._tokenize_search_query(query)
+        if tokens:
+            if settings.database_type == 'postgres':
+                return self._search_entries_postgres(user_id, tokens, journal_id, limit, offset)
+            try:
+                return self._search_entries_sqlite(user_id, tokens, journal_id, limit, offset)
+            except OperationalError as exc:
+                # entry_fts is created by migrations; databases built via create_all lack it
+                log_warning(f"Full-text search unavailable, falling back to substring search: {exc}")
+                self.session.rollback()
+
+        return self._search_entries_substring(user_id, query, journal_id, limit, offset)
+
+    def _search_entries_sqlite(
+        self,
+        user_id: uuid.UUID,
+        tokens: List[str],
+        journal_id: Optional[uuid.UUID],
+        limit: int,
+        offset: int
+    ) -> List[Entry]:
+        """Ranked prefix search against the entry_fts FTS5 table."""
+        match_expression = " ".join(f'"{token}"*' for token in tokens)
+        matches = text(
+            "SELECT entry_id, bm25(entry_fts, :title_weight, :content_weight) AS rank "
+            "FROM entry_fts WHERE entry_fts MATCH :match_expression"
+        ).bindparams(
+            title_weight=self._SQLITE_TITLE_WEIGHT,
+            content_weight=self._SQLITE_CONTENT_WEIGHT,
+            match_expression=match_expression,
+        ).columns(column("entry_id"), column("rank")).subquery("entry_matches")
+
+        statement = select(Entry).join(
+            matches, Entry.id == matches.c.entry_id
+        ).where(Entry.user_id == user_id)
+
+        if journal_id:
+            statement = statement.where(Entry.journal_id == journal_id)
+
+        # bm25 scores are lower for better matches
+        statement = statement.order_by(
+            matches.c.rank.asc(),
+            Entry.entry_datetime_utc.desc()
+        ).offset(offset).limit(limit)
+        return list(self.session.exec(statement))
+
+    def _search_entries_postgres(
+        self,
+        user_id: uuid.UUID,
+        tokens: List[str],
+        journal_id: Optional[uuid.UUID],
+        limit: int,
+        offset: int
+    ) -> List[Entry]:
+        """Ranked prefix search using the weighted tsvector GIN index."""
+        document = literal_column(self._POSTGRES_SEARCH_DOCUMENT)
+        ts_query = func.to_tsquery(
+            literal_column("'simple'"),
+            " & ".join(f"{token}:*" for token in tokens)
+        )
+
+        statement = select(Entry).where(
+            Entry.user_id == user_id,
+            document.op("@@")(ts_query)
+        )
+
+        if journal_id:
+            statement = statement.where(Entry.journal_id == journal_id)
+
+        statement = statement.order_by(
+            func.ts_rank(document, ts_query).desc(),
+            Entry.entry_datetime_utc.desc()
+        ).offset(offset).limit(limit)
+        return list(self.session.exec(statement))
+
+    def _search_entries_substring(
+        self,
+        user_id: uuid.UUID,
+        query: str,
+        journal_id: Optional[uuid.UUID],
+        limit: int,
+        offset: int
+    ) -> List[Entry]:
+        """Unindexed substring search over title and content."""
+        pattern = f"%{query}%"
         statement = select(Entry).where(
             Entry.user_id == user_id,
-            Entry.content.ilike(f"%{query}%")
+            or_(Entry.title.ilike(pattern), Entry.content.ilike(pattern))
         )
 
         if journal_id:
@@ -478,7 +650,7 @@ class EntryService:
         )
         return list(self.session.exec(statement))
 
-    def delete_entry_media(self, media_id: uuid.UUID, user_id: uuid.UUID) -> bool:
+    def delete_entry_media(self, media_id: uuid.UUID, user_id: uuid.UUID) -> List[str]:
         """Hard delete an entry media file.
 
         Args:
@@ -486,11 +658,13 @@ class EntryService:
             user_id: User ID for authorization
 
         Returns:
-            True if deleted successfully
+            Absolute paths of stored files no longer referenced by any media
 
         Raises:
             EntryNotFoundError: If media doesn't exist or doesn't belong to user's entry
         """
+        from app.services.media_service import MediaService
+
         # Get the media and verify it belongs to user's entry
         statement = select(EntryMedia).join(Entry).where(
             EntryMedia.id == media_id,
@@ -503,7 +677,9 @@ class EntryService:
 
         # Hard delete the media
         self.session.delete(media)
+        touch_entries(self.session, [media.entry_id])
         try:
+            released_files = MediaService().release_media_files(self.session, user_id, [media])
             self._commit()
         except SQLAlchemyError as exc:
             self.session.rollback()
@@ -511,4 +687,4 @@ class EntryService:
             raise
 
         log_info(f"Media hard-deleted for user {user_id}: {media.id}")
-        return True
+        return released_files
@@ -3,23 +3,22 @@ Export service for creating Journiv data exports.
 
 Handles the business logic for exporting user data to ZIP archives.
 """
-import json
-import tempfile
-from datetime import timedelta
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Callable
+from typing import IO, Iterable, Iterator, List, Optional, Dict, Any, Callable
 from uuid import UUID
 
-from sqlalchemy import func
+from sqlalchemy import func, or_, select
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
 from app.core.logging_config import log_info, log_warning
-from app.core.time_utils import utc_now
-from app.models import User, Journal, Entry, EntryMedia, Mood, Tag
+from app.core.time_utils import ensure_utc, parse_iso_datetime, utc_now
+from app.models import User, Journal, Entry, EntryMedia, EntryTagLink, Mood, MoodLog, Tag
 from app.models.export_job import ExportJob
-from app.models.enums import ExportType
+from app.models.enums import ExportType, JobStatus
 from app.schemas.dto import (
+    ExportManifestDTO,
     JournivExportDTO,
     JournalDTO,
     EntryDTO,
@@ -28,8 +27,9 @@ from app.schemas.dto import (
     UserSettingsDTO,
     MoodLogDTO,
 )
-from app.utils.import_export import ZipHandler, MediaHandler, validate_export_data
+from app.utils.import_export import ExportDataWriter, ZipHandler, MediaHandler
 from app.utils.import_export.constants import ExportConfig
+from app.utils.import_export.validators import ValidationResult, validate_entry, validate_journal
 
 
 class ExportService:
@@ -53,21 +53,31 @@ class ExportService:
         export_type: ExportType,
         journal_ids: Optional[List[UUID]] = None,
         include_media: bool = True,
+        since: Optional[datetime] = None,
+        base_export_id: Optional[UUID] = None,
     ) -> ExportJob:
         """
         Create a new export job.
 
+        An INCREMENTAL export covers the whole account, but only what changed
+        after ``since``. Without an explicit time it continues where a base
+        export ended: ``base_export_id``, or else the latest completed full or
+        incremental export.
+
         Args:
             user_id: User ID to export data for
-            export_type: Type of export (FULL, JOURNAL)
+            export_type: Type of export (FULL, JOURNAL, INCREMENTAL)
             journal_ids: Specific journal IDs to export (for JOURNAL type)
             include_media: Whether to include media files
+            since: Export changes after this time (for INCREMENTAL type)
+            base_export_id: Export to continue from (for INCREMENTAL type)
 
         Returns:
             Created ExportJob
 
         Raises:
-            ValueError: If export type is invalid or user not found
+            ValueError: If export type is invalid, user not found, or there is
+                no export to continue from
         """
         # Validate user exists
         user = self.db.query(User).filter(User.id == user_id).first()
@@ -75,12 +85,20 @@ class ExportService:
             raise ValueError(f"User not found: {user_id}")
         self._media_export_map.clear()
 
+        if export_type == ExportType.INCREMENTAL:
+            since, base_export_id = self._resolve_incremental_start(user_id, since, base_export_id)
+            journal_ids = None
+        else:
+            since, base_export_id = None, None
+
         # Create export job
         export_job = ExportJob(
             user_id=user_id,
             export_type=export_type,
             journal_ids=[str(jid) for jid in journal_ids] if journal_ids else None,
             include_media=include_media,
+            since=since,
+            base_export_id=base_export_id,
         )
 
         self.db.add(export_job)
@@ -90,167 +108,256 @@ class ExportService:
         log_info(f"Created export job {export_job.id} for user {user_id}", user_id=str(user_id), export_job_id=str(export_job.id))
         return export_job
 
-    def build_export_data(
+    def _resolve_incremental_start(
+        self,
+        user_id: UUID,
+        since: Optional[datetime],
+        base_export_id: Optional[UUID],
+    ) -> tuple[datetime, Optional[UUID]]:
+        """Return the time an incremental export starts from, and the export it continues."""
+        if since is not None:
+            if base_export_id is not None:
+                raise ValueError("Incremental export takes either since or base_export_id, not both")
+            return since, None
+
+        query = self.db.query(ExportJob).filter(
+            ExportJob.user_id == user_id,
+            ExportJob.status == JobStatus.COMPLETED,
+            ExportJob.export_type.in_([ExportType.FULL, ExportType.INCREMENTAL]),
+        )
+        if base_export_id is not None:
+            base_export = query.filter(ExportJob.id == base_export_id).first()
+        else:
+            base_export = query.order_by(ExportJob.completed_at.desc()).first()
+        if base_export is None:
+            raise ValueError("Incremental export needs a completed full or incremental export to continue from")
+
+        manifest = (base_export.result_data or {}).get("manifest")
+        if not manifest:
+            raise ValueError(
+                f"Export {base_export.id} predates incremental exports; create a full export to continue from"
+            )
+        return parse_iso_datetime(manifest["until"]), base_export.id
+
+    def create_export_zip(
         self,
         user_id: UUID,
         export_type: ExportType,
         journal_ids: Optional[List[str]] = None,
+        include_media: bool = True,
         total_entries: Optional[int] = None,
         progress_callback: Optional[Callable[[int, int], None]] = None,
-    ) -> JournivExportDTO:
+        since: Optional[datetime] = None,
+        base_export_id: Optional[UUID] = None,
+        export_id: Optional[UUID] = None,
+    ) -> tuple[Path, int, Dict[str, Any]]:
         """
-        Build export data structure.
+        Create the export ZIP archive, streaming data.json into it.
+
+        Entries are read in batches and each one is validated and written as
+        soon as it is converted, so memory use does not grow with the size of
+        the account.
+
+        With ``since``, only journals and entries changed after it are written
+        (an entry also counts as changed when its media or mood log did), and
+        only changed media files are added to the archive; unchanged media is
+        still listed with its checksum. Every record carries its ID as
+        external_id, and with ``export_id`` the document gets a manifest, so an
+        import can apply incremental exports on top of their base; an
+        incremental manifest also lists the IDs of all the user's journals and
+        entries, so the import can delete the ones deleted since.
 
         Args:
             user_id: User ID to export
             export_type: Type of export
             journal_ids: Optional list of journal IDs to export
+            include_media: Whether to include media files
+            total_entries: Entry count for progress reporting (counted if omitted)
+            progress_callback: Called with (entries_processed, total_entries)
+            since: Only export changes after this time
+            base_export_id: Export an incremental export continues from
+            export_id: ID of the export job, recorded in the manifest
 
         Returns:
-            JournivExportDTO with all user data
+            Tuple of (zip_path, file_size, stats)
 
         Raises:
-            ValueError: If user not found
+            ValueError: If user not found or export validation fails
+            IOError: If ZIP creation fails
         """
         user = self.db.query(User).filter(User.id == user_id).first()
         if not user:
             raise ValueError(f"User not found: {user_id}")
 
+        # Changes made while the export runs may also be in the next one
+        until = utc_now()
+        if since is not None:
+            since = ensure_utc(since)
+        manifest = None
+        if export_id is not None:
+            manifest = ExportManifestDTO(
+                export_id=str(export_id),
+                export_type=export_type,
+                base_export_id=str(base_export_id) if base_export_id else None,
+                since=since,
+                until=until,
+            )
+            if since is not None:
+                # Deleted records are missing from these; imports delete them too
+                manifest.journal_ids = [
+                    str(journal_id)
+                    for journal_id in self.db.execute(select(Journal.id).where(Journal.user_id == user_id)).scalars()
+                ]
+                manifest.entry_ids = [
+                    str(entry_id)
+                    for entry_id in self.db.execute(select(Entry.id).where(Entry.user_id == user_id)).scalars()
+                ]
+
         journals_query = self.db.query(Journal).filter(Journal.user_id == user_id)
 
         if export_type == ExportType.JOURNAL and journal_ids:
             # Selective journal export
             journal_uuids = [UUID(jid) for jid in journal_ids]
             journals_query = journals_query.filter(Journal.id.in_(journal_uuids))
+        if since is not None:
+            # Changed journals, and journals holding changed entries
+            changed_entries = select(Entry.id).where(
+                Entry.journal_id == Journal.id,
+                self._entry_changed_since(since),
+            )
+            journals_query = journals_query.filter(or_(Journal.updated_at > since, changed_entries.exists()))
 
         journals = journals_query.all()
         if total_entries is None:
-            total_entries = self.count_entries(user_id, export_type, journal_ids)
+            total_entries = self.count_entries(user_id, export_type, journal_ids, since=since)
 
-        entries_processed = 0
-
-        def handle_entry_progress():
-            nonlocal entries_processed
-            entries_processed += 1
-            if progress_callback and total_entries:
-                progress_callback(entries_processed, total_entries)
-
-        # Convert journals to DTOs
-        journal_dtos = []
-        for journal in journals:
-            journal_dto = self._convert_journal_to_dto(
-                journal,
-                entry_progress_callback=handle_entry_progress,
-            )
-            journal_dtos.append(journal_dto)
+        # Create export directory if needed
+        export_dir = Path(settings.export_dir)
+        export_dir.mkdir(parents=True, exist_ok=True)
 
-        # Get custom mood definitions
-        mood_dtos = self._get_mood_definitions()
+        # Generate filename
+        timestamp = utc_now().strftime("%Y%m%d_%H%M%S")
+        zip_filename = f"journiv_export_{user_id}_{timestamp}.zip"
+        zip_path = export_dir / zip_filename
 
-        # Get user settings
-        user_settings = self._get_user_settings(user)
+        stats: Dict[str, Any] = {}
+
+        def write_data(stream: IO[bytes]) -> Dict[str, Path]:
+            media_files = self._write_export_data(
+                stream,
+                user,
+                journals,
+                stats,
+                total_entries=total_entries,
+                progress_callback=progress_callback,
+                since=since,
+                manifest=manifest,
+            )
+            return media_files if include_media else {}
 
-        # Calculate statistics
-        total_entries = sum(len(j.entries) for j in journal_dtos)
-        total_media = sum(
-            len(e.media) for j in journal_dtos for e in j.entries
+        file_size = self.zip_handler.create_streaming_export_zip(
+            output_path=zip_path,
+            write_data=write_data,
+            data_filename=ExportConfig.DATA_FILENAME,
         )
 
+        # Update stats
         stats = {
-            "journal_count": len(journal_dtos),
-            "entry_count": total_entries,
-            "media_count": total_media,
-            "export_size_estimate": "calculated_during_zip_creation",
+            "journal_count": stats["journal_count"],
+            "entry_count": stats["entry_count"],
+            "media_count": stats["media_file_count"] if include_media else 0,
+            "file_size": file_size,
         }
+        if manifest is not None:
+            # The job only needs what chaining the next export relies on
+            stats["manifest"] = manifest.model_dump(mode="json", exclude={"journal_ids", "entry_ids"})
 
-        # Build export DTO
-        export_dto = JournivExportDTO(
-            export_version=ExportConfig.EXPORT_VERSION,
-            export_date=utc_now(),
-            app_version=settings.app_version,
-            user_email=user.email,
-            user_name=user.name or user.email.split('@')[0],
-            user_settings=user_settings,
-            journals=journal_dtos,
-            mood_definitions=mood_dtos,
-            stats=stats,
-        )
-
-        return export_dto
+        log_info(f"Created export ZIP: {zip_path} ({file_size} bytes)", user_id=str(user_id), file_size=file_size, media_count=stats["media_count"])
+        return zip_path, file_size, stats
 
-    def create_export_zip(
+    def _write_export_data(
         self,
-        export_data: JournivExportDTO,
-        user_id: UUID,
-        include_media: bool = True,
-    ) -> tuple[Path, int, Dict[str, Any]]:
+        stream: IO[bytes],
+        user: User,
+        journals: List[Journal],
+        stats: Dict[str, Any],
+        total_entries: Optional[int] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        since: Optional[datetime] = None,
+        manifest: Optional[ExportManifestDTO] = None,
+    ) -> Dict[str, Path]:
         """
-        Create ZIP archive from export data.
+        Stream the export document for ``journals`` to ``stream``.
 
-        Args:
-            export_data: Export data to package
-            user_id: User ID (for file naming)
-            include_media: Whether to include media files
-
-        Returns:
-            Tuple of (zip_path, file_size, stats)
-
-        Raises:
-            IOError: If ZIP creation fails
+        Fills ``stats`` with the journal, entry and media counts and returns the
+        media files to add to the archive: those referenced by the written
+        entries, or with ``since`` only the ones changed after it.
         """
-        # Create export directory if needed
-        export_dir = Path(settings.export_dir)
-        export_dir.mkdir(parents=True, exist_ok=True)
-
-        # Generate filename
-        timestamp = utc_now().strftime("%Y%m%d_%H%M%S")
-        zip_filename = f"journiv_export_{user_id}_{timestamp}.zip"
-        zip_path = export_dir / zip_filename
+        writer = ExportDataWriter(stream)
+        writer.start(
+            JournivExportDTO(
+                export_version=ExportConfig.EXPORT_VERSION,
+                export_date=utc_now(),
+                app_version=settings.app_version,
+                user_email=user.email,
+                user_name=user.name or user.email.split('@')[0],
+                user_settings=self._get_user_settings(user),
+                manifest=manifest,
+                journals=[],
+                mood_definitions=self._get_mood_definitions(),
+            )
+        )
 
-        # Collect media files if requested
         media_files: Dict[str, Path] = {}
-        if include_media:
-            media_files = self._collect_media_files(export_data, user_id)
+        entries_processed = 0
+        media_count = 0
+
+        for journal_idx, journal in enumerate(journals, start=1):
+            context = f"Journal {journal_idx}"
+            journal_dto = self._convert_journal_to_dto(journal)
+            self._raise_for_invalid(validate_journal(journal_dto, context))
+            writer.start_journal(journal_dto)
+
+            for entry_idx, entry in enumerate(self._iter_journal_entries(journal.id, since), start=1):
+                entry_dto = self._convert_entry_to_dto(entry)
+                self._raise_for_invalid(validate_entry(entry_dto, f"{context}, Entry {entry_idx}"))
+                writer.write_entry(entry_dto)
+                changed_media = entry_dto.media
+                if since is not None:
+                    # Files the base export carried are found by checksum on import
+                    changed_media = [
+                        media for media in entry_dto.media
+                        if not media.checksum or ensure_utc(media.updated_at) > since
+                    ]
+                self._collect_media_files(changed_media, user.id, media_files)
+
+                media_count += len(entry_dto.media)
+                entries_processed += 1
+                if progress_callback and total_entries:
+                    progress_callback(entries_processed, total_entries)
+
+            writer.end_journal()
+
+        writer.finish({
+            "journal_count": len(journals),
+            "entry_count": entries_processed,
+            "media_count": media_count,
+            "export_size_estimate": "calculated_during_zip_creation",
+        })
 
-        # Convert export data to dictionary and validate
-        export_dict = export_data.model_dump(mode='json')
-        validation = validate_export_data(export_dict)
+        stats.update(
+            journal_count=len(journals),
+            entry_count=entries_processed,
+            media_file_count=len(media_files),
+        )
+        return media_files
+
+    @staticmethod
+    def _raise_for_invalid(validation: ValidationResult) -> None:
+        """Abort the export when a record fails validation."""
         if not validation.valid:
             raise ValueError(f"Export validation failed: {validation.errors}")
 
-        temp_data_path: Optional[Path] = None
-        try:
-            with tempfile.NamedTemporaryFile(
-                mode="w",
-                delete=False,
-                encoding="utf-8",
-                suffix=".json",
-            ) as tmp_file:
-                json.dump(export_dict, tmp_file, ensure_ascii=False)
-                temp_data_path = Path(tmp_file.name)
-
-            # Create ZIP
-            file_size = self.zip_handler.create_export_zip(
-                output_path=zip_path,
-                data_file_path=temp_data_path,
-                media_files=media_files,
-                data_filename=ExportConfig.DATA_FILENAME,
-            )
-        finally:
-            if temp_data_path and temp_data_path.exists():
-                temp_data_path.unlink(missing_ok=True)
-
-        # Update stats
-        stats = {
-            "journal_count": len(export_data.journals),
-            "entry_count": sum(len(j.entries) for j in export_data.journals),
-            "media_count": len(media_files),
-            "file_size": file_size,
-        }
-
-        log_info(f"Created export ZIP: {zip_path} ({file_size} bytes)", user_id=str(user_id), file_size=file_size, media_count=len(media_files))
-        return zip_path, file_size, stats
-
     def cleanup_old_exports(self) -> int:
         """
         Remove export archives older than the configured retention period.
@@ -286,6 +393,7 @@ class ExportService:
         user_id: UUID,
         export_type: ExportType,
         journal_ids: Optional[List[str]] = None,
+        since: Optional[datetime] = None,
     ) -> int:
         """Count the number of entries that will be included in the export."""
         query = self.db.query(func.count(Entry.id)).join(Journal, Entry.journal_id == Journal.id)
@@ -294,14 +402,30 @@ class ExportService:
         if export_type == ExportType.JOURNAL and journal_ids:
             journal_uuids = [UUID(jid) for jid in journal_ids]
             query = query.filter(Entry.journal_id.in_(journal_uuids))
+        if since is not None:
+            query = query.filter(self._entry_changed_since(since))
 
         return int(query.scalar() or 0)
 
-    def _convert_journal_to_dto(
-        self,
-        journal: Journal,
-        entry_progress_callback: Optional[Callable[[], None]] = None,
-    ) -> JournalDTO:
+    @staticmethod
+    def _entry_changed_since(since: datetime):
+        """
+        SQL condition for entries that, or whose media, mood log or tags, changed after ``since``.
+
+        Removing a tag, media file or mood log, or renaming a tag, bumps the
+        entry's updated_at (see touch_entries), so these are caught by the
+        first clause.
+        """
+        return or_(
+            Entry.updated_at > since,
+            select(EntryTagLink.entry_id).where(
+                EntryTagLink.entry_id == Entry.id, EntryTagLink.created_at > since
+            ).exists(),
+            select(EntryMedia.id).where(EntryMedia.entry_id == Entry.id, EntryMedia.updated_at > since).exists(),
+            select(MoodLog.id).where(MoodLog.entry_id == Entry.id, MoodLog.updated_at > since).exists(),
+        )
+
+    def _convert_journal_to_dto(self, journal: Journal) -> JournalDTO:
         """
         Convert Journal model to JournalDTO.
 
@@ -309,29 +433,10 @@ class ExportService:
         - journal.title -> title
         - journal.color -> color (enum to string)
         - journal.is_archived, entry_count, last_entry_at included
-        """
-        from sqlalchemy.orm import joinedload
-        from app.models.mood import MoodLog
-
-        # Get all entries for this journal with eager loading
-        entries = (
-            self.db.query(Entry)
-            .filter(Entry.journal_id == journal.id)
-            .options(
-                joinedload(Entry.tags),
-                joinedload(Entry.mood_log).joinedload(MoodLog.mood),
-                joinedload(Entry.media),
-            )
-            .order_by(Entry.entry_datetime_utc)
-            .all()
-        )
-
-        entry_dtos = []
-        for entry in entries:
-            entry_dtos.append(self._convert_entry_to_dto(entry))
-            if entry_progress_callback:
-                entry_progress_callback()
 
+        Entries are left empty; they are streamed separately from
+        _iter_journal_entries.
+        """
         return JournalDTO(
             title=journal.title,  # Journal has 'title' not 'name'
             description=journal.description,
@@ -341,9 +446,37 @@ class ExportService:
             is_archived=journal.is_archived,  # Include archived status
             entry_count=journal.entry_count,  # Denormalized count
             last_entry_at=journal.last_entry_at,  # Last entry timestamp
-            entries=entry_dtos,
+            entries=[],
             created_at=journal.created_at,
             updated_at=journal.updated_at,
+            external_id=str(journal.id),
+        )
+
+    def _iter_journal_entries(self, journal_id: UUID, since: Optional[datetime] = None) -> Iterator[Entry]:
+        """
+        Yield a journal's entries in batches with their relations loaded.
+
+        Rows are streamed (server-side cursor where the driver supports it)
+        and relations are loaded per batch with IN queries, so only one batch
+        of entries is held in memory at a time. With ``since``, only entries
+        changed after it are yielded.
+        """
+        from sqlalchemy.orm import joinedload, selectinload
+
+        query = self.db.query(Entry).filter(Entry.journal_id == journal_id)
+        if since is not None:
+            query = query.filter(self._entry_changed_since(since))
+
+        return iter(
+            query
+            .options(
+                selectinload(Entry.tags),
+                selectinload(Entry.mood_log).joinedload(MoodLog.mood),
+                selectinload(Entry.media),
+                joinedload(Entry.prompt),
+            )
+            .order_by(Entry.entry_datetime_utc)
+            .yield_per(ExportConfig.ENTRY_BATCH_SIZE)
         )
 
     def _convert_entry_to_dto(self, entry: Entry) -> EntryDTO:
@@ -405,6 +538,7 @@ class ExportService:
             prompt_text=prompt_text,
             created_at=entry.created_at,
             updated_at=entry.updated_at,
+            external_id=str(entry.id),
         )
 
     def _convert_media_to_dto(self, media: EntryMedia) -> MediaDTO:
@@ -440,6 +574,7 @@ class ExportService:
             created_at=media.created_at,
             updated_at=media.updated_at,
             caption=media.alt_text,  # PLACEHOLDER: Map alt_text to caption for compatibility
+            external_id=str(media.id),
         )
 
     def _get_mood_definitions(self) -> List[MoodDefinitionDTO]:
@@ -492,46 +627,42 @@ class ExportService:
         )
 
     def _collect_media_files(
-        self, export_data: JournivExportDTO, user_id: UUID
-    ) -> Dict[str, Path]:
+        self,
+        media_dtos: Iterable[MediaDTO],
+        user_id: UUID,
+        media_files: Dict[str, Path],
+    ) -> None:
         """
-        Collect media files from export data.
+        Add the files behind exported media to ``media_files``.
 
         Args:
-            export_data: Export data with media references
-            user_id: User ID for media lookup
-
-        Returns:
-            Dictionary of {relative_path: absolute_path}
+            media_dtos: Exported media references
+            user_id: User ID for logging
+            media_files: Dictionary of {relative_path: absolute_path} to fill
         """
-        media_files: Dict[str, Path] = {}
-        for journal in export_data.journals:
-            for entry in journal.entries:
-                for media in entry.media:
-                    # Skip media without file_path
-                    if not media.file_path:
-                        log_warning(
-                            f"Media {media.filename} has no file_path, skipping",
-                            user_id=str(user_id),
-                            media_filename=media.filename
-                        )
-                        continue
-
-                    source_path = self._media_export_map.get(media.file_path)
-                    if not source_path:
-                        source_path = Path(settings.media_root) / media.file_path
-
-                    if source_path.exists():
-                        media_files[media.file_path] = source_path
-                    else:
-                        log_warning(
-                            f"Media file not found: {source_path} (file_path: {media.file_path})",
-                            user_id=str(user_id),
-                            file_path=media.file_path,
-                            source_path=str(source_path)
-                        )
-
-        return media_files
+        for media in media_dtos:
+            # Skip media without file_path
+            if not media.file_path:
+                log_warning(
+                    f"Media {media.filename} has no file_path, skipping",
+                    user_id=str(user_id),
+                    media_filename=media.filename
+                )
+                continue
+
+            source_path = self._media_export_map.get(media.file_path)
+            if not source_path:
+                source_path = Path(settings.media_root) / media.file_path
+
+            if source_path.exists():
+                media_files[media.file_path] = source_path
+            else:
+                log_warning(
+                    f"Media file not found: {source_path} (file_path: {media.file_path})",
+                    user_id=str(user_id),
+                    file_path=media.file_path,
+                    source_path=str(source_path)
+                )
 
     def _build_media_export_path(self, media: EntryMedia) -> str:
         """Build a sanitized relative path for media inside the export ZIP."""
@@ -1,52 +1,41 @@
 """
 File processing service.
-Handles background file processing with thread pool management.
+Hands uploaded files to the media engine for background processing.
 """
-import atexit
 import uuid
-from concurrent.futures import ThreadPoolExecutor
-from typing import Optional
 
 from sqlmodel import Session
 
 from app.core.exceptions import MediaNotFoundError
 from app.core.logging_config import log_info, log_warning, log_error
+from app.core.media_engine import MediaPriority, get_media_engine, shutdown_media_engine
 from app.services.media_service import MediaService
 
-# Thread pool for background processing
-_processing_executor: Optional[ThreadPoolExecutor] = None
-_is_shutting_down: bool = False
 
+def _process_uploaded_file_job(media_id: str, file_path: str, user_id: str) -> None:
+    """
+    File processing job run in a media engine worker process.
 
-def _get_processing_executor() -> ThreadPoolExecutor:
-    """Get or create the processing thread pool executor."""
-    global _processing_executor
-    if _processing_executor is None and not _is_shutting_down:
-        _processing_executor = ThreadPoolExecutor(
-            max_workers=4,
-            thread_name_prefix="file-processing"
-        )
-        log_info("File processing thread pool initialized")
+    Each job opens its own database session; sessions cannot cross processes.
+    """
+    from app.core.database import engine
 
-    if _processing_executor is None:
-        raise RuntimeError("Thread pool executor is not available (shutting down)")
+    worker_session = Session(engine)
+    try:
+        log_info(f"Starting file processing for media {media_id}")
 
-    return _processing_executor
+        media_service = MediaService(worker_session)
+        media_service.process_uploaded_file(media_id, file_path, user_id)
 
+        log_info(f"File processing completed successfully for media {media_id}")
 
-def _shutdown_executor():
-    """Shutdown the thread pool executor on application exit."""
-    global _processing_executor, _is_shutting_down
-    if _processing_executor is not None and not _is_shutting_down:
-        _is_shutting_down = True
-        log_info("Shutting down file processing thread pool")
-        _processing_executor.shutdown(wait=True)
-        _processing_executor = None
-        _is_shutting_down = False
-
-
-# Register shutdown handler
-atexit.register(_shutdown_executor)
+    except MediaNotFoundError as e:
+        log_warning(f"Media not found during processing: {e}")
+    except Exception as e:
+        log_error(e)
+        # The media service already handles marking as failed
+    finally:
+        worker_session.close()
 
 
 class FileProcessingService:
@@ -58,7 +47,10 @@ class FileProcessingService:
 
     def process_uploaded_file_async(self, media_id: str, file_path: str, user_id: str) -> None:
         """
-        Submit file processing to background thread pool.
+        Queue file processing on the media engine.
+
+        Waits for room when the engine queue is full; the upload endpoint
+        turns uploads away while it is.
 
         Args:
             media_id: UUID of the media record
@@ -81,16 +73,13 @@ class FileProcessingService:
             if not isinstance(file_path, str) or not file_path.strip():
                 raise ValueError("file_path must be a non-empty string")
 
-            # Submit to thread pool
-            executor = _get_processing_executor()
-            if executor is None:
-                raise RuntimeError("Thread pool executor is not available (shutting down)")
-
-            future = executor.submit(
-                self._process_uploaded_file_sync,
+            # Uploads are user-visible, so they overtake batch reprocessing
+            get_media_engine().submit(
+                _process_uploaded_file_job,
                 media_id,
                 file_path,
-                user_id
+                user_id,
+                priority=MediaPriority.UPLOAD,
             )
 
             log_info(f"File processing task submitted for media {media_id}")
@@ -99,76 +88,18 @@ class FileProcessingService:
             log_error(e)
             raise
 
-    def _process_uploaded_file_sync(self, media_id: str, file_path: str, user_id: str) -> None:
-        """
-        Synchronous file processing worker.
-
-        This method runs in a background thread and handles the actual processing.
-        Each thread creates its own database session to avoid conflicts.
-        """
-        from app.core.database import engine
-
-        # Create a new session for this background thread
-        thread_session = Session(engine)
-        try:
-            log_info(f"Starting file processing for media {media_id}")
-
-            # Create a new media service instance with thread-local session
-            media_service = MediaService(thread_session)
-            media_service.process_uploaded_file(media_id, file_path, user_id)
-
-            log_info(f"File processing completed successfully for media {media_id}")
-
-        except MediaNotFoundError as e:
-            log_warning(f"Media not found during processing: {e}")
-        except Exception as e:
-            log_error(e)
-            # The media service already handles marking as failed
-        finally:
-            # Always close the thread-local session
-            thread_session.close()
-
     def get_processing_status(self) -> dict:
-        """Get the status of the processing thread pool.
-
-        Note: Uses public ThreadPoolExecutor interface where possible.
-        Some attributes may not be available in future Python versions.
-        """
+        """Get the status of the media engine."""
         try:
-            executor = _get_processing_executor()
-
-            # Use public interface where possible
-            # _threads and _work_queue are implementation details
-            status = {
-                "is_shutting_down": _is_shutting_down,
-            }
-
-            # Try to get internal details, but don't fail if unavailable
-            try:
-                status["max_workers"] = getattr(executor, "_max_workers", None)
-                status["active_threads"] = len(getattr(executor, "_threads", []))
-                work_queue = getattr(executor, "_work_queue", None)
-                status["pending_tasks"] = work_queue.qsize() if work_queue and hasattr(work_queue, 'qsize') else 0
-                status["shutdown"] = getattr(executor, "_shutdown", False)
-            except (AttributeError, TypeError):
-                # Fallback if private attributes are not available
-                status["max_workers"] = "unavailable"
-                status["active_threads"] = "unavailable"
-                status["pending_tasks"] = "unavailable"
-                status["shutdown"] = "unavailable"
-
-            return status
+            return get_media_engine().stats()
         except Exception as e:
             log_warning(f"Failed to get processing status: {e}")
-            return {
-                "error": str(e),
-                "is_shutting_down": _is_shutting_down
-            }
+            return {"error": str(e)}
 
     def shutdown_processing(self, wait: bool = True) -> None:
-        """Shutdown the processing thread pool."""
-        _shutdown_executor()
+        """Shutdown the media engine."""
+        shutdown_media_engine(wait=wait)
         if wait:
-            log_info("File processing thread pool shutdown completed")
+            log_info("File processing shutdown completed")
         else:
-            log_info("File processing thread pool shutdown initiated")
+            log_info("File processing shutdown initiated")
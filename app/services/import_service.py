@@ -4,35 +4,53 @@ Import service for importing data into Journiv.
 Handles the business logic for importing data from various sources.
 """
 import shutil
+import zipfile
+from contextlib import nullcontext
+from datetime import date
+from itertools import islice
 from pathlib import Path
-from typing import Dict, Any, Optional, Callable
+from typing import Dict, Any, List, Optional, Callable, Set
 from uuid import UUID, uuid4
 
+from celery.exceptions import SoftTimeLimitExceeded
 from sqlalchemy.orm import Session
-from sqlalchemy import select, func
+from sqlalchemy import delete, select, func, or_, update
 from sqlalchemy.exc import SQLAlchemyError
 
+from app.core.analytics_cache import get_analytics_cache
 from app.core.config import settings
 from app.core.logging_config import log_info, log_warning, log_error
-from app.models import User, Journal, Entry, EntryMedia, Mood, MoodLog, Tag
+from app.core.reference_cache import REFERENCE_MOODS, get_reference_cache
+from app.models import User, Journal, Entry, EntryMedia, EntryTagLink, MediaBlob, Mood, MoodLog, Tag
 from app.models.import_job import ImportJob
-from app.models.enums import ImportSourceType, JournalColor, MediaType, UploadStatus
+from app.models.enums import ExportType, ImportSourceType, JobStatus, JournalColor, MediaType, UploadStatus
+from app.services.analytics_service import AnalyticsService, DayChanges, add_day_change
+from app.services.media_service import MediaService
 from app.schemas.dto import (
     JournivExportDTO,
     JournalDTO,
     EntryDTO,
+    ExportManifestDTO,
     MediaDTO,
     MoodLogDTO,
     ImportResultSummary,
 )
 from app.utils.import_export import (
+    BatchInserter,
     ZipHandler,
+    ZipMediaReader,
     MediaHandler,
     IDMapper,
     normalize_datetime,
+    validate_journiv_export_file,
 )
-from app.utils.import_export.constants import ExportConfig
-from app.core.time_utils import local_date_for_user
+from app.utils.import_export.json_stream import (
+    JsonStreamReader,
+    StreamedJournal,
+    iter_export_journals,
+)
+from app.utils.import_export.constants import ExportConfig, ImportConfig
+from app.core.time_utils import local_date_for_user, utc_now
 
 
 class ImportService:
@@ -94,15 +112,21 @@ class ImportService:
 
     def extract_import_data(
         self, file_path: Path
-    ) -> tuple[Dict[str, Any], Optional[Path]]:
+    ) -> tuple[Path, Optional[Path]]:
         """
         Extract import data from ZIP file.
 
+        Only the data file is extracted; it is left on disk to be read
+        incrementally (see validate_journiv_export_file() and
+        import_journiv_data()). Media stays in the archive and is streamed
+        from it during import.
+
         Args:
             file_path: Path to ZIP file
 
         Returns:
-            Tuple of (data_dict, media_dir)
+            Tuple of (data_file_path, media_archive); media_archive is the ZIP
+            path, or None if the archive contains no media
 
         Raises:
             ValueError: If ZIP is invalid
@@ -112,57 +136,121 @@ class ImportService:
         temp_dir = Path(settings.import_temp_dir)
         temp_dir.mkdir(parents=True, exist_ok=True)
 
-        # Extract ZIP
-        extract_result = self.zip_handler.extract_zip(
+        # Extract the data file
+        extract_result = self.zip_handler.extract_data_file(
             zip_path=file_path,
             extract_to=temp_dir / file_path.stem,
             max_size_mb=settings.import_export_max_file_size_mb,
         )
 
-        # Load JSON data
-        import json
-        with open(extract_result["data_file"], "r") as f:
-            data = json.load(f)
-
-        return data, extract_result.get("media_dir")
+        media_archive = file_path if extract_result["has_media"] else None
+        return Path(extract_result["data_file"]), media_archive
 
     def import_journiv_data(
         self,
         user_id: UUID,
-        data: Dict[str, Any],
-        media_dir: Optional[Path] = None,
+        data_file: Path,
+        media_archive: Optional[Path] = None,
         *,
+        header: Optional[Dict[str, Any]] = None,
         total_entries: Optional[int] = None,
         progress_callback: Optional[Callable[[int, int], None]] = None,
+        checkpoint: Optional[Dict[str, Any]] = None,
+        checkpoint_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        thumbnail_callback: Optional[Callable[[List[UUID]], None]] = None,
     ) -> ImportResultSummary:
         """
         Import Journiv export data.
 
+        Journals and entries are streamed from the data file and imported one
+        at a time, so memory use does not grow with the size of the export.
+
+        Each journal is committed once imported. With a checkpoint_callback,
+        journals are additionally committed every ImportConfig.ENTRY_BATCH_SIZE
+        rows, and the callback receives the state to resume from right before
+        each commit, so it can be saved in the same transaction. Its
+        id_mappings hold only the mappings recorded since the previous
+        checkpoint. Passing the last state back as ``checkpoint``, with the
+        id_mappings of all the checkpoints saved, continues an interrupted
+        import without duplicating what it already committed.
+
+        Thumbnails are not generated inside the import transaction. Imported
+        images and videos are stored as PENDING, and their IDs are passed to
+        thumbnail_callback after each commit to generate them elsewhere; without
+        a callback they are generated right after the commit.
+
+        An incremental export is applied on top of the imports of the exports
+        it is based on (see its manifest), which must have completed first:
+        journals imported before are updated, entries imported before are
+        replaced by their new version, and both are deleted once deleted at
+        the source. Media files the export omits because they did not change
+        are taken from the user's stored copies.
+
         Args:
             user_id: User ID to import for
-            data: Parsed export data
-            media_dir: Directory containing media files
+            data_file: Path to the export's data.json
+            media_archive: ZIP file containing the export's media files
+            header: Top-level export fields, as returned by
+                validate_journiv_export_file(); read from data_file if omitted
+            total_entries: Number of entries in the export, for progress
+            checkpoint: State saved by an interrupted run of this import
+            checkpoint_callback: Called with the resume state before each commit
+            thumbnail_callback: Called with committed media IDs awaiting a thumbnail
 
         Returns:
             ImportResultSummary with statistics
 
         Raises:
-            ValueError: If data is invalid
+            ValueError: If data is invalid, doesn't match the checkpoint, or is
+                an incremental export whose base export was not imported
         """
-        # Parse data into DTO
+        if header is None:
+            validation, header, total_entries = validate_journiv_export_file(data_file)
+            if not validation.valid:
+                raise ValueError(f"Invalid Journiv export format: {validation.errors}")
+
+        # Parse top-level fields into DTO; journals are read separately
         try:
-            export_dto = JournivExportDTO(**data)
+            export_dto = JournivExportDTO(**{**header, "journals": []})
         except Exception as e:
             raise ValueError(f"Invalid Journiv export format: {e}") from e
 
         # Initialize tracking
-        summary = ImportResultSummary()
+        manifest = export_dto.manifest
+        summary = ImportResultSummary(
+            manifest=manifest.model_copy(update={"journal_ids": None, "entry_ids": None}) if manifest else None
+        )
         id_mapper = IDMapper()
+        entries_processed = 0
+        journals_done = 0
+        if checkpoint:
+            summary = ImportResultSummary(**checkpoint["summary"])
+            for entity_type, mappings in checkpoint.get("id_mappings", {}).items():
+                summary.id_mappings.setdefault(entity_type, {}).update(mappings)
+            for mappings in summary.id_mappings.values():
+                for external_id, new_id in mappings.items():
+                    id_mapper.record(external_id, UUID(new_id))
+            entries_processed = checkpoint["entries_processed"]
+            journals_done = checkpoint["journals_done"]
+            log_info(
+                f"Resuming import after {journals_done} journals, {entries_processed} entries",
+                user_id=str(user_id),
+                journals_done=journals_done,
+                entries_processed=entries_processed,
+            )
+        # ID mappings recorded since the last commit
+        new_mappings: Dict[str, Dict[str, str]] = {}
+        # Committed with the next commit, then handed off for thumbnails
+        pending_thumbnails: List[UUID] = []
+        # Media files no longer referenced once the next commit goes through
+        released_files: List[str] = []
+        # Journal whose entries were partly committed by the last checkpoint
+        partial_journal: Optional[Dict[str, Any]] = (checkpoint or {}).get("journal")
 
         # Track existing items for deduplication
-        existing_media_checksums = self._get_existing_media_checksums(user_id)
-        existing_tag_names = self._get_existing_tag_names(user_id)
+        tag_ids = self._get_existing_tag_ids(user_id)
         existing_mood_names = self._get_existing_mood_names(user_id)
+        mood_ids: Dict[str, UUID] = {}
 
         if export_dto.export_version != ExportConfig.EXPORT_VERSION:
             raise ValueError(
@@ -170,10 +258,8 @@ class ImportService:
                 f"Expected {ExportConfig.EXPORT_VERSION}."
             )
 
-        if total_entries is None:
-            total_entries = self.count_entries_in_data(data)
-
-        entries_processed = 0
+        # Records an incremental export updates, by their ID in the export
+        chained_ids = self._get_chained_import_ids(user_id, manifest)
 
         def handle_entry_progress():
             nonlocal entries_processed
@@ -186,10 +272,118 @@ class ImportService:
                 return
             id_mapper.record(external_id, new_id)
             summary.id_mappings.setdefault(entity_type, {})[external_id] = str(new_id)
+            new_mappings.setdefault(entity_type, {})[external_id] = str(new_id)
+
+        def reload_lookups():
+            # Rows created by a rolled-back journal must not be referenced again
+            tag_ids.clear()
+            tag_ids.update(self._get_existing_tag_ids(user_id))
+            mood_ids.clear()
+            mood_ids.update(self._get_mood_ids())
+
+        def add_journal_result(target: ImportResultSummary, result: Dict[str, int]):
+            if result["journal_updated"]:
+                target.journals_updated += 1
+            else:
+                target.journals_created += 1
+            target.entries_created += result["entries_created"]
+            target.entries_updated += result["entries_updated"]
+            target.mood_logs_created += result["mood_logs_created"]
+            target.media_files_imported += result["media_imported"]
+            target.media_files_deduplicated += result["media_deduplicated"]
+            target.tags_created += result["tags_created"]
+            target.tags_reused += result["tags_reused"]
+
+        moods_uncommitted = False
+
+        def commit(
+            done: int,
+            journal_state: Optional[Dict[str, Any]] = None,
+            journal_result: Optional[Dict[str, int]] = None,
+        ):
+            # Local state only advances once the commit went through
+            nonlocal journals_done, partial_journal, moods_uncommitted
+            if checkpoint_callback:
+                committed = summary.model_copy()
+                if journal_result is not None:
+                    add_journal_result(committed, journal_result)
+                # Only the mappings added since the last checkpoint, so
+                # checkpoints do not grow with the size of the import
+                checkpoint_callback({
+                    "journals_done": done,
+                    "entries_processed": entries_processed,
+                    "journal": journal_state,
+                    "summary": committed.model_dump(mode="json", exclude={"id_mappings"}),
+                    "id_mappings": {
+                        entity_type: dict(mappings) for entity_type, mappings in new_mappings.items()
+                    },
+                })
+            self.db.commit()
+            new_mappings.clear()
+            if journal_result is not None:
+                add_journal_result(summary, journal_result)
+            journals_done, partial_journal = done, journal_state
+            get_analytics_cache().invalidate(str(user_id))
+            if moods_uncommitted:
+                get_reference_cache().invalidate(REFERENCE_MOODS)
+                moods_uncommitted = False
+
+            if pending_thumbnails:
+                if thumbnail_callback:
+                    thumbnail_callback(list(pending_thumbnails))
+                else:
+                    MediaService(self.db).generate_pending_thumbnails(pending_thumbnails)
+                pending_thumbnails.clear()
+
+            for file_path in released_files:
+                try:
+                    MediaService().remove_media_file(file_path)
+                except OSError as exc:
+                    log_warning(f"Failed to delete replaced media file {file_path}: {exc}", user_id=str(user_id))
+            released_files.clear()
+
+        def handle_journal_failure(
+            index: int,
+            streamed_journal: StreamedJournal,
+            journal_title: Optional[str],
+            journal_error: Exception,
+            **log_context,
+        ):
+            nonlocal journals_done
+            self.db.rollback()
+            reload_lookups()
+            # The records they map to were rolled back
+            for entity_type, mappings in new_mappings.items():
+                for external_id in mappings:
+                    summary.id_mappings[entity_type].pop(external_id, None)
+            new_mappings.clear()
+            pending_thumbnails.clear()
+            released_files.clear()
+            log_error(journal_error, user_id=str(user_id), journal_title=journal_title, **log_context)
+            streamed_journal.drain()
+
+            if partial_journal is None:
+                summary.warnings.append(f"Failed to import journal '{journal_title}': {journal_error}")
+                summary.entries_skipped += streamed_journal.entry_count
+                journals_done = index + 1
+                return
+
+            # Entries committed by earlier checkpoints stay; bring the
+            # journal's statistics in line with them
+            result = partial_journal["result"]
+            self._update_imported_journal_stats(
+                user_id, UUID(partial_journal["journal_id"]), *self._load_journal_analytics(partial_journal)
+            )
+            summary.entries_skipped += streamed_journal.entry_count - result["entries_created"]
+            summary.warnings.append(
+                f"Journal '{journal_title}' was only partially imported "
+                f"({result['entries_created']} of {streamed_journal.entry_count} entries): {journal_error}"
+            )
+            commit(index + 1, journal_result=result)
 
         try:
-            # Import mood definitions first
-            if export_dto.mood_definitions:
+            # Mood definitions were committed with the first checkpoint
+            if export_dto.mood_definitions and not checkpoint:
                 for mood_dto in export_dto.mood_definitions:
                     mood_name_lower = mood_dto.name.lower()
                     if mood_name_lower not in existing_mood_names:
@@ -201,62 +395,75 @@ class ImportService:
                         )
                         self.db.add(mood)
                         summary.moods_created += 1
+                        moods_uncommitted = True
                         existing_mood_names.add(mood_name_lower)
                     else:
                         summary.moods_reused += 1
 
-            # Flush to get mood IDs
+            # Flush to get mood IDs, then resolve mood names once for all mood logs
             self.db.flush()
+            mood_ids.update(self._get_mood_ids())
 
             # Import journals and entries with per-journal commits
-            for journal_dto in export_dto.journals:
-                try:
-                    result = self._import_journal(
-                        user_id=user_id,
-                        journal_dto=journal_dto,
-                        media_dir=media_dir,
-                        id_mapper=id_mapper,
-                        existing_media_checksums=existing_media_checksums,
-                        existing_tag_names=existing_tag_names,
-                        existing_mood_names=existing_mood_names,
-                        summary=summary,
-                        entry_progress_callback=handle_entry_progress,
-                        record_mapping=record_mapping,
-                    )
-                    self.db.commit()
-
-                    # Update summary
-                    summary.journals_created += 1
-                    summary.entries_created += result["entries_created"]
-                    summary.mood_logs_created += result["mood_logs_created"]
-                    summary.media_files_imported += result["media_imported"]
-                    summary.media_files_deduplicated += result["media_deduplicated"]
-                    summary.tags_created += result["tags_created"]
-                    summary.tags_reused += result["tags_reused"]
-                except (ValueError, SQLAlchemyError) as journal_error:
-                    # Narrow exception handling: catch expected DB/validation errors
-                    # but let unexpected errors propagate to outer handler
-                    self.db.rollback()
-                    warning_msg = (
-                        f"Failed to import journal '{journal_dto.title}': {journal_error}"
-                    )
-                    log_error(journal_error, user_id=str(user_id), journal_title=journal_dto.title)
-                    summary.warnings.append(warning_msg)
-                    summary.entries_skipped += len(journal_dto.entries)
-                except Exception as journal_error:
-                    # Defensive catch-all for truly unexpected errors
-                    # This allows continuing with other journals even on programming errors
-                    self.db.rollback()
-                    warning_msg = (
-                        f"Failed to import journal '{journal_dto.title}': {journal_error}"
-                    )
-                    log_error(journal_error, user_id=str(user_id), journal_title=journal_dto.title, context="unexpected_journal_import_error")
-                    summary.warnings.append(warning_msg)
-                    summary.entries_skipped += len(journal_dto.entries)
+            media_context = ZipMediaReader(media_archive) if media_archive else nullcontext()
+            with open(data_file, "r", encoding="utf-8") as fp, media_context as media_reader:
+                for index, streamed_journal in enumerate(iter_export_journals(JsonStreamReader(fp))):
+                    if index < journals_done:
+                        # Imported (or failed) before the checkpoint
+                        continue
+                    if partial_journal:
+                        self._skip_committed_entries(streamed_journal, partial_journal)
+
+                    journal_title = streamed_journal.fields.get("title")
+                    try:
+                        result = self._import_journal(
+                            user_id=user_id,
+                            streamed_journal=streamed_journal,
+                            media_reader=media_reader,
+                            id_mapper=id_mapper,
+                            tag_ids=tag_ids,
+                            mood_ids=mood_ids,
+                            summary=summary,
+                            entry_progress_callback=handle_entry_progress,
+                            record_mapping=record_mapping,
+                            pending_thumbnails=pending_thumbnails,
+                            chained_ids=chained_ids,
+                            released_files=released_files,
+                            partial_journal=partial_journal,
+                            commit_entries=(
+                                (lambda journal_state: commit(journals_done, journal_state))
+                                if checkpoint_callback else None
+                            ),
+                        )
+                        commit(index + 1, journal_result=result)
+                    except SoftTimeLimitExceeded:
+                        # The task is out of time; it resumes from the last checkpoint
+                        raise
+                    except (ValueError, SQLAlchemyError) as journal_error:
+                        # Narrow exception handling: catch expected DB/validation errors
+                        # but let unexpected errors propagate to outer handler
+                        handle_journal_failure(index, streamed_journal, journal_title, journal_error)
+                    except Exception as journal_error:
+                        # Defensive catch-all for truly unexpected errors
+                        # This allows continuing with other journals even on programming errors
+                        handle_journal_failure(
+                            index, streamed_journal, journal_title, journal_error,
+                            context="unexpected_journal_import_error",
+                        )
+
+            if chained_ids and manifest.entry_ids is not None:
+                journals_deleted, entries_deleted = self._delete_removed_records(
+                    user_id, manifest, chained_ids, released_files
+                )
+                if journals_deleted or entries_deleted:
+                    summary.journals_deleted += journals_deleted
+                    summary.entries_deleted += entries_deleted
+                    commit(journals_done)
 
             log_info(
-                f"Import completed: {summary.journals_created} journals, "
-                f"{summary.entries_created} entries, "
+                f"Import completed: {summary.journals_created} journals "
+                f"({summary.journals_updated} updated), "
+                f"{summary.entries_created} entries ({summary.entries_updated} replaced), "
                 f"{summary.mood_logs_created} mood logs, "
                 f"{summary.media_files_imported} media files",
                 user_id=str(user_id),
@@ -277,25 +484,265 @@ class ImportService:
             log_error(e, user_id=str(user_id))
             raise
 
+    def _get_chained_import_ids(
+        self,
+        user_id: UUID,
+        manifest: Optional[ExportManifestDTO],
+    ) -> Dict[str, Dict[str, UUID]]:
+        """
+        Map the IDs of an incremental export's base records to the records imported from them.
+
+        Follows the manifest's chain of base exports through the user's
+        completed imports; a record imported more than once maps to its most
+        recent import.
+
+        Raises:
+            ValueError: If an export in the chain has not been imported
+        """
+        if manifest is None or manifest.export_type != ExportType.INCREMENTAL or not manifest.base_export_id:
+            return {}
+
+        imports_by_export: Dict[str, Dict[str, Any]] = {}
+        completed_imports = self.db.execute(
+            select(ImportJob.result_data)
+            .where(ImportJob.user_id == user_id, ImportJob.status == JobStatus.COMPLETED)
+            .order_by(ImportJob.completed_at)
+        ).scalars()
+        for result_data in completed_imports:
+            imported_manifest = (result_data or {}).get("manifest")
+            if imported_manifest:
+                imports_by_export[imported_manifest["export_id"]] = result_data
+
+        chain: List[Dict[str, Any]] = []
+        export_id = manifest.base_export_id
+        while export_id:
+            result_data = imports_by_export.get(export_id)
+            if result_data is None:
+                raise ValueError(
+                    f"Incremental export is based on export {export_id}, which has not been imported; "
+                    f"import the exports it builds on first"
+                )
+            if result_data in chain:
+                break
+            chain.append(result_data)
+            export_id = result_data["manifest"].get("base_export_id")
+
+        chained_ids: Dict[str, Dict[str, UUID]] = {}
+        # Oldest first, so records replaced later map to their latest import
+        for result_data in reversed(chain):
+            for entity_type, mappings in (result_data.get("id_mappings") or {}).items():
+                chained_ids.setdefault(entity_type, {}).update(
+                    (external_id, UUID(new_id)) for external_id, new_id in mappings.items()
+                )
+        return chained_ids
+
+    def _delete_removed_records(
+        self,
+        user_id: UUID,
+        manifest: ExportManifestDTO,
+        chained_ids: Dict[str, Dict[str, UUID]],
+        released_files: List[str],
+    ) -> tuple[int, int]:
+        """
+        Delete the records imported from an incremental export's base that were deleted since.
+
+        The manifest lists every journal and entry the user had when the export
+        was made; earlier imports of the others are deleted the way replaced
+        entries are (see _delete_replaced_entry()), and media files nothing
+        references anymore are added to released_files.
+
+        Returns:
+            Tuple of (journals_deleted, entries_deleted)
+        """
+        live_journal_ids = set(manifest.journal_ids or [])
+        live_entry_ids = set(manifest.entry_ids or [])
+        removed_journal_ids = [
+            journal_id for external_id, journal_id in chained_ids.get("journals", {}).items()
+            if external_id not in live_journal_ids
+        ]
+        removed_entry_ids = [
+            entry_id for external_id, entry_id in chained_ids.get("entries", {}).items()
+            if external_id not in live_entry_ids
+        ]
+        if not removed_journal_ids and not removed_entry_ids:
+            return 0, 0
+
+        # Entries of a deleted journal go with it
+        entries = self.db.execute(
+            select(Entry.id, Entry.journal_id).where(
+                Entry.user_id == user_id,
+                or_(Entry.id.in_(removed_entry_ids), Entry.journal_id.in_(removed_journal_ids)),
+            )
+        ).all()
+        day_changes: DayChanges = {}
+        rollup_dates: Set[date] = set()
+        for entry_id, journal_id in entries:
+            self._delete_replaced_entry(user_id, entry_id, journal_id, day_changes, rollup_dates, released_files)
+
+        journals_deleted = self.db.execute(
+            delete(Journal).where(Journal.user_id == user_id, Journal.id.in_(removed_journal_ids))
+        ).rowcount if removed_journal_ids else 0
+        for journal_id in {journal_id for _, journal_id in entries} - set(removed_journal_ids):
+            self._refresh_journal_stats(journal_id)
+
+        analytics_service = AnalyticsService(self.db)
+        analytics_service.record_entry_changes(user_id, day_changes)
+        analytics_service.refresh_daily_rollups(user_id, rollup_dates)
+        return journals_deleted, len(entries)
+
+    @staticmethod
+    def _skip_committed_entries(streamed_journal: StreamedJournal, partial_journal: Dict[str, Any]) -> None:
+        """Read past the entries of a journal that a checkpoint already committed."""
+        last_entry: Dict[str, Any] = {}
+        for last_entry in islice(streamed_journal.entries, partial_journal["result"]["entries_created"]):
+            pass
+        if last_entry.get("external_id") != partial_journal["last_entry_external_id"]:
+            raise ValueError("Import file does not match the checkpoint it is resumed from")
+
+    @staticmethod
+    def _dump_journal_analytics(day_changes: DayChanges, rollup_dates: Set[date]) -> Dict[str, Any]:
+        """Serialize a journal's pending analytics changes for its checkpoint."""
+        return {
+            "day_changes": {day.isoformat(): list(change) for day, change in day_changes.items()},
+            "rollup_dates": sorted(day.isoformat() for day in rollup_dates),
+        }
+
+    @staticmethod
+    def _load_journal_analytics(partial_journal: Dict[str, Any]) -> tuple[DayChanges, Set[date]]:
+        """Restore a journal's pending analytics changes from its checkpoint."""
+        day_changes: DayChanges = {
+            date.fromisoformat(day): (entries, words)
+            for day, (entries, words) in partial_journal.get("day_changes", {}).items()
+        }
+        rollup_dates = {date.fromisoformat(day) for day in partial_journal.get("rollup_dates", [])}
+        return day_changes, rollup_dates
+
     def _import_journal(
         self,
         user_id: UUID,
-        journal_dto: JournalDTO,
-        media_dir: Optional[Path],
+        streamed_journal: StreamedJournal,
+        media_reader: Optional[ZipMediaReader],
         id_mapper: IDMapper,
-        existing_media_checksums: set,
-        existing_tag_names: set,
-        existing_mood_names: set,
+        tag_ids: Dict[str, UUID],
+        mood_ids: Dict[str, UUID],
         summary: ImportResultSummary,
         entry_progress_callback: Optional[Callable[[], None]] = None,
         record_mapping: Optional[Callable[[str, Optional[str], UUID], None]] = None,
+        pending_thumbnails: Optional[List[UUID]] = None,
+        chained_ids: Optional[Dict[str, Dict[str, UUID]]] = None,
+        released_files: Optional[List[str]] = None,
+        partial_journal: Optional[Dict[str, Any]] = None,
+        commit_entries: Optional[Callable[[Dict[str, Any]], None]] = None,
     ) -> Dict[str, int]:
         """
         Import a single journal with its entries.
 
+        Entries are parsed one at a time as they are read, and their rows are
+        written in bulk batches of ImportConfig.ENTRY_BATCH_SIZE. If given,
+        commit_entries is called after each full batch with the journal's
+        progress so far (see import_journiv_data()); partial_journal is such
+        progress from a checkpoint, whose entries have already been read past.
+
+        A journal or entry found in chained_ids (see _get_chained_import_ids())
+        updates the record imported before instead of adding another one.
+
         Returns:
             Dictionary with counts of imported items
         """
+        chained_ids = chained_ids or {}
+        if partial_journal:
+            journal = self.db.get(Journal, UUID(partial_journal["journal_id"]))
+            if journal is None:
+                raise ValueError("Journal of the import checkpoint no longer exists")
+            result = dict(partial_journal["result"])
+            day_changes, rollup_dates = self._load_journal_analytics(partial_journal)
+        else:
+            journal = None
+            chained_journal_id = chained_ids.get("journals", {}).get(streamed_journal.fields.get("external_id"))
+            if chained_journal_id:
+                journal = self.db.get(Journal, chained_journal_id)
+                if journal is not None and journal.user_id != user_id:
+                    journal = None
+            journal = self._create_imported_journal(user_id, streamed_journal, summary, existing=journal)
+            result = {
+                "journal_updated": int(journal.id == chained_journal_id),
+                "entries_created": 0,
+                "entries_updated": 0,
+                "mood_logs_created": 0,
+                "media_imported": 0,
+                "media_deduplicated": 0,
+                "tags_created": 0,
+                "tags_reused": 0,
+            }
+            day_changes, rollup_dates = {}, set()
+        # Progress commits expire the instance; avoid a reload per entry
+        journal_id = journal.id
+
+        # Import entries
+        batch = BatchInserter(self.db, ImportConfig.ENTRY_BATCH_SIZE)
+        for entry_data in streamed_journal.entries:
+            entry_dto = EntryDTO(**entry_data)
+            entry_result = self._import_entry(
+                journal_id=journal_id,
+                user_id=user_id,
+                entry_dto=entry_dto,
+                media_reader=media_reader,
+                batch=batch,
+                tag_ids=tag_ids,
+                mood_ids=mood_ids,
+                summary=summary,
+                record_mapping=record_mapping,
+                pending_thumbnails=pending_thumbnails,
+                day_changes=day_changes,
+                rollup_dates=rollup_dates,
+                replaces_entry_id=chained_ids.get("entries", {}).get(entry_dto.external_id),
+                released_files=released_files,
+            )
+
+            result["entries_created"] += 1
+            result["entries_updated"] += entry_result["entries_updated"]
+            result["mood_logs_created"] += entry_result["mood_logs_created"]
+            result["media_imported"] += entry_result["media_imported"]
+            result["media_deduplicated"] += entry_result["media_deduplicated"]
+            result["tags_created"] += entry_result["tags_created"]
+            result["tags_reused"] += entry_result["tags_reused"]
+
+            if entry_progress_callback:
+                entry_progress_callback()
+
+            if batch.flush_if_full() and commit_entries:
+                commit_entries({
+                    "journal_id": str(journal_id),
+                    "last_entry_external_id": entry_data.get("external_id"),
+                    "result": dict(result),
+                    **self._dump_journal_analytics(day_changes, rollup_dates),
+                })
+
+        # Entries are exhausted, so all of the journal's fields have been read
+        journal_dto = JournalDTO(**streamed_journal.fields)
+        # Preserve original timestamps from export
+        journal.created_at = journal_dto.created_at
+        journal.updated_at = journal_dto.updated_at
+        if record_mapping and journal_dto.external_id:
+            record_mapping("journals", journal_dto.external_id, journal.id)
+
+        batch.flush()
+        self._update_imported_journal_stats(user_id, journal_id, day_changes, rollup_dates)
+        return result
+
+    def _create_imported_journal(
+        self,
+        user_id: UUID,
+        streamed_journal: StreamedJournal,
+        summary: ImportResultSummary,
+        existing: Optional[Journal] = None,
+    ) -> Journal:
+        """Create the journal row from the fields read ahead of its entries, or update ``existing`` with them."""
+        # Fields that follow the entries in the document (timestamps in older
+        # exports) are not known yet; they are applied once entries are read
+        now = utc_now()
+        journal_dto = JournalDTO(**{"created_at": now, "updated_at": now, **streamed_journal.fields})
+
         # Parse color enum if provided
         color = None
         if journal_dto.color:
@@ -313,69 +760,64 @@ class ImportService:
                     log_warning(warning_msg, user_id=str(user_id), journal_title=journal_dto.title, color=journal_dto.color)
                     summary.warnings.append(warning_msg)
 
+        fields = {
+            "title": journal_dto.title,
+            "description": journal_dto.description,
+            "color": color,
+            "icon": journal_dto.icon,
+            "is_favorite": journal_dto.is_favorite,
+            "is_archived": journal_dto.is_archived,
+        }
+        if existing is not None:
+            for name, value in fields.items():
+                setattr(existing, name, value)
+            return existing
+
         # Create journal
-        journal = Journal(
-            user_id=user_id,
-            title=journal_dto.title,
-            description=journal_dto.description,
-            color=color,
-            icon=journal_dto.icon,
-            is_favorite=journal_dto.is_favorite,
-            is_archived=journal_dto.is_archived,
-            # Preserve original timestamps from export
-            created_at=journal_dto.created_at,
-            updated_at=journal_dto.updated_at,
-            # Note: entry_count and last_entry_at are denormalized fields
-            # They will be updated by the service layer after entries are imported
-        )
+        # Note: entry_count and last_entry_at are denormalized fields
+        # They will be updated by the service layer after entries are imported
+        journal = Journal(user_id=user_id, **fields)
         self.db.add(journal)
         self.db.flush()  # Get journal ID
-        if record_mapping and journal_dto.external_id:
-            record_mapping("journals", journal_dto.external_id, journal.id)
-
-        result = {
-            "entries_created": 0,
-            "mood_logs_created": 0,
-            "media_imported": 0,
-            "media_deduplicated": 0,
-            "tags_created": 0,
-            "tags_reused": 0,
-        }
+        return journal
 
-        # Import entries
-        for entry_dto in journal_dto.entries:
-            entry_result = self._import_entry(
-                journal_id=journal.id,
-                user_id=user_id,
-                entry_dto=entry_dto,
-                media_dir=media_dir,
-                existing_media_checksums=existing_media_checksums,
-                existing_tag_names=existing_tag_names,
-                existing_mood_names=existing_mood_names,
-                summary=summary,
-                record_mapping=record_mapping,
-            )
+    def _update_imported_journal_stats(
+        self,
+        user_id: UUID,
+        journal_id: UUID,
+        day_changes: DayChanges,
+        rollup_dates: Set[date],
+    ) -> None:
+        """Update a journal's denormalized stats and fold its imported entries into analytics."""
+        # Update journal denormalized fields (entry_count, total_words, last_entry_at)
+        # This ensures the journal card statistics are accurate after import
+        entry_count, total_words, last_created = self._refresh_journal_stats(journal_id)
 
-            result["entries_created"] += 1
-            result["mood_logs_created"] += entry_result["mood_logs_created"]
-            result["media_imported"] += entry_result["media_imported"]
-            result["media_deduplicated"] += entry_result["media_deduplicated"]
-            result["tags_created"] += entry_result["tags_created"]
-            result["tags_reused"] += entry_result["tags_reused"]
+        # Fold the imported (and replaced) entries into the writing-day
+        # counters and streak as part of this journal's transaction
+        analytics_service = AnalyticsService(self.db)
+        analytics_service.record_entry_changes(user_id, day_changes)
+        analytics_service.refresh_daily_rollups(user_id, rollup_dates)
 
-            if entry_progress_callback:
-                entry_progress_callback()
+        log_info(
+            f"Updated journal {journal_id} denormalized stats: "
+            f"{entry_count} entries, {total_words} words, last entry at {last_created}",
+            user_id=str(user_id),
+            journal_id=str(journal_id),
+            entry_count=entry_count,
+            total_words=total_words
+        )
 
-        # Update journal denormalized fields (entry_count, total_words, last_entry_at)
-        # This ensures the journal card statistics are accurate after import
-        self.db.flush()  # Ensure all entries are committed
+    def _refresh_journal_stats(self, journal_id: UUID) -> tuple:
+        """Recount a journal's denormalized stats from its entries; return (count, words, last entry)."""
+        self.db.flush()  # Ensure all entries are counted
         stats = self.db.execute(
             select(
                 func.count(Entry.id).label("count"),
                 func.sum(Entry.word_count).label("total_words"),
-                func.max(Entry.created_at).label("last_created")
+                func.max(Entry.entry_datetime_utc).label("last_created")
             ).where(
-                Entry.journal_id == journal.id
+                Entry.journal_id == journal_id
             )
         ).one()
 
@@ -383,34 +825,45 @@ class ImportService:
         total_words = int(stats.total_words) if stats and stats.total_words is not None else 0
         last_created = stats.last_created if stats else None
 
-        journal.entry_count = entry_count
-        journal.total_words = total_words
-        journal.last_entry_at = last_created
-
-        log_info(
-            f"Updated journal {journal.id} denormalized stats: "
-            f"{entry_count} entries, {total_words} words, last entry at {last_created}",
-            user_id=str(user_id),
-            journal_id=str(journal.id),
-            entry_count=entry_count,
-            total_words=total_words
+        self.db.execute(
+            update(Journal)
+            .where(Journal.id == journal_id)
+            .values(entry_count=entry_count, total_words=total_words, last_entry_at=last_created)
+            .execution_options(synchronize_session=False)
         )
-
-        return result
+        return entry_count, total_words, last_created
 
     def _import_entry(
         self,
         journal_id: UUID,
         user_id: UUID,
         entry_dto: EntryDTO,
-        media_dir: Optional[Path],
-        existing_media_checksums: set,
-        existing_tag_names: set,
-        existing_mood_names: set,
+        media_reader: Optional[ZipMediaReader],
+        batch: BatchInserter,
+        tag_ids: Dict[str, UUID],
+        mood_ids: Dict[str, UUID],
         summary: ImportResultSummary,
         record_mapping: Optional[Callable[[str, Optional[str], UUID], None]] = None,
+        pending_thumbnails: Optional[List[UUID]] = None,
+        day_changes: Optional[DayChanges] = None,
+        rollup_dates: Optional[Set[date]] = None,
+        replaces_entry_id: Optional[UUID] = None,
+        released_files: Optional[List[str]] = None,
     ) -> Dict[str, int]:
-        """Import a single entry with media and tags."""
+        """
+        Import a single entry with media and tags.
+
+        Rows are added to batch rather than the session; IDs are assigned
+        client-side, so nothing is flushed here. The entry's analytics changes
+        are added to day_changes and rollup_dates. replaces_entry_id is an
+        earlier import of the entry, deleted once the new version is added.
+        """
+        if day_changes is None:
+            day_changes = {}
+        if rollup_dates is None:
+            rollup_dates = set()
+        if released_files is None:
+            released_files = []
         # Calculate word count from content to ensure accuracy
         # (don't trust the DTO value in case it's outdated or incorrect)
         word_count = len(entry_dto.content.split()) if entry_dto.content else 0
@@ -424,29 +877,32 @@ class ImportService:
         )
 
         # Create entry with proper datetime fields
-        entry = Entry(
-            journal_id=journal_id,
-            user_id=user_id,
-            title=entry_dto.title,
-            content=entry_dto.content,
-            entry_date=recalculated_entry_date,  # Recalculated local date
-            entry_datetime_utc=entry_dto.entry_datetime_utc,  # UTC timestamp
-            entry_timezone=entry_dto.entry_timezone or "UTC",  # IANA timezone, default to UTC
-            word_count=word_count,  # Recalculate from content
-            is_pinned=entry_dto.is_pinned,
-            location=entry_dto.location,
-            weather=entry_dto.weather,
+        entry_id = uuid4()
+        batch.add(Entry, {
+            "id": entry_id,
+            "journal_id": journal_id,
+            "user_id": user_id,
+            "title": entry_dto.title,
+            "content": entry_dto.content,
+            "entry_date": recalculated_entry_date,  # Recalculated local date
+            "entry_datetime_utc": entry_dto.entry_datetime_utc,  # UTC timestamp
+            "entry_timezone": entry_dto.entry_timezone or "UTC",  # IANA timezone, default to UTC
+            "word_count": word_count,  # Recalculate from content
+            "is_pinned": entry_dto.is_pinned,
+            "location": entry_dto.location,
+            "weather": entry_dto.weather,
             # Preserve original timestamps from export
-            created_at=entry_dto.created_at,
-            updated_at=entry_dto.updated_at,
+            "created_at": entry_dto.created_at,
+            "updated_at": entry_dto.updated_at,
             # Note: latitude, longitude, temperature are placeholders (not in DB)
-        )
-        self.db.add(entry)
-        self.db.flush()  # Get entry ID
+        })
         if record_mapping and entry_dto.external_id:
-            record_mapping("entries", entry_dto.external_id, entry.id)
+            record_mapping("entries", entry_dto.external_id, entry_id)
+        add_day_change(day_changes, recalculated_entry_date, 1, word_count)
+        rollup_dates.add(recalculated_entry_date)
 
         result = {
+            "entries_updated": 0,
             "mood_logs_created": 0,
             "media_imported": 0,
             "media_deduplicated": 0,
@@ -456,26 +912,29 @@ class ImportService:
 
         # Import mood log if present
         if entry_dto.mood_log:
-            mood_log_created = self._import_mood_log(
-                entry_id=entry.id,
+            logged_date = self._import_mood_log(
+                entry_id=entry_id,
                 user_id=user_id,
                 mood_log_dto=entry_dto.mood_log,
-                existing_mood_names=existing_mood_names,
+                batch=batch,
+                mood_ids=mood_ids,
                 summary=summary,
             )
-            if mood_log_created:
+            if logged_date:
                 result["mood_logs_created"] += 1
+                rollup_dates.add(logged_date)
 
         # Import media
         for media_dto in entry_dto.media:
             media_result = self._import_media(
-                entry_id=entry.id,
+                entry_id=entry_id,
                 user_id=user_id,
                 media_dto=media_dto,
-                media_dir=media_dir,
-                existing_checksums=existing_media_checksums,
+                media_reader=media_reader,
+                batch=batch,
                 summary=summary,
                 record_mapping=record_mapping,
+                pending_thumbnails=pending_thumbnails,
             )
             if media_result["imported"]:
                 result["media_imported"] += 1
@@ -483,47 +942,99 @@ class ImportService:
                 result["media_deduplicated"] += 1
 
         # Import tags
+        linked_tag_ids = set()
         for tag_name in entry_dto.tags:
             tag_result = self._import_tag(
-                entry_id=entry.id,
+                entry_id=entry_id,
                 user_id=user_id,
                 tag_name=tag_name,
-                existing_tag_names=existing_tag_names,
+                batch=batch,
+                tag_ids=tag_ids,
+                linked_tag_ids=linked_tag_ids,
             )
             if tag_result["created"]:
                 result["tags_created"] += 1
             else:
                 result["tags_reused"] += 1
 
+        # Media of the new version already holds its references, so files
+        # shared with the earlier version are kept
+        if replaces_entry_id and self._delete_replaced_entry(
+            user_id, replaces_entry_id, journal_id, day_changes, rollup_dates, released_files,
+        ):
+            result["entries_updated"] += 1
+
         return result
 
+    def _delete_replaced_entry(
+        self,
+        user_id: UUID,
+        entry_id: UUID,
+        journal_id: UUID,
+        day_changes: DayChanges,
+        rollup_dates: Set[date],
+        released_files: List[str],
+    ) -> bool:
+        """
+        Delete an entry that an incremental import replaces with its new version.
+
+        Its analytics changes are added to day_changes and rollup_dates, and
+        media files nothing references anymore to released_files.
+
+        Returns:
+            True if the entry existed, False if it was deleted since
+        """
+        entry = self.db.execute(
+            select(Entry.journal_id, Entry.entry_date, Entry.word_count)
+            .where(Entry.id == entry_id, Entry.user_id == user_id)
+        ).one_or_none()
+        if entry is None:
+            return False
+
+        media_records = self.db.execute(
+            select(EntryMedia).where(EntryMedia.entry_id == entry_id)
+        ).scalars().all()
+        mood_log_dates = self.db.execute(
+            select(MoodLog.logged_date).where(MoodLog.entry_id == entry_id)
+        ).scalars().all()
+
+        for model in (EntryTagLink, MoodLog, EntryMedia):
+            self.db.execute(delete(model).where(model.entry_id == entry_id))
+        self.db.execute(delete(Entry).where(Entry.id == entry_id))
+        for media in media_records:
+            self.db.expunge(media)
+
+        released_files.extend(MediaService().release_media_files(self.db, user_id, media_records))
+        add_day_change(day_changes, entry.entry_date, -1, -entry.word_count)
+        rollup_dates.update([entry.entry_date, *mood_log_dates])
+        if entry.journal_id != journal_id:
+            # The entry moved to another journal since the earlier export
+            self._refresh_journal_stats(entry.journal_id)
+        return True
+
     def _import_mood_log(
         self,
         entry_id: UUID,
         user_id: UUID,
         mood_log_dto: MoodLogDTO,
-        existing_mood_names: set,
+        batch: BatchInserter,
+        mood_ids: Dict[str, UUID],
         summary: ImportResultSummary,
-    ) -> bool:
+    ) -> Optional[date]:
         """
         Import a mood log entry.
 
         Returns:
-            True if mood log was created, False otherwise
+            The mood log's date if it was created, None otherwise
         """
         # Find mood by name (case-insensitive, since existing records might store mixed case)
-        mood_name_lower = mood_log_dto.mood_name.lower()
-        mood = (
-            self.db.query(Mood)
-            .filter(func.lower(Mood.name) == mood_name_lower)
-            .first()
-        )
+        mood_id = mood_ids.get(mood_log_dto.mood_name.lower())
 
-        if not mood:
+        if not mood_id:
             warning_msg = f"Mood not found: '{mood_log_dto.mood_name}', skipping mood log"
             log_warning(warning_msg, user_id=str(user_id), mood_name=mood_log_dto.mood_name, entry_id=str(entry_id))
             summary.warnings.append(warning_msg)
-            return False
+            return None
 
         # Recalculate logged_date from UTC timestamp and timezone to avoid DST drift
         recalculated_logged_date = local_date_for_user(
@@ -532,40 +1043,58 @@ class ImportService:
         )
 
         # Create mood log
-        mood_log = MoodLog(
-            user_id=user_id,
-            entry_id=entry_id,
-            mood_id=mood.id,
-            note=mood_log_dto.note,
-            logged_date=recalculated_logged_date,  # Recalculated local date
-            logged_datetime_utc=mood_log_dto.logged_datetime_utc,
-            logged_timezone=mood_log_dto.logged_timezone,
+        batch.add(MoodLog, {
+            "id": uuid4(),
+            "user_id": user_id,
+            "entry_id": entry_id,
+            "mood_id": mood_id,
+            "note": mood_log_dto.note,
+            "logged_date": recalculated_logged_date,  # Recalculated local date
+            "logged_datetime_utc": mood_log_dto.logged_datetime_utc,
+            "logged_timezone": mood_log_dto.logged_timezone or "UTC",
             # Preserve original timestamps from export
-            created_at=mood_log_dto.created_at,
-            updated_at=mood_log_dto.updated_at,
-        )
-        self.db.add(mood_log)
-        return True
+            "created_at": mood_log_dto.created_at,
+            "updated_at": mood_log_dto.updated_at,
+        })
+        return recalculated_logged_date
 
     def _import_media(
         self,
         entry_id: UUID,
         user_id: UUID,
         media_dto: MediaDTO,
-        media_dir: Optional[Path],
-        existing_checksums: set,
+        media_reader: Optional[ZipMediaReader],
+        batch: BatchInserter,
         summary: ImportResultSummary,
         record_mapping: Optional[Callable[[str, Optional[str], UUID], None]] = None,
+        pending_thumbnails: Optional[List[UUID]] = None,
     ) -> Dict[str, Any]:
         """
         Import a media file with deduplication.
 
+        The file is streamed from the import archive into the media store
+        while it is hashed, so it is decompressed and written exactly once.
+        Images and videos without a generated thumbnail are stored as PENDING
+        and their IDs appended to pending_thumbnails. Media missing from the
+        archive (incremental exports leave out unchanged files) reuses the
+        user's stored copy with the same checksum, if there is one.
+
         Returns:
             {"imported": True/False, "deduplicated": True/False, "stored_relative_path": str | None}
         """
-        # Check if media file exists in media_dir
-        if not media_dir:
-            warning_msg = f"No media directory, skipping media: {media_dto.filename}"
+        source = media_reader.open(media_dto.file_path) if media_reader and media_dto.file_path else None
+        if source is None and media_dto.checksum:
+            stored_path = self._retain_stored_media(user_id, media_dto.checksum)
+            if stored_path:
+                return self._add_deduplicated_media(
+                    entry_id, media_dto, media_dto.checksum, stored_path, batch,
+                    record_mapping=record_mapping,
+                    pending_thumbnails=pending_thumbnails,
+                )
+
+        # Check if media file exists in the archive
+        if not media_reader:
+            warning_msg = f"No media in import file, skipping media: {media_dto.filename}"
             log_warning(warning_msg, user_id=str(user_id), media_filename=media_dto.filename, entry_id=str(entry_id))
             summary.warnings.append(warning_msg)
             summary.media_files_skipped += 1
@@ -578,13 +1107,13 @@ class ImportService:
             summary.media_files_skipped += 1
             return {"imported": False, "deduplicated": False, "stored_relative_path": None}
 
-        source_path = media_dir / media_dto.file_path
-        if not source_path.exists():
-            warning_msg = f"Media file not found: {source_path}"
+        if source is None:
+            warning_msg = f"Media file not found: {media_dto.file_path}"
             log_warning(warning_msg, user_id=str(user_id), media_filename=media_dto.filename, file_path=media_dto.file_path, entry_id=str(entry_id))
             summary.warnings.append(warning_msg)
             summary.media_files_skipped += 1
             return {"imported": False, "deduplicated": False, "stored_relative_path": None}
+        suffix = Path(media_dto.file_path).suffix
 
         # Choose media subdirectory based on type
         media_type = media_dto.media_type.lower() if media_dto.media_type else "unknown"
@@ -602,70 +1131,50 @@ class ImportService:
         dest_dir.mkdir(parents=True, exist_ok=True)
 
         # Stream copy while calculating checksum to avoid double reads
-        tmp_path = dest_dir / f"tmp_{uuid4().hex}{source_path.suffix}"
+        tmp_path = dest_dir / f"tmp_{uuid4().hex}{suffix}"
         sha256 = MediaHandler.sha256_hasher()
 
-        with open(source_path, "rb") as src, open(tmp_path, "wb") as dst:
-            for chunk in iter(lambda: src.read(8192), b""):
-                sha256.update(chunk)
-                dst.write(chunk)
+        try:
+            with source, open(tmp_path, "wb") as dst:
+                for chunk in iter(lambda: source.read(ZipMediaReader.CHUNK_SIZE), b""):
+                    sha256.update(chunk)
+                    dst.write(chunk)
+        except zipfile.BadZipFile as e:
+            # CRC mismatch or truncated member
+            tmp_path.unlink(missing_ok=True)
+            warning_msg = f"Corrupted media file in import: {media_dto.file_path} ({e})"
+            log_warning(warning_msg, user_id=str(user_id), media_filename=media_dto.filename, file_path=media_dto.file_path, entry_id=str(entry_id))
+            summary.warnings.append(warning_msg)
+            summary.media_files_skipped += 1
+            return {"imported": False, "deduplicated": False, "stored_relative_path": None}
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
 
         checksum = sha256.hexdigest()
 
-        # Check for duplicate by checksum
-        if checksum in existing_checksums:
-            existing_media = (
-                self.db.query(EntryMedia)
-                .join(Entry)
-                .filter(
-                    Entry.user_id == user_id,
-                    EntryMedia.checksum == checksum
-                )
-                .first()
-            )
-
-            if existing_media:
-                tmp_path.unlink(missing_ok=True)
-                media = EntryMedia(
-                    entry_id=entry_id,
-                    file_path=existing_media.file_path,
-                    original_filename=media_dto.filename,
-                    media_type=existing_media.media_type,
-                    file_size=existing_media.file_size,
-                    mime_type=existing_media.mime_type,
-                    checksum=checksum,
-                    thumbnail_path=existing_media.thumbnail_path,
-                    width=existing_media.width,
-                    height=existing_media.height,
-                    duration=existing_media.duration,
-                    alt_text=media_dto.alt_text or media_dto.caption,
-                    upload_status=existing_media.upload_status,
-                    file_metadata=existing_media.file_metadata,
-                    created_at=media_dto.created_at,
-                    updated_at=media_dto.updated_at,
-                )
-                self.db.add(media)
-                if record_mapping and media_dto.external_id:
-                    record_mapping("media", media_dto.external_id, media.id)
-                return {
-                    "imported": False,
-                    "deduplicated": True,
-                    "stored_relative_path": existing_media.file_path,
-                    "stored_filename": Path(existing_media.file_path).name,
-                }
-
         # Final filename uses checksum for uniqueness
-        target_name = f"{checksum}{source_path.suffix}"
+        target_name = f"{checksum}{suffix}"
         dest_path = dest_dir / target_name
         counter = 1
         while dest_path.exists():
-            dest_path = dest_dir / f"{checksum}_{counter}{source_path.suffix}"
+            dest_path = dest_dir / f"{checksum}_{counter}{suffix}"
             counter += 1
 
-        tmp_path.rename(dest_path)
-
         relative_path = f"{subdir}/{dest_path.name}"
 
+        # Bytes the user already has stored become a metadata-only record
+        stored_path = MediaService.retain_media_blob(self.db, user_id, checksum, relative_path)
+        if stored_path != relative_path:
+            tmp_path.unlink(missing_ok=True)
+            return self._add_deduplicated_media(
+                entry_id, media_dto, checksum, stored_path, batch,
+                record_mapping=record_mapping,
+                pending_thumbnails=pending_thumbnails,
+            )
+
+        tmp_path.rename(dest_path)
+
         # Create media record
         media = self._create_media_record(
             entry_id=entry_id,
@@ -674,33 +1183,11 @@ class ImportService:
             checksum=checksum,
             file_size=dest_path.stat().st_size,
         )
-        self.db.add(media)
-        existing_checksums.add(checksum)
-
-        # Generate thumbnail for imported media
-        if media.media_type in [MediaType.IMAGE, MediaType.VIDEO]:
-            try:
-                from app.services.media_service import MediaService
-                media_service = MediaService(self.db)
-
-                # Generate thumbnail synchronously
-                full_path = Path(settings.media_root) / relative_path
-                if not full_path.exists():
-                    log_warning(f"Media file not found for thumbnail generation: {full_path}", media_id=str(media.id), file_path=str(full_path))
-                else:
-                    thumbnail_path = media_service._generate_thumbnail(
-                        str(full_path),
-                        media.media_type
-                    )
 
-                    if thumbnail_path:
-                        # Convert to relative path
-                        media.thumbnail_path = media_service._relative_thumbnail_path(Path(thumbnail_path))
-                        log_info(f"Generated thumbnail for imported media: {media.id}", media_id=str(media.id))
-            except Exception as thumb_error:
-                # Log but don't fail import if thumbnail generation fails
-                log_warning(f"Failed to generate thumbnail for imported media {media.id}: {thumb_error}", media_id=str(media.id))
+        # Thumbnails are generated once the row is committed
+        self._defer_thumbnail(media, pending_thumbnails)
 
+        batch.add(EntryMedia, media.model_dump())
         if record_mapping and media_dto.external_id:
             record_mapping("media", media_dto.external_id, media.id)
 
@@ -711,6 +1198,83 @@ class ImportService:
             "stored_filename": dest_path.name,
         }
 
+    def _retain_stored_media(self, user_id: UUID, checksum: str) -> Optional[str]:
+        """Reference the user's stored copy of ``checksum``; return its path, or None if there is none."""
+        stored_path = self.db.execute(
+            select(MediaBlob.file_path).where(MediaBlob.user_id == user_id, MediaBlob.checksum == checksum)
+        ).scalar_one_or_none()
+        if stored_path is None:
+            return None
+        return MediaService.retain_media_blob(self.db, user_id, checksum, stored_path)
+
+    def _add_deduplicated_media(
+        self,
+        entry_id: UUID,
+        media_dto: MediaDTO,
+        checksum: str,
+        stored_path: str,
+        batch: BatchInserter,
+        record_mapping: Optional[Callable[[str, Optional[str], UUID], None]] = None,
+        pending_thumbnails: Optional[List[UUID]] = None,
+    ) -> Dict[str, Any]:
+        """Add a metadata-only media record for bytes the user already has stored at stored_path."""
+        # The stored copy may belong to a row still waiting in the batch
+        batch.flush()
+        existing_media = (
+            self.db.query(EntryMedia)
+            .filter(EntryMedia.file_path == stored_path)
+            .first()
+        )
+        if existing_media:
+            media = EntryMedia(
+                entry_id=entry_id,
+                file_path=existing_media.file_path,
+                original_filename=media_dto.filename,
+                media_type=existing_media.media_type,
+                file_size=existing_media.file_size,
+                mime_type=existing_media.mime_type,
+                checksum=checksum,
+                thumbnail_path=existing_media.thumbnail_path,
+                width=existing_media.width,
+                height=existing_media.height,
+                duration=existing_media.duration,
+                alt_text=media_dto.alt_text or media_dto.caption,
+                upload_status=existing_media.upload_status,
+                file_metadata=existing_media.file_metadata,
+                created_at=media_dto.created_at,
+                updated_at=media_dto.updated_at,
+            )
+            if media.upload_status != UploadStatus.COMPLETED:
+                self._defer_thumbnail(media, pending_thumbnails)
+        else:
+            media = self._create_media_record(
+                entry_id=entry_id,
+                file_path=stored_path,
+                media_dto=media_dto,
+                checksum=checksum,
+            )
+            self._defer_thumbnail(media, pending_thumbnails)
+        batch.add(EntryMedia, media.model_dump())
+        if record_mapping and media_dto.external_id:
+            record_mapping("media", media_dto.external_id, media.id)
+        return {
+            "imported": False,
+            "deduplicated": True,
+            "stored_relative_path": stored_path,
+            "stored_filename": Path(stored_path).name,
+        }
+
+    @staticmethod
+    def _defer_thumbnail(media: EntryMedia, pending_thumbnails: Optional[List[UUID]]) -> None:
+        """Mark an image or video as awaiting its thumbnail."""
+        if media.media_type not in (MediaType.IMAGE, MediaType.VIDEO) or pending_thumbnails is None:
+            return
+        # A thumbnail path from the export refers to the source instance
+        media.thumbnail_path = None
+        media.upload_status = UploadStatus.PENDING
+        media.processing_error = None
+        pending_thumbnails.append(media.id)
+
     def _parse_media_type(self, media_type_str: str) -> MediaType:
         """Parse media type string to enum."""
         try:
@@ -749,7 +1313,7 @@ class ImportService:
             file_size: Optional file size override (uses DTO value if not provided)
 
         Returns:
-            Created EntryMedia instance (not yet added to session)
+            Created EntryMedia instance (not yet added to session or batch)
         """
         media_type = self._parse_media_type(media_dto.media_type)
         upload_status = self._parse_upload_status(media_dto.upload_status)
@@ -778,73 +1342,39 @@ class ImportService:
         entry_id: UUID,
         user_id: UUID,
         tag_name: str,
-        existing_tag_names: set,
+        batch: BatchInserter,
+        tag_ids: Dict[str, UUID],
+        linked_tag_ids: set,
     ) -> Dict[str, bool]:
         """
         Import a tag with deduplication.
 
-        Uses existing_tag_names for fast-path check before querying DB.
+        Tags are resolved through tag_ids (lowercase name -> ID), which holds
+        the user's existing tags and is extended with every tag created.
 
         Returns:
             {"created": True/False}
         """
         tag_name_lower = tag_name.strip().lower()
 
-        # Fast-path: check if tag already exists in set
-        if tag_name_lower in existing_tag_names:
-            # Tag exists, just need to link it
-            tag = (
-                self.db.query(Tag)
-                .filter(
-                    Tag.user_id == user_id,
-                    Tag.name == tag_name_lower
-                )
-                .first()
-            )
-            created = False
-        else:
-            # Tag doesn't exist in set, check DB and create if needed
-            tag = (
-                self.db.query(Tag)
-                .filter(
-                    Tag.user_id == user_id,
-                    Tag.name == tag_name_lower
-                )
-                .first()
-            )
-
-            created = False
-            if not tag:
-                tag = Tag(user_id=user_id, name=tag_name_lower)
-                self.db.add(tag)
-                self.db.flush()
-                existing_tag_names.add(tag_name_lower)
-                created = True
+        tag_id = tag_ids.get(tag_name_lower)
+        created = False
+        if tag_id is None:
+            tag_id = tag_ids[tag_name_lower] = uuid4()
+            batch.add(Tag, {"id": tag_id, "user_id": user_id, "name": tag_name_lower})
+            created = True
 
-        # Link tag to entry
-        from app.models.entry_tag_link import EntryTagLink
-        link = EntryTagLink(entry_id=entry_id, tag_id=tag.id)
-        self.db.add(link)
+        # Link tag to entry, once even if the export repeats the name
+        if tag_id not in linked_tag_ids:
+            linked_tag_ids.add(tag_id)
+            batch.add(EntryTagLink, {"entry_id": entry_id, "tag_id": tag_id})
 
         return {"created": created}
 
-    def _get_existing_media_checksums(self, user_id: UUID) -> set:
-        """Get set of existing media checksums for user."""
-        checksums = (
-            self.db.query(EntryMedia.checksum)
-            .join(Entry)
-            .filter(
-                Entry.user_id == user_id,
-                EntryMedia.checksum.isnot(None)
-            )
-            .all()
-        )
-        return {c[0] for c in checksums if c[0]}
-
-    def _get_existing_tag_names(self, user_id: UUID) -> set:
-        """Get set of existing tag names for user (lowercase)."""
-        tags = self.db.query(Tag.name).filter(Tag.user_id == user_id).all()
-        return {t[0].lower() for t in tags}
+    def _get_existing_tag_ids(self, user_id: UUID) -> Dict[str, UUID]:
+        """Get existing tag IDs for user, keyed by lowercase name."""
+        tags = self.db.query(Tag.name, Tag.id).filter(Tag.user_id == user_id).all()
+        return {name.lower(): tag_id for name, tag_id in tags}
 
     def _get_existing_mood_names(self, user_id: UUID) -> set:
         """
@@ -856,15 +1386,10 @@ class ImportService:
         moods = self.db.query(Mood.name).all()
         return {m[0].lower() for m in moods}
 
-    @staticmethod
-    def count_entries_in_data(data: Dict[str, Any]) -> int:
-        """Count number of entries present in import data."""
-        journals = data.get("journals", [])
-        total = 0
-        for journal in journals:
-            entries = journal.get("entries", [])
-            total += len(entries)
-        return total
+    def _get_mood_ids(self) -> Dict[str, UUID]:
+        """Get mood IDs (system-wide), keyed by lowercase name."""
+        moods = self.db.query(Mood.name, Mood.id).all()
+        return {name.lower(): mood_id for name, mood_id in moods}
 
     def cleanup_temp_files(self, file_path: Path):
         """
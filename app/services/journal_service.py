@@ -7,6 +7,8 @@ from typing import List, Optional
 from sqlalchemy.exc import SQLAlchemyError
 from sqlmodel import Session, select, func
 
+from app.core.analytics_cache import get_analytics_cache
+from app.core.concurrency import run_in_db_threadpool
 from app.core.exceptions import JournalNotFoundError
 from app.core.logging_config import log_info, log_warning, log_error
 from app.core.time_utils import utc_now
@@ -52,6 +54,7 @@ class JournalService:
             log_error(exc)
             raise
 
+        get_analytics_cache().invalidate(str(user_id))
         log_info(f"Journal created for user {user_id}: {journal.id}")
         return journal
 
@@ -103,37 +106,65 @@ class JournalService:
             log_error(exc)
             raise
 
+        get_analytics_cache().invalidate(str(user_id))
         log_info(f"Journal updated for {user_id}: {journal.id}")
         return journal
 
     async def delete_journal(self, journal_id: uuid.UUID, user_id: uuid.UUID) -> bool:
         """Hard delete a journal and all related entries and media."""
+        from app.services.media_service import MediaService
+
+        media_files_to_delete = await run_in_db_threadpool(
+            self._delete_journal_records, journal_id, user_id
+        )
+
+        # Delete physical media files from disk
+        media_service = MediaService()
+        for file_path in media_files_to_delete:
+            try:
+                await media_service.delete_media_file(file_path)
+            except Exception as exc:
+                log_warning(f"Failed to delete media file {file_path} after journal deletion: {exc}")
+
+        log_info(f"Journal and related entries/media hard-deleted for {user_id}: {journal_id}")
+        return True
+
+    def _delete_journal_records(self, journal_id: uuid.UUID, user_id: uuid.UUID) -> List[str]:
+        """Delete the journal rows and refresh derived stats; return media files to remove."""
         journal = self._get_owned_journal(journal_id, user_id)
 
         # Hard delete all related entries and their media first
         from app.models.entry import Entry, EntryMedia
+        from app.models.mood import MoodLog
         from app.services.media_service import MediaService
 
         entries = self.session.exec(
             select(Entry).where(Entry.journal_id == journal_id)
         ).all()
 
-        media_service = MediaService()
-        media_files_to_delete = []
+        from app.services.analytics_service import AnalyticsService, add_day_change
+
+        # Mood logs attached to the entries are removed with them
+        mood_log_dates = self.session.exec(
+            select(MoodLog.logged_date)
+            .join(Entry, Entry.id == MoodLog.entry_id)
+            .where(Entry.journal_id == journal_id)
+            .distinct()
+        ).all()
+
+        media_records = []
+        day_changes = {}
 
         for entry in entries:
-            # Collect all entry media records with their file paths before deletion
+            add_day_change(day_changes, entry.entry_date, -1, -entry.word_count)
+
+            # Collect all entry media records before deletion
             entry_media_list = self.session.exec(
                 select(EntryMedia).where(EntryMedia.entry_id == entry.id)
             ).all()
 
             for media in entry_media_list:
-                # Collect file paths for deletion (file_path is relative to media_root)
-                if media.file_path:
-                    full_path = (media_service.media_root / media.file_path).resolve()
-                    if full_path.exists() and str(full_path).startswith(str(media_service.media_root.resolve())):
-                        media_files_to_delete.append(str(full_path))
-
+                media_records.append(media)
                 self.session.delete(media)
 
             # Hard delete the entry
@@ -143,31 +174,21 @@ class JournalService:
         self.session.delete(journal)
 
         try:
+            # Files shared with media outside this journal stay on disk
+            media_files_to_delete = MediaService().release_media_files(
+                self.session, user_id, media_records
+            )
+            analytics_service = AnalyticsService(self.session)
+            analytics_service.record_entry_changes(user_id, day_changes)
+            analytics_service.refresh_daily_rollups(user_id, [*day_changes, *mood_log_dates])
             self.session.commit()
         except SQLAlchemyError as exc:
             self.session.rollback()
             log_error(exc)
             raise
 
-        # Recalculate writing streak statistics after journal is deleted
-        # This ensures analytics reflect the correct entry counts
-        try:
-            from app.services.analytics_service import AnalyticsService
-            analytics_service = AnalyticsService(self.session)
-            analytics_service.recalculate_writing_streak_stats(user_id)
-        except Exception as exc:
-            # Log error but don't fail the deletion
-            log_warning(f"Failed to update writing streak stats after journal deletion: {exc}")
-
-        # Delete physical media files from disk
-        for file_path in media_files_to_delete:
-            try:
-                await media_service.delete_media_file(file_path)
-            except Exception as exc:
-                log_warning(f"Failed to delete media file {file_path} after journal deletion: {exc}")
-
-        log_info(f"Journal and related entries/media hard-deleted for {user_id}: {journal_id}")
-        return True
+        get_analytics_cache().invalidate(str(user_id))
+        return media_files_to_delete
 
     def get_favorite_journals(self, user_id: uuid.UUID) -> List[Journal]:
         """Get favorite journals for a user."""
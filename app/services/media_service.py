@@ -4,20 +4,27 @@ Media service for file upload and processing.
 import asyncio
 import hashlib
 import logging
+import os
 import subprocess
 import uuid
+from concurrent.futures import Future
 from datetime import datetime, timezone
 from io import BytesIO
 from pathlib import Path
-from typing import Optional, Dict, Any, Tuple
+from typing import BinaryIO, Iterable, List, Optional, Dict, Any, Tuple
 
 import aiofiles
 import aiofiles.os
+import anyio.to_thread
 import magic
 from fastapi import UploadFile
+from sqlalchemy import delete, update
+from sqlalchemy.dialects.postgresql import insert as postgres_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import SQLAlchemyError
 from sqlmodel import Session, select
 
+from app.core.concurrency import run_in_db_threadpool
 from app.core.config import get_settings
 from app.core.exceptions import (
     MediaNotFoundError,
@@ -27,13 +34,15 @@ from app.core.exceptions import (
     EntryNotFoundError
 )
 from app.core.logging_config import log_error, log_file_upload, log_warning
-from app.models.entry import Entry, EntryMedia
-from app.models.enums import MediaType, UploadStatus
+from app.core.media_engine import MediaPriority, get_media_engine
+from app.core.time_utils import utc_now
+from app.models.entry import Entry, EntryMedia, MediaBlob
+from app.models.enums import MediaType, RenditionSize, UploadStatus
 from app.models.journal import Journal
 from app.utils.import_export.media_handler import MediaHandler
 
 try:
-    from PIL import Image
+    from PIL import Image, ImageOps, features as pil_features
 except ImportError:
     Image = None
 
@@ -52,6 +61,24 @@ class MediaService:
     FFPROBE_DEFAULT_TIMEOUT = 300
     VIDEO_THUMBNAIL_SEEK_TIME = "00:00:01"
 
+    # Renditions: longest side in pixels per named size, and the formats tried
+    # in order of preference (JPEG is the fallback every client accepts)
+    RENDITION_SIZES = {
+        RenditionSize.SMALL: 150,
+        RenditionSize.MEDIUM: 300,
+        RenditionSize.LARGE: 720,
+        RenditionSize.XLARGE: 1440,
+    }
+    RENDITION_FORMATS = {
+        "avif": {"mime_type": "image/avif", "extension": "avif", "pil_format": "AVIF", "quality": 60},
+        "webp": {"mime_type": "image/webp", "extension": "webp", "pil_format": "WEBP", "quality": 80},
+        "jpeg": {"mime_type": "image/jpeg", "extension": "jpg", "pil_format": "JPEG", "quality": 85},
+    }
+
+    # Uploads are streamed to disk in chunks; only the head is sniffed for MIME
+    UPLOAD_CHUNK_SIZE = 1024 * 1024
+    MIME_SNIFF_SIZE = 8192
+
     # Use MediaHandler constants to avoid duplication
     MIME_TYPE_MAP = MediaHandler.MIME_TYPE_MAP
     IMAGE_EXTENSIONS = MediaHandler.IMAGE_EXTENSIONS
@@ -164,36 +191,35 @@ class MediaService:
 
     async def save_uploaded_file(
         self,
-        file_content: bytes,
+        file: UploadFile,
         original_filename: str,
         user_id: str,
-        media_type: MediaType
+        media_type: MediaType,
+        mime_type: str
     ) -> Dict[str, Any]:
-        """Save an uploaded file quickly without processing (for async processing)."""
+        """Stream an uploaded file to disk without processing (for async processing).
+
+        The upload is copied in chunks to a temporary file next to its final
+        location and only renamed into place once it is complete, so a failed or
+        oversized upload never leaves a partial media file behind.
+        """
         # Generate unique filename
         filename = self._generate_filename(original_filename, user_id)
         file_path = self._get_media_path(filename, media_type)
-
         tmp_path = file_path.with_suffix(file_path.suffix + ".tmp")
-        async with aiofiles.open(tmp_path, 'wb') as f:
-            await f.write(file_content)
-            await f.flush()
+        max_bytes = self.settings.max_file_size_mb * 1024 * 1024
 
         try:
+            await file.seek(0)
+            file_size, checksum = await anyio.to_thread.run_sync(
+                self._copy_upload, file.file, tmp_path, max_bytes
+            )
             await aiofiles.os.rename(tmp_path, file_path)
-        except Exception:
-            # Attempt cleanup and re-raise
-            try:
-                await aiofiles.os.remove(tmp_path)
-            except FileNotFoundError:
-                pass
+        except BaseException:
+            # Synchronous cleanup so it still runs when the request is cancelled
+            tmp_path.unlink(missing_ok=True)
             raise
 
-        # Get basic metadata
-        file_size = len(file_content)
-        mime_type = self._detect_mime(file_content)
-        checksum = hashlib.sha256(file_content).hexdigest()
-
         # Return relative paths for API responses
         relative_file_path = str(file_path.relative_to(self.media_root))
 
@@ -210,6 +236,25 @@ class MediaService:
             "full_file_path": str(file_path)  # For background processing
         }
 
+    def _copy_upload(self, source: BinaryIO, destination: Path, max_bytes: int) -> Tuple[int, str]:
+        """Copy an upload to ``destination`` chunk by chunk; return its size and SHA-256.
+
+        The size limit is enforced as bytes arrive, so peak memory stays at one
+        chunk no matter how large the upload (or its declared size) is.
+        """
+        digest = hashlib.sha256()
+        file_size = 0
+        with open(destination, "wb") as out:
+            while chunk := source.read(self.UPLOAD_CHUNK_SIZE):
+                file_size += len(chunk)
+                if file_size > max_bytes:
+                    raise FileTooLargeError(
+                        f"File too large. Maximum size: {self.settings.max_file_size_mb}MB"
+                    )
+                digest.update(chunk)
+                out.write(chunk)
+        return file_size, digest.hexdigest()
+
     async def get_media_info(self, file_path: str) -> Dict[str, Any]:
         """Get detailed information about a media file."""
         path = Path(file_path)
@@ -287,6 +332,10 @@ class MediaService:
 
     async def delete_media_file(self, file_path: str) -> bool:
         """Delete a media file and its thumbnail."""
+        return self.remove_media_file(file_path)
+
+    def remove_media_file(self, file_path: str) -> bool:
+        """Delete a media file and its thumbnail (blocking variant of delete_media_file)."""
         path = Path(file_path)
         if not path.exists():
             return False
@@ -301,6 +350,11 @@ class MediaService:
             if thumbnail_path and thumbnail_path.exists():
                 thumbnail_path.unlink(missing_ok=True)
 
+        # Delete renditions generated from it
+        for size in RenditionSize:
+            for image_format in self.RENDITION_FORMATS:
+                self._get_rendition_path(path, size, image_format).unlink(missing_ok=True)
+
         return True
 
     def _validate_file_internal(self, file_content: bytes, filename: str) -> Tuple[bool, str]:
@@ -313,25 +367,31 @@ class MediaService:
             if not MediaHandler.validate_file_size(len(file_content), self.settings.max_file_size_mb):
                 return False, f"File size exceeds maximum limit of {self.settings.max_file_size_mb}MB"
 
-            # Get allowed types (from settings or cached)
-            allowed_mime_types = {mime.lower() for mime in (self.settings.allowed_media_types or [])} or self.allowed_mime_types
-            allowed_extensions = {ext.lower() for ext in (self.settings.allowed_file_extensions or [])} or self.allowed_extensions
-
-            # Check MIME type
             mime_type = self._detect_mime(file_content)
-            if allowed_mime_types and mime_type.lower() not in allowed_mime_types:
-                return False, f"Mime type {mime_type} not allowed"
-
-            # Check file extension
-            file_ext = Path(filename).suffix.lower()
-            if allowed_extensions and file_ext not in allowed_extensions:
-                return False, f"File extension {file_ext} not allowed"
+            self._validate_file_type(mime_type, filename)
 
             return True, "File is valid"
+        except (InvalidFileTypeError, FileValidationError) as exc:
+            return False, str(exc)
         except Exception as exc:
             log_error(exc, request_id="", user_email="")
             return False, "File validation failed"
 
+    def _validate_file_type(self, mime_type: str, filename: str) -> None:
+        """Check a detected MIME type and the filename extension against the allowlists."""
+        # Get allowed types (from settings or cached)
+        allowed_mime_types = {mime.lower() for mime in (self.settings.allowed_media_types or [])} or self.allowed_mime_types
+        allowed_extensions = {ext.lower() for ext in (self.settings.allowed_file_extensions or [])} or self.allowed_extensions
+
+        # Check MIME type
+        if allowed_mime_types and mime_type.lower() not in allowed_mime_types:
+            raise InvalidFileTypeError(f"Mime type {mime_type} not allowed")
+
+        # Check file extension
+        file_ext = Path(filename).suffix.lower()
+        if allowed_extensions and file_ext not in allowed_extensions:
+            raise FileValidationError(f"File extension {file_ext} not allowed")
+
     def validate_file_sync(self, file_content: bytes, filename: str) -> Tuple[bool, str]:
         """Validate file content and extension synchronously.
 
@@ -368,11 +428,10 @@ class MediaService:
                     f"File too large. Maximum size: {self.settings.max_file_size_mb}MB"
                 )
 
-    async def _read_file_content(self, file: UploadFile) -> bytes:
-        """Read file content from UploadFile."""
+    async def _read_file_head(self, file: UploadFile) -> bytes:
+        """Read just enough of an upload to sniff its MIME type."""
         try:
-            content = await file.read()
-            return content
+            return await file.read(self.MIME_SNIFF_SIZE)
         except Exception as e:
             log_error(e, request_id="", user_email="")
             raise FileValidationError("Failed to read file")
@@ -398,24 +457,15 @@ class MediaService:
                 # Generic validation error
                 raise FileValidationError(error_message or "File validation failed")
 
-    def _detect_media_type(self, file_content: bytes) -> MediaType:
-        """Detect media type from file content."""
-        try:
-            mime_type = self._detect_mime(file_content)
-
-            if mime_type.startswith('image/'):
-                return MediaType.IMAGE
-            elif mime_type.startswith('video/'):
-                return MediaType.VIDEO
-            elif mime_type.startswith('audio/'):
-                return MediaType.AUDIO
-            else:
-                raise InvalidFileTypeError("Unsupported media type")
-        except Exception as e:
-            if isinstance(e, InvalidFileTypeError):
-                raise
-            log_error(e, request_id="", user_email="")
-            raise FileValidationError("Failed to determine media type")
+    def _detect_media_type(self, mime_type: str) -> MediaType:
+        """Map a detected MIME type to the media type it is stored under."""
+        if mime_type.startswith('image/'):
+            return MediaType.IMAGE
+        elif mime_type.startswith('video/'):
+            return MediaType.VIDEO
+        elif mime_type.startswith('audio/'):
+            return MediaType.AUDIO
+        raise InvalidFileTypeError("Unsupported media type")
 
     async def upload_media(
         self,
@@ -446,40 +496,30 @@ class MediaService:
             InvalidFileTypeError: If file type is not supported
             EntryNotFoundError: If entry_id is provided but entry doesn't exist
         """
-        # 1. Check file size before reading
+        # 1. Check declared file size before reading
         await self._check_file_size(file)
+        filename = file.filename or "unknown"
 
-        # 2. Read file content
-        file_content = await self._read_file_content(file)
+        # 2. Validate type from the first bytes only
+        mime_type = self._detect_mime(await self._read_file_head(file))
+        self._validate_file_type(mime_type, filename)
 
-        # 3. Validate file
-        validation_ok, validation_message = await self.validate_file(
-            file_content,
-            file.filename or "unknown"
-        )
-        if not validation_ok:
-            normalized = (validation_message or "").lower()
-            if "file too large" in normalized or "exceeds" in normalized:
-                raise FileTooLargeError(validation_message)
-            if "unsupported media type" in normalized or "mime type" in normalized:
-                raise InvalidFileTypeError(validation_message)
-            raise FileValidationError(validation_message)
-
-        # 4. Detect media type
-        media_type = self._detect_media_type(file_content)
-
-        # 5. Save file
+        # 3. Detect media type
+        media_type = self._detect_media_type(mime_type)
+
+        # 4. Stream file to disk, enforcing the size limit as it is written
         media_info = await self.save_uploaded_file(
-            file_content,
-            file.filename or "unknown",
+            file,
+            filename,
             str(user_id),
-            media_type
+            media_type,
+            mime_type
         )
 
         media_record = None
         if entry_id:
             db_session = self._get_session(session)
-            self._get_entry_for_user(db_session, entry_id, user_id)
+            await run_in_db_threadpool(self._get_entry_for_user, db_session, entry_id, user_id)
 
             media_record = EntryMedia(
                 entry_id=entry_id,
@@ -496,15 +536,20 @@ class MediaService:
             )
 
             try:
-                db_session.add(media_record)
-                db_session.commit()
-                db_session.refresh(media_record)
+                deduplicated = await run_in_db_threadpool(
+                    self._save_media_record, db_session, media_record, user_id
+                )
             except SQLAlchemyError as exc:
                 db_session.rollback()
                 log_error(exc)
                 await self.delete_media_file(media_info["full_file_path"])
                 raise
 
+            if deduplicated:
+                # The same bytes were already stored; keep only the shared copy
+                await self.delete_media_file(media_info["full_file_path"])
+                media_info["full_file_path"] = str(self.media_root / media_record.file_path)
+
             log_file_upload(
                 media_record.original_filename or media_record.file_path,
                 media_info["file_size"],
@@ -517,6 +562,115 @@ class MediaService:
             "full_file_path": media_info["full_file_path"],
         }
 
+    def _save_media_record(self, session: Session, media_record: EntryMedia, user_id: uuid.UUID) -> bool:
+        """Persist a new media record and reload server-side defaults.
+
+        When the user already has these bytes stored, the record is pointed at
+        the existing file (reusing its processed metadata) and True is returned
+        so the caller can drop the redundant upload.
+        """
+        stored_path = self.retain_media_blob(
+            session, user_id, media_record.checksum, media_record.file_path
+        )
+        deduplicated = stored_path != media_record.file_path
+        if deduplicated:
+            media_record.file_path = stored_path
+            processed = session.exec(
+                select(EntryMedia).where(
+                    EntryMedia.file_path == stored_path,
+                    EntryMedia.upload_status == UploadStatus.COMPLETED,
+                )
+            ).first()
+            if processed:
+                media_record.thumbnail_path = processed.thumbnail_path
+                media_record.width = processed.width
+                media_record.height = processed.height
+                media_record.duration = processed.duration
+                media_record.file_metadata = processed.file_metadata
+                media_record.upload_status = UploadStatus.COMPLETED
+
+        session.add(media_record)
+        session.commit()
+        session.refresh(media_record)
+        return deduplicated
+
+    @staticmethod
+    def retain_media_blob(session: Session, user_id: uuid.UUID, checksum: str, file_path: str) -> str:
+        """Reference the user's stored copy of ``checksum``, storing ``file_path`` if there is none.
+
+        Returns the relative path new EntryMedia rows for these bytes must use.
+        The blob is inserted or its reference count bumped in a single upsert,
+        so concurrent uploads of the same bytes all share the first stored
+        file; commit it together with the EntryMedia insert.
+        """
+        now = utc_now()
+        dialect_insert = postgres_insert if get_settings().database_type == 'postgres' else sqlite_insert
+        statement = dialect_insert(MediaBlob).values(
+            user_id=user_id,
+            checksum=checksum,
+            file_path=file_path,
+            ref_count=1,
+            created_at=now,
+            updated_at=now,
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[MediaBlob.user_id, MediaBlob.checksum],
+            set_={
+                'ref_count': MediaBlob.ref_count + 1,
+                'updated_at': statement.excluded.updated_at,
+            },
+        ).returning(MediaBlob.file_path)
+        return session.execute(statement).scalar_one()
+
+    def release_media_files(
+        self,
+        session: Session,
+        user_id: uuid.UUID,
+        media_records: Iterable[EntryMedia],
+    ) -> List[str]:
+        """Drop the references held by deleted media and return files nothing uses anymore.
+
+        Call after deleting the records and before committing. The returned
+        absolute paths are safe to remove from disk once the transaction commits.
+        Files not tracked in the store (stored before it existed) are released
+        only when no remaining EntryMedia row points at them.
+        """
+        media_root = self.media_root.resolve()
+        released: List[str] = []
+        for media in media_records:
+            if not media.file_path:
+                continue
+
+            blob_filter = (
+                MediaBlob.user_id == user_id,
+                MediaBlob.checksum == media.checksum,
+                MediaBlob.file_path == media.file_path,
+            )
+            remaining = None
+            if media.checksum:
+                remaining = session.execute(
+                    update(MediaBlob)
+                    .where(*blob_filter)
+                    .values(ref_count=MediaBlob.ref_count - 1, updated_at=utc_now())
+                    .returning(MediaBlob.ref_count)
+                ).scalar_one_or_none()
+
+            if remaining is None:
+                still_used = session.exec(
+                    select(EntryMedia.id).where(EntryMedia.file_path == media.file_path)
+                ).first()
+                if still_used:
+                    continue
+            elif remaining > 0:
+                continue
+            else:
+                session.execute(delete(MediaBlob).where(*blob_filter, MediaBlob.ref_count <= 0))
+
+            full_path = (self.media_root / media.file_path).resolve()
+            if full_path.exists() and str(full_path).startswith(str(media_root)) and str(full_path) not in released:
+                released.append(str(full_path))
+        return released
+
     def _commit(self) -> None:
         """Commit database changes with proper error handling."""
         try:
@@ -743,8 +897,87 @@ class MediaService:
 
         return None
 
-    def _generate_thumbnail(self, file_path: str, media_type: MediaType | str) -> Optional[str]:
-        """Generate thumbnail synchronously."""
+    def generate_pending_thumbnails(self, media_ids: Iterable[uuid.UUID]) -> int:
+        """
+        Generate thumbnails for media stored without one (e.g. by an import).
+
+        Media still PENDING is claimed as PROCESSING first, and only the
+        records a call claimed are processed by it, so a record is only
+        thumbnailed once even if it is queued again. The records keep their
+        updated_at. No transaction is
+        held while thumbnails are generated; the results are committed
+        together, marking each record COMPLETED or FAILED.
+
+        Args:
+            media_ids: IDs of the EntryMedia records
+
+        Returns:
+            Number of thumbnails generated
+        """
+        media_ids = list(media_ids)
+        if not media_ids:
+            return 0
+
+        # Only the rows this call moved out of PENDING are its to process
+        claimed = self.session.exec(
+            update(EntryMedia)
+            .where(
+                EntryMedia.id.in_(media_ids),
+                EntryMedia.upload_status == UploadStatus.PENDING,
+            )
+            .values(upload_status=UploadStatus.PROCESSING)
+            .returning(EntryMedia.id, EntryMedia.file_path, EntryMedia.media_type)
+        ).all()
+        self._commit()
+
+        # Queue them all on the media engine so its workers share the batch
+        engine = get_media_engine()
+        jobs: Dict[uuid.UUID, Future] = {}
+        for media_id, file_path, media_type in claimed:
+            full_path = self.media_root / file_path
+            if full_path.exists():
+                jobs[media_id] = engine.submit(
+                    MediaService._generate_thumbnail, str(full_path), media_type,
+                    priority=MediaPriority.BATCH,
+                )
+            else:
+                jobs[media_id] = Future()
+                jobs[media_id].set_exception(FileNotFoundError(f"Media file not found at {full_path}"))
+
+        results: Dict[uuid.UUID, Dict[str, Any]] = {}
+        for media_id, job in jobs.items():
+            try:
+                thumbnail_path = job.result()
+                results[media_id] = {
+                    "upload_status": UploadStatus.COMPLETED,
+                    "processing_error": None,
+                    "thumbnail_path": self._relative_thumbnail_path(Path(thumbnail_path)) if thumbnail_path else None,
+                }
+            except Exception as e:
+                log_warning(f"Thumbnail generation failed for {media_id}: {e}", media_id=str(media_id))
+                results[media_id] = {
+                    "upload_status": UploadStatus.FAILED,
+                    "processing_error": f"Thumbnail generation failed: {e}",
+                }
+
+        # updated_at is left alone: imports keep the exported one, and
+        # incremental exports would otherwise re-ship every file
+        for media_id, values in results.items():
+            self.session.exec(
+                update(EntryMedia)
+                .where(EntryMedia.id == media_id)
+                .values(**values)
+            )
+        self._commit()
+        return sum(1 for values in results.values() if values.get("thumbnail_path"))
+
+    @classmethod
+    def _generate_thumbnail(cls, file_path: str, media_type: MediaType | str) -> Optional[str]:
+        """
+        Generate thumbnail synchronously.
+
+        A classmethod so it can be shipped to media engine worker processes.
+        """
         file_path_obj = Path(file_path)
 
         # Determine thumbnail directory based on media type
@@ -753,18 +986,19 @@ class MediaService:
         if media_type_value == "image":
             thumbnail_dir = file_path_obj.parent / "thumbnails"
             thumbnail_path = thumbnail_dir / f"thumb_{file_path_obj.name}"
-            self._generate_image_thumbnail(file_path_obj, thumbnail_path)
+            cls._generate_image_thumbnail(file_path_obj, thumbnail_path)
         elif media_type_value == "video":
             thumbnail_dir = file_path_obj.parent / "thumbnails"
             thumbnail_name = file_path_obj.stem
             thumbnail_path = thumbnail_dir / f"thumb_{thumbnail_name}.jpg"
-            self._generate_video_thumbnail(file_path_obj, thumbnail_path)
+            cls._generate_video_thumbnail(file_path_obj, thumbnail_path)
         else:
             return None
 
         return str(thumbnail_path)
 
-    def _generate_image_thumbnail(self, image_path: Path, thumbnail_path: Path):
+    @classmethod
+    def _generate_image_thumbnail(cls, image_path: Path, thumbnail_path: Path):
         """Generate image thumbnail using PIL."""
         if not Image:
             raise Exception("PIL not available for image thumbnail generation")
@@ -778,29 +1012,30 @@ class MediaService:
                     img = img.convert('RGB')
 
                 # Create thumbnail using class constants
-                img.thumbnail(self.THUMBNAIL_SIZE, Image.Resampling.LANCZOS)
-                img.save(thumbnail_path, "JPEG", quality=self.THUMBNAIL_QUALITY, optimize=True)
+                img.thumbnail(cls.THUMBNAIL_SIZE, Image.Resampling.LANCZOS)
+                img.save(thumbnail_path, "JPEG", quality=cls.THUMBNAIL_QUALITY, optimize=True)
         except Exception as e:
             log_error(f"Failed to generate image thumbnail: {e}")
             raise
 
-    def _generate_video_thumbnail(self, video_path: Path, thumbnail_path: Path):
+    @classmethod
+    def _generate_video_thumbnail(cls, video_path: Path, thumbnail_path: Path):
         """Generate video thumbnail using FFmpeg."""
         try:
             thumbnail_path.parent.mkdir(parents=True, exist_ok=True)
 
             cmd = [
                 "ffmpeg", "-i", str(video_path),
-                "-ss", self.VIDEO_THUMBNAIL_SEEK_TIME,
+                "-ss", cls.VIDEO_THUMBNAIL_SEEK_TIME,
                 "-vframes", "1",
-                "-vf", f"scale={self.THUMBNAIL_SIZE[0]}:{self.THUMBNAIL_SIZE[1]}",
+                "-vf", f"scale={cls.THUMBNAIL_SIZE[0]}:{cls.THUMBNAIL_SIZE[1]}",
                 "-f", "image2",  # Force image output format
                 "-y",  # Overwrite output
                 str(thumbnail_path)
             ]
 
             # Use configurable timeout from settings or class constant
-            timeout = getattr(self.settings, 'ffmpeg_timeout', self.FFMPEG_DEFAULT_TIMEOUT)
+            timeout = getattr(settings, 'ffmpeg_timeout', cls.FFMPEG_DEFAULT_TIMEOUT)
             result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
 
             if result.returncode != 0:
@@ -957,6 +1192,146 @@ class MediaService:
 
         return full_path
 
+    @classmethod
+    def negotiate_rendition_format(cls, accept: Optional[str]) -> str:
+        """Pick the smallest rendition format the client accepts (AVIF, then WebP, then JPEG)."""
+        accepted = set()
+        for part in (accept or "").split(","):
+            mime_type, *params = [item.strip().lower() for item in part.split(";")]
+            quality = next((param[2:] for param in params if param.startswith("q=")), "1")
+            try:
+                if float(quality) > 0:
+                    accepted.add(mime_type)
+            except ValueError:
+                continue
+        for image_format in ("avif", "webp"):
+            if cls.RENDITION_FORMATS[image_format]["mime_type"] in accepted and cls._can_encode(image_format):
+                return image_format
+        return "jpeg"
+
+    @staticmethod
+    def _can_encode(image_format: str) -> bool:
+        """Whether the installed Pillow can write the format."""
+        if not Image:
+            return False
+        return image_format == "jpeg" or bool(pil_features.check(image_format))
+
+    @staticmethod
+    def _get_rendition_path(source_path: Path, size: RenditionSize, image_format: str) -> Path:
+        """Renditions sit next to the original, shared by every record pointing at it."""
+        extension = MediaService.RENDITION_FORMATS[image_format]["extension"]
+        return source_path.parent / "renditions" / f"{source_path.stem}_{size.value}.{extension}"
+
+    async def get_media_rendition_path(
+        self,
+        media: EntryMedia,
+        size: RenditionSize,
+        image_format: str,
+    ) -> Path:
+        """Get a rendition of an image or video, generating it on first request.
+
+        Generation runs on the media engine ahead of batch work. Renditions are
+        cached on disk and removed together with the original.
+
+        Args:
+            media: EntryMedia record, already ownership-checked
+            size: Named rendition size
+            image_format: Key of RENDITION_FORMATS, see negotiate_rendition_format
+
+        Returns:
+            Path object to the rendition file
+
+        Raises:
+            MediaNotFoundError: If the media has no visual content or the original is missing
+            MediaEngineBusyError: If the rendition is not cached and the engine queue is full
+        """
+        if media.media_type not in (MediaType.IMAGE, MediaType.VIDEO):
+            raise MediaNotFoundError("Thumbnail not found")
+
+        source_path = await anyio.to_thread.run_sync(self.get_media_file_path, media)
+        rendition_path = self._get_rendition_path(source_path, size, image_format)
+        if not await aiofiles.os.path.exists(rendition_path):
+            await asyncio.wrap_future(get_media_engine().submit(
+                MediaService._generate_rendition,
+                str(source_path),
+                media.media_type.value,
+                str(rendition_path),
+                self.RENDITION_SIZES[size],
+                image_format,
+                priority=MediaPriority.UPLOAD,
+                block=False,
+            ))
+        return rendition_path
+
+    @classmethod
+    def _generate_rendition(
+        cls,
+        source_path: str,
+        media_type: str,
+        rendition_path: str,
+        max_size: int,
+        image_format: str,
+    ) -> str:
+        """
+        Generate a rendition synchronously (runs in a media engine worker).
+
+        Images are oriented by their EXIF data and never upscaled. Videos
+        are rendered from the frame used for their thumbnail. The file is
+        written under a temporary name and renamed, so concurrent requests
+        never serve a partial file.
+        """
+        if not Image:
+            raise Exception("PIL not available for rendition generation")
+
+        destination = Path(rendition_path)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = destination.with_name(f".{destination.name}.{uuid.uuid4().hex}.tmp")
+        frame_path = None
+        try:
+            if media_type == MediaType.VIDEO.value:
+                frame_path = temp_path.with_suffix(".frame.png")
+                cls._extract_video_frame(Path(source_path), frame_path)
+                source_path = str(frame_path)
+
+            spec = cls.RENDITION_FORMATS[image_format]
+            with Image.open(source_path) as img:
+                img = ImageOps.exif_transpose(img)
+                if spec["pil_format"] == "JPEG":
+                    if img.mode not in ("RGB", "L"):
+                        img = img.convert("RGB")
+                elif img.mode not in ("RGB", "RGBA", "L"):
+                    img = img.convert("RGBA")
+                img.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
+                img.save(temp_path, spec["pil_format"], quality=spec["quality"])
+            os.replace(temp_path, destination)
+        except Exception as e:
+            log_error(f"Failed to generate {image_format} rendition of {source_path}: {e}")
+            raise
+        finally:
+            temp_path.unlink(missing_ok=True)
+            if frame_path is not None:
+                frame_path.unlink(missing_ok=True)
+        return str(destination)
+
+    @classmethod
+    def _extract_video_frame(cls, video_path: Path, frame_path: Path) -> None:
+        """Extract the thumbnail frame of a video at full resolution using FFmpeg."""
+        cmd = [
+            "ffmpeg", "-i", str(video_path),
+            "-ss", cls.VIDEO_THUMBNAIL_SEEK_TIME,
+            "-vframes", "1",
+            "-f", "image2",
+            "-y",
+            str(frame_path)
+        ]
+        timeout = getattr(settings, 'ffmpeg_timeout', cls.FFMPEG_DEFAULT_TIMEOUT)
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+        except subprocess.TimeoutExpired:
+            raise Exception("FFmpeg timeout")
+        if result.returncode != 0:
+            raise Exception(f"FFmpeg failed with return code {result.returncode}")
+
     async def delete_media_by_id(self, media_id: uuid.UUID, user_id: uuid.UUID, session: Session) -> None:
         """Delete media by ID including database record and filesystem file.
 
@@ -970,14 +1345,16 @@ class MediaService:
         """
         from app.services import entry_service as entry_service_module
 
-        # Get media record first to get file path and thumbnail path
-        media = self.get_media_by_id(media_id, user_id, session)
-        file_path = media.file_path
+        # Get media record first to get the thumbnail path
+        media = await run_in_db_threadpool(self.get_media_by_id, media_id, user_id, session)
         thumbnail_path = media.thumbnail_path
 
         # Delete database record using entry service
         entry_service = entry_service_module.EntryService(session)
-        entry_service.delete_entry_media(media_id, user_id)
+        released_files = await run_in_db_threadpool(entry_service.delete_entry_media, media_id, user_id)
+        if not released_files:
+            # The stored file is still shared with other media
+            return
 
         # Delete thumbnail file if it exists
         if thumbnail_path:
@@ -989,81 +1366,44 @@ class MediaService:
                 log_error(f"Failed to delete thumbnail file: {e}")
 
         # Delete file from filesystem
-        try:
-            full_path = (self.media_root / file_path).resolve()
-            if full_path.exists() and str(full_path).startswith(str(self.media_root.resolve())):
-                await self.delete_media_file(str(full_path))
-        except Exception as e:
-            # Log error but don't fail since DB record is already deleted
-            log_error(f"Failed to delete media file: {e}")
+        for full_path in released_files:
+            try:
+                await self.delete_media_file(full_path)
+            except Exception as e:
+                # Log error but don't fail since DB record is already deleted
+                log_error(f"Failed to delete media file: {e}")
 
-    def get_media_file_for_serving(self, media_id: uuid.UUID, user_id: uuid.UUID, session: Session, range_header: Optional[str] = None) -> Dict[str, Any]:
-        """Get media file information for serving with optional range support.
+    def get_media_file_for_serving(self, media: EntryMedia) -> Dict[str, Any]:
+        """Get media file information for serving.
+
+        Range handling is left to the file response, which reads the Range and
+        If-Range headers itself.
 
         Args:
-            media_id: UUID of the media record
-            user_id: UUID of the user requesting the media
-            session: Database session
-            range_header: Optional Range header value
+            media: EntryMedia record, already ownership-checked
 
         Returns:
-            Dict with file_path, file_size, content_type, and optional range info
+            Dict with file_path, file_size, stat_result, content_type and filename
 
         Raises:
-            MediaNotFoundError: If media not found or user doesn't have access
+            MediaNotFoundError: If the file is missing on disk
         """
         import mimetypes
 
-        media = self.get_media_by_id(media_id, user_id, session)
         full_path = self.get_media_file_path(media)
 
-        file_size = full_path.stat().st_size
+        stat_result = full_path.stat()
         content_type, _ = mimetypes.guess_type(str(full_path))
         content_type = content_type or media.mime_type or "application/octet-stream"
 
-        result = {
+        return {
             "file_path": full_path,
-            "file_size": file_size,
+            "file_size": stat_result.st_size,
+            "stat_result": stat_result,
             "content_type": content_type,
             "filename": media.original_filename or full_path.name,
-            "range_info": None,
         }
 
-        # Parse range header if provided
-        if range_header:
-            try:
-                if not range_header.strip().startswith("bytes="):
-                    raise ValueError("Invalid range unit")
-
-                range_val = range_header.strip().split("=")[1]
-                start_str, end_str = range_val.split("-")
-
-                if not start_str:
-                    suffix_len = int(end_str)
-                    if suffix_len <= 0:
-                        raise ValueError("Invalid Range header")
-                    start = max(file_size - suffix_len, 0)
-                    end = file_size - 1
-                elif not end_str:
-                    start = int(start_str)
-                    end = file_size - 1
-                else:
-                    start = int(start_str)
-                    end = int(end_str)
-
-                if start >= file_size or end >= file_size or start > end:
-                    raise ValueError("Range not satisfiable")
-
-                result["range_info"] = {
-                    "start": start,
-                    "end": end,
-                    "length": end - start + 1,
-                }
-            except Exception:
-                raise ValueError("Invalid Range header")
-
-        return result
-
     async def process_entry_media(self, entry_id: uuid.UUID, user_id: uuid.UUID, session: Session) -> int:
         """Process all media files for an entry, generating thumbnails.
 
@@ -1083,10 +1423,10 @@ class MediaService:
         entry_service = entry_service_module.EntryService(session)
 
         # Verify entry belongs to user
-        entry = entry_service.get_entry_by_id(entry_id, user_id)
+        entry = await run_in_db_threadpool(entry_service.get_entry_by_id, entry_id, user_id)
 
         # Get entry media
-        media_list = entry_service.get_entry_media(entry_id, user_id)
+        media_list = await run_in_db_threadpool(entry_service.get_entry_media, entry_id, user_id)
 
         processed_count = 0
 
@@ -1097,17 +1437,14 @@ class MediaService:
                 try:
                     full_path = self.get_media_file_path(media)
 
-                    # Run thumbnail generation in thread pool since it involves file I/O and subprocess calls
-                    loop = asyncio.get_event_loop()
+                    # Resize in a media engine worker process, ahead of batch work;
+                    # the event loop cannot wait for queue room, so a full queue raises
                     thumbnail_path = None
-                    if media.media_type == MediaType.IMAGE:
-                        thumbnail_path = await loop.run_in_executor(
-                            None, self._generate_thumbnail, str(full_path), MediaType.IMAGE
-                        )
-                    elif media.media_type == MediaType.VIDEO:
-                        thumbnail_path = await loop.run_in_executor(
-                            None, self._generate_thumbnail, str(full_path), MediaType.VIDEO
-                        )
+                    if media.media_type in (MediaType.IMAGE, MediaType.VIDEO):
+                        thumbnail_path = await asyncio.wrap_future(get_media_engine().submit(
+                            MediaService._generate_thumbnail, str(full_path), media.media_type,
+                            priority=MediaPriority.UPLOAD, block=False,
+                        ))
 
                     if thumbnail_path:
                         media.thumbnail_path = self._relative_thumbnail_path(Path(thumbnail_path))
@@ -1130,5 +1467,5 @@ class MediaService:
                 processed_count += 1
 
         # Commit all changes
-        session.commit()
+        await run_in_db_threadpool(session.commit)
         return processed_count
@@ -1,7 +1,6 @@
 """
 Mood service for handling mood-related operations.
 """
-import threading
 import uuid
 from datetime import datetime, date, timedelta
 from typing import List, Optional, Dict, Any
@@ -10,13 +9,17 @@ from zoneinfo import ZoneInfo
 from sqlalchemy.exc import SQLAlchemyError
 from sqlmodel import Session, select, func
 
+from app.core.analytics_cache import get_analytics_cache
 from app.core.exceptions import MoodNotFoundError, EntryNotFoundError
 from app.core.logging_config import log_error
+from app.core.reference_cache import REFERENCE_MOODS, MoodRecord, get_reference_cache
 from app.core.time_utils import utc_now, local_date_for_user, ensure_utc, to_utc
 from app.models.entry import Entry
 from app.models.enums import MoodCategory
 from app.models.mood import Mood, MoodLog
 from app.schemas.mood import MoodLogCreate, MoodLogUpdate
+from app.services.analytics_service import AnalyticsService
+from app.services.entry_service import touch_entries
 
 DEFAULT_MOOD_PAGE_LIMIT = 50
 MAX_MOOD_PAGE_LIMIT = 100
@@ -25,56 +28,24 @@ MAX_MOOD_PAGE_LIMIT = 100
 class MoodService:
     """Service class for mood operations."""
 
-    _mood_cache: Dict[str, List[Mood]] = {}
-    _cache_lock = threading.RLock()
-
     def __init__(self, session: Session):
         self.session = session
 
     @staticmethod
-    def _cache_key(category: Optional[str] = None) -> str:
-        return category or "__all__"
-
-    @classmethod
-    def invalidate_mood_cache(cls) -> None:
-        """Clear the mood cache. Thread-safe."""
-        with cls._cache_lock:
-            cls._mood_cache.clear()
-
-    @classmethod
-    def _store_cache(cls, key: str, moods: List[Mood]) -> None:
-        """Store moods in cache. Thread-safe."""
-        with cls._cache_lock:
-            # Create copies to avoid session-related issues
-            cls._mood_cache[key] = [
-                Mood(
-                    id=mood.id,
-                    name=mood.name,
-                    icon=mood.icon,
-                    category=mood.category,
-                    created_at=mood.created_at,
-                    updated_at=mood.updated_at
-                ) for mood in moods
-            ]
-
-    @classmethod
-    def _get_cached_moods(cls, key: str) -> Optional[List[Mood]]:
-        """Get moods from cache. Thread-safe."""
-        with cls._cache_lock:
-            cached = cls._mood_cache.get(key)
-            if cached is None:
-                return None
-            # Return copies to avoid session-related issues
-            return [
-                Mood(
-                    id=mood.id,
-                    name=mood.name,
-                    icon=mood.icon,
-                    category=mood.category,
-                    created_at=mood.created_at,
-                    updated_at=mood.updated_at
-                ) for mood in cached
-            ]
+    def invalidate_mood_cache() -> None:
+        """Invalidate cached mood listings in every worker."""
+        get_reference_cache().invalidate(REFERENCE_MOODS)
+
+    def _get_mood_records(self, variant: str, statement) -> List[MoodRecord]:
+        """Get a mood listing from the reference cache, reading it on a miss."""
+        cache = get_reference_cache()
+        version, cached = cache.get_records(REFERENCE_MOODS, variant, MoodRecord)
+        if cached is not None:
+            return list(cached)
+
+        moods = [MoodRecord.from_model(mood) for mood in self.session.exec(statement)]
+        cache.set_records(REFERENCE_MOODS, variant, version, moods)
+        return moods
 
     @staticmethod
     def _normalize_limit(limit: int) -> int:
@@ -156,35 +127,21 @@ class MoodService:
         return dt.astimezone(ZoneInfo("UTC"))
 
     # Mood Management (System moods)
-    def get_all_moods(self) -> List[Mood]:
+    def get_all_moods(self) -> List[MoodRecord]:
         """Get all system moods."""
-        cache_key = self._cache_key()
-        cached = self._get_cached_moods(cache_key)
-        if cached is not None:
-            return cached
-
         statement = select(Mood).order_by(Mood.category, Mood.name)
-        moods = list(self.session.exec(statement))
-        self._store_cache(cache_key, moods)
-        return moods
+        return self._get_mood_records("all", statement)
 
     def get_mood_by_id(self, mood_id: uuid.UUID) -> Optional[Mood]:
         """Get a mood by ID."""
         statement = select(Mood).where(Mood.id == mood_id)
         return self.session.exec(statement).first()
 
-    def get_moods_by_category(self, category: str) -> List[Mood]:
+    def get_moods_by_category(self, category: str) -> List[MoodRecord]:
         """Get moods by category."""
         normalized = self._normalize_category(category)
-        cache_key = self._cache_key(normalized)
-        cached = self._get_cached_moods(cache_key)
-        if cached is not None:
-            return cached
-
         statement = select(Mood).where(Mood.category == normalized).order_by(Mood.name)
-        moods = list(self.session.exec(statement))
-        self._store_cache(cache_key, moods)
-        return moods
+        return self._get_mood_records(f"category-{normalized}", statement)
 
     def find_mood_by_name(self, mood_name: str) -> Optional[Mood]:
         """Find a mood by name with symbolic lookup support."""
@@ -273,7 +230,9 @@ class MoodService:
         )
 
         self.session.add(mood_log)
+        AnalyticsService(self.session).refresh_daily_rollups(user_id, [logged_date])
         self._commit()
+        get_analytics_cache().invalidate(str(user_id))
         self.session.refresh(mood_log)
         return mood_log
 
@@ -318,6 +277,7 @@ class MoodService:
         mood_log = self.get_mood_log_by_id(mood_log_id, user_id)
         if not mood_log:
             raise MoodNotFoundError("Mood log not found")
+        previous_logged_date = mood_log.logged_date
 
         if mood_log_data.mood_id is not None:
             # Verify the new mood exists
@@ -344,7 +304,11 @@ class MoodService:
 
         mood_log.updated_at = utc_now()
         self.session.add(mood_log)
+        AnalyticsService(self.session).refresh_daily_rollups(
+            user_id, [previous_logged_date, mood_log.logged_date]
+        )
         self._commit()
+        get_analytics_cache().invalidate(str(user_id))
         self.session.refresh(mood_log)
         return mood_log
 
@@ -355,7 +319,10 @@ class MoodService:
             raise MoodNotFoundError("Mood log not found")
 
         self.session.delete(mood_log)
+        touch_entries(self.session, [mood_log.entry_id])
+        AnalyticsService(self.session).refresh_daily_rollups(user_id, [mood_log.logged_date])
         self._commit()
+        get_analytics_cache().invalidate(str(user_id))
         return True
 
     def get_mood_statistics(
@@ -579,7 +546,11 @@ class MoodService:
             self.session.add(mood_log)
             updated_logs.append(mood_log)
 
+        AnalyticsService(self.session).refresh_daily_rollups(
+            user_id, [mood_log.logged_date for mood_log in updated_logs]
+        )
         self._commit()
+        get_analytics_cache().invalidate(str(user_id))
         return updated_logs
 
     def bulk_delete_mood_logs(self, user_id: uuid.UUID, mood_log_ids: List[uuid.UUID]) -> int:
@@ -601,6 +572,11 @@ class MoodService:
         # Delete all logs
         for mood_log in existing_logs:
             self.session.delete(mood_log)
+        touch_entries(self.session, [mood_log.entry_id for mood_log in existing_logs])
 
+        AnalyticsService(self.session).refresh_daily_rollups(
+            user_id, [mood_log.logged_date for mood_log in existing_logs]
+        )
         self._commit()
+        get_analytics_cache().invalidate(str(user_id))
         return len(existing_logs)
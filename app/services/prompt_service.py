@@ -2,15 +2,16 @@
 Prompt service for handling prompt-related operations.
 """
 import random
-import threading
 import uuid
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Union
 
+from sqlalchemy import update
 from sqlalchemy.exc import SQLAlchemyError
 from sqlmodel import Session, select, func
 
 from app.core.exceptions import PromptNotFoundError
 from app.core.logging_config import log_error
+from app.core.reference_cache import REFERENCE_PROMPTS, PromptRecord, get_reference_cache
 from app.core.time_utils import utc_now
 from app.models.entry import Entry
 from app.models.enums import PromptCategory
@@ -25,9 +26,6 @@ MAX_PROMPT_PAGE_LIMIT = 100
 class PromptService:
     """Service class for prompt operations."""
 
-    _system_prompt_cache: Dict[str, List[Prompt]] = {}
-    _cache_lock = threading.RLock()
-
     def __init__(self, session: Session):
         self.session = session
 
@@ -46,58 +44,14 @@ class PromptService:
         except ValueError as exc:
             raise PromptNotFoundError(f"Invalid prompt category '{category}'") from exc
 
-    @classmethod
-    def _cache_key(cls, *, category: Optional[str], difficulty_level: Optional[int], limit: int) -> str:
-        return f"{category or 'any'}::{difficulty_level or 'any'}::{limit}"
-
-    @classmethod
-    def invalidate_cache(cls) -> None:
-        """Clear the prompt cache. Thread-safe."""
-        with cls._cache_lock:
-            cls._system_prompt_cache.clear()
-
-    @classmethod
-    def _store_cache(cls, key: str, prompts: List[Prompt]) -> None:
-        """Store prompts in cache. Thread-safe."""
-        with cls._cache_lock:
-            # Create copies to avoid session-related issues
-            cls._system_prompt_cache[key] = [
-                Prompt(
-                    id=prompt.id,
-                    text=prompt.text,
-                    category=prompt.category,
-                    difficulty_level=prompt.difficulty_level,
-                    estimated_time_minutes=prompt.estimated_time_minutes,
-                    is_active=prompt.is_active,
-                    usage_count=prompt.usage_count,
-                    user_id=prompt.user_id,
-                    created_at=prompt.created_at,
-                    updated_at=prompt.updated_at
-                ) for prompt in prompts
-            ]
-
-    @classmethod
-    def _get_cached_prompts(cls, key: str) -> Optional[List[Prompt]]:
-        """Get prompts from cache. Thread-safe."""
-        with cls._cache_lock:
-            cached = cls._system_prompt_cache.get(key)
-            if cached is None:
-                return None
-            # Return copies to avoid session-related issues
-            return [
-                Prompt(
-                    id=prompt.id,
-                    text=prompt.text,
-                    category=prompt.category,
-                    difficulty_level=prompt.difficulty_level,
-                    estimated_time_minutes=prompt.estimated_time_minutes,
-                    is_active=prompt.is_active,
-                    usage_count=prompt.usage_count,
-                    user_id=prompt.user_id,
-                    created_at=prompt.created_at,
-                    updated_at=prompt.updated_at
-                ) for prompt in cached
-            ]
+    @staticmethod
+    def _cache_variant(*, category: Optional[str], difficulty_level: Optional[int], limit: int) -> str:
+        return f"{category or 'any'}-{difficulty_level or 'any'}-{limit}"
+
+    @staticmethod
+    def invalidate_cache() -> None:
+        """Invalidate cached system prompt listings in every worker."""
+        get_reference_cache().invalidate(REFERENCE_PROMPTS)
 
     def _commit(self) -> None:
         try:
@@ -248,8 +202,13 @@ class PromptService:
         is_active: bool = True,
         limit: int = 50,
         offset: int = 0
-    ) -> List[Prompt]:
-        """Get prompts with optional filters."""
+    ) -> List[Union[Prompt, PromptRecord]]:
+        """
+        Get prompts with optional filters.
+
+        The first page of active system prompts is shared reference data and
+        is returned as cached PromptRecord copies rather than Prompt objects.
+        """
         limit = self._normalize_limit(limit)
         normalized_category = self._normalize_category(category) if category else None
 
@@ -269,24 +228,24 @@ class PromptService:
         if difficulty_level is not None:
             statement = statement.where(Prompt.difficulty_level == difficulty_level)
 
-        use_cache = user_id is None and is_active and offset == 0
-        cache_key = None
-        if use_cache:
-            cache_key = self._cache_key(
-                category=normalized_category,
-                difficulty_level=difficulty_level,
-                limit=limit
-            )
-            cached = self._get_cached_prompts(cache_key)
-            if cached is not None:
-                return cached
-
         statement = statement.order_by(Prompt.created_at.desc()).offset(offset).limit(limit)
-        prompts = list(self.session.exec(statement))
 
-        if use_cache and cache_key is not None:
-            self._store_cache(cache_key, prompts)
+        if not (user_id is None and is_active and offset == 0):
+            return list(self.session.exec(statement))
 
+        # First page of active system prompts: shared reference data
+        cache = get_reference_cache()
+        variant = self._cache_variant(
+            category=normalized_category,
+            difficulty_level=difficulty_level,
+            limit=limit
+        )
+        version, cached = cache.get_records(REFERENCE_PROMPTS, variant, PromptRecord)
+        if cached is not None:
+            return list(cached)
+
+        prompts = [PromptRecord.from_model(prompt) for prompt in self.session.exec(statement)]
+        cache.set_records(REFERENCE_PROMPTS, variant, version, prompts)
         return prompts
 
     def get_system_prompts(
@@ -294,7 +253,7 @@ class PromptService:
         category: Optional[str] = None,
         difficulty_level: Optional[int] = None,
         limit: int = 50
-    ) -> List[Prompt]:
+    ) -> List[PromptRecord]:
         """Get system prompts (user_id is NULL)."""
         return self.get_all_prompts(
             user_id=None,
@@ -389,12 +348,16 @@ class PromptService:
         if not prompt:
             raise PromptNotFoundError("Prompt not found")
 
-        prompt.usage_count += 1
-        prompt.updated_at = utc_now()
-        self.session.add(prompt)
+        # Increment in SQL so concurrent uses are not lost. Cached system prompt
+        # listings are left alone: their usage_count may lag by up to
+        # REFERENCE_CACHE_TTL rather than every use invalidating them.
+        self.session.execute(
+            update(Prompt)
+            .where(Prompt.id == prompt_id)
+            .values(usage_count=Prompt.usage_count + 1, updated_at=utc_now())
+        )
         self._commit()
         self.session.refresh(prompt)
-        self.invalidate_cache()
         return prompt
 
     def get_prompt_statistics(self, user_id: Optional[uuid.UUID] = None) -> Dict[str, Any]:
@@ -455,7 +418,7 @@ class PromptService:
             'difficulty_distribution': difficulty_distribution
         }
 
-    def get_prompts_by_category(self, category: str, user_id: Optional[uuid.UUID] = None) -> List[Prompt]:
+    def get_prompts_by_category(self, category: str, user_id: Optional[uuid.UUID] = None) -> List[Union[Prompt, PromptRecord]]:
         """Get prompts by category."""
         return self.get_all_prompts(
             user_id=user_id,
@@ -463,7 +426,7 @@ class PromptService:
             limit=100
         )
 
-    def get_prompts_by_difficulty(self, difficulty_level: int, user_id: Optional[uuid.UUID] = None) -> List[Prompt]:
+    def get_prompts_by_difficulty(self, difficulty_level: int, user_id: Optional[uuid.UUID] = None) -> List[Union[Prompt, PromptRecord]]:
         """Get prompts by difficulty level."""
         return self.get_all_prompts(
             user_id=user_id,
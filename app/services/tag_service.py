@@ -9,14 +9,18 @@ from datetime import datetime, timedelta, date
 from sqlalchemy.exc import SQLAlchemyError
 from sqlmodel import Session, select, func
 
+from app.core.analytics_cache import get_analytics_cache
 from app.core.config import settings
 from app.core.exceptions import TagNotFoundError
 from app.core.logging_config import log_error, log_info
+from app.core.pagination import EntryCursor, apply_entry_cursor
 from app.core.time_utils import utc_now
 from app.models.entry import Entry
 from app.models.tag import Tag, EntryTagLink
 from app.schemas.tag import TagCreate, TagUpdate, TagStatisticsResponse, TagAnalyticsResponse, TagSummary, TagDetailAnalyticsResponse, PeakMonth
 from app.schemas.tag_plus import TagAnalyticsRawData, TagRawData, MonthlyUsageData, TagDetailAnalyticsRawData
+from app.services.analytics_service import AnalyticsService
+from app.services.entry_service import touch_entries
 
 DEFAULT_TAG_PAGE_LIMIT = 50
 MAX_TAG_PAGE_LIMIT = 100
@@ -115,12 +119,19 @@ class TagService:
             if existing_tag:
                 raise ValueError("Tag with this name already exists")
 
-        if tag_data.name:
+        if tag_data.name and tag_data.name.lower().strip() != tag.name:
             tag.name = tag_data.name.lower().strip()
+            # Entries export their tags by name
+            touch_entries(
+                self.session,
+                self.session.exec(select(EntryTagLink.entry_id).where(EntryTagLink.tag_id == tag_id)).all(),
+            )
 
         tag.updated_at = utc_now()
         self.session.add(tag)
         self._commit()
+        # Dashboards list top tags by name
+        get_analytics_cache().invalidate(str(user_id))
         self.session.refresh(tag)
         return tag
 
@@ -135,6 +146,7 @@ class TagService:
         tag_link_records = self.session.exec(tag_link_statement).all()
         for tag_link in tag_link_records:
             self.session.delete(tag_link)
+        touch_entries(self.session, [tag_link.entry_id for tag_link in tag_link_records])
 
         # Hard delete the tag
         self.session.delete(tag)
@@ -145,6 +157,7 @@ class TagService:
             self.session.rollback()
             log_error(exc)
             raise
+        get_analytics_cache().invalidate(str(user_id))
 
         log_info(f"Tag hard-deleted for user {user_id}: {tag_id}")
         return True
@@ -164,7 +177,7 @@ class TagService:
     def add_tag_to_entry(self, entry_id: uuid.UUID, tag_id: uuid.UUID, user_id: uuid.UUID) -> EntryTagLink:
         """Add a tag to an entry."""
         # Verify entry belongs to user
-        self._get_entry_for_user(entry_id, user_id)
+        entry = self._get_entry_for_user(entry_id, user_id)
 
         # Verify tag belongs to user
         tag = self.get_tag_by_id(tag_id, user_id)
@@ -190,19 +203,23 @@ class TagService:
         )
 
         self.session.add(link)
+        entry.updated_at = utc_now()
+        self.session.add(entry)
 
         # Update tag usage count
         tag.usage_count += 1
         self.session.add(tag)
+        AnalyticsService(self.session).refresh_daily_rollups(user_id, [entry.entry_date])
 
         self._commit()
+        get_analytics_cache().invalidate(str(user_id))
         self.session.refresh(link)
         return link
 
     def remove_tag_from_entry(self, entry_id: uuid.UUID, tag_id: uuid.UUID, user_id: uuid.UUID) -> bool:
         """Remove a tag from an entry (soft delete)."""
         # Verify entry belongs to user
-        self._get_entry_for_user(entry_id, user_id)
+        entry = self._get_entry_for_user(entry_id, user_id)
 
         # Verify tag belongs to user
         tag = self.get_tag_by_id(tag_id, user_id)
@@ -220,12 +237,16 @@ class TagService:
         if link:
             # Hard delete the link
             self.session.delete(link)
+            entry.updated_at = utc_now()
+            self.session.add(entry)
 
             # Update tag usage count
             tag.usage_count = max(0, tag.usage_count - 1)
             self.session.add(tag)
+            AnalyticsService(self.session).refresh_daily_rollups(user_id, [entry.entry_date])
 
             self._commit()
+            get_analytics_cache().invalidate(str(user_id))
             return True
         return False
 
@@ -243,9 +264,14 @@ class TagService:
         tag_id: uuid.UUID,
         user_id: uuid.UUID,
         limit: int = DEFAULT_TAG_PAGE_LIMIT,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[EntryCursor] = None
     ) -> List[Entry]:
-        """Get entries that have a specific tag."""
+        """Get entries that have a specific tag.
+
+        When a cursor is given, offset is ignored and the page starts right
+        after the cursor position.
+        """
         # Verify tag belongs to user
         tag = self.get_tag_by_id(tag_id, user_id)
         if not tag:
@@ -254,8 +280,12 @@ class TagService:
         statement = select(Entry).join(EntryTagLink).where(
             EntryTagLink.tag_id == tag_id,
             Entry.user_id == user_id,
-        ).order_by(Entry.entry_datetime_utc.desc()).offset(offset).limit(limit)
-        return list(self.session.exec(statement))
+        )
+        statement = apply_entry_cursor(statement, cursor)
+        statement = statement.order_by(Entry.entry_datetime_utc.desc(), Entry.id.desc())
+        if cursor is None:
+            statement = statement.offset(offset)
+        return list(self.session.exec(statement.limit(limit)))
 
     def get_tag_statistics(self, user_id: uuid.UUID, include_usage_over_time: bool = False) -> TagStatisticsResponse:
         """Get tag usage statistics for a user.
@@ -593,6 +623,12 @@ class TagService:
         source_links = self.session.exec(
             select(EntryTagLink).where(EntryTagLink.tag_id == source_id)
         ).all()
+        affected_dates = self.session.exec(
+            select(Entry.entry_date)
+            .join(EntryTagLink, EntryTagLink.entry_id == Entry.id)
+            .where(EntryTagLink.tag_id == source_id)
+            .distinct()
+        ).all()
 
         for link in source_links:
             # Check if target already has this entry tagged
@@ -615,11 +651,14 @@ class TagService:
                 # Update usage counts
                 source_tag.usage_count = max(0, source_tag.usage_count - 1)
                 target_tag.usage_count += 1
+        touch_entries(self.session, [link.entry_id for link in source_links])
 
         # Delete source tag
         self.session.delete(source_tag)
         self.session.add(target_tag)
+        AnalyticsService(self.session).refresh_daily_rollups(user_id, affected_dates)
         self._commit()
+        get_analytics_cache().invalidate(str(user_id))
         self.session.refresh(target_tag)
 
         log_info(f"Tag merged: {source_id} -> {target_id} for user {user_id}")
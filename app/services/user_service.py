@@ -5,7 +5,7 @@ import secrets
 import time
 import uuid
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Dict, Iterable, Optional
 
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.orm import selectinload
@@ -20,6 +20,8 @@ from app.core.exceptions import (
     UserSettingsNotFoundError,
 )
 from app.core.logging_config import log_error, log_warning, log_info
+from app.core.principal_cache import get_principal_cache
+from app.core.user_settings_cache import get_user_settings_cache
 from app.core.security import get_password_hash, verify_password, create_access_token, create_refresh_token
 from app.models.user import User, UserSettings
 from app.models.external_identity import ExternalIdentity
@@ -29,6 +31,9 @@ from app.schemas.user import UserCreate, UserUpdate, UserSettingsCreate, UserSet
 # Hash evaluated once to keep timing consistent for missing users
 _DUMMY_PASSWORD_HASH = get_password_hash("journiv-dummy-password")
 
+# Session.info key of the settings read through the session (i.e. the request)
+_SETTINGS_SNAPSHOTS_KEY = "user_settings_snapshots"
+
 
 def _schema_dump(schema_obj, *, exclude_unset: bool = False):
     """Support both Pydantic v1 and v2 dump APIs."""
@@ -245,6 +250,7 @@ class UserService:
             log_error(exc, user_email=user.email)
             raise
 
+        get_principal_cache().invalidate(str(user.id))
         return user
 
     def delete_user(self, user_id: str, bypass_admin_check: bool = False) -> bool:
@@ -283,6 +289,7 @@ class UserService:
             log_error(exc, user_email=user_email)
             raise
 
+        get_principal_cache().invalidate(str(user_id))
         log_info(f"User and all related data deleted via cascade: {user_email}")
         return True
 
@@ -329,6 +336,7 @@ class UserService:
         else:
             self.session.flush()
 
+        self._invalidate_settings_snapshot(user_id)
         return settings
 
     def get_user_settings(self, user_id: str) -> UserSettings:
@@ -361,8 +369,72 @@ class UserService:
             log_error(exc)
             raise
 
+        self._invalidate_settings_snapshot(settings.user_id)
         return settings
 
+    def get_user_settings_snapshots(self, user_ids: Iterable[uuid.UUID]) -> Dict[uuid.UUID, Dict[str, Any]]:
+        """
+        Get read-only settings of several users.
+
+        Settings are looked up in this session (so repeated reads within a
+        request are free), then in the settings cache, and the rest are read
+        in one query. Use get_user_settings to modify settings.
+
+        Args:
+            user_ids: User UUIDs
+
+        Returns:
+            Settings dict by user ID; empty for users without settings
+        """
+        request_snapshots = self.session.info.setdefault(_SETTINGS_SNAPSHOTS_KEY, {})
+        cache = get_user_settings_cache()
+        snapshots: Dict[uuid.UUID, Dict[str, Any]] = {}
+        missing = []
+        for user_id in dict.fromkeys(
+            user_id if isinstance(user_id, uuid.UUID) else uuid.UUID(str(user_id)) for user_id in user_ids
+        ):
+            snapshot = request_snapshots.get(user_id)
+            if snapshot is None:
+                snapshot = cache.get_settings(str(user_id))
+            if snapshot is None:
+                missing.append(user_id)
+            else:
+                snapshots[user_id] = request_snapshots[user_id] = snapshot
+
+        if missing:
+            loaded = {
+                settings.user_id: settings.model_dump(mode="json", exclude={"id", "user_id"})
+                for settings in self.session.exec(
+                    select(UserSettings).where(UserSettings.user_id.in_(missing))
+                ).all()
+            }
+            for user_id in missing:
+                snapshot = loaded.get(user_id, {})
+                snapshots[user_id] = request_snapshots[user_id] = snapshot
+                cache.set_settings(str(user_id), snapshot)
+
+        return snapshots
+
+    def _invalidate_settings_snapshot(self, user_id: uuid.UUID) -> None:
+        """Drop a user's settings from this session and the settings cache."""
+        self.session.info.get(_SETTINGS_SNAPSHOTS_KEY, {}).pop(user_id, None)
+        get_user_settings_cache().invalidate(str(user_id))
+
+    def get_user_timezones(self, user_ids: Iterable[uuid.UUID]) -> Dict[uuid.UUID, str]:
+        """
+        Get the timezones of several users (e.g. for list endpoints).
+
+        Args:
+            user_ids: User UUIDs
+
+        Returns:
+            IANA timezone string by user ID (defaults to "UTC" if not set)
+        """
+        return {
+            user_id: snapshot.get("time_zone") or "UTC"
+            for user_id, snapshot in self.get_user_settings_snapshots(user_ids).items()
+        }
+
     def get_user_timezone(self, user_id: uuid.UUID) -> str:
         """
         Get user's timezone from settings.
@@ -374,13 +446,9 @@ class UserService:
             str: IANA timezone string (defaults to "UTC" if not set)
         """
         try:
-            statement = select(UserSettings).where(UserSettings.user_id == user_id)
-            settings = self.session.exec(statement).first()
-            if settings and settings.time_zone:
-                return settings.time_zone
+            return next(iter(self.get_user_timezones([user_id]).values()))
         except Exception:
-            pass
-        return "UTC"
+            return "UTC"
 
     def get_or_create_user_from_oidc(
         self,
@@ -676,4 +744,6 @@ class UserService:
             log_error(exc, user_email=user.email)
             raise
 
+        # Role and active status are checked against the cached user
+        get_principal_cache().invalidate(str(user.id))
         return user
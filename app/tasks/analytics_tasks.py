@@ -0,0 +1,64 @@
+"""
+Celery task for rebuilding the daily analytics rollups.
+"""
+import uuid
+from typing import Optional
+
+from sqlalchemy.exc import OperationalError
+from sqlmodel import select
+
+from app.core.celery_app import celery_app
+from app.core.database import get_session_context
+from app.core.logging_config import log_info, log_error
+from app.models.user import User
+from app.services.analytics_service import AnalyticsService
+
+
+@celery_app.task(
+    bind=True,
+    autoretry_for=(OperationalError,),
+    retry_kwargs={"max_retries": 5, "countdown": 60},
+    retry_backoff=True,
+)
+def rebuild_analytics_rollups(self, user_id: Optional[str] = None):
+    """
+    Rebuild the per-day analytics rollups from the source tables.
+
+    Rebuilds a single user when ``user_id`` is given, otherwise every user.
+    The rollups are maintained on write, so this is only needed to repair
+    drift (e.g. after manual database edits or a failed migration).
+    """
+    log_info(
+        "Analytics rollup rebuild started",
+        task_id=self.request.id,
+        user_id=user_id,
+        attempt=self.request.retries + 1,
+    )
+
+    rebuilt = 0
+    try:
+        with get_session_context() as db:
+            if user_id:
+                user_ids = [uuid.UUID(str(user_id))]
+            else:
+                user_ids = list(db.exec(select(User.id)).all())
+
+            service = AnalyticsService(db)
+            for uid in user_ids:
+                service.rebuild_daily_rollups(uid)
+                rebuilt += 1
+    except OperationalError as exc:
+        log_error(
+            exc,
+            task_id=self.request.id,
+            retries=self.request.retries,
+            context="rebuild_analytics_rollups",
+        )
+        raise
+
+    log_info(
+        "Analytics rollup rebuild completed",
+        task_id=self.request.id,
+        users_rebuilt=rebuilt,
+    )
+    return {"status": "success", "users_rebuilt": rebuilt}
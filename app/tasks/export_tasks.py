@@ -6,7 +6,7 @@ from uuid import UUID
 from sqlmodel import Session
 
 from app.core.celery_app import celery_app
-from app.core.database import engine
+from app.core.database import engine, get_session_context
 from app.core.logging_config import log_info, log_warning, log_error
 from app.models.export_job import ExportJob
 from app.services.export_service import ExportService
@@ -44,12 +44,18 @@ def process_export_job(job_id: str):
             job.mark_running()
             db.commit()
 
-            # Create export service
-            export_service = ExportService(db)
+            # Create export service on its own session: the entry cursor it
+            # streams from must not be interrupted by progress commits below.
+            # It stays on the primary even with read replicas: the manifest's
+            # "until" is where the next incremental export starts, so a write
+            # not yet replicated would be missing from the whole chain.
+            export_db = get_session_context()
+            export_service = ExportService(export_db)
             total_entries = export_service.count_entries(
                 user_id=job.user_id,
                 export_type=job.export_type,
                 journal_ids=job.journal_ids,
+                since=job.since,
             )
             job.total_items = total_entries
             job.processed_items = 0
@@ -70,25 +76,17 @@ def process_export_job(job_id: str):
                 percentage_threshold=5,
             )
 
-            # Build export data
-            export_data = export_service.build_export_data(
+            # Stream export data and media into the ZIP archive
+            zip_path, file_size, stats = export_service.create_export_zip(
                 user_id=job.user_id,
                 export_type=job.export_type,
                 journal_ids=job.journal_ids,
+                include_media=job.include_media,
                 total_entries=total_entries,
                 progress_callback=handle_progress,
-            )
-
-            # Update progress: Creating ZIP (ensure minimum, but don't regress)
-            current_progress = job.progress or ProgressStages.EXPORT_CREATING_ZIP
-            job.set_progress(max(current_progress, ProgressStages.EXPORT_CREATING_ZIP))
-            db.commit()
-
-            # Create ZIP archive
-            zip_path, file_size, stats = export_service.create_export_zip(
-                export_data=export_data,
-                user_id=job.user_id,
-                include_media=job.include_media,
+                since=job.since,
+                base_export_id=job.base_export_id,
+                export_id=job.id,
             )
 
             # Update progress: Finalizing (ensure minimum, but don't regress)
@@ -143,6 +141,7 @@ def process_export_job(job_id: str):
             }
         finally:
             if "export_service" in locals():
+                export_db.close()
                 try:
                     export_service.cleanup_old_exports()
                 except Exception as cleanup_error:
@@ -2,26 +2,65 @@
 Celery tasks for import operations.
 """
 from pathlib import Path
+from typing import Any, Dict, Optional
 from uuid import UUID
 
+from celery.exceptions import SoftTimeLimitExceeded
+from sqlalchemy import delete, insert, select
 from sqlmodel import Session
 
 from app.core.celery_app import celery_app
 from app.core.database import engine
 from app.core.logging_config import log_info, log_warning, log_error
-from app.models.import_job import ImportJob
+from app.models.import_job import ImportIdMapping, ImportJob
 from app.models.enums import JobStatus, ImportSourceType
 from app.services.import_service import ImportService
-from app.utils.import_export.constants import ProgressStages
-from app.utils.import_export import validate_import_data
+from app.tasks.media_tasks import queue_thumbnail_generation
+from app.utils.import_export.constants import ImportConfig, ProgressStages
+from app.utils.import_export import validate_journiv_export_file
 from app.utils.import_export.progress_utils import create_throttled_progress_callback
 
 
+def _save_checkpoint(db: Session, job: ImportJob, checkpoint: Dict[str, Any]) -> None:
+    """Save an import checkpoint on its job, appending its new ID mappings as rows."""
+    new_mappings = checkpoint.pop("id_mappings", {})
+    rows = [
+        {"import_job_id": job.id, "entity_type": entity_type, "external_id": external_id, "new_id": UUID(new_id)}
+        for entity_type, mappings in new_mappings.items()
+        for external_id, new_id in mappings.items()
+    ]
+    if rows:
+        db.execute(insert(ImportIdMapping), rows)
+    job.save_checkpoint(checkpoint)
+
+
+def _load_checkpoint(db: Session, job: ImportJob) -> Optional[Dict[str, Any]]:
+    """Return the job's checkpoint with the ID mappings of all its checkpoints."""
+    if job.checkpoint is None:
+        return None
+    id_mappings: Dict[str, Dict[str, str]] = {}
+    for entity_type, external_id, new_id in db.execute(
+        select(ImportIdMapping.entity_type, ImportIdMapping.external_id, ImportIdMapping.new_id)
+        .where(ImportIdMapping.import_job_id == job.id)
+    ):
+        id_mappings.setdefault(entity_type, {})[external_id] = str(new_id)
+    return {**job.checkpoint, "id_mappings": id_mappings}
+
+
+def _delete_id_mappings(db: Session, job: ImportJob) -> None:
+    """Drop a finished job's saved ID mappings; its result holds them."""
+    db.execute(delete(ImportIdMapping).where(ImportIdMapping.import_job_id == job.id))
+
+
 @celery_app.task(name="app.tasks.import.process_import_job", bind=True)
 def process_import_job(self, job_id: str):
     """
     Process an import job asynchronously.
 
+    The import saves a checkpoint on the job with every commit. A run that is
+    interrupted (worker lost, or the soft time limit re-queuing the task)
+    continues from that checkpoint instead of starting over.
+
     Args:
         job_id: Import job ID (UUID string)
 
@@ -41,7 +80,14 @@ def process_import_job(self, job_id: str):
                     "error": "Job not found"
                 }
 
-            log_info(f"Processing import job {job_id}", job_id=job_id, user_id=str(job.user_id), source_type=job.source_type.value)
+            if job.status in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED):
+                # Redelivered after the job already finished
+                log_warning(f"Import job {job_id} already {job.status.value}", job_id=job_id)
+                return {
+                    "status": job.status.value,
+                }
+
+            log_info(f"Processing import job {job_id}", job_id=job_id, user_id=str(job.user_id), source_type=job.source_type.value, resuming=job.checkpoint is not None)
 
             # Mark as running
             job.mark_running()
@@ -56,12 +102,17 @@ def process_import_job(self, job_id: str):
 
             # Extract import data
             file_path = Path(job.file_path)
-            data, media_dir = import_service.extract_import_data(file_path)
-            validation = validate_import_data(data, job.source_type.value)
+            data_file, media_archive = import_service.extract_import_data(file_path)
+            if job.source_type != ImportSourceType.JOURNIV:
+                raise NotImplementedError(
+                    f"Import from {job.source_type} not yet implemented"
+                )
+
+            # Validates journals and entries one at a time and counts entries
+            validation, header, total_entries = validate_journiv_export_file(data_file)
             if not validation.valid:
                 raise ValueError(f"Invalid import file: {validation.errors}")
 
-            total_entries = import_service.count_entries_in_data(data)
             job.total_items = total_entries
             job.processed_items = 0
 
@@ -70,30 +121,28 @@ def process_import_job(self, job_id: str):
             job.set_progress(max(current_progress, ProgressStages.IMPORT_PROCESSING))
             db.commit()
 
-            # Create throttled progress callback for processing stage
+            # Create progress callback for processing stage
             # Progress range: 30% (PROCESSING) to 90% (FINALIZING)
+            # Progress is saved by the import's checkpoint commits; committing
+            # in between would commit journals partway past their checkpoint
             handle_progress = create_throttled_progress_callback(
                 job=job,
-                db=db,
+                db=None,
                 start_progress=ProgressStages.IMPORT_PROCESSING,
                 end_progress=ProgressStages.IMPORT_FINALIZING,
-                commit_interval=10,
-                percentage_threshold=5,
             )
 
-            # Import based on source type
-            if job.source_type == ImportSourceType.JOURNIV:
-                summary = import_service.import_journiv_data(
-                    user_id=job.user_id,
-                    data=data,
-                    media_dir=media_dir,
-                    total_entries=total_entries,
-                    progress_callback=handle_progress,
-                )
-            else:
-                raise NotImplementedError(
-                    f"Import from {job.source_type} not yet implemented"
-                )
+            summary = import_service.import_journiv_data(
+                user_id=job.user_id,
+                data_file=data_file,
+                media_archive=media_archive,
+                header=header,
+                total_entries=total_entries,
+                progress_callback=handle_progress,
+                checkpoint=_load_checkpoint(db, job),
+                checkpoint_callback=lambda checkpoint: _save_checkpoint(db, job, checkpoint),
+                thumbnail_callback=queue_thumbnail_generation,
+            )
 
             # Update progress: Finalizing (ensure minimum, but don't regress)
             current_progress = job.progress or ProgressStages.IMPORT_FINALIZING
@@ -101,12 +150,13 @@ def process_import_job(self, job_id: str):
             db.commit()
 
             # Build result data
-            result_data = summary.model_dump()
+            result_data = summary.model_dump(mode="json")
 
             # Mark as completed
             job.total_items = job.total_items or summary.entries_created
             job.processed_items = job.total_items
             job.mark_completed(result_data=result_data)
+            _delete_id_mappings(db, job)
             db.commit()
 
             # Clean up temp files
@@ -128,6 +178,12 @@ def process_import_job(self, job_id: str):
             }
 
         except Exception as e:
+            if isinstance(e, SoftTimeLimitExceeded) and self.request.retries < ImportConfig.MAX_RESUME_ATTEMPTS:
+                # Committed journals are kept; the next run starts from the checkpoint
+                db.rollback()
+                log_warning(f"Import job {job_id} reached the task time limit, re-queuing it", job_id=job_id)
+                raise self.retry(exc=e, countdown=0, max_retries=ImportConfig.MAX_RESUME_ATTEMPTS)
+
             # Mark as failed
             user_id = None
             try:
@@ -135,6 +191,7 @@ def process_import_job(self, job_id: str):
                 if job:
                     user_id = str(job.user_id)
                     job.mark_failed(str(e))
+                    _delete_id_mappings(db, job)
                     db.commit()
 
                     # Try to clean up temp files even on failure
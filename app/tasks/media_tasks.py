@@ -0,0 +1,49 @@
+"""
+Celery tasks for media processing.
+"""
+import uuid
+from typing import Iterable, List
+
+from app.core.celery_app import celery_app
+from app.core.database import get_session_context
+from app.core.logging_config import log_info
+from app.services.media_service import MediaService
+from app.utils.import_export.constants import ImportConfig
+
+
+@celery_app.task(name="app.tasks.media.generate_media_thumbnails", bind=True)
+def generate_media_thumbnails(self, media_ids: List[str]):
+    """
+    Generate thumbnails for media records waiting for one.
+
+    Args:
+        media_ids: EntryMedia IDs (UUID strings)
+
+    Returns:
+        Dictionary with the number of thumbnails generated
+    """
+    with get_session_context() as db:
+        generated = MediaService(db).generate_pending_thumbnails(
+            uuid.UUID(media_id) for media_id in media_ids
+        )
+
+    log_info(
+        f"Generated {generated} of {len(media_ids)} media thumbnails",
+        task_id=self.request.id,
+        media_count=len(media_ids),
+        generated=generated,
+    )
+    return {"status": "completed", "generated": generated}
+
+
+def queue_thumbnail_generation(media_ids: Iterable[uuid.UUID]) -> None:
+    """
+    Queue thumbnail generation for committed media records.
+
+    The IDs are split into tasks of ImportConfig.THUMBNAIL_BATCH_SIZE, so
+    the workers generate them in parallel.
+    """
+    media_ids = [str(media_id) for media_id in media_ids]
+    batch_size = ImportConfig.THUMBNAIL_BATCH_SIZE
+    for start in range(0, len(media_ids), batch_size):
+        generate_media_thumbnails.delay(media_ids[start:start + batch_size])
@@ -0,0 +1,68 @@
+"""
+Batched INSERTs for import operations.
+
+Imported rows get their primary keys client-side, so nothing needs to be
+read back after inserting them. Rows are therefore buffered as plain column
+dictionaries and written with one executemany INSERT per table, instead of
+constructing ORM instances and flushing the unit of work per entry.
+"""
+from collections import defaultdict
+from typing import Any, Dict, List, Type
+
+from sqlalchemy import Table, insert
+from sqlalchemy.orm import Session
+from sqlmodel import SQLModel
+
+
+class BatchInserter:
+    """
+    Buffers new rows and inserts them in bulk.
+
+    Rows are dictionaries of column values; columns left out receive their
+    column defaults. Tables are written in foreign-key dependency order, so a
+    batch may hold parents (tags, entries) together with their children
+    (links, mood logs, media). Row dictionaries may still be modified after
+    add() until the batch is flushed. Inserted rows never enter the session's
+    identity map.
+    """
+
+    def __init__(self, db: Session, batch_size: int):
+        """
+        Initialize the inserter.
+
+        Args:
+            db: Database session whose transaction the rows are written in
+            batch_size: Number of buffered rows that makes the batch full
+        """
+        self.db = db
+        self.batch_size = batch_size
+        self._pending: Dict[Table, List[Dict[str, Any]]] = defaultdict(list)
+        self._count = 0
+
+    def add(self, model: Type[SQLModel], row: Dict[str, Any]) -> None:
+        """Buffer a row for the model's table."""
+        self._pending[model.__table__].append(row)
+        self._count += 1
+
+    def flush_if_full(self) -> bool:
+        """Flush the batch once it holds batch_size rows; return whether it did."""
+        if self._count >= self.batch_size:
+            self.flush()
+            return True
+        return False
+
+    def flush(self) -> None:
+        """Insert all buffered rows."""
+        if not self._count:
+            return
+        for table in SQLModel.metadata.sorted_tables:
+            rows = self._pending.pop(table, None)
+            if not rows:
+                continue
+            # executemany needs the same columns in every row
+            shapes: Dict[frozenset, List[Dict[str, Any]]] = defaultdict(list)
+            for row in rows:
+                shapes[frozenset(row)].append(row)
+            for shaped_rows in shapes.values():
+                self.db.execute(insert(table), shaped_rows)
+        self._count = 0
@@ -28,6 +28,26 @@ class ExportConfig:
     EXPORT_VERSION = "1.0"
     DATA_FILENAME = "data.json"
 
+    # Entries fetched per round trip while streaming data.json
+    ENTRY_BATCH_SIZE = 100
+
+    # Media formats that are already compressed; they are STORED in the archive
+    # because deflating them again costs CPU without making them smaller
+    STORED_MEDIA_EXTENSIONS = frozenset({
+        ".jpg", ".jpeg", ".png", ".gif", ".webp", ".heic", ".heif", ".avif",
+        ".mp4", ".m4v", ".mov", ".avi", ".webm", ".mkv",
+        ".mp3", ".m4a", ".aac", ".ogg", ".oga", ".opus", ".flac",
+        ".zip", ".gz",
+    })
+
+    # Media read-ahead: files are read by worker threads while the archive
+    # writer is busy with earlier members. Files larger than
+    # MEDIA_READ_AHEAD_MAX_BYTES are streamed by the writer instead, so at most
+    # MEDIA_READ_AHEAD_FILES * MEDIA_READ_AHEAD_MAX_BYTES is buffered.
+    MEDIA_READ_AHEAD_WORKERS = 4
+    MEDIA_READ_AHEAD_FILES = 8
+    MEDIA_READ_AHEAD_MAX_BYTES = 8 * 1024 * 1024  # 8 MB
+
 
 class ImportConfig:
     """Configuration constants for import operations."""
@@ -36,6 +56,14 @@ class ImportConfig:
     MAX_FILENAME_LENGTH = 255
     ALLOWED_EXTENSIONS = frozenset({".zip"})
 
-    # Batch processing (for future optimization)
-    ENTRY_BATCH_SIZE = 100
+    # Batch processing
+    # Rows buffered before a bulk INSERT (entries plus their tags, mood logs and media)
+    ENTRY_BATCH_SIZE = 1000
     MEDIA_BATCH_SIZE = 50
+
+    # Imported media per thumbnail generation task
+    THUMBNAIL_BATCH_SIZE = 20
+
+    # Times an import interrupted by the task time limit is re-queued to
+    # continue from its checkpoint
+    MAX_RESUME_ATTEMPTS = 10
@@ -0,0 +1,85 @@
+"""
+Incremental writer for the Journiv export JSON document.
+
+Writes data.json record by record so an export never holds more than one
+entry in memory. The document is equivalent to a serialized
+JournivExportDTO; keys are ordered so mood definitions precede journals,
+each journal's own fields precede its entries, and statistics (only known
+once every entry has been written) come last.
+"""
+import json
+from typing import Any, BinaryIO, Dict, Optional
+
+from pydantic import BaseModel
+
+
+class ExportDataWriter:
+    """
+    Streams an export document to a binary file object.
+
+    Usage:
+        writer = ExportDataWriter(stream)
+        writer.start(header_dto)             # JournivExportDTO without journals
+        writer.start_journal(journal_dto)    # JournalDTO without entries
+        writer.write_entry(entry_dto)
+        writer.end_journal()
+        writer.finish(stats)
+    """
+
+    # Small pieces are batched so the compressor sees reasonably sized writes
+    FLUSH_THRESHOLD = 64 * 1024
+
+    def __init__(self, stream: BinaryIO):
+        self._stream = stream
+        self._buffer = bytearray()
+        self._journal_count = 0
+        self._entry_count = 0
+
+    def start(self, header: BaseModel) -> None:
+        """Write the top-level fields and open the journals array."""
+        self._open_array(header, exclude={"journals", "stats"}, array_key="journals")
+
+    def start_journal(self, journal: BaseModel) -> None:
+        """Write a journal's own fields and open its entries array."""
+        if self._journal_count:
+            self._write(",")
+        self._journal_count += 1
+        self._entry_count = 0
+        self._open_array(journal, exclude={"entries"}, array_key="entries")
+
+    def write_entry(self, entry: BaseModel) -> None:
+        """Append one entry to the open journal."""
+        if self._entry_count:
+            self._write(",")
+        self._entry_count += 1
+        self._write(entry.model_dump_json())
+
+    def end_journal(self) -> None:
+        """Close the open journal."""
+        self._write("]}")
+
+    def finish(self, stats: Optional[Dict[str, Any]]) -> None:
+        """Close the journals array and write the statistics."""
+        self._write("],\"stats\":")
+        self._write(json.dumps(stats, ensure_ascii=False, default=str))
+        self._write("}")
+        self._flush()
+
+    def _open_array(self, model: BaseModel, exclude: set, array_key: str) -> None:
+        body = model.model_dump_json(exclude=exclude)
+        # Re-open the serialized object to append the streamed array
+        self._write(body[:-1])
+        if body != "{}":
+            self._write(",")
+        self._write(json.dumps(array_key))
+        self._write(":[")
+
+    def _write(self, text: str) -> None:
+        self._buffer += text.encode("utf-8")
+        if len(self._buffer) >= self.FLUSH_THRESHOLD:
+            self._flush()
+
+    def _flush(self) -> None:
+        if self._buffer:
+            self._stream.write(bytes(self._buffer))
+            self._buffer.clear()
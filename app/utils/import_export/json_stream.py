@@ -0,0 +1,190 @@
+"""
+Incremental reading of large JSON documents.
+
+Import files can be hundreds of megabytes, so data.json is walked
+structurally instead of being loaded whole: containers are iterated one
+member at a time and only the values the caller asks for (a single entry,
+say) are decoded into Python objects, using the C-accelerated decoder.
+"""
+import json
+from typing import Any, Dict, Iterator, Optional, TextIO
+
+
+class JsonStreamReader:
+    """
+    Pull parser over a JSON text stream.
+
+    Containers are consumed with iter_object() / iter_array(), which yield
+    once per member and expect the caller to consume that member (with
+    read_value(), skip_value() or a nested iteration) before resuming.
+    """
+
+    CHUNK_SIZE = 64 * 1024
+    _WHITESPACE = " \t\n\r"
+
+    def __init__(self, fp: TextIO, chunk_size: Optional[int] = None):
+        self._fp = fp
+        self._chunk_size = chunk_size or self.CHUNK_SIZE
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def iter_object(self) -> Iterator[str]:
+        """Iterate over an object, yielding each key with its value unread."""
+        self._expect("{")
+        if self._peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self.read_value()
+            if not isinstance(key, str):
+                raise ValueError("Invalid JSON: object keys must be strings")
+            self._expect(":")
+            yield key
+            if self._next_char() == "}":
+                return
+            self._pos -= 1
+            self._expect(",")
+
+    def iter_array(self) -> Iterator[int]:
+        """Iterate over an array, yielding each index with its item unread."""
+        self._expect("[")
+        if self._peek() == "]":
+            self._pos += 1
+            return
+        index = 0
+        while True:
+            yield index
+            index += 1
+            if self._next_char() == "]":
+                return
+            self._pos -= 1
+            self._expect(",")
+
+    def read_value(self) -> Any:
+        """Decode the next complete value."""
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+                # Value spans past the buffer; read as much again and retry
+                self._fill(max(self._chunk_size, len(self._buffer) - self._pos))
+                continue
+            if end == len(self._buffer) and not self._eof:
+                # A number (or literal) may continue in the next chunk
+                self._fill(self._chunk_size)
+                continue
+            self._pos = end
+            return value
+
+    def skip_value(self) -> None:
+        """Consume the next value without keeping it."""
+        char = self._peek()
+        if char == "{":
+            for _ in self.iter_object():
+                self.skip_value()
+        elif char == "[":
+            for _ in self.iter_array():
+                self.skip_value()
+        else:
+            self.read_value()
+
+    def expect_end(self) -> None:
+        """Ensure nothing but whitespace follows the document."""
+        if self._peek() is not None:
+            raise ValueError("Invalid JSON: unexpected data after document")
+
+    def _peek(self) -> Optional[str]:
+        """Skip whitespace and return the next character without consuming it."""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in self._WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if self._eof:
+                return None
+            self._fill(self._chunk_size)
+
+    def _next_char(self) -> str:
+        char = self._peek()
+        if char is None:
+            raise ValueError("Invalid JSON: unexpected end of document")
+        self._pos += 1
+        return char
+
+    def _expect(self, expected: str) -> None:
+        char = self._next_char()
+        if char != expected:
+            raise ValueError(f"Invalid JSON: expected '{expected}' but found '{char}'")
+
+    def _fill(self, size: int) -> None:
+        # Drop the consumed prefix so the buffer only holds unread text
+        self._buffer = self._buffer[self._pos:]
+        self._pos = 0
+        chunk = self._fp.read(size)
+        if chunk:
+            self._buffer += chunk
+        else:
+            self._eof = True
+
+
+class StreamedJournal:
+    """
+    A journal from an export document whose entries are read lazily.
+
+    ``fields`` holds the journal's own fields seen before its entries; once
+    ``entries`` is exhausted (or drain() is called) it also holds the fields
+    that follow them.
+    """
+
+    def __init__(self, reader: JsonStreamReader):
+        self.fields: Dict[str, Any] = {}
+        self.entry_count = 0
+        self._members = self._iter_members(reader)
+        # Read up to the first entry so the leading fields are available
+        self._lookahead = next(self._members, None)
+        self.entries: Iterator[Dict[str, Any]] = self._iter_entries()
+
+    def drain(self) -> None:
+        """Consume any remaining entries and trailing fields."""
+        for _ in self.entries:
+            pass
+
+    def _iter_entries(self) -> Iterator[Dict[str, Any]]:
+        if self._lookahead is not None:
+            entry, self._lookahead = self._lookahead, None
+            yield entry
+        yield from self._members
+
+    def _iter_members(self, reader: JsonStreamReader) -> Iterator[Dict[str, Any]]:
+        for key in reader.iter_object():
+            if key == "entries":
+                for _ in reader.iter_array():
+                    self.entry_count += 1
+                    yield reader.read_value()
+            else:
+                self.fields[key] = reader.read_value()
+
+
+def iter_export_journals(reader: JsonStreamReader) -> Iterator[StreamedJournal]:
+    """
+    Iterate over the journals of an export document, one at a time.
+
+    Top-level fields other than journals are skipped; read them in a separate
+    pass (see validate_journiv_export_file()). Each journal is drained before the next one
+    is read, even if the caller stopped consuming its entries.
+    """
+    for key in reader.iter_object():
+        if key != "journals":
+            reader.skip_value()
+            continue
+        for _ in reader.iter_array():
+            journal = StreamedJournal(reader)
+            yield journal
+            journal.drain()
+    reader.expect_end()
+
@@ -1,13 +1,13 @@
 """
 Progress callback utilities for import/export operations.
 """
-from typing import Callable
+from typing import Callable, Optional
 from sqlalchemy.orm import Session
 
 
 def create_throttled_progress_callback(
     job,
-    db: Session,
+    db: Optional[Session],
     start_progress: int = 0,
     end_progress: int = 90,
     commit_interval: int = 10,
@@ -21,7 +21,8 @@ def create_throttled_progress_callback(
 
     Args:
         job: Job object with processed_items, total_items, and set_progress method
-        db: Database session
+        db: Database session, or None to only set progress on the job and
+            leave persisting it to the caller's own commits
         start_progress: Starting progress percentage (default 0)
         end_progress: Ending progress percentage (default 90)
         commit_interval: Commit every N entries (default 10)
@@ -63,7 +64,7 @@ def create_throttled_progress_callback(
                 processed == total
             )
 
-            if should_commit:
+            if should_commit and db is not None:
                 db.commit()
                 last_committed_progress = processed
                 last_committed_percentage = new_progress
@@ -74,7 +75,8 @@ def create_throttled_progress_callback(
                 current_progress = job.progress or start_progress
                 if current_progress < start_progress:
                     job.set_progress(start_progress)
-                db.commit()
+                if db is not None:
+                    db.commit()
                 zero_total_committed = True
 
     return handle_progress
@@ -3,7 +3,8 @@ Validation utilities for import/export data.
 
 Validates data structure and content before processing.
 """
-from typing import Dict, Any, List, Optional
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
 from pydantic import ValidationError
 
 from app.schemas.dto import (
@@ -13,6 +14,7 @@ from app.schemas.dto import (
     MediaDTO,
 )
 from app.core.logging_config import log_error
+from app.utils.import_export.json_stream import JsonStreamReader, StreamedJournal
 
 
 class ValidationResult:
@@ -133,6 +135,85 @@ def validate_journiv_export(data: Dict[str, Any]) -> ValidationResult:
     return result
 
 
+def validate_journiv_export_file(data_file: Path) -> Tuple[ValidationResult, Dict[str, Any], int]:
+    """
+    Validate a Journiv export document on disk without loading it whole.
+
+    Performs the same checks as validate_journiv_export(), reading journals
+    and entries one at a time.
+
+    Args:
+        data_file: Path to the export's data.json
+
+    Returns:
+        Tuple of (ValidationResult, top-level fields with an empty journals
+        list, total number of entries)
+    """
+    result = ValidationResult()
+    header: Dict[str, Any] = {}
+    total_entries = 0
+    journal_count = 0
+    journal_titles: List[str] = []
+
+    try:
+        with open(data_file, "r", encoding="utf-8") as fp:
+            reader = JsonStreamReader(fp)
+            for key in reader.iter_object():
+                if key != "journals":
+                    header[key] = reader.read_value()
+                    continue
+                for idx in reader.iter_array():
+                    journal_count += 1
+                    context = f"Journal {idx + 1}"
+                    journal = StreamedJournal(reader)
+                    entry_dates = []
+                    for entry_idx, entry_data in enumerate(journal.entries):
+                        entry_context = f"{context}, Entry {entry_idx + 1}"
+                        try:
+                            entry = EntryDTO(**entry_data)
+                        except ValidationError as e:
+                            result.add_error(f"{entry_context}: Invalid entry: {e}")
+                            continue
+                        entry_dates.append(entry.entry_date)
+                        entry_result = validate_entry(entry, entry_context)
+                        result.errors.extend(entry_result.errors)
+                        result.warnings.extend(entry_result.warnings)
+                        if entry_result.has_errors():
+                            result.valid = False
+                    total_entries += journal.entry_count
+
+                    try:
+                        journal_dto = JournalDTO(**journal.fields)
+                    except ValidationError as e:
+                        result.add_error(f"{context}: Invalid journal: {e}")
+                        continue
+                    journal_titles.append(journal_dto.title.lower())
+                    if not journal_dto.title or not journal_dto.title.strip():
+                        result.add_error(f"{context}: Title is required")
+                    if len(entry_dates) != len(set(entry_dates)):
+                        result.add_warning(f"{context}: Contains entries with duplicate dates")
+            reader.expect_end()
+
+        header["journals"] = []
+        JournivExportDTO(**header)
+    except ValueError as e:
+        # Covers schema errors as well as malformed JSON and encoding errors
+        result.add_error(f"Invalid export format: {e}")
+        log_error(e, context="export_validation")
+    except Exception as e:
+        log_error(e, context="export_validation_unexpected_error")
+        raise
+
+    if journal_count == 0:
+        result.add_warning("Export contains no journals")
+    if total_entries == 0:
+        result.add_warning("Export contains no entries")
+    if len(journal_titles) != len(set(journal_titles)):
+        result.add_warning("Export contains duplicate journals")
+
+    return result, header, total_entries
+
+
 def validate_journal(journal: JournalDTO, context: str = "Journal") -> ValidationResult:
     """
     Validate a journal DTO.
@@ -3,12 +3,20 @@ ZIP file handling utilities for import/export.
 
 Handles creation and extraction of ZIP archives for data exports/imports.
 """
+import shutil
 import zipfile
-import json
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import IO, Any, Callable, Dict, List, Optional, Union
 
 from app.core.logging_config import log_warning, log_error
+from app.utils.import_export.constants import ExportConfig
+
+
+# Read-ahead results for media that must not be buffered in memory
+_MEDIA_MISSING = object()
+_MEDIA_TOO_LARGE = object()
 
 
 class ZipHandler:
@@ -22,15 +30,13 @@ class ZipHandler:
     """
 
     @staticmethod
-    def create_export_zip(
+    def create_streaming_export_zip(
         output_path: Path,
-        data: Optional[Dict[str, Any]] = None,
-        media_files: Optional[Dict[str, Path]] = None,
+        write_data: Callable[[IO[bytes]], Dict[str, Path]],
         data_filename: str = "data.json",
-        data_file_path: Optional[Path] = None,
     ) -> int:
         """
-        Create a ZIP archive for export.
+        Create a ZIP archive for export, streaming the JSON data into it.
 
         Structure:
         ```
@@ -48,68 +54,140 @@ class ZipHandler:
         and avoid filename conflicts. Each media file path format is:
         `{entry_id}/{media_id}_{sanitized_filename}`
 
+        ``write_data`` writes the data file directly into the archive member
+        instead of it being serialized up front. It returns the media files the
+        written data references, which are added afterwards (a ZIP member must
+        be complete before the next one starts).
+
         Args:
             output_path: Path for output ZIP file
-            data: Export data (will be JSON serialized)
-            media_files: Dictionary of {relative_path: source_file_path}
+            write_data: Callable writing the data file to a binary stream and
+                returning {relative_path: source_file_path} for media to include
             data_filename: Name for the JSON data file
 
         Returns:
             Total size of created ZIP file in bytes
 
         Raises:
+            ValueError: If ``write_data`` rejects the data
             IOError: If ZIP creation fails
         """
         try:
-            if data is None and data_file_path is None:
-                raise ValueError("Either data or data_file_path must be provided")
-
             with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                # Write JSON data
-                if data_file_path:
-                    zipf.write(data_file_path, arcname=data_filename)
-                else:
-                    json_str = json.dumps(data, indent=2, default=str)
-                    zipf.writestr(data_filename, json_str)
+                with zipf.open(data_filename, 'w', force_zip64=True) as data_stream:
+                    media_files = write_data(data_stream)
 
-                # Write media files
                 if media_files:
-                    for relative_path, source_path in media_files.items():
-                        if source_path.exists():
-                            # Store in media/ subdirectory
-                            archive_path = f"media/{relative_path}"
-                            zipf.write(source_path, archive_path)
-                        else:
-                            log_warning(f"Media file not found: {source_path}", source_path=str(source_path))
-
-            # Return file size
+                    ZipHandler._write_media_files(zipf, media_files)
+
             return output_path.stat().st_size
 
+        except ValueError:
+            output_path.unlink(missing_ok=True)
+            raise
         except Exception as e:
+            output_path.unlink(missing_ok=True)
             log_error(e, output_path=str(output_path))
             raise IOError(f"ZIP creation failed: {e}") from e
 
     @staticmethod
-    def extract_zip(
+    def media_compression(relative_path: str) -> int:
+        """
+        Choose the compression method for a media member.
+
+        Already-compressed formats (JPEG, MP4, M4A, ...) are stored as-is;
+        everything else is deflated.
+        """
+        if Path(relative_path).suffix.lower() in ExportConfig.STORED_MEDIA_EXTENSIONS:
+            return zipfile.ZIP_STORED
+        return zipfile.ZIP_DEFLATED
+
+    @staticmethod
+    def _read_media_file(source_path: Path) -> Union[bytes, object]:
+        """Read a media file for read-ahead, or return a marker if it can't be buffered."""
+        try:
+            if source_path.stat().st_size > ExportConfig.MEDIA_READ_AHEAD_MAX_BYTES:
+                return _MEDIA_TOO_LARGE
+            return source_path.read_bytes()
+        except FileNotFoundError:
+            return _MEDIA_MISSING
+
+    @staticmethod
+    def _write_media_files(zipf: zipfile.ZipFile, media_files: Dict[str, Path]) -> None:
+        """
+        Add media files under the media/ directory of an open archive.
+
+        Files are read ahead by a small thread pool so disk reads overlap with
+        writing earlier members; the archive itself is only written from the
+        calling thread.
+        """
+        items = iter(media_files.items())
+        pending = deque()
+
+        with ThreadPoolExecutor(
+            max_workers=ExportConfig.MEDIA_READ_AHEAD_WORKERS,
+            thread_name_prefix="export-media",
+        ) as executor:
+            def schedule_next() -> None:
+                item = next(items, None)
+                if item is not None:
+                    relative_path, source_path = item
+                    pending.append((
+                        relative_path,
+                        source_path,
+                        executor.submit(ZipHandler._read_media_file, source_path),
+                    ))
+
+            for _ in range(ExportConfig.MEDIA_READ_AHEAD_FILES):
+                schedule_next()
+
+            while pending:
+                relative_path, source_path, future = pending.popleft()
+                content = future.result()
+                schedule_next()
+
+                if content is _MEDIA_MISSING:
+                    log_warning(f"Media file not found: {source_path}", source_path=str(source_path))
+                    continue
+
+                # Store in media/ subdirectory
+                archive_path = f"media/{relative_path}"
+                compression = ZipHandler.media_compression(relative_path)
+                if content is _MEDIA_TOO_LARGE:
+                    zipf.write(source_path, archive_path, compress_type=compression)
+                else:
+                    zinfo = zipfile.ZipInfo.from_file(source_path, archive_path)
+                    zinfo.compress_type = compression
+                    zipf.writestr(zinfo, content)
+
+    @staticmethod
+    def extract_data_file(
         zip_path: Path,
         extract_to: Path,
-        max_size_mb: int = 500
+        max_size_mb: int = 500,
+        data_filename: str = "data.json",
     ) -> Dict[str, Any]:
         """
-        Extract a ZIP archive safely.
+        Extract the data file of an export archive, leaving media in place.
+
+        Media members are read straight out of the archive during import
+        (see ZipMediaReader), so each byte is decompressed once and written
+        once. Member CRCs are verified as they are read instead of
+        test-decompressing the whole archive up front.
 
         Args:
             zip_path: Path to ZIP file
-            extract_to: Directory to extract to
+            extract_to: Directory to extract the data file to
             max_size_mb: Maximum allowed uncompressed size
+            data_filename: Name of the data file in the archive
 
         Returns:
             Dictionary with extraction info:
             {
-                "data_file": Path to data.json,
-                "media_dir": Path to media directory,
-                "total_size": Total extracted size in bytes,
-                "file_count": Number of files extracted
+                "data_file": Path to the extracted data file,
+                "has_media": Whether the archive contains media files,
+                "total_size": Total uncompressed size in bytes,
+                "file_count": Number of files in the archive
             }
 
         Raises:
@@ -118,12 +196,10 @@ class ZipHandler:
         """
         try:
             with zipfile.ZipFile(zip_path, 'r') as zipf:
-                # Validate ZIP
-                if zipf.testzip() is not None:
-                    raise ValueError("ZIP file is corrupted")
+                infos = zipf.infolist()
 
                 # Check total uncompressed size
-                total_size = sum(info.file_size for info in zipf.infolist())
+                total_size = sum(info.file_size for info in infos)
                 max_bytes = max_size_mb * 1024 * 1024
 
                 if total_size > max_bytes:
@@ -132,44 +208,31 @@ class ZipHandler:
                         f"(max: {max_size_mb}MB)"
                     )
 
-                # Ensure extract_to directory exists
-                extract_to.mkdir(parents=True, exist_ok=True)
-                extract_to_resolved = extract_to.resolve()
-
-                # Check for path traversal attacks
-                for info in zipf.infolist():
-                    # Build extraction path and normalize to detect traversal attempts
-                    extract_path = (extract_to / info.filename).resolve()
-
-                    # Ensure it's within extract_to (prevents path traversal)
-                    # Use proper path containment check, not string prefix matching
-                    try:
-                        extract_path.relative_to(extract_to_resolved)
-                    except ValueError:
-                        # Path is outside extract_to directory
-                        raise ValueError(
-                            f"ZIP contains unsafe path: {info.filename}"
-                        )
-
-                # Extract all files
-                zipf.extractall(extract_to)
-
-                # Find data file and media directory
-                data_file = extract_to / "data.json"
-                media_dir = extract_to / "media"
+                try:
+                    data_info = zipf.getinfo(data_filename)
+                except KeyError:
+                    raise ValueError(f"ZIP missing {data_filename} file")
 
-                if not data_file.exists():
-                    raise ValueError("ZIP missing data.json file")
+                # Fixed destination name, so member paths cannot escape extract_to
+                extract_to.mkdir(parents=True, exist_ok=True)
+                data_file = extract_to / data_filename
+                with zipf.open(data_info) as source, open(data_file, "wb") as destination:
+                    shutil.copyfileobj(source, destination, ZipMediaReader.CHUNK_SIZE)
 
                 return {
                     "data_file": data_file,
-                    "media_dir": media_dir if media_dir.exists() else None,
+                    "has_media": any(
+                        info.filename.startswith(ZipMediaReader.MEDIA_PREFIX) and not info.is_dir()
+                        for info in infos
+                    ),
                     "total_size": total_size,
-                    "file_count": len(zipf.infolist())
+                    "file_count": len(infos),
                 }
 
         except zipfile.BadZipFile as e:
             raise ValueError(f"Invalid ZIP file: {e}") from e
+        except ValueError:
+            raise
         except Exception as e:
             log_error(e, zip_path=str(zip_path), extract_to=str(extract_to))
             raise IOError(f"Extraction failed: {e}") from e
@@ -177,7 +240,7 @@ class ZipHandler:
     @staticmethod
     def validate_zip_structure(zip_path: Path) -> Dict[str, Any]:
         """
-        Validate ZIP file structure without extracting.
+        Validate ZIP file structure without extracting or decompressing.
 
         Args:
             zip_path: Path to ZIP file
@@ -204,12 +267,8 @@ class ZipHandler:
 
         try:
             with zipfile.ZipFile(zip_path, 'r') as zipf:
-                # Test ZIP integrity
-                bad_file = zipf.testzip()
-                if bad_file is not None:
-                    result["valid"] = False
-                    result["errors"].append(f"Corrupted file in ZIP: {bad_file}")
-                    return result
+                # Member CRCs are verified when the import reads them, so the
+                # archive is not test-decompressed here
 
                 # Check contents
                 file_list = zipf.namelist()
@@ -273,3 +332,60 @@ class ZipHandler:
                 return zipf.namelist()
         except zipfile.BadZipFile as e:
             raise ValueError(f"Invalid ZIP file: {e}") from e
+
+
+class ZipMediaReader:
+    """
+    Reads the media files of an export archive in place.
+
+    Members are streamed out of the open archive, so importing media needs no
+    extracted copy on disk. zipfile verifies each member's CRC as it is read
+    and raises zipfile.BadZipFile on a mismatch.
+
+    Usage:
+        with ZipMediaReader(zip_path) as reader:
+            source = reader.open("images/photo.jpg")
+    """
+
+    MEDIA_PREFIX = "media/"
+    CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, zip_path: Path):
+        """
+        Open the archive.
+
+        Args:
+            zip_path: Path to ZIP file
+
+        Raises:
+            ValueError: If ZIP is invalid
+        """
+        try:
+            self._zipf = zipfile.ZipFile(zip_path, 'r')
+        except zipfile.BadZipFile as e:
+            raise ValueError(f"Invalid ZIP file: {e}") from e
+
+    def open(self, relative_path: str) -> Optional[IO[bytes]]:
+        """
+        Open a media file by its path relative to the media directory.
+
+        Returns:
+            Readable binary stream, or None if the archive has no such file
+        """
+        try:
+            info = self._zipf.getinfo(f"{self.MEDIA_PREFIX}{relative_path}")
+        except KeyError:
+            return None
+        if info.is_dir():
+            return None
+        return self._zipf.open(info)
+
+    def close(self) -> None:
+        """Close the archive."""
+        self._zipf.close()
+
+    def __enter__(self) -> "ZipMediaReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -217,6 +217,63 @@ def test_writing_patterns_include_entries_moods_and_tags(
         assert tag_counts.get(tag_name) == count
 
 
+def test_writing_patterns_follow_entry_deletion(
+    api_client: JournivApiClient,
+    api_user: ApiUser,
+    journal_factory,
+):
+    """Deleting an entry must drop its mood and tag counts from the daily rollups."""
+    token = api_user.access_token
+    journal = journal_factory(title="Rollup Journal")
+    moods = api_client.list_moods(token)
+    if not moods:
+        pytest.skip("Analytics tests require at least one mood to be configured.")
+
+    day = utc_now().date() - timedelta(days=2)
+    entry = api_client.create_entry(
+        token,
+        journal_id=journal["id"],
+        title="Rollup entry",
+        content=_content_with_words(5),
+        entry_date=day.isoformat(),
+        entry_timezone="UTC",
+    )
+    api_client.request(
+        "POST",
+        f"/tags/entry/{entry['id']}/bulk",
+        token=token,
+        json=["rollup"],
+        expected=(200,),
+    )
+    api_client.create_mood_log(
+        token,
+        entry_id=entry["id"],
+        mood_id=moods[0]["id"],
+        logged_date=day.isoformat(),
+    )
+
+    def _patterns() -> Dict[str, Any]:
+        return api_client.request(
+            "GET",
+            "/analytics/writing-patterns",
+            token=token,
+            params={"days": 30},
+        ).json()
+
+    patterns = _patterns()
+    mood_counts = {item["date"]: item["mood_count"] for item in patterns["mood_patterns"]}
+    tag_counts = {item["tag_name"]: item["usage_count"] for item in patterns["top_tags"]}
+    assert mood_counts.get(day.isoformat()) == 1
+    assert tag_counts.get("rollup") == 1
+
+    api_client.delete_entry(token, entry["id"])
+
+    patterns = _patterns()
+    assert day.isoformat() not in {item["date"] for item in patterns["mood_patterns"]}
+    assert day.isoformat() not in {item["date"] for item in patterns["entries_by_day"]}
+    assert "rollup" not in {item["tag_name"] for item in patterns["top_tags"]}
+
+
 def test_productivity_metrics_compare_current_and_last_month(
     api_client: JournivApiClient,
     api_user: ApiUser,
@@ -289,6 +346,71 @@ def test_dashboard_combines_all_analytics_sources(
     assert summary["longest_streak"] == dashboard["writing_streak"]["longest_streak"]
 
 
+def test_dashboard_matches_individual_endpoints(
+    api_client: JournivApiClient,
+    api_user: ApiUser,
+    analytics_dataset: AnalyticsSeedData,
+):
+    """The batched dashboard must return exactly what the single endpoints return."""
+    token = api_user.access_token
+    dashboard = api_client.request(
+        "GET", "/analytics/dashboard", token=token, params={"days": 45}
+    ).json()
+
+    assert dashboard["writing_streak"] == api_client.request(
+        "GET", "/analytics/writing-streak", token=token
+    ).json()
+    assert dashboard["writing_patterns"] == api_client.request(
+        "GET", "/analytics/writing-patterns", token=token, params={"days": 45}
+    ).json()
+    assert dashboard["productivity"] == api_client.request(
+        "GET", "/analytics/productivity", token=token
+    ).json()
+    assert dashboard["journals"] == api_client.request(
+        "GET", "/analytics/journals", token=token
+    ).json()
+
+
+def test_dashboard_cache_is_invalidated_by_writes(
+    api_client: JournivApiClient,
+    api_user: ApiUser,
+    journal_factory,
+):
+    """Cached dashboards must reflect entry, tag, and mood writes immediately."""
+    token = api_user.access_token
+    journal = journal_factory(title="Dashboard Cache")
+
+    def _dashboard() -> Dict[str, Any]:
+        return api_client.request("GET", "/analytics/dashboard", token=token).json()
+
+    before = _dashboard()
+    assert _dashboard() == before
+
+    entry = api_client.create_entry(
+        token,
+        journal_id=journal["id"],
+        title="Cache buster",
+        content=_content_with_words(4),
+        entry_date=utc_now().date().isoformat(),
+        entry_timezone="UTC",
+    )
+    after_entry = _dashboard()
+    assert after_entry["summary"]["total_entries"] == before["summary"]["total_entries"] + 1
+
+    api_client.request(
+        "POST",
+        f"/tags/entry/{entry['id']}/bulk",
+        token=token,
+        json=["cached"],
+        expected=(200,),
+    )
+    top_tags = {item["tag_name"] for item in _dashboard()["writing_patterns"]["top_tags"]}
+    assert "cached" in top_tags
+
+    api_client.delete_entry(token, entry["id"])
+    assert _dashboard()["summary"]["total_entries"] == before["summary"]["total_entries"]
+
+
 def test_analytics_requires_authentication(api_client: JournivApiClient):
     """All analytics endpoints must require a token."""
     assert_requires_authentication(
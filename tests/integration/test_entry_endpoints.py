@@ -68,6 +68,58 @@ def test_entry_listing_supports_pagination(
     assert first_page[0]["id"] != second_page[0]["id"]
 
 
+def test_entry_listing_supports_cursor_pagination(
+    api_client: JournivApiClient,
+    api_user: ApiUser,
+    journal_factory,
+    entry_factory,
+):
+    """Cursor pagination walks the timeline without gaps or duplicates."""
+    journal = journal_factory()
+    today = date.today()
+    created = [
+        entry_factory(journal=journal, entry_date=(today - timedelta(days=offset)).isoformat())
+        for offset in range(5)
+    ]
+    pinned = api_client.pin_entry(api_user.access_token, created[-1]["id"])
+
+    for path in ("/entries/", f"/entries/journal/{journal['id']}"):
+        seen: list[str] = []
+        params = {"limit": 2}
+        while True:
+            response = api_client.request(
+                "GET", path, token=api_user.access_token, params=params
+            )
+            assert response.status_code == 200
+            seen.extend(entry["id"] for entry in response.json())
+            next_cursor = response.headers.get("X-Next-Cursor")
+            if not next_cursor:
+                break
+            params = {"limit": 2, "cursor": next_cursor}
+
+        offset_ids = [
+            entry["id"]
+            for entry in api_client.request(
+                "GET", path, token=api_user.access_token, params={"limit": 10}
+            ).json()
+        ]
+        assert seen == offset_ids
+        assert set(seen) == {entry["id"] for entry in created}
+
+    journal_ids = [
+        entry["id"]
+        for entry in api_client.request(
+            "GET", f"/entries/journal/{journal['id']}", token=api_user.access_token
+        ).json()
+    ]
+    assert journal_ids[0] == pinned["id"]
+
+    invalid = api_client.request(
+        "GET", "/entries/", token=api_user.access_token, params={"cursor": "not-a-cursor"}
+    )
+    assert invalid.status_code == 400
+
+
 def test_update_entry_adjusts_metadata(
     api_client: JournivApiClient,
     api_user: ApiUser,
@@ -287,6 +339,45 @@ def test_entry_search_and_date_range_filters(
     assert earlier["id"] not in returned_ids
 
 
+def test_entry_search_ranks_title_matches_and_supports_prefixes(
+    api_client: JournivApiClient,
+    api_user: ApiUser,
+    journal_factory,
+    entry_factory,
+):
+    """Full-text search should match word prefixes and rank title hits first."""
+    journal = journal_factory(title="Search Journal")
+    content_hit = entry_factory(
+        journal=journal,
+        title="Morning notes",
+        content="Walked past the Lighthousekeeper cottage today",
+    )
+    title_hit = entry_factory(
+        journal=journal,
+        title="Lighthousekeeper diaries",
+        content="Nothing much happened",
+    )
+    entry_factory(journal=journal, title="Unrelated", content="Groceries and errands")
+
+    results = api_client.request(
+        "GET",
+        "/entries/search",
+        token=api_user.access_token,
+        params={"q": "lighthouse"},
+    ).json()
+    assert [entry["id"] for entry in results] == [title_hit["id"], content_hit["id"]]
+
+    deleted_id = title_hit["id"]
+    api_client.delete_entry(api_user.access_token, deleted_id)
+    results = api_client.request(
+        "GET",
+        "/entries/search",
+        token=api_user.access_token,
+        params={"q": "lighthouse"},
+    ).json()
+    assert [entry["id"] for entry in results] == [content_hit["id"]]
+
+
 def test_journal_listing_respects_pinned_flag(
     api_client: JournivApiClient,
     api_user: ApiUser,
@@ -90,6 +90,89 @@ def test_media_download_supports_range(
     assert response.headers["accept-ranges"] == "bytes"
 
 
+def test_media_download_supports_multiple_ranges(
+    api_client: JournivApiClient,
+    api_user: ApiUser,
+    entry_factory,
+):
+    """Multiple ranges are answered with a multipart/byteranges body."""
+    entry = entry_factory()
+    uploaded = _upload_sample_media(api_client, api_user.access_token, entry["id"])
+
+    response = api_client.request(
+        "GET",
+        f"/media/{uploaded['id']}",
+        token=api_user.access_token,
+        headers={"Range": "bytes=0-3,8-11"},
+    )
+    assert response.status_code == 206
+    assert response.headers["content-type"].startswith("multipart/byteranges; boundary=")
+    assert "content-encoding" not in response.headers
+    assert int(response.headers["content-length"]) == len(response.content)
+    assert b"Content-Range: bytes 0-3/" in response.content
+    assert b"Content-Range: bytes 8-11/" in response.content
+
+
+def test_media_download_supports_conditional_requests(
+    api_client: JournivApiClient,
+    api_user: ApiUser,
+    entry_factory,
+):
+    """Revalidating with the checksum ETag or Last-Modified returns 304."""
+    entry = entry_factory()
+    uploaded = _upload_sample_media(api_client, api_user.access_token, entry["id"])
+
+    download = api_client.get_media(api_user.access_token, uploaded["id"])
+    assert download.status_code == 200
+    etag = download.headers["etag"]
+    assert etag == f'"{uploaded["checksum"]}"'
+    assert "immutable" in download.headers["cache-control"]
+
+    for headers in (
+        {"If-None-Match": etag},
+        {"If-Modified-Since": download.headers["last-modified"]},
+    ):
+        response = api_client.request(
+            "GET",
+            f"/media/{uploaded['id']}",
+            token=api_user.access_token,
+            headers=headers,
+        )
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    stale = api_client.request(
+        "GET",
+        f"/media/{uploaded['id']}",
+        token=api_user.access_token,
+        headers={"If-None-Match": '"stale"'},
+    )
+    assert stale.status_code == 200
+
+
+def test_identical_uploads_share_one_stored_file(
+    api_client: JournivApiClient,
+    api_user: ApiUser,
+    entry_factory,
+):
+    """Re-uploading the same bytes reuses the stored file until its last reference is deleted."""
+    first = _upload_sample_media(api_client, api_user.access_token, entry_factory()["id"])
+    second = _upload_sample_media(api_client, api_user.access_token, entry_factory()["id"])
+    assert second["checksum"] == first["checksum"]
+    assert second["file_path"] == first["file_path"]
+
+    api_client.request("DELETE", f"/media/{first['id']}", token=api_user.access_token)
+    remaining = api_client.get_media(api_user.access_token, second["id"])
+    assert remaining.status_code == 200
+    assert remaining.content == sample_jpeg_bytes()
+
+    api_client.request("DELETE", f"/media/{second['id']}", token=api_user.access_token)
+    third = _upload_sample_media(api_client, api_user.access_token, entry_factory()["id"])
+    assert third["file_path"] != first["file_path"]
+    assert api_client.get_media(api_user.access_token, third["id"]).status_code == 200
+
+
 def test_media_delete_requires_ownership(
     api_client: JournivApiClient,
     api_user: ApiUser,
@@ -147,3 +230,56 @@ def test_media_get_and_delete_require_auth(
         ],
     )
     api_client.request("DELETE", f"/media/{uploaded['id']}", token=api_user.access_token)
+
+
+def test_media_thumbnail_serves_sized_renditions(
+    api_client: JournivApiClient,
+    api_user: ApiUser,
+    entry_factory,
+):
+    """Sized renditions follow the Accept header and are cached like the original."""
+    from PIL import Image
+
+    image = io.BytesIO()
+    Image.new("RGB", (1600, 1200), (30, 120, 200)).save(image, "JPEG")
+    uploaded = api_client.upload_media(
+        api_user.access_token,
+        entry_id=entry_factory()["id"],
+        filename="large-photo.jpg",
+        content=image.getvalue(),
+        content_type="image/jpeg",
+    )
+    path = f"/media/{uploaded['id']}/thumbnail"
+
+    webp = api_client.request(
+        "GET",
+        path,
+        token=api_user.access_token,
+        params={"size": "large"},
+        headers={"Accept": "image/webp,image/*;q=0.8"},
+    )
+    assert webp.status_code == 200
+    assert webp.headers["content-type"] == "image/webp"
+    assert webp.headers["vary"] == "Accept"
+    with Image.open(io.BytesIO(webp.content)) as rendition:
+        assert rendition.size == (720, 540)
+
+    jpeg = api_client.request(
+        "GET", path, token=api_user.access_token, params={"size": "small"}
+    )
+    assert jpeg.headers["content-type"] == "image/jpeg"
+    assert jpeg.headers["etag"] != webp.headers["etag"]
+
+    revalidated = api_client.request(
+        "GET",
+        path,
+        token=api_user.access_token,
+        params={"size": "large"},
+        headers={"Accept": "image/webp", "If-None-Match": webp.headers["etag"]},
+    )
+    assert revalidated.status_code == 304
+
+    invalid = api_client.request(
+        "GET", path, token=api_user.access_token, params={"size": "huge"}
+    )
+    assert invalid.status_code == 422
@@ -703,3 +703,61 @@ def test_case_k_backdating_far_before_long_streak_preserves_streak(
     assert analytics_after["last_entry_date"] == dec_14.isoformat()
     assert analytics_after["longest_streak"] == 10
 
+
+
+def test_case_l_moving_entry_to_another_day_updates_streak_and_totals(
+    api_client: JournivApiClient,
+    api_user: ApiUser,
+    journal_factory,
+):
+    """Case L: Editing an entry's date and content moves it between writing days."""
+    journal = journal_factory(title="Streak Test Journal")
+    token = api_user.access_token
+
+    base_date = date.today()
+    day_1 = base_date - timedelta(days=4)
+    day_2 = base_date - timedelta(days=3)
+    day_4 = base_date - timedelta(days=1)
+
+    for entry_date in (day_1, day_2):
+        api_client.create_entry(
+            token,
+            journal_id=journal["id"],
+            title=f"Entry {entry_date.isoformat()}",
+            content=_content_with_words(10),
+            entry_date=entry_date.isoformat(),
+            entry_timezone="UTC",
+        )
+    moved = api_client.create_entry(
+        token,
+        journal_id=journal["id"],
+        title="Entry to move",
+        content=_content_with_words(10),
+        entry_date=day_4.isoformat(),
+        entry_timezone="UTC",
+    )
+
+    analytics_before = api_client.request(
+        "GET", "/analytics/writing-streak", token=token
+    ).json()
+    assert analytics_before["current_streak"] == 1
+    assert analytics_before["longest_streak"] == 2
+    assert analytics_before["total_words"] == 30
+
+    # Fill the gap on day 3 and grow the entry to 25 words
+    day_3 = base_date - timedelta(days=2)
+    api_client.update_entry(
+        token,
+        moved["id"],
+        {"entry_date": day_3.isoformat(), "content": _content_with_words(25)},
+    )
+
+    analytics_after = api_client.request(
+        "GET", "/analytics/writing-streak", token=token
+    ).json()
+    assert analytics_after["current_streak"] == 3
+    assert analytics_after["longest_streak"] == 3
+    assert analytics_after["last_entry_date"] == day_3.isoformat()
+    assert analytics_after["streak_start_date"] == day_1.isoformat()
+    assert analytics_after["total_entries"] == 3
+    assert analytics_after["total_words"] == 45
@@ -0,0 +1,32 @@
+"""
+Pytest fixtures shared across the unit tests.
+"""
+import pytest
+from sqlalchemy import create_engine, event
+from sqlmodel import Session, SQLModel
+
+from app.models import User
+
+
+@pytest.fixture
+def session():
+    """In-memory SQLite session with foreign keys enforced."""
+    engine = create_engine("sqlite://")
+
+    @event.listens_for(engine, "connect")
+    def enable_foreign_keys(dbapi_connection, _):
+        dbapi_connection.execute("PRAGMA foreign_keys=ON")
+
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as db:
+        yield db
+    engine.dispose()
+
+
+@pytest.fixture
+def user_id(session):
+    """ID of a committed user to import into."""
+    user = User(email="user@example.com", password="x" * 60, name="User")
+    session.add(user)
+    session.commit()
+    return user.id
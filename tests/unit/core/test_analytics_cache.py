@@ -0,0 +1,84 @@
+"""
+Unit tests for the analytics dashboard cache.
+
+Tests version stamping and invalidation on top of the in-memory backend.
+"""
+from datetime import date
+
+import pytest
+
+from app.core.analytics_cache import AnalyticsCache
+from app.core.cache import InMemoryCache
+
+
+@pytest.fixture
+def cache():
+    return AnalyticsCache(cache_backend=InMemoryCache())
+
+
+TODAY = date(2026, 3, 14)
+
+
+class TestAnalyticsCacheVersioning:
+    """Test the per-user version stamp."""
+
+    def test_version_is_stable_until_invalidated(self, cache):
+        version = cache.get_version("user-1")
+
+        assert cache.get_version("user-1") == version
+
+    def test_invalidate_replaces_version(self, cache):
+        version = cache.get_version("user-1")
+
+        cache.invalidate("user-1")
+
+        assert cache.get_version("user-1") != version
+
+    def test_versions_are_per_user(self, cache):
+        version = cache.get_version("user-1")
+
+        cache.invalidate("user-2")
+
+        assert cache.get_version("user-1") == version
+
+    def test_missing_version_is_never_reused(self, cache):
+        version = cache.get_version("user-1")
+
+        cache.delete("user-1", "version")
+
+        assert cache.get_version("user-1") != version
+
+
+class TestAnalyticsCacheDashboard:
+    """Test dashboard storage under version stamps."""
+
+    def test_round_trip(self, cache):
+        version = cache.get_version("user-1")
+
+        cache.set_dashboard("user-1", 30, TODAY, version, {"summary": {"total_entries": 3}})
+
+        assert cache.get_dashboard("user-1", 30, TODAY, version) == {"summary": {"total_entries": 3}}
+
+    def test_keyed_by_days_and_day(self, cache):
+        version = cache.get_version("user-1")
+        cache.set_dashboard("user-1", 30, TODAY, version, {"days": 30})
+
+        assert cache.get_dashboard("user-1", 7, TODAY, version) is None
+        assert cache.get_dashboard("user-1", 30, date(2026, 3, 15), version) is None
+
+    def test_invalidate_hides_cached_dashboards(self, cache):
+        version = cache.get_version("user-1")
+        cache.set_dashboard("user-1", 30, TODAY, version, {"days": 30})
+
+        cache.invalidate("user-1")
+
+        assert cache.get_dashboard("user-1", 30, TODAY, cache.get_version("user-1")) is None
+
+    def test_build_racing_a_write_is_not_served(self, cache):
+        """A dashboard computed from pre-write data lands under the old stamp."""
+        stale_version = cache.get_version("user-1")
+        cache.invalidate("user-1")
+
+        cache.set_dashboard("user-1", 30, TODAY, stale_version, {"stale": True})
+
+        assert cache.get_dashboard("user-1", 30, TODAY, cache.get_version("user-1")) is None
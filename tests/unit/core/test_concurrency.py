@@ -0,0 +1,101 @@
+"""
+Unit tests for the database threadpool dispatcher and per-route counters.
+"""
+import threading
+
+import pytest
+
+from app.core import concurrency
+from app.core.concurrency import (
+    RouteConcurrencyRegistry,
+    get_threadpool_stats,
+    run_in_db_threadpool,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_route_stats():
+    concurrency.route_concurrency.reset()
+    yield
+    concurrency.route_concurrency.reset()
+
+
+class TestRouteConcurrencyRegistry:
+    """Test the per-route counters."""
+
+    def test_tracks_in_flight_and_peak(self):
+        registry = RouteConcurrencyRegistry()
+
+        registry.request_started("GET /entries/")
+        registry.request_started("GET /entries/")
+        registry.request_finished("GET /entries/", 0.2)
+
+        stats = registry.snapshot()["GET /entries/"]
+        assert stats["in_flight"] == 1
+        assert stats["peak_in_flight"] == 2
+        assert stats["requests"] == 1
+        assert stats["max_ms"] == 200.0
+
+    def test_records_db_wait_and_run_time(self):
+        registry = RouteConcurrencyRegistry()
+
+        registry.db_call_finished("GET /tags/", wait=0.01, run=0.03)
+        registry.db_call_finished("GET /tags/", wait=0.03, run=0.01)
+
+        stats = registry.snapshot()["GET /tags/"]
+        assert stats["db_calls"] == 2
+        assert stats["db_avg_wait_ms"] == 20.0
+        assert stats["db_max_wait_ms"] == 30.0
+        assert stats["db_avg_run_ms"] == 20.0
+
+    def test_reset_clears_all_routes(self):
+        registry = RouteConcurrencyRegistry()
+        registry.request_started("GET /health")
+
+        registry.reset()
+
+        assert registry.snapshot() == {}
+
+
+class TestRunInDbThreadpool:
+    """Test dispatching blocking calls to the threadpool."""
+
+    async def test_runs_off_the_event_loop_thread(self):
+        loop_thread = threading.get_ident()
+
+        worker_thread = await run_in_db_threadpool(threading.get_ident)
+
+        assert worker_thread != loop_thread
+
+    async def test_passes_args_and_kwargs(self):
+        def combine(a, b, *, sep):
+            return f"{a}{sep}{b}"
+
+        assert await run_in_db_threadpool(combine, "x", "y", sep="-") == "x-y"
+
+    async def test_attributes_calls_to_current_route(self):
+        token = concurrency._current_route.set("POST /entries/")
+        try:
+            await run_in_db_threadpool(lambda: None)
+        finally:
+            concurrency._current_route.reset(token)
+
+        assert concurrency.route_concurrency.snapshot()["POST /entries/"]["db_calls"] == 1
+
+    async def test_records_call_when_function_raises(self):
+        def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            await run_in_db_threadpool(fail)
+
+        stats = concurrency.route_concurrency.snapshot()[concurrency.UNROUTED_LABEL]
+        assert stats["db_calls"] == 1
+
+    async def test_threadpool_is_released_after_call(self):
+        await run_in_db_threadpool(lambda: None)
+
+        stats = get_threadpool_stats()
+        assert stats["in_use"] == 0
+        assert stats["waiting"] == 0
+        assert stats["size"] > 0
@@ -0,0 +1,66 @@
+"""
+Unit tests for the instrumented database connection pool.
+"""
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app.core.db_pool import InstrumentedQueuePool, get_pool_stats, instrument_engine
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """File-based SQLite engine with a single pooled connection."""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    instrument_engine(engine)
+    yield engine
+    engine.dispose()
+
+
+class TestInstrumentedPool:
+    """Test checkout telemetry and pool gauges."""
+
+    def test_records_checkouts_and_gauges(self, engine):
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+            stats = get_pool_stats(engine)
+            assert (stats["size"], stats["in_use"], stats["idle"], stats["overflow"]) == (1, 1, 0, 0)
+
+        stats = get_pool_stats(engine)
+        assert stats["checkouts"] == 1
+        assert stats["peak_in_use"] == 1
+        assert stats["in_use"] == 0
+        assert sum(stats["checkout_wait_histogram"].values()) == 1
+        assert stats["connections"]["open"] == 1
+
+    def test_exhausted_pool_records_timeout(self, engine, caplog):
+        engine.pool.metrics.slow_checkout_ms = 10
+        with engine.connect():
+            with pytest.raises(PoolTimeoutError):
+                engine.connect()
+
+        stats = get_pool_stats(engine)
+        assert stats["checkouts"] == 2
+        assert stats["checkout_timeouts"] == 1
+        assert stats["slow_checkouts"] == 1
+        assert stats["waiting"] == 0
+        assert stats["checkout_max_wait_ms"] >= 50
+        assert "Slow database connection checkout" in caplog.text
+
+    def test_metrics_survive_dispose(self, engine):
+        with engine.connect():
+            pass
+        engine.dispose()
+
+        stats = get_pool_stats(engine)
+        assert stats["checkouts"] == 1
+        assert stats["connections"]["open"] == 0
+        with engine.connect():
+            pass
+        assert get_pool_stats(engine)["connections"]["open"] == 1
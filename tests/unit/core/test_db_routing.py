@@ -0,0 +1,53 @@
+"""
+Unit tests for read replica routing.
+"""
+import pytest
+from sqlalchemy import create_engine
+
+from app.core.cache import InMemoryCache
+from app.core.db_routing import ReplicaRouter
+
+
+@pytest.fixture
+def replicas(tmp_path):
+    engines = [create_engine(f"sqlite:///{tmp_path / f'replica{index}.db'}") for index in range(2)]
+    yield engines
+    for engine in engines:
+        engine.dispose()
+
+
+class TestReplicaRouter:
+    """Test replica choice, stickiness and fallback."""
+
+    def test_without_replicas_reads_from_primary(self):
+        router = ReplicaRouter([])
+        router.record_write("user")
+
+        assert not router.enabled
+        assert router.choose("user") is None
+        assert router.stats() == {"primary_reads": 1, "replicas": []}
+
+    def test_round_robin_until_user_writes(self, replicas):
+        shared = InMemoryCache()
+        router = ReplicaRouter(replicas, cache_backend=shared, sticky_seconds=10)
+
+        assert [router.choose("user") for _ in range(3)] == [replicas[0], replicas[1], replicas[0]]
+
+        # Another worker records the write; both keep the user on the primary
+        ReplicaRouter(replicas, cache_backend=shared, sticky_seconds=10).record_write("user")
+        assert router.choose("user") is None
+        assert router.choose("other-user") is replicas[1]
+        assert router.choose() is replicas[0]
+
+        stats = router.stats()
+        assert stats["primary_reads"] == 1
+        assert [replica["reads"] for replica in stats["replicas"]] == [3, 2]
+
+    def test_unavailable_replica_is_skipped(self, replicas):
+        router = ReplicaRouter(replicas, cache_backend=InMemoryCache())
+        router.mark_down(replicas[0])
+
+        assert [router.choose() for _ in range(2)] == [replicas[1], replicas[1]]
+        router.mark_down(replicas[1])
+        assert router.choose() is None
+        assert [replica["available"] for replica in router.stats()["replicas"]] == [False, False]
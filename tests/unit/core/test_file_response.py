@@ -0,0 +1,171 @@
+"""
+Unit tests for MediaFileResponse range streaming and conditional requests.
+"""
+from datetime import datetime
+
+import pytest
+
+from app.core.file_response import MediaFileResponse, http_date, is_not_modified
+
+CONTENT = bytes(range(256)) * 64  # 16 KiB
+
+
+@pytest.fixture
+def media_file(tmp_path):
+    path = tmp_path / "clip.mp4"
+    path.write_bytes(CONTENT)
+    return path
+
+
+async def _serve(response, headers=None, method="GET"):
+    scope = {
+        "type": "http",
+        "method": method,
+        "headers": [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()],
+    }
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    await response(scope, receive, send)
+
+    start = messages[0]
+    response_headers = {k.decode(): v.decode() for k, v in start["headers"]}
+    return start["status"], response_headers, messages[1:]
+
+
+def _body(messages):
+    return b"".join(m.get("body", b"") for m in messages if m["type"] == "http.response.body")
+
+
+class TestSingleRange:
+    """Test single byte-range requests."""
+
+    async def test_serves_requested_bytes(self, media_file):
+        status, headers, messages = await _serve(
+            MediaFileResponse(media_file, media_type="video/mp4"), {"Range": "bytes=10-19"}
+        )
+
+        assert status == 206
+        assert headers["content-range"] == f"bytes 10-19/{len(CONTENT)}"
+        assert headers["content-length"] == "10"
+        assert _body(messages) == CONTENT[10:20]
+        assert messages[-1]["more_body"] is False
+
+    async def test_reads_in_large_chunks(self, media_file):
+        response = MediaFileResponse(media_file, media_type="video/mp4")
+        response.chunk_size = 4096
+
+        _, _, messages = await _serve(response, {"Range": "bytes=0-"})
+
+        chunks = [m["body"] for m in messages if m["body"]]
+        assert [len(chunk) for chunk in chunks] == [4096] * 4
+        assert b"".join(chunks) == CONTENT
+
+    async def test_oversized_suffix_selects_whole_file(self, media_file):
+        status, headers, messages = await _serve(
+            MediaFileResponse(media_file, media_type="video/mp4"),
+            {"Range": f"bytes=-{len(CONTENT) * 2}"},
+        )
+
+        assert status == 206
+        assert headers["content-range"] == f"bytes 0-{len(CONTENT) - 1}/{len(CONTENT)}"
+        assert _body(messages) == CONTENT
+
+    async def test_unsatisfiable_range(self, media_file):
+        status, headers, _ = await _serve(
+            MediaFileResponse(media_file, media_type="video/mp4"),
+            {"Range": f"bytes={len(CONTENT)}-"},
+        )
+
+        assert status == 416
+        assert headers["content-range"] == f"*/{len(CONTENT)}"
+
+
+class TestMultipleRanges:
+    """Test multipart/byteranges responses."""
+
+    async def test_multipart_body_and_content_type(self, media_file):
+        status, headers, messages = await _serve(
+            MediaFileResponse(media_file, media_type="video/mp4"),
+            {"Range": "bytes=0-9,100-109"},
+        )
+
+        body = _body(messages)
+        assert status == 206
+        assert headers["content-type"].startswith("multipart/byteranges; boundary=")
+        assert "content-range" not in headers
+        assert int(headers["content-length"]) == len(body)
+        assert b"Content-Type: video/mp4" in body
+        assert b"Content-Range: bytes 0-9/" in body
+        assert CONTENT[0:10] in body and CONTENT[100:110] in body
+
+
+class TestIfRange:
+    """Test conditional range requests."""
+
+    async def test_matching_validator_serves_range(self, media_file):
+        probe = MediaFileResponse(media_file, stat_result=media_file.stat())
+        etag = probe.headers["etag"]
+
+        status, _, _ = await _serve(
+            MediaFileResponse(media_file, stat_result=media_file.stat()),
+            {"Range": "bytes=0-9", "If-Range": etag},
+        )
+
+        assert status == 206
+
+    async def test_stale_validator_serves_full_file(self, media_file):
+        status, _, messages = await _serve(
+            MediaFileResponse(media_file, stat_result=media_file.stat()),
+            {"Range": "bytes=0-9", "If-Range": '"stale"'},
+        )
+
+        assert status == 200
+        assert _body(messages) == CONTENT
+
+
+class TestIsNotModified:
+    """Test conditional request evaluation against stored validators."""
+
+    LAST_MODIFIED = datetime(2026, 1, 2, 3, 4, 5, 678000)
+
+    def test_matching_etag(self):
+        assert is_not_modified({"if-none-match": '"abc"'}, '"abc"', None)
+
+    def test_etag_list_and_weak_comparison(self):
+        assert is_not_modified({"if-none-match": 'W/"xyz", W/"abc"'}, '"abc"', None)
+
+    def test_wildcard_etag(self):
+        assert is_not_modified({"if-none-match": "*"}, '"abc"', None)
+
+    def test_mismatched_etag(self):
+        assert not is_not_modified({"if-none-match": '"other"'}, '"abc"', None)
+
+    def test_etag_takes_precedence_over_date(self):
+        headers = {
+            "if-none-match": '"other"',
+            "if-modified-since": http_date(self.LAST_MODIFIED),
+        }
+
+        assert not is_not_modified(headers, '"abc"', self.LAST_MODIFIED)
+
+    def test_if_modified_since_ignores_sub_second_precision(self):
+        headers = {"if-modified-since": http_date(self.LAST_MODIFIED)}
+
+        assert is_not_modified(headers, None, self.LAST_MODIFIED)
+
+    def test_modified_after_date(self):
+        headers = {"if-modified-since": "Thu, 01 Jan 2026 00:00:00 GMT"}
+
+        assert not is_not_modified(headers, None, self.LAST_MODIFIED)
+
+    def test_invalid_date_is_ignored(self):
+        assert not is_not_modified({"if-modified-since": "yesterday"}, None, self.LAST_MODIFIED)
+
+    def test_no_conditional_headers(self):
+        assert not is_not_modified({}, '"abc"', self.LAST_MODIFIED)
@@ -0,0 +1,68 @@
+"""
+Unit tests for the media engine's priority queue and backpressure.
+"""
+import operator
+import time
+
+import pytest
+
+from app.core.exceptions import MediaEngineBusyError
+from app.core.media_engine import MediaEngine, MediaPriority
+
+
+@pytest.fixture
+def engine():
+    engine = MediaEngine(workers=1, queue_size=2)
+    yield engine
+    engine.shutdown()
+
+
+def _wait_until_active(engine: MediaEngine) -> None:
+    deadline = time.monotonic() + 30
+    while engine.stats()["active"] == 0:
+        assert time.monotonic() < deadline, "media engine never started the job"
+        time.sleep(0.01)
+
+
+class TestMediaEngine:
+    """Test dispatching media jobs to worker processes."""
+
+    def test_uploads_overtake_queued_batch_jobs(self, engine):
+        finished = []
+        blocker = engine.submit(time.sleep, 0.5)
+        _wait_until_active(engine)
+
+        batch = engine.submit(operator.add, 1, 1, priority=MediaPriority.BATCH)
+        upload = engine.submit(operator.add, 2, 2, priority=MediaPriority.UPLOAD)
+        batch.add_done_callback(lambda _: finished.append("batch"))
+        upload.add_done_callback(lambda _: finished.append("upload"))
+
+        assert engine.stats()["queued"] == {"upload": 1, "batch": 1}
+        assert (batch.result(timeout=30), upload.result(timeout=30)) == (2, 4)
+        assert blocker.done()
+        assert finished == ["upload", "batch"]
+        assert engine.stats()["completed"] == 3
+
+    def test_full_queue_rejects_jobs_that_cannot_wait(self, engine):
+        engine.submit(time.sleep, 0.5)
+        _wait_until_active(engine)
+        queued = [engine.submit(operator.neg, value) for value in (1, 2)]
+
+        assert not engine.has_capacity()
+        with pytest.raises(MediaEngineBusyError):
+            engine.submit(operator.neg, 3, priority=MediaPriority.UPLOAD, block=False)
+        with pytest.raises(MediaEngineBusyError):
+            engine.submit(operator.neg, 3, timeout=0.01)
+        assert engine.stats()["rejected"] == 2
+
+        # A blocking submission waits for the queue to drain instead
+        assert engine.submit(operator.neg, 3).result(timeout=30) == -3
+        assert [job.result() for job in queued] == [-1, -2]
+
+    def test_zero_workers_runs_jobs_inline(self):
+        engine = MediaEngine(workers=0, queue_size=1)
+
+        assert engine.inline
+        assert engine.submit(operator.add, 1, 2).result() == 3
+        with pytest.raises(ZeroDivisionError):
+            engine.run(operator.truediv, 1, 0)
@@ -0,0 +1,80 @@
+"""
+Unit tests for the authenticated principal cache.
+"""
+import time
+import uuid
+
+from app.core.cache import InMemoryCache
+from app.core.principal_cache import PrincipalCache
+from app.models.enums import UserRole
+from app.models.user import User
+from app.core.time_utils import utc_now
+
+
+def _user(**overrides) -> User:
+    values = dict(
+        id=uuid.uuid4(),
+        email="principal@example.com",
+        password="x" * 60,
+        name="Principal",
+        role=UserRole.ADMIN,
+        created_at=utc_now(),
+        updated_at=utc_now(),
+    )
+    values.update(overrides)
+    return User(**values)
+
+
+class TestPrincipalCache:
+    """Test caching users between authenticated requests."""
+
+    def test_returns_fresh_copy_without_password(self):
+        cache = PrincipalCache()
+        user = _user()
+        cache.set(user, time.monotonic())
+
+        cached = cache.get(str(user.id))
+        assert cached is not cache.get(str(user.id))
+        assert (cached.id, cached.email, cached.role, cached.is_active) == (
+            user.id, user.email, UserRole.ADMIN, True,
+        )
+        assert cached.created_at == user.created_at
+        assert "password" not in cached.model_dump()
+
+    def test_invalidation_wins_over_lookup_started_before_it(self):
+        cache = PrincipalCache()
+        user = _user()
+        read_started = time.monotonic()
+
+        cache.invalidate(str(user.id))
+        cache.set(user, read_started)
+
+        assert cache.get(str(user.id)) is None
+        cache.set(user, time.monotonic())
+        assert cache.get(str(user.id)) is not None
+
+    def test_shared_tier_serves_other_workers(self):
+        shared = InMemoryCache()
+        user = _user(is_active=False)
+        PrincipalCache(cache_backend=shared).set(user, time.monotonic())
+
+        other_worker = PrincipalCache(cache_backend=shared)
+        cached = other_worker.get(str(user.id))
+        assert cached.id == user.id
+        assert cached.is_active is False
+
+        other_worker.invalidate(str(user.id))
+        assert PrincipalCache(cache_backend=shared).get(str(user.id)) is None
+
+    def test_evicts_least_recently_used(self):
+        cache = PrincipalCache(max_entries=2)
+        users = [_user() for _ in range(3)]
+        for user in users[:2]:
+            cache.set(user, time.monotonic())
+        cache.get(str(users[0].id))
+
+        cache.set(users[2], time.monotonic())
+
+        assert cache.get(str(users[0].id)) is not None
+        assert cache.get(str(users[1].id)) is None
+        assert cache.get(str(users[2].id)) is not None
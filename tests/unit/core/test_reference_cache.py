@@ -0,0 +1,99 @@
+"""
+Unit tests for the shared reference data cache.
+"""
+import uuid
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlmodel import Session, SQLModel
+
+from app.core import reference_cache
+from app.core.cache import InMemoryCache
+from app.core.reference_cache import REFERENCE_MOODS, MoodRecord, PromptRecord, ReferenceCache
+from app.core.time_utils import utc_now
+from app.models.mood import Mood
+from app.models.prompt import Prompt
+from app.services.mood_service import MoodService
+from app.services.prompt_service import PromptService
+
+
+def _mood(name: str, category: str = "positive") -> MoodRecord:
+    return MoodRecord(
+        id=uuid.uuid4(), name=name, icon=None, category=category,
+        created_at=utc_now(), updated_at=utc_now(),
+    )
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    """In-memory SQLite engine with seeded reference data, counting the SELECTs it runs."""
+    monkeypatch.setattr(reference_cache, "_reference_cache", ReferenceCache(InMemoryCache()))
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all([Mood(name="happy", category="positive"), Mood(name="sad", category="negative")])
+        session.add(Prompt(text="What made you smile today?", category="gratitude"))
+        session.commit()
+
+    engine.selects = 0
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def count_selects(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            engine.selects += 1
+
+    yield engine
+    engine.dispose()
+
+
+class TestReferenceCache:
+    """Test the versioned reference data cache."""
+
+    def test_records_round_trip_through_shared_backend(self):
+        shared = InMemoryCache()
+        moods = [_mood("happy"), _mood("sad", "negative")]
+        cache = ReferenceCache(shared)
+        version, cached = cache.get_records(REFERENCE_MOODS, "all", MoodRecord)
+        assert cached is None
+        cache.set_records(REFERENCE_MOODS, "all", version, moods)
+
+        _, cached = ReferenceCache(shared).get_records(REFERENCE_MOODS, "all", MoodRecord)
+        assert list(cached) == moods
+
+    def test_invalidation_reaches_other_workers(self):
+        shared = InMemoryCache()
+        worker, other_worker = ReferenceCache(shared), ReferenceCache(shared)
+        version, _ = worker.get_records(REFERENCE_MOODS, "all", MoodRecord)
+        worker.set_records(REFERENCE_MOODS, "all", version, [_mood("happy")])
+        assert other_worker.get_records(REFERENCE_MOODS, "all", MoodRecord)[1] is not None
+
+        other_worker.invalidate(REFERENCE_MOODS)
+
+        assert worker.get_records(REFERENCE_MOODS, "all", MoodRecord)[1] is None
+
+    def test_services_serve_listings_from_cache(self, engine):
+        with Session(engine) as session:
+            assert [mood.name for mood in MoodService(session).get_all_moods()] == ["sad", "happy"]
+            PromptService(session).get_system_prompts()
+        selects = engine.selects
+
+        with Session(engine) as session:
+            moods = MoodService(session).get_all_moods()
+            prompts = PromptService(session).get_system_prompts()
+        assert engine.selects == selects
+        assert [mood.name for mood in moods] == ["sad", "happy"]
+        assert isinstance(prompts[0], PromptRecord)
+
+        MoodService.invalidate_mood_cache()
+        with Session(engine) as session:
+            MoodService(session).get_all_moods()
+        assert engine.selects == selects + 1
+
+    def test_usage_count_is_incremented_without_invalidating(self, engine):
+        with Session(engine) as session:
+            service = PromptService(session)
+            prompt_id = service.get_system_prompts()[0].id
+
+            assert service.increment_usage_count(prompt_id).usage_count == 1
+            assert service.increment_usage_count(prompt_id).usage_count == 2
+            assert service.get_system_prompts()[0].usage_count == 0
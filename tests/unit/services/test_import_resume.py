@@ -0,0 +1,139 @@
+"""
+Unit tests for resuming interrupted imports from their checkpoint.
+
+Validates:
+- Checkpoints are saved with each commit, including within long journals
+- Each checkpoint saves only the ID mappings recorded since the previous one
+- Resuming skips committed journals and entries instead of duplicating them
+- A journal failing after a checkpoint keeps its committed entries
+"""
+import json
+import uuid
+
+import pytest
+from celery.exceptions import SoftTimeLimitExceeded
+from sqlmodel import func, select
+
+from app.models import Entry, ImportJob, Journal
+from app.models.enums import ImportSourceType
+from app.services.import_service import ImportService
+from app.tasks.import_tasks import _load_checkpoint, _save_checkpoint
+from app.utils.import_export.constants import ExportConfig, ImportConfig
+
+
+TIMESTAMP = "2026-01-02T03:04:05Z"
+
+
+@pytest.fixture
+def data_file(tmp_path, monkeypatch):
+    # Entries and their tag links fill a batch every three entries
+    monkeypatch.setattr(ImportConfig, "ENTRY_BATCH_SIZE", 6)
+    journals = [
+        {
+            "title": title,
+            "external_id": f"journal-{title}",
+            "created_at": TIMESTAMP,
+            "updated_at": TIMESTAMP,
+            "entries": [
+                {
+                    "external_id": f"{title}-{index}",
+                    "content": f"entry {index}",
+                    "entry_date": f"2026-01-{index + 1:02d}",
+                    "entry_datetime_utc": f"2026-01-{index + 1:02d}T03:04:05Z",
+                    "created_at": TIMESTAMP,
+                    "updated_at": TIMESTAMP,
+                    "tags": ["resume"],
+                }
+                for index in range(count)
+            ],
+        }
+        for title, count in (("first", 4), ("second", 8))
+    ]
+    path = tmp_path / "data.json"
+    path.write_text(json.dumps({
+        "export_version": ExportConfig.EXPORT_VERSION,
+        "export_date": TIMESTAMP,
+        "app_version": "test",
+        "user_email": "export@example.com",
+        "journals": journals,
+    }), encoding="utf-8")
+    return path
+
+
+def _interrupt_at(entry_number: int):
+    def handle_progress(processed: int, total: int):
+        if processed == entry_number:
+            raise SoftTimeLimitExceeded()
+    return handle_progress
+
+
+def _entry_count(session, user_id: uuid.UUID) -> int:
+    return session.exec(select(func.count()).select_from(Entry).where(Entry.user_id == user_id)).one()
+
+
+class TestResumableImport:
+    """Test checkpointing and resuming imports."""
+
+    def test_resume_continues_after_last_checkpoint(self, session, user_id, data_file):
+        job = ImportJob(user_id=user_id, source_type=ImportSourceType.JOURNIV, file_path=str(data_file))
+        session.add(job)
+        session.commit()
+        checkpoints = []
+
+        def save_checkpoint(checkpoint):
+            checkpoints.append(len(checkpoint["id_mappings"].get("entries", {})))
+            _save_checkpoint(session, job, checkpoint)
+
+        with pytest.raises(SoftTimeLimitExceeded):
+            ImportService(session).import_journiv_data(
+                user_id, data_file,
+                progress_callback=_interrupt_at(11),
+                checkpoint_callback=save_checkpoint,
+            )
+        session.rollback()
+
+        # Within and after the first journal, then twice within the second
+        assert checkpoints == [3, 1, 3, 3]
+        checkpoint = job.checkpoint
+        assert "id_mappings" not in checkpoint and "id_mappings" not in checkpoint["summary"]
+        assert checkpoint["journals_done"] == 1
+        assert checkpoint["journal"]["result"]["entries_created"] == 6
+        assert checkpoint["journal"]["last_entry_external_id"] == "second-5"
+        assert _entry_count(session, user_id) == 10
+
+        summary = ImportService(session).import_journiv_data(
+            user_id, data_file, checkpoint=_load_checkpoint(session, job), checkpoint_callback=save_checkpoint,
+        )
+
+        assert summary.journals_created == 2
+        assert summary.entries_created == 12
+        assert summary.tags_created == 1
+        assert len(summary.id_mappings["entries"]) == 12
+        assert _entry_count(session, user_id) == 12
+        journals = session.exec(select(Journal).where(Journal.user_id == user_id).order_by(Journal.title)).all()
+        assert [(journal.title, journal.entry_count) for journal in journals] == [("first", 4), ("second", 8)]
+
+    def test_failed_journal_keeps_checkpointed_entries(self, session, user_id, data_file, monkeypatch):
+        import_entry = ImportService._import_entry
+        calls = []
+
+        def fail_eighth_entry(self, *args, **kwargs):
+            calls.append(None)
+            if len(calls) == 8:
+                raise ValueError("broken entry")
+            return import_entry(self, *args, **kwargs)
+
+        monkeypatch.setattr(ImportService, "_import_entry", fail_eighth_entry)
+
+        summary = ImportService(session).import_journiv_data(
+            user_id, data_file, checkpoint_callback=lambda checkpoint: None,
+        )
+
+        assert summary.journals_created == 2
+        assert summary.entries_created == 7
+        assert summary.entries_skipped == 5
+        # Only committed entries are mapped
+        assert len(summary.id_mappings["entries"]) == 7
+        assert "only partially imported (3 of 8 entries)" in summary.warnings[0]
+        second = session.exec(select(Journal).where(Journal.title == "second")).one()
+        assert second.entry_count == 3
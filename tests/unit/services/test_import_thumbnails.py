@@ -0,0 +1,114 @@
+"""
+Unit tests for generating imported media thumbnails after the import commits.
+
+Validates:
+- Imported images are committed as PENDING without a thumbnail
+- Their IDs are handed to the thumbnail callback once committed
+- Pending thumbnails are generated once and marked COMPLETED
+- Media another task claimed is left to it
+"""
+import json
+import zipfile
+from io import BytesIO
+
+import pytest
+from PIL import Image
+from sqlmodel import select
+
+from app.core.config import settings
+from app.models import EntryMedia
+from app.models.enums import UploadStatus
+from app.services.import_service import ImportService
+from app.services.media_service import MediaService
+from app.utils.import_export.constants import ExportConfig
+
+
+TIMESTAMP = "2026-01-02T03:04:05Z"
+
+
+@pytest.fixture
+def archive(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "media_root", str(tmp_path / "media"))
+    monkeypatch.setattr(settings, "import_temp_dir", str(tmp_path / "imports"))
+    image = BytesIO()
+    Image.new("RGB", (640, 480), (30, 120, 200)).save(image, "JPEG")
+    entry = {
+        "content": "with a photo",
+        "entry_date": "2026-01-02",
+        "entry_datetime_utc": TIMESTAMP,
+        "created_at": TIMESTAMP,
+        "updated_at": TIMESTAMP,
+        "media": [{
+            "file_path": "entry/photo.jpg",
+            "filename": "photo.jpg",
+            "media_type": "image",
+            "mime_type": "image/jpeg",
+            "file_size": len(image.getvalue()),
+            "thumbnail_path": "images/thumbnails/thumb_from_source.jpg",
+            "created_at": TIMESTAMP,
+            "updated_at": TIMESTAMP,
+        }],
+    }
+    path = tmp_path / "export.zip"
+    with zipfile.ZipFile(path, "w") as zipf:
+        zipf.writestr("data.json", json.dumps({
+            "export_version": ExportConfig.EXPORT_VERSION,
+            "export_date": TIMESTAMP,
+            "app_version": "test",
+            "user_email": "export@example.com",
+            "journals": [{
+                "title": "Photos",
+                "created_at": TIMESTAMP,
+                "updated_at": TIMESTAMP,
+                "entries": [entry],
+            }],
+        }))
+        zipf.writestr("media/entry/photo.jpg", image.getvalue())
+    return path
+
+
+class TestImportThumbnails:
+    """Test deferring thumbnail generation out of the import transaction."""
+
+    def test_thumbnails_are_generated_after_commit(self, session, user_id, archive):
+        service = ImportService(session)
+        data_file, media_archive = service.extract_import_data(archive)
+        queued = []
+
+        summary = service.import_journiv_data(
+            user_id, data_file, media_archive, thumbnail_callback=queued.extend,
+        )
+
+        media = session.exec(select(EntryMedia)).one()
+        assert summary.media_files_imported == 1
+        assert queued == [media.id]
+        assert media.upload_status == UploadStatus.PENDING
+        assert media.thumbnail_path is None
+        imported_updated_at = media.updated_at
+
+        media_service = MediaService(session)
+        assert media_service.generate_pending_thumbnails(queued) == 1
+        # Already processed, so queuing it again does nothing
+        assert media_service.generate_pending_thumbnails(queued) == 0
+
+        session.refresh(media)
+        assert media.upload_status == UploadStatus.COMPLETED
+        assert (media_service.media_root / media.thumbnail_path).is_file()
+        # The exported timestamp is kept, so incremental exports skip the file
+        assert media.updated_at == imported_updated_at
+
+    def test_media_claimed_by_another_task_is_skipped(self, session, user_id, archive):
+        service = ImportService(session)
+        data_file, media_archive = service.extract_import_data(archive)
+        queued = []
+        service.import_journiv_data(user_id, data_file, media_archive, thumbnail_callback=queued.extend)
+
+        media = session.exec(select(EntryMedia)).one()
+        media.upload_status = UploadStatus.PROCESSING
+        session.add(media)
+        session.commit()
+
+        assert MediaService(session).generate_pending_thumbnails(queued) == 0
+        session.refresh(media)
+        assert media.upload_status == UploadStatus.PROCESSING
+        assert media.thumbnail_path is None
@@ -0,0 +1,289 @@
+"""
+Unit tests for incremental exports and applying them on import.
+
+Validates:
+- An incremental export continues from its base export and holds only changes
+- Unchanged media is listed without its file
+- Importing it on top of the base import updates journals and replaces entries
+- Entries and journals deleted at the source are deleted on import
+- Tagging, untagging and renaming a tag of an entry makes it part of the next incremental export
+- Incremental exports and imports need their base
+"""
+import json
+import zipfile
+from datetime import date, datetime, timezone
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+from PIL import Image
+from sqlmodel import func, select
+
+from app.core.config import settings
+from app.core.time_utils import utc_now
+from app.models import Entry, EntryMedia, EntryTagLink, Journal, MediaBlob, Tag, User
+from app.models.analytics import WritingDay
+from app.models.enums import ExportType, ImportSourceType
+from app.models.import_job import ImportJob
+from app.schemas.journal import JournalCreate
+from app.schemas.tag import TagUpdate
+from app.services.entry_service import EntryService
+from app.services.export_service import ExportService
+from app.services.import_service import ImportService
+from app.services.journal_service import JournalService
+from app.services.tag_service import TagService
+from app.utils.import_export.constants import ExportConfig
+
+
+TIMESTAMP = "2026-01-02T03:04:05Z"
+
+
+@pytest.fixture
+def users(session, tmp_path, monkeypatch):
+    """A source account holding a journal with a photo entry, and an empty target account."""
+    monkeypatch.setattr(settings, "media_root", str(tmp_path / "media"))
+    monkeypatch.setattr(settings, "import_temp_dir", str(tmp_path / "imports"))
+    monkeypatch.setattr(settings, "export_dir", str(tmp_path / "exports"))
+    source = User(email="source@example.com", password="x" * 60, name="Source")
+    target = User(email="target@example.com", password="x" * 60, name="Target")
+    session.add_all([source, target])
+    session.commit()
+
+    image = BytesIO()
+    Image.new("RGB", (64, 48), (30, 120, 200)).save(image, "JPEG")
+    entries = [
+        {
+            "content": content,
+            "entry_date": f"2026-01-0{day}",
+            "entry_datetime_utc": f"2026-01-0{day}T03:04:05Z",
+            "created_at": TIMESTAMP,
+            "updated_at": TIMESTAMP,
+            "tags": ["travel"],
+            "media": media,
+        }
+        for day, content, media in (
+            (1, "a quiet day", []),
+            (2, "with a photo", [{
+                "file_path": "entry/photo.jpg",
+                "filename": "photo.jpg",
+                "media_type": "image",
+                "mime_type": "image/jpeg",
+                "file_size": len(image.getvalue()),
+                "created_at": TIMESTAMP,
+                "updated_at": TIMESTAMP,
+            }]),
+        )
+    ]
+    archive = tmp_path / "seed.zip"
+    with zipfile.ZipFile(archive, "w") as zipf:
+        zipf.writestr("data.json", json.dumps({
+            "export_version": ExportConfig.EXPORT_VERSION,
+            "export_date": TIMESTAMP,
+            "app_version": "test",
+            "user_email": "seed@example.com",
+            "journals": [{
+                "title": "Travel",
+                "created_at": TIMESTAMP,
+                "updated_at": TIMESTAMP,
+                "entries": entries,
+            }],
+        }))
+        zipf.writestr("media/entry/photo.jpg", image.getvalue())
+    _import(session, source.id, archive, record_job=False)
+    return source.id, target.id
+
+
+def _export(session, user_id, export_type, **kwargs):
+    """Run an export job the way the export task does."""
+    service = ExportService(session)
+    job = service.create_export(user_id, export_type, **kwargs)
+    zip_path, file_size, stats = service.create_export_zip(
+        user_id,
+        job.export_type,
+        since=job.since,
+        base_export_id=job.base_export_id,
+        export_id=job.id,
+    )
+    job.mark_completed(str(zip_path), file_size, stats)
+    session.commit()
+    # Exports finishing within the same second would share the file name
+    renamed = zip_path.with_name(f"{job.id}.zip")
+    zip_path.rename(renamed)
+    return job, renamed
+
+
+def _import(session, user_id, zip_path, record_job=True):
+    """Run an import job the way the import task does."""
+    service = ImportService(session)
+    data_file, media_archive = service.extract_import_data(zip_path)
+    summary = service.import_journiv_data(user_id, data_file, media_archive)
+    if record_job:
+        job = ImportJob(user_id=user_id, source_type=ImportSourceType.JOURNIV, file_path=str(zip_path))
+        job.mark_completed(summary.model_dump(mode="json"))
+        session.add(job)
+        session.commit()
+    return summary
+
+
+class TestIncrementalExport:
+    """Test chaining an incremental export onto a full export."""
+
+    def test_incremental_export_applies_on_top_of_its_base(self, session, users):
+        source_id, target_id = users
+        full_job, full_zip = _export(session, source_id, ExportType.FULL)
+        _import(session, target_id, full_zip)
+
+        # Edit the photo entry and write a new one
+        photo_entry = session.exec(
+            select(Entry).where(Entry.user_id == source_id, Entry.content == "with a photo")
+        ).one()
+        photo_entry.content = "with a photo, edited later"
+        photo_entry.updated_at = utc_now()
+        session.add(Entry(
+            journal_id=photo_entry.journal_id,
+            user_id=source_id,
+            content="written after the backup",
+            entry_date=date(2026, 1, 3),
+            entry_datetime_utc=datetime(2026, 1, 3, 3, 4, 5, tzinfo=timezone.utc),
+            word_count=4,
+        ))
+        session.commit()
+
+        delta_job, delta_zip = _export(session, source_id, ExportType.INCREMENTAL)
+
+        assert delta_job.base_export_id == full_job.id
+        with zipfile.ZipFile(delta_zip) as zipf:
+            # The photo did not change, so the file stays out of the archive
+            assert zipf.namelist() == ["data.json"]
+            data = json.loads(zipf.read("data.json"))
+        assert data["manifest"]["base_export_id"] == str(full_job.id)
+        assert data["manifest"]["since"] == full_job.result_data["manifest"]["until"]
+        [journal] = data["journals"]
+        assert sorted(entry["content"] for entry in journal["entries"]) == [
+            "with a photo, edited later",
+            "written after the backup",
+        ]
+
+        summary = _import(session, target_id, delta_zip)
+
+        assert (summary.journals_created, summary.journals_updated) == (0, 1)
+        assert (summary.entries_created, summary.entries_updated) == (2, 1)
+        assert summary.media_files_deduplicated == 1
+        contents = session.exec(
+            select(Entry.content).where(Entry.user_id == target_id).order_by(Entry.entry_date)
+        ).all()
+        assert contents == ["a quiet day", "with a photo, edited later", "written after the backup"]
+        journal = session.exec(select(Journal).where(Journal.user_id == target_id)).one()
+        assert journal.entry_count == 3
+
+        # The photo moved to the new version of its entry and kept its one stored copy
+        media = session.exec(
+            select(EntryMedia).join(Entry).where(Entry.user_id == target_id)
+        ).one()
+        blob = session.exec(select(MediaBlob).where(MediaBlob.user_id == target_id)).one()
+        assert media.file_path == blob.file_path
+        assert blob.ref_count == 1
+        assert (Path(settings.media_root) / blob.file_path).is_file()
+
+        writing_days = session.exec(
+            select(func.sum(WritingDay.entry_count)).where(WritingDay.user_id == target_id)
+        ).one()
+        assert writing_days == 3
+
+    def test_tag_changes_are_exported_incrementally(self, session, users):
+        source_id, target_id = users
+        _, full_zip = _export(session, source_id, ExportType.FULL)
+        _import(session, target_id, full_zip)
+
+        def entry_tags(user_id):
+            return sorted(session.exec(
+                select(Tag.name)
+                .join(EntryTagLink, EntryTagLink.tag_id == Tag.id)
+                .join(Entry, Entry.id == EntryTagLink.entry_id)
+                .where(Entry.user_id == user_id, Entry.content == "a quiet day")
+            ).all())
+
+        def exported_contents(zip_path):
+            with zipfile.ZipFile(zip_path) as zipf:
+                data = json.loads(zipf.read("data.json"))
+            return [entry["content"] for journal in data["journals"] for entry in journal["entries"]]
+
+        tag_service = TagService(session)
+        quiet_day = session.exec(
+            select(Entry).where(Entry.user_id == source_id, Entry.content == "a quiet day")
+        ).one()
+        [home] = tag_service.create_or_get_tags(source_id, ["home"])
+        tag_service.add_tag_to_entry(quiet_day.id, home.id, source_id)
+
+        _, tagged_zip = _export(session, source_id, ExportType.INCREMENTAL)
+        assert exported_contents(tagged_zip) == ["a quiet day"]
+        _import(session, target_id, tagged_zip)
+        assert entry_tags(target_id) == ["home", "travel"]
+
+        travel = tag_service.get_tag_by_name(source_id, "travel")
+        assert tag_service.remove_tag_from_entry(quiet_day.id, travel.id, source_id)
+
+        _, untagged_zip = _export(session, source_id, ExportType.INCREMENTAL)
+        assert exported_contents(untagged_zip) == ["a quiet day"]
+        _import(session, target_id, untagged_zip)
+        assert entry_tags(target_id) == ["home"]
+
+        tag_service.update_tag(home.id, source_id, TagUpdate(name="house"))
+
+        _, renamed_zip = _export(session, source_id, ExportType.INCREMENTAL)
+        assert exported_contents(renamed_zip) == ["a quiet day"]
+        _import(session, target_id, renamed_zip)
+        assert entry_tags(target_id) == ["house"]
+
+    def test_deletions_are_applied_on_import(self, session, users):
+        source_id, target_id = users
+        work = JournalService(session).create_journal(source_id, JournalCreate(title="Work"))
+        session.add(Entry(
+            journal_id=work.id,
+            user_id=source_id,
+            content="a meeting",
+            entry_date=date(2026, 1, 3),
+            entry_datetime_utc=datetime(2026, 1, 3, 3, 4, 5, tzinfo=timezone.utc),
+            word_count=2,
+        ))
+        session.commit()
+        _, full_zip = _export(session, source_id, ExportType.FULL)
+        _import(session, target_id, full_zip)
+
+        quiet_day = session.exec(
+            select(Entry).where(Entry.user_id == source_id, Entry.content == "a quiet day")
+        ).one()
+        EntryService(session)._delete_entry_records(quiet_day.id, source_id)
+        JournalService(session)._delete_journal_records(work.id, source_id)
+
+        _, delta_zip = _export(session, source_id, ExportType.INCREMENTAL)
+        summary = _import(session, target_id, delta_zip)
+
+        assert (summary.journals_deleted, summary.entries_deleted) == (1, 2)
+        journal = session.exec(select(Journal).where(Journal.user_id == target_id)).one()
+        assert (journal.title, journal.entry_count) == ("Travel", 1)
+        contents = session.exec(select(Entry.content).where(Entry.user_id == target_id)).all()
+        assert contents == ["with a photo"]
+        writing_days = session.exec(
+            select(func.sum(WritingDay.entry_count)).where(WritingDay.user_id == target_id)
+        ).one()
+        assert writing_days == 1
+        # The ID lists stay out of the job results
+        result_data = session.exec(
+            select(ImportJob.result_data).where(ImportJob.user_id == target_id).order_by(ImportJob.created_at.desc())
+        ).first()
+        assert result_data["manifest"]["entry_ids"] is None
+
+    def test_incremental_export_needs_a_base(self, session, users):
+        source_id, _ = users
+
+        with pytest.raises(ValueError, match="needs a completed full or incremental export"):
+            ExportService(session).create_export(source_id, ExportType.INCREMENTAL)
+
+    def test_incremental_import_needs_its_base_imported(self, session, users):
+        source_id, target_id = users
+        _export(session, source_id, ExportType.FULL)
+        _, delta_zip = _export(session, source_id, ExportType.INCREMENTAL)
+
+        with pytest.raises(ValueError, match="has not been imported"):
+            _import(session, target_id, delta_zip)
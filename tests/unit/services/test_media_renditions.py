@@ -0,0 +1,80 @@
+"""
+Unit tests for lazily generated media renditions.
+
+Validates:
+- The rendition format follows the client's Accept header
+- Renditions are generated once, fit their size and are never upscaled
+- Renditions are removed together with their original
+"""
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from PIL import Image
+
+from app.core.config import settings
+from app.models.enums import MediaType, RenditionSize
+from app.services.media_service import MediaService
+
+
+@pytest.fixture
+def media_service(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "media_root", str(tmp_path / "media"))
+    monkeypatch.setattr(settings, "media_engine_workers", 0)
+    monkeypatch.setattr("app.core.media_engine._engine", None)
+    return MediaService()
+
+
+def _photo(media_service: MediaService, size=(2000, 1000)) -> SimpleNamespace:
+    path = media_service.media_root / "images" / "photo.jpg"
+    Image.new("RGB", size, (30, 120, 200)).save(path, "JPEG")
+    return SimpleNamespace(file_path="images/photo.jpg", media_type=MediaType.IMAGE)
+
+
+class TestMediaRenditions:
+    """Test rendition negotiation, generation and cleanup."""
+
+    @pytest.mark.parametrize("accept, expected", [
+        ("image/avif,image/webp,*/*", "avif"),
+        ("image/webp,*/*;q=0.8", "webp"),
+        ("image/avif;q=0,image/webp", "webp"),
+        ("*/*", "jpeg"),
+        (None, "jpeg"),
+    ])
+    def test_negotiates_format_from_accept_header(self, accept, expected, monkeypatch):
+        monkeypatch.setattr(MediaService, "_can_encode", staticmethod(lambda image_format: True))
+
+        assert MediaService.negotiate_rendition_format(accept) == expected
+
+    @pytest.mark.asyncio
+    async def test_generates_rendition_once(self, media_service):
+        media = _photo(media_service)
+
+        path = await media_service.get_media_rendition_path(media, RenditionSize.LARGE, "webp")
+
+        assert path == media_service.media_root / "images" / "renditions" / "photo_large.webp"
+        with Image.open(path) as img:
+            assert (img.format, img.size) == ("WEBP", (720, 360))
+        generated_at = path.stat().st_mtime_ns
+        assert await media_service.get_media_rendition_path(media, RenditionSize.LARGE, "webp") == path
+        assert path.stat().st_mtime_ns == generated_at
+
+    @pytest.mark.asyncio
+    async def test_does_not_upscale_small_originals(self, media_service):
+        media = _photo(media_service, size=(400, 300))
+
+        path = await media_service.get_media_rendition_path(media, RenditionSize.XLARGE, "jpeg")
+
+        with Image.open(path) as img:
+            assert (img.format, img.size) == ("JPEG", (400, 300))
+
+    @pytest.mark.asyncio
+    async def test_renditions_are_removed_with_original(self, media_service):
+        media = _photo(media_service)
+        paths = [
+            await media_service.get_media_rendition_path(media, size, "jpeg")
+            for size in (RenditionSize.SMALL, RenditionSize.MEDIUM)
+        ]
+
+        assert media_service.remove_media_file(str(media_service.media_root / media.file_path))
+        assert not any(Path(path).exists() for path in paths)
@@ -0,0 +1,128 @@
+"""
+Unit tests for the streaming media upload pipeline.
+
+Validates:
+- Uploads are written with their size and checksum computed incrementally
+- Oversized uploads are rejected mid-stream without leaving files behind
+- The MIME type is sniffed from the head of the upload only
+- Uploading bytes the user already stored references the existing file
+"""
+import hashlib
+from io import BytesIO
+
+import pytest
+from sqlalchemy import create_engine
+from sqlmodel import Session, SQLModel, select
+from starlette.datastructures import UploadFile
+
+from app.core.exceptions import FileTooLargeError, InvalidFileTypeError
+from app.models import MediaBlob, User
+from app.models.enums import MediaType
+from app.services.media_service import MediaService
+
+
+JPEG_HEAD = b"\xff\xd8\xff\xe0\x00\x10JFIF\x00\x01\x01\x00\x00\x01\x00\x01\x00\x00"
+
+
+@pytest.fixture
+def media_service(tmp_path, monkeypatch):
+    """MediaService writing into a temporary media root with a 1MB limit."""
+    service = MediaService()
+    service.media_root = tmp_path
+    for folder in ("images", "videos", "audio"):
+        (tmp_path / folder).mkdir()
+    monkeypatch.setattr(service.settings, "max_file_size_mb", 1)
+    monkeypatch.setattr(MediaService, "UPLOAD_CHUNK_SIZE", 64 * 1024)
+    return service
+
+
+def _upload(content: bytes, filename: str = "photo.jpg") -> UploadFile:
+    return UploadFile(file=BytesIO(content), filename=filename)
+
+
+def _leftover_files(media_service):
+    return [path for path in media_service.media_root.rglob("*") if path.is_file()]
+
+
+class TestSaveUploadedFile:
+    """Test streaming an upload to disk."""
+
+    @pytest.mark.asyncio
+    async def test_writes_file_with_incremental_size_and_checksum(self, media_service):
+        content = JPEG_HEAD + b"\x00" * (300 * 1024)
+
+        info = await media_service.save_uploaded_file(
+            _upload(content), "photo.jpg", "user", MediaType.IMAGE, "image/jpeg"
+        )
+
+        stored = media_service.media_root / info["file_path"]
+        assert stored.read_bytes() == content
+        assert info["file_size"] == len(content)
+        assert info["checksum"] == hashlib.sha256(content).hexdigest()
+        assert _leftover_files(media_service) == [stored]
+
+    @pytest.mark.asyncio
+    async def test_rejects_oversized_upload_and_removes_partial_file(self, media_service):
+        content = JPEG_HEAD + b"\x00" * (1024 * 1024)
+
+        with pytest.raises(FileTooLargeError):
+            await media_service.save_uploaded_file(
+                _upload(content), "photo.jpg", "user", MediaType.IMAGE, "image/jpeg"
+            )
+
+        assert _leftover_files(media_service) == []
+
+
+class TestUploadMedia:
+    """Test validation performed before the upload is streamed."""
+
+    @pytest.mark.asyncio
+    async def test_sniffs_mime_type_from_head(self, media_service, monkeypatch):
+        sniffed = []
+        detect_mime = media_service._detect_mime
+
+        def record(content):
+            sniffed.append(len(content))
+            return detect_mime(content)
+
+        monkeypatch.setattr(media_service, "_detect_mime", record)
+        content = JPEG_HEAD + b"\x00" * (512 * 1024)
+
+        result = await media_service.upload_media(_upload(content), user_id="user")
+
+        assert sniffed == [MediaService.MIME_SNIFF_SIZE]
+        assert result["full_file_path"].endswith(".jpg")
+
+    @pytest.mark.asyncio
+    async def test_rejects_disallowed_type_before_writing(self, media_service):
+        with pytest.raises(InvalidFileTypeError):
+            await media_service.upload_media(_upload(b"plain text notes", "notes.txt"), user_id="user")
+
+        assert _leftover_files(media_service) == []
+
+
+class TestRetainMediaBlob:
+    """Test reference counting of stored media files."""
+
+    def test_same_bytes_from_separate_sessions_share_first_file(self, tmp_path):
+        engine = create_engine(f"sqlite:///{tmp_path / 'media.db'}")
+        SQLModel.metadata.create_all(engine)
+        with Session(engine) as session:
+            user = User(email="media@example.com", password="x" * 60, name="Media")
+            session.add(user)
+            session.commit()
+            user_id = user.id
+        checksum = hashlib.sha256(JPEG_HEAD).hexdigest()
+
+        stored_paths = []
+        for file_path in ("images/first.jpg", "images/second.jpg"):
+            with Session(engine) as session:
+                stored_paths.append(MediaService.retain_media_blob(session, user_id, checksum, file_path))
+                session.commit()
+
+        with Session(engine) as session:
+            blob = session.exec(select(MediaBlob)).one()
+        engine.dispose()
+
+        assert stored_paths == ["images/first.jpg", "images/first.jpg"]
+        assert (blob.file_path, blob.ref_count) == ("images/first.jpg", 2)
@@ -0,0 +1,96 @@
+"""
+Unit tests for cached user settings reads.
+
+Validates:
+- Timezones are read once per request and then served from the settings cache
+- Updating settings invalidates both
+- The batched variant reads all missing users in one query
+"""
+import pytest
+from sqlalchemy import create_engine, event
+from sqlmodel import Session, SQLModel
+
+from app.core import user_settings_cache
+from app.core.cache import InMemoryCache
+from app.core.user_settings_cache import UserSettingsCache
+from app.models import User
+from app.schemas.user import UserSettingsCreate, UserSettingsUpdate
+from app.services.user_service import UserService
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    """In-memory SQLite engine counting the user settings queries it runs."""
+    monkeypatch.setattr(user_settings_cache, "_user_settings_cache", UserSettingsCache(InMemoryCache()))
+    engine = create_engine("sqlite://")
+    engine.settings_queries = 0
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def count_settings_queries(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and "FROM user_settings" in statement:
+            engine.settings_queries += 1
+
+    SQLModel.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def user_ids(engine):
+    with Session(engine) as session:
+        users = [
+            User(email=f"tz{index}@example.com", password="x" * 60, name=f"Zone {index}")
+            for index in range(3)
+        ]
+        session.add_all(users)
+        session.commit()
+        service = UserService(session)
+        for user, time_zone in zip(users, ("Europe/Paris", "Asia/Tokyo")):
+            service.create_user_settings(user.id, UserSettingsCreate(time_zone=time_zone))
+        user_ids = [user.id for user in users]
+    engine.settings_queries = 0
+    return user_ids
+
+
+class TestUserSettingsCache:
+    """Test the request-scoped and cross-request settings caches."""
+
+    def test_timezone_is_read_once(self, engine, user_ids):
+        with Session(engine) as session:
+            service = UserService(session)
+            assert service.get_user_timezone(user_ids[0]) == "Europe/Paris"
+            assert UserService(session).get_user_timezone(user_ids[0]) == "Europe/Paris"
+        assert engine.settings_queries == 1
+
+        with Session(engine) as session:
+            assert UserService(session).get_user_timezone(user_ids[0]) == "Europe/Paris"
+            # No settings row falls back to UTC, and the miss is cached too
+            assert UserService(session).get_user_timezone(user_ids[2]) == "UTC"
+            assert UserService(session).get_user_timezone(user_ids[2]) == "UTC"
+        assert engine.settings_queries == 2
+
+    def test_update_invalidates_cached_timezone(self, engine, user_ids):
+        with Session(engine) as session:
+            service = UserService(session)
+            assert service.get_user_timezone(user_ids[0]) == "Europe/Paris"
+
+            service.update_user_settings(str(user_ids[0]), UserSettingsUpdate(time_zone="America/Denver"))
+
+            assert service.get_user_timezone(user_ids[0]) == "America/Denver"
+        with Session(engine) as session:
+            assert UserService(session).get_user_timezone(user_ids[0]) == "America/Denver"
+
+    def test_batched_timezones_use_one_query(self, engine, user_ids):
+        with Session(engine) as session:
+            service = UserService(session)
+            service.get_user_timezone(user_ids[1])
+            queries_before = engine.settings_queries
+
+            timezones = service.get_user_timezones(user_ids)
+
+        assert timezones == {
+            user_ids[0]: "Europe/Paris",
+            user_ids[1]: "Asia/Tokyo",
+            user_ids[2]: "UTC",
+        }
+        assert engine.settings_queries == queries_before + 1
@@ -0,0 +1,78 @@
+"""
+Unit tests for batched import INSERTs.
+
+Validates:
+- Rows are written in foreign-key order regardless of the order they were added
+- Omitted columns receive their column defaults
+- Rows are only written once the batch is full or flushed
+"""
+import uuid
+from datetime import date, datetime, timezone
+
+import pytest
+from sqlmodel import select
+
+from app.models import Entry, EntryTagLink, Journal, Tag, User
+from app.utils.import_export import BatchInserter
+
+
+NOW = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def journal(session):
+    user = User(email="batch@example.com", password="x" * 60, name="Batch")
+    session.add(user)
+    session.flush()
+    journal = Journal(user_id=user.id, title="Imported")
+    session.add(journal)
+    session.flush()
+    return journal
+
+
+def _entry_row(journal: Journal) -> dict:
+    return {
+        "id": uuid.uuid4(),
+        "journal_id": journal.id,
+        "user_id": journal.user_id,
+        "content": "imported entry",
+        "entry_date": date(2026, 1, 2),
+        "entry_datetime_utc": NOW,
+        "created_at": NOW,
+        "updated_at": NOW,
+    }
+
+
+class TestBatchInserter:
+    """Test buffering and bulk-inserting rows."""
+
+    def test_flush_orders_tables_by_foreign_keys(self, session, journal):
+        batch = BatchInserter(session, batch_size=100)
+        entry = _entry_row(journal)
+        tag_id = uuid.uuid4()
+        # Children are added before their parents
+        batch.add(EntryTagLink, {"entry_id": entry["id"], "tag_id": tag_id})
+        batch.add(Tag, {"id": tag_id, "user_id": journal.user_id, "name": "bulk"})
+        batch.add(Entry, entry)
+
+        batch.flush()
+
+        stored_entry = session.exec(select(Entry)).one()
+        assert stored_entry.id == entry["id"]
+        assert stored_entry.entry_timezone == "UTC"
+        assert stored_entry.is_pinned is False
+        stored_tag = session.exec(select(Tag)).one()
+        assert stored_tag.usage_count == 0
+        assert stored_tag.created_at is not None
+        assert session.exec(select(EntryTagLink)).one().tag_id == tag_id
+
+    def test_flush_if_full_waits_for_batch_size(self, session, journal):
+        batch = BatchInserter(session, batch_size=2)
+
+        batch.add(Entry, _entry_row(journal))
+        batch.flush_if_full()
+        assert session.exec(select(Entry)).all() == []
+
+        batch.add(Entry, {**_entry_row(journal), "title": "second"})
+        batch.flush_if_full()
+        assert len(session.exec(select(Entry)).all()) == 2
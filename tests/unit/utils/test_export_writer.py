@@ -0,0 +1,75 @@
+"""
+Unit tests for the streaming export JSON writer.
+
+Validates:
+- The streamed document matches a serialized JournivExportDTO
+- Journals without entries and exports without journals stay valid JSON
+"""
+import json
+from datetime import date, datetime, timezone
+from io import BytesIO
+
+from app.schemas.dto import EntryDTO, JournalDTO, JournivExportDTO
+from app.utils.import_export import ExportDataWriter
+
+
+NOW = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+
+def _header() -> JournivExportDTO:
+    return JournivExportDTO(
+        export_date=NOW,
+        app_version="test",
+        user_email="writer@example.com",
+        user_name="Writer",
+        journals=[],
+    )
+
+
+def _journal(title: str) -> JournalDTO:
+    return JournalDTO(title=title, created_at=NOW, updated_at=NOW)
+
+
+def _entry(content: str) -> EntryDTO:
+    return EntryDTO(
+        content=content,
+        entry_date=date(2026, 1, 2),
+        entry_datetime_utc=NOW,
+        created_at=NOW,
+        updated_at=NOW,
+    )
+
+
+class TestExportDataWriter:
+    """Test incremental serialization of export documents."""
+
+    def test_streamed_document_matches_dto_serialization(self):
+        journals = [
+            _journal("Daily ✍️").model_copy(update={"entries": [_entry("first"), _entry("zweite Ü")]}),
+            _journal("Empty"),
+        ]
+        stats = {"journal_count": 2, "entry_count": 2}
+
+        stream = BytesIO()
+        writer = ExportDataWriter(stream)
+        writer.start(_header())
+        for journal in journals:
+            writer.start_journal(journal)
+            for entry in journal.entries:
+                writer.write_entry(entry)
+            writer.end_journal()
+        writer.finish(stats)
+
+        expected = _header().model_copy(update={"journals": journals, "stats": stats})
+        assert json.loads(stream.getvalue()) == expected.model_dump(mode="json")
+
+    def test_export_without_journals(self):
+        stream = BytesIO()
+        writer = ExportDataWriter(stream)
+        writer.start(_header())
+        writer.finish(None)
+
+        document = json.loads(stream.getvalue())
+        assert document["journals"] == []
+        assert document["stats"] is None
+        assert list(document)[-2:] == ["journals", "stats"]
@@ -0,0 +1,136 @@
+"""
+Unit tests for the incremental JSON reader used by imports.
+
+Validates:
+- Values split across read boundaries decode the same as json.loads
+- Journals are streamed with fields before and after their entries
+- Unread entries are skipped so the next journal is read correctly
+- Export documents are validated and counted without loading them whole
+"""
+import json
+from io import StringIO
+
+import pytest
+
+from app.utils.import_export import validate_journiv_export_file
+from app.utils.import_export.json_stream import (
+    JsonStreamReader,
+    iter_export_journals,
+)
+
+
+DOCUMENT = {
+    "export_version": "1.0",
+    "journals": [
+        {
+            "title": "Daily ✍️",
+            "entries": [
+                {"content": "first", "n": 12345678901234, "x": -1.5e-3, "ok": True},
+                {"content": "with \"quotes\" and \\ escapes", "tags": [], "nested": {"a": [1, {}]}},
+            ],
+            "created_at": "2026-01-02T03:04:05Z",
+        },
+        {"title": "Empty", "entries": []},
+        {"entries": [{"content": "third"}], "title": "Entries first"},
+    ],
+    "stats": None,
+}
+
+ENTRY = {
+    "content": "Hello",
+    "entry_date": "2026-01-02",
+    "entry_datetime_utc": "2026-01-02T03:04:05Z",
+    "created_at": "2026-01-02T03:04:05Z",
+    "updated_at": "2026-01-02T03:04:05Z",
+}
+
+
+def _reader(document, chunk_size: int = 7) -> JsonStreamReader:
+    return JsonStreamReader(StringIO(json.dumps(document, indent=1, ensure_ascii=False)), chunk_size)
+
+
+class TestJsonStreamReader:
+    """Test structural iteration over small read chunks."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7, 4096])
+    def test_read_value_matches_json_loads(self, chunk_size):
+        assert _reader(DOCUMENT, chunk_size).read_value() == DOCUMENT
+
+    def test_skip_value_and_trailing_data(self):
+        reader = JsonStreamReader(StringIO('{"skip": [1, {"a": "]"}], "keep": 2} x'), 2)
+        members = {}
+        for key in reader.iter_object():
+            if key == "skip":
+                reader.skip_value()
+            else:
+                members[key] = reader.read_value()
+        assert members == {"keep": 2}
+        with pytest.raises(ValueError):
+            reader.expect_end()
+
+
+class TestIterExportJournals:
+    """Test streaming journals and entries from an export document."""
+
+    def test_streams_entries_and_fields_in_any_order(self):
+        journals = []
+        for journal in iter_export_journals(_reader(DOCUMENT)):
+            before = dict(journal.fields)
+            entries = list(journal.entries)
+            journals.append((before, entries, dict(journal.fields), journal.entry_count))
+
+        first, empty, entries_first = journals
+        assert first[0] == {"title": "Daily ✍️"}
+        assert first[1] == DOCUMENT["journals"][0]["entries"]
+        assert first[2]["created_at"] == "2026-01-02T03:04:05Z"
+        assert empty[1:] == ([], {"title": "Empty"}, 0)
+        assert entries_first[0] == {}
+        assert entries_first[2:] == ({"title": "Entries first"}, 1)
+
+    def test_unconsumed_entries_are_skipped(self):
+        titles = [journal.fields.get("title") for journal in iter_export_journals(_reader(DOCUMENT))]
+        # Fields after the entries are unknown until the entries are read
+        assert titles == ["Daily ✍️", "Empty", None]
+
+
+class TestValidateJournivExportFile:
+    """Test streaming validation of data.json."""
+
+    def _write(self, tmp_path, journals):
+        document = {
+            "export_date": "2026-01-02T03:04:05Z",
+            "app_version": "test",
+            "user_email": "reader@example.com",
+            "journals": journals,
+        }
+        data_file = tmp_path / "data.json"
+        data_file.write_text(json.dumps(document), encoding="utf-8")
+        return data_file
+
+    def test_returns_header_and_entry_count(self, tmp_path):
+        journal = {
+            "title": "Daily",
+            "entries": [ENTRY, {**ENTRY, "entry_date": "2026-01-03"}],
+            "created_at": "2026-01-02T03:04:05Z",
+            "updated_at": "2026-01-02T03:04:05Z",
+        }
+        result, header, total_entries = validate_journiv_export_file(
+            self._write(tmp_path, [journal, {**journal, "title": "Other", "entries": [ENTRY]}])
+        )
+
+        assert result.valid, result.errors
+        assert total_entries == 3
+        assert header["user_email"] == "reader@example.com"
+        assert header["journals"] == []
+
+    def test_reports_invalid_entries(self, tmp_path):
+        journal = {
+            "title": "Daily",
+            "entries": [{**ENTRY, "latitude": 120}],
+            "created_at": "2026-01-02T03:04:05Z",
+            "updated_at": "2026-01-02T03:04:05Z",
+        }
+        result, _, _ = validate_journiv_export_file(self._write(tmp_path, [journal]))
+
+        assert not result.valid
+        assert "Journal 1, Entry 1: Invalid latitude" in result.errors[0]
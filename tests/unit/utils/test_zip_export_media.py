@@ -0,0 +1,76 @@
+"""
+Unit tests for writing media into export archives.
+
+Validates:
+- Already-compressed media is stored, other members are deflated
+- Read-ahead preserves member order and content, including files too large to buffer
+- Missing media files are skipped
+"""
+import json
+import zipfile
+
+from app.utils.import_export import ZipHandler
+from app.utils.import_export.constants import ExportConfig
+
+
+def _write_media(tmp_path, names):
+    media_files = {}
+    for index, name in enumerate(names):
+        source = tmp_path / "source" / name
+        source.parent.mkdir(parents=True, exist_ok=True)
+        source.write_bytes(bytes([index]) * 4096)
+        media_files[f"entry/{name}"] = source
+    return media_files
+
+
+def _create_export_zip(output, data, media_files):
+    def write_data(stream):
+        stream.write(json.dumps(data).encode("utf-8"))
+        return media_files
+
+    return ZipHandler.create_streaming_export_zip(output, write_data)
+
+
+class TestExportMediaCompression:
+    """Test the per-member compression policy."""
+
+    def test_compressed_formats_are_stored(self, tmp_path):
+        media_files = _write_media(tmp_path, ["photo.JPG", "clip.mp4", "voice.m4a", "notes.txt"])
+        output = tmp_path / "export.zip"
+
+        _create_export_zip(output, {"journals": []}, media_files)
+
+        with zipfile.ZipFile(output) as zipf:
+            compression = {info.filename: info.compress_type for info in zipf.infolist()}
+            assert json.loads(zipf.read("data.json")) == {"journals": []}
+        assert compression == {
+            "data.json": zipfile.ZIP_DEFLATED,
+            "media/entry/photo.JPG": zipfile.ZIP_STORED,
+            "media/entry/clip.mp4": zipfile.ZIP_STORED,
+            "media/entry/voice.m4a": zipfile.ZIP_STORED,
+            "media/entry/notes.txt": zipfile.ZIP_DEFLATED,
+        }
+
+
+class TestExportMediaReadAhead:
+    """Test reading media ahead of the archive writer."""
+
+    def test_members_keep_order_and_content(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(ExportConfig, "MEDIA_READ_AHEAD_FILES", 3)
+        monkeypatch.setattr(ExportConfig, "MEDIA_READ_AHEAD_MAX_BYTES", 4096)
+        names = [f"photo_{index}.jpg" for index in range(10)]
+        media_files = _write_media(tmp_path, names)
+        # Larger than the read-ahead limit, so written straight from disk
+        media_files["entry/photo_4.jpg"].write_bytes(b"\x04" * 8192)
+        media_files["entry/photo_7.jpg"].unlink()
+        output = tmp_path / "export.zip"
+
+        _create_export_zip(output, {}, media_files)
+
+        with zipfile.ZipFile(output) as zipf:
+            assert zipf.namelist() == ["data.json"] + [
+                f"media/entry/{name}" for name in names if name != "photo_7.jpg"
+            ]
+            assert zipf.read("media/entry/photo_4.jpg") == b"\x04" * 8192
+            assert zipf.read("media/entry/photo_9.jpg") == b"\x09" * 4096
+            assert zipf.testzip() is None
@@ -0,0 +1,76 @@
+"""
+Unit tests for reading import archives without full extraction.
+
+Validates:
+- Only data.json is extracted; media is read from the archive in place
+- Missing media members are reported as absent
+- Corrupted members fail their CRC check when read
+"""
+import zipfile
+
+import pytest
+
+from app.utils.import_export import ZipHandler, ZipMediaReader
+
+
+MEDIA_BYTES = b"\x89PNG\r\n\x1a\n" + bytes(range(256)) * 64
+
+
+def _make_archive(path, media=True, compression=zipfile.ZIP_DEFLATED):
+    with zipfile.ZipFile(path, "w", compression) as zipf:
+        zipf.writestr("data.json", '{"journals": []}')
+        if media:
+            zipf.writestr("media/images/photo.png", MEDIA_BYTES)
+    return path
+
+
+class TestExtractDataFile:
+    """Test extracting only the data file."""
+
+    def test_extracts_data_file_only(self, tmp_path):
+        archive = _make_archive(tmp_path / "export.zip")
+
+        result = ZipHandler.extract_data_file(archive, tmp_path / "out")
+
+        assert result["data_file"].read_text() == '{"journals": []}'
+        assert result["has_media"] is True
+        assert result["file_count"] == 2
+        assert [path.name for path in (tmp_path / "out").iterdir()] == ["data.json"]
+
+    def test_rejects_archive_without_data_file(self, tmp_path):
+        archive = tmp_path / "export.zip"
+        with zipfile.ZipFile(archive, "w") as zipf:
+            zipf.writestr("media/images/photo.png", MEDIA_BYTES)
+
+        with pytest.raises(ValueError, match="data.json"):
+            ZipHandler.extract_data_file(archive, tmp_path / "out")
+
+    def test_reports_archive_without_media(self, tmp_path):
+        archive = _make_archive(tmp_path / "export.zip", media=False)
+
+        assert ZipHandler.extract_data_file(archive, tmp_path / "out")["has_media"] is False
+
+
+class TestZipMediaReader:
+    """Test streaming media members out of the archive."""
+
+    def test_reads_media_in_place(self, tmp_path):
+        archive = _make_archive(tmp_path / "export.zip")
+
+        with ZipMediaReader(archive) as reader:
+            with reader.open("images/photo.png") as source:
+                assert source.read() == MEDIA_BYTES
+            assert reader.open("images/missing.png") is None
+            assert reader.open("../data.json") is None
+
+    def test_corrupted_member_fails_crc_check(self, tmp_path):
+        archive = _make_archive(tmp_path / "export.zip", compression=zipfile.ZIP_STORED)
+        content = bytearray(archive.read_bytes())
+        offset = content.index(MEDIA_BYTES)
+        content[offset + 100] ^= 0xFF
+        archive.write_bytes(bytes(content))
+
+        with ZipMediaReader(archive) as reader:
+            with pytest.raises(zipfile.BadZipFile):
+                with reader.open("images/photo.png") as source:
+                    source.read()